@@ -18,6 +18,20 @@ for _stream in (sys.stdout, sys.stderr):
     except (AttributeError, ValueError):
         pass
 
+# `--profile-startup` has to hook the import system before anything below is
+# imported; main() prints the report instead of starting the server.
+_startup_profiler = None
+if "--profile-startup" in sys.argv[1:]:
+    _app_dir = getattr(sys, "_MEIPASS", None) or os.path.dirname(
+        os.path.abspath(__file__)
+    )
+    if _app_dir not in sys.path:
+        sys.path.insert(0, _app_dir)
+    from src.startup_profile import StartupImportProfiler
+
+    _startup_profiler = StartupImportProfiler()
+    _startup_profiler.install()
+
 
 def _safe_print(message: str) -> None:
     """print() that can't crash shutdown/atexit paths on a non-UTF-8 stdout.
@@ -46,6 +60,7 @@ import json
 import re
 import ipaddress
 import http.client
+import importlib.util
 import secrets
 import shlex
 import shutil
@@ -372,7 +387,6 @@ from src.dedicated_terminal import (
     build_windows_dedicated_terminal_command,
     should_relaunch_in_dedicated_terminal,
 )
-from src.project_manager import ProjectManager
 from src.project_session_logging import close_project_session, get_active_project_session_root
 from src.version_utils import is_newer_release_available
 
@@ -405,15 +419,21 @@ if run_validation:
 else:
     run_main_validator = None
 
-# Import core components
-compute_survey_recipes: Any = None
-try:
+# Import core components lazily: recipes pull in pandas, which the first page
+# render does not need. Availability is checked up front, so callers can still
+# test ``compute_survey_recipes is None``.
+def _compute_survey_recipes_on_demand(*args, **kwargs):
     from src.recipes_surveys import compute_survey_recipes as _compute_survey_recipes
 
-    compute_survey_recipes = _compute_survey_recipes
-except ImportError as e:
-    compute_survey_recipes = None
-    print(f"[WARN]  Could not import compute_survey_recipes: {e}")
+    return _compute_survey_recipes(*args, **kwargs)
+
+
+_RECIPES_AVAILABLE = importlib.util.find_spec("src.recipes_surveys") is not None
+compute_survey_recipes: Any = (
+    _compute_survey_recipes_on_demand if _RECIPES_AVAILABLE else None
+)
+if not _RECIPES_AVAILABLE:
+    print("[WARN]  Could not import compute_survey_recipes: src.recipes_surveys not found")
 
 
 if getattr(sys, "frozen", False):
@@ -430,7 +450,6 @@ app.config["SEND_FILE_MAX_AGE_DEFAULT"] = 0
 
 # Global shutdown flag to signal graceful termination
 _shutdown_requested = threading.Event()
-_shutdown_project_manager = ProjectManager()
 
 
 def cleanup_and_exit(exit_code=0):
@@ -439,7 +458,9 @@ def cleanup_and_exit(exit_code=0):
         _safe_print("🛑 Cleaning up resources...")
         active_project_root = get_active_project_session_root()
         if active_project_root is not None:
-            autosave_result = _shutdown_project_manager.autosave_datalad_snapshot(
+            from src.project_manager import ProjectManager
+
+            autosave_result = ProjectManager().autosave_datalad_snapshot(
                 active_project_root,
                 reason="prism_closed",
             )
@@ -540,66 +561,28 @@ except ImportError as e:
 except Exception as e:
     print(f"[WARN]  Error registering REST API blueprint: {e}")
 
-# Register Modular Blueprints (individually so one failure doesn't block others)
-modular_blueprints = [
-    ("src.web.blueprints.neurobagel", "neurobagel_bp", "neurobagel"),
-    ("src.web.blueprints.conversion", "conversion_bp", "conversion"),
-    (
-        "src.web.blueprints.conversion_survey_blueprint",
-        "conversion_survey_bp",
-        "conversion_survey",
-    ),
-    (
-        "src.web.blueprints.conversion_participants_blueprint",
-        "conversion_participants_bp",
-        "conversion_participants",
-    ),
-    ("src.web.blueprints.validation", "validation_bp", "validation"),
-    ("src.web.blueprints.tools", "tools_bp", "tools"),
-    (
-        "src.web.blueprints.tools_template_editor_blueprint",
-        "tools_template_editor_bp",
-        "tools_template_editor",
-    ),
-    ("src.web.blueprints.projects", "projects_bp", "projects"),
-    (
-        "src.web.blueprints.projects_library_blueprint",
-        "projects_library_bp",
-        "projects_library",
-    ),
-    (
-        "src.web.blueprints.projects_export_blueprint",
-        "projects_export_bp",
-        "projects_export",
-    ),
-    (
-        "src.web.blueprints.projects_datalad_server_blueprint",
-        "projects_datalad_server_bp",
-        "projects_datalad_server",
-    ),
-    (
-        "src.web.blueprints.projects_rsync_server_blueprint",
-        "projects_rsync_server_bp",
-        "projects_rsync_server",
-    ),
-    (
-        "src.web.blueprints.projects_remote_browse_blueprint",
-        "projects_remote_browse_bp",
-        "projects_remote_browse",
-    ),
-]
-
-registered_modular_blueprints: list[str] = []
-for module_name, blueprint_attr, label in modular_blueprints:
-    try:
-        module = __import__(module_name, fromlist=[blueprint_attr])
-        blueprint = getattr(module, blueprint_attr)
-        app.register_blueprint(blueprint)
-        registered_modular_blueprints.append(label)
-    except ImportError as e:
-        print(f"[WARN]  Could not import modular blueprint '{label}': {e}")
-    except Exception as e:
-        print(f"[WARN]  Could not register modular blueprint '{label}': {e}")
+# Register Modular Blueprints (individually so one failure doesn't block others).
+# Routes come from src/web/blueprint_routes.json; each blueprint module (and
+# the handlers it imports) is loaded on the first request to one of its routes.
+from src.web.lazy_blueprints import (
+    preload_lazy_blueprints,
+    register_modular_blueprints,
+)
+
+
+def _report_blueprint_error(label: str, error: Exception) -> None:
+    if isinstance(error, ImportError):
+        print(f"[WARN]  Could not import modular blueprint '{label}': {error}")
+    else:
+        print(f"[WARN]  Could not register modular blueprint '{label}': {error}")
+
+
+lazy_modular_blueprints = register_modular_blueprints(
+    app,
+    lazy=os.environ.get("PRISM_EAGER_BLUEPRINTS") != "1",
+    on_error=_report_blueprint_error,
+)
+registered_modular_blueprints: list[str] = list(lazy_modular_blueprints)
 
 if registered_modular_blueprints:
     _print_startup_step("Workflow routes")
@@ -1625,9 +1608,22 @@ def main():
         action="store_true",
         help="Run without opening a dedicated terminal window",
     )
+    parser.add_argument(
+        "--profile-startup",
+        action="store_true",
+        help="Print per-module import times for startup and exit",
+    )
 
     args = parser.parse_args()
 
+    if args.profile_startup:
+        if _startup_profiler is None:
+            print("[WARN]  Startup profiling was not enabled before imports ran")
+            return
+        _startup_profiler.uninstall()
+        print(_startup_profiler.format_report())
+        return
+
     if _should_relaunch_in_dedicated_terminal(args):
         if _launch_dedicated_terminal_for_frozen_app():
             print("[INFO]  Relaunching PRISM Studio in dedicated terminal window...")
@@ -1725,6 +1721,13 @@ def main():
                 print(f"   Please visit {url} manually")
 
     def run_server():
+        # Import the deferred blueprints in the background once the server
+        # is coming up, so the first visit to each page does not pay for it.
+        threading.Thread(
+            target=preload_lazy_blueprints,
+            args=(app, lazy_modular_blueprints.values()),
+            daemon=True,
+        ).start()
         if args.debug:
             configure_debug_logging()
             print("[DEBUG] Debug mode enabled (verbose logging, Flask debugger active)")
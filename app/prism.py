@@ -45,6 +45,15 @@ if (
         print("   Then run this script again.")
         sys.exit(1)
 
+# Forward to a running worker daemon (prism_tools daemon start) before paying
+# for the heavy imports below; without one, run in-process as usual.
+if __name__ == "__main__":
+    from src.cli.daemon import run_via_daemon
+
+    _daemon_exit = run_via_daemon("prism", sys.argv[1:])
+    if _daemon_exit is not None:
+        sys.exit(_daemon_exit)
+
 # Add src directory to path for imports
 current_dir = os.path.dirname(os.path.abspath(__file__))
 src_path = os.path.join(current_dir, "src")
@@ -35,6 +35,13 @@ def main() -> None:
     if str(app_root) not in sys.path:
         sys.path.append(str(app_root))
 
+    # Forward to a running worker daemon (prism_tools daemon start), if any.
+    from src.cli.daemon import run_via_daemon
+
+    daemon_exit = run_via_daemon("prism_tools", sys.argv[1:])
+    if daemon_exit is not None:
+        sys.exit(daemon_exit)
+
     from src.cli.entrypoint import main as cli_main
 
     cli_main()
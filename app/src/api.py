@@ -18,6 +18,7 @@ _real = load_canonical_module(
 create_api_blueprint = _real.create_api_blueprint
 _utc_isoformat_z = _real._utc_isoformat_z
 validate_dataset = getattr(_real, "validate_dataset", None)
+_VALIDATOR_AVAILABLE = getattr(_real, "_VALIDATOR_AVAILABLE", False)
 get_available_schema_versions = getattr(_real, "get_available_schema_versions", None)
 load_all_schemas = getattr(_real, "load_all_schemas", None)
 tuple_to_issue = getattr(_real, "tuple_to_issue", None)
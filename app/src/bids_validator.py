@@ -8,8 +8,27 @@ import json
 import subprocess
 from typing import List, Tuple, Set, Optional
 
+from bids_validator_cache import (
+    merge_deno_reports,
+    merge_legacy_reports,
+    run_validator_cached,
+)
+
 DENO_BIDS_VALIDATOR_SPEC = "jsr:@bids/validator@2.4.1"
 
+# PRISM-only modalities that should be ignored by BIDS
+PRISM_IGNORE_FOLDERS = frozenset(
+    {
+        "physiological",
+        "physio",
+        "survey",
+        "biometrics",
+        "metadata",
+        "environment",
+        "events",
+    }
+)
+
 # Recommended-key warnings are often produced by upstream converters
 # (for example BIDScoin) and are not required for BIDS validity.
 SUPPRESSED_RECOMMENDED_WARNING_CODES = {
@@ -47,11 +66,31 @@ def _is_citation_precedence_warning(
     return False
 
 
+def _run_validator_command(cmd: List[str]) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+
+
+def _report_cache_status(run) -> None:
+    if run.cache_status == "hit":
+        print("   Reusing cached validator report (no BIDS-visible changes)")
+    elif run.cache_status == "partial":
+        print(
+            "   Re-validated changed subjects only: "
+            + ", ".join(run.changed_subjects)
+        )
+
+
 def run_bids_validator(
     root_dir: str,
     verbose: bool = False,
     placeholders: Optional[Set[str]] = None,
     structure_only: bool = False,
+    use_cache: bool = True,
 ) -> List[Tuple[str, str, str]]:
     """
     Run the standard BIDS validator CLI and return issues.
@@ -61,6 +100,9 @@ def run_bids_validator(
         verbose: Enable verbose output
         placeholders: Set of relative paths to placeholder files to ignore content errors for
         structure_only: Whether this is a structure-only upload (suppress content errors)
+        use_cache: Reuse the cached validator report when the dataset's
+            BIDS-visible files are unchanged, and only re-validate changed
+            subjects otherwise (see ``bids_validator_cache``)
 
     Returns:
         List of (severity, message, file_path) tuples
@@ -84,16 +126,7 @@ def run_bids_validator(
         "FILE_READ",
     }
 
-    # PRISM-only modalities that should be ignored by BIDS
-    prism_ignore_folders = {
-        "physiological",
-        "physio",
-        "survey",
-        "biometrics",
-        "metadata",
-        "environment",
-        "events",
-    }
+    prism_ignore_folders = PRISM_IGNORE_FOLDERS
     standard_bids_folders = {
         "anat",
         "func",
@@ -216,20 +249,24 @@ def run_bids_validator(
         print(f"   Using Deno-based validator ({DENO_BIDS_VALIDATOR_SPEC})")
 
         # Run Deno validator
-        process = subprocess.run(
-            [
+        process = run_validator_cached(
+            root_dir,
+            f"deno:{DENO_BIDS_VALIDATOR_SPEC}",
+            lambda target: [
                 "deno",
                 "run",
                 "-ERWN",
                 "--allow-sys",
                 DENO_BIDS_VALIDATOR_SPEC,
-                root_dir,
+                target,
                 "--json",
             ],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
+            _run_validator_command,
+            merge_deno_reports,
+            use_cache=use_cache,
+            path_only_folders=PRISM_IGNORE_FOLDERS,
         )
+        _report_cache_status(process)
 
         if process.stdout:
             try:
@@ -398,20 +435,27 @@ def run_bids_validator(
     print("   ⚠️  Falling back to legacy 'bids-validator' CLI...")
     try:
         # Check if bids-validator is installed
-        subprocess.run(
+        version = subprocess.run(
             ["bids-validator", "--version"],
             check=True,
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
         )
+        legacy_version = version.stdout or ""
+        if isinstance(legacy_version, bytes):
+            legacy_version = legacy_version.decode("utf-8", "replace")
 
         # Run validation
-        process = subprocess.run(
-            ["bids-validator", root_dir, "--json"],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
+        process = run_validator_cached(
+            root_dir,
+            f"legacy:{legacy_version.strip()}",
+            lambda target: ["bids-validator", target, "--json"],
+            _run_validator_command,
+            merge_legacy_reports,
+            use_cache=use_cache,
+            path_only_folders=PRISM_IGNORE_FOLDERS,
         )
+        _report_cache_status(process)
 
         if process.stdout:
             try:
@@ -0,0 +1,531 @@
+"""
+Result cache for the external BIDS validator.
+
+Running the Deno (or legacy Node) BIDS validator is by far the slowest part of
+a ``run_bids=True`` validation, and most re-validations happen on datasets
+that did not change, or changed in a handful of subjects. This module keeps
+the validator's raw JSON report in ``<dataset>/.prism/bids_validator_cache.json``
+together with a fingerprint of every file the validator can see:
+
+* Files are walked like the validator walks them: dot entries are skipped and
+  ``.bidsignore`` rules (gitignore syntax) are honored. ``.bidsignore`` itself
+  is part of the fingerprint.
+* Each visible file contributes ``(size, mtime_ns)``. Files inside PRISM-only
+  datatype folders (``survey/``, ``biometrics/``, ...) that are not
+  bidsignored only produce ``NOT_INCLUDED`` issues, so only their path and
+  emptiness count; editing survey data does not invalidate the cache.
+
+An unchanged fingerprint reuses the cached report without starting the
+validator. When only the contents of existing files inside ``sub-*`` folders
+changed, the validator runs on a temporary symlink view holding the top-level
+files and the changed subjects only, its issues for those subjects replace
+the cached ones and the summary ``size`` is adjusted by the size difference.
+Anything else (top-level files, added/removed/renamed files, other folders,
+or more than half of the subjects) triggers a full run, because dataset-wide
+results such as the legacy ``INCONSISTENT_SUBJECTS`` check, the
+participants.tsv cross-check and the summary counts depend on the file set.
+
+Only the raw report is cached; PRISM's filtering of the issues (placeholders,
+structure-only uploads, PRISM modalities) is applied to it on every run.
+"""
+
+from __future__ import annotations
+
+import copy
+import json
+import os
+import re
+import shutil
+import tempfile
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Iterable, Optional
+
+CACHE_RELATIVE_PATH = Path(".prism") / "bids_validator_cache.json"
+CACHE_ENV_VAR = "PRISM_BIDS_VALIDATOR_CACHE"
+_CACHE_VERSION = 1
+
+#: Re-run the whole dataset once more than this share of subjects changed.
+PARTIAL_RUN_MAX_SHARE = 0.5
+
+
+def cache_enabled() -> bool:
+    """False when ``PRISM_BIDS_VALIDATOR_CACHE`` is set to 0/false/no/off."""
+    value = os.environ.get(CACHE_ENV_VAR, "").strip().lower()
+    return value not in {"0", "false", "no", "off"}
+
+
+def _glob_to_regex(pattern: str) -> str:
+    parts = []
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        if pattern.startswith("**/", i):
+            parts.append("(?:.*/)?")
+            i += 3
+            continue
+        if pattern.startswith("**", i):
+            parts.append(".*")
+            i += 2
+            continue
+        if char == "*":
+            parts.append("[^/]*")
+        elif char == "?":
+            parts.append("[^/]")
+        elif char == "[":
+            end = pattern.find("]", i + 1)
+            if end == -1:
+                parts.append(re.escape(char))
+            else:
+                parts.append("[" + pattern[i + 1 : end].replace("\\", "\\\\") + "]")
+                i = end
+        else:
+            parts.append(re.escape(char))
+        i += 1
+    return "".join(parts)
+
+
+class BidsIgnore:
+    """Matcher for ``.bidsignore`` rules (gitignore syntax, last match wins)."""
+
+    def __init__(self, lines: Iterable[str] = ()) -> None:
+        self._rules: list[tuple[re.Pattern[str], bool, bool]] = []
+        for raw in lines:
+            line = raw.strip()
+            if not line or line.startswith("#"):
+                continue
+            negate = line.startswith("!")
+            if negate:
+                line = line[1:]
+            dir_only = line.endswith("/")
+            line = line.strip("/") if dir_only else line
+            if not line:
+                continue
+            anchored = line.startswith("/") or "/" in line
+            body = _glob_to_regex(line.lstrip("/"))
+            prefix = "^" if anchored else "^(?:.*/)?"
+            self._rules.append((re.compile(prefix + body + "$"), dir_only, negate))
+
+    @classmethod
+    def from_dataset(cls, root_dir: str | Path) -> BidsIgnore:
+        try:
+            text = (Path(root_dir) / ".bidsignore").read_text(encoding="utf-8")
+        except (OSError, UnicodeDecodeError):
+            return cls()
+        return cls(text.splitlines())
+
+    def ignores(self, relpath: str, is_dir: bool = False) -> bool:
+        ignored = False
+        for regex, dir_only, negate in self._rules:
+            if dir_only and not is_dir:
+                continue
+            if regex.match(relpath):
+                ignored = not negate
+        return ignored
+
+
+def _is_path_only(parts: tuple[str, ...], path_only_folders: frozenset[str]) -> bool:
+    """True for files below a PRISM-only datatype folder of a subject/session."""
+    if not path_only_folders or len(parts) < 3 or not parts[0].startswith("sub-"):
+        return False
+    if parts[1].lower() in path_only_folders:
+        return True
+    return (
+        len(parts) >= 4
+        and parts[1].startswith("ses-")
+        and parts[2].lower() in path_only_folders
+    )
+
+
+def dataset_fingerprint(
+    root_dir: str | Path, path_only_folders: Iterable[str] = ()
+) -> dict[str, list[int]]:
+    """Map each validator-visible file (POSIX relpath) to ``[size, mtime_ns]``.
+
+    Broken symlinks (unfetched annex content) map to ``[-1, lstat mtime]``;
+    files below ``path_only_folders`` map to ``[0 or 1, 0]`` (empty or not).
+    """
+    root = os.fspath(root_dir)
+    path_only = frozenset(folder.lower() for folder in path_only_folders)
+    bidsignore = BidsIgnore.from_dataset(root)
+    files: dict[str, list[int]] = {}
+
+    try:
+        stat = os.stat(os.path.join(root, ".bidsignore"))
+        files[".bidsignore"] = [stat.st_size, stat.st_mtime_ns]
+    except OSError:
+        pass
+
+    seen_dirs: set[str] = set()
+    for dirpath, dirnames, filenames in os.walk(root, followlinks=True):
+        real = os.path.realpath(dirpath)
+        if real in seen_dirs:
+            dirnames[:] = []
+            continue
+        seen_dirs.add(real)
+        rel_dir = os.path.relpath(dirpath, root)
+        rel_dir = "" if rel_dir == "." else rel_dir.replace(os.sep, "/") + "/"
+        dirnames[:] = sorted(
+            name
+            for name in dirnames
+            if not name.startswith(".")
+            and not bidsignore.ignores(rel_dir + name, is_dir=True)
+        )
+        for name in filenames:
+            if name.startswith("."):
+                continue
+            relpath = rel_dir + name
+            if bidsignore.ignores(relpath):
+                continue
+            full = os.path.join(dirpath, name)
+            try:
+                stat = os.stat(full)
+                entry = [stat.st_size, stat.st_mtime_ns]
+            except OSError:
+                try:
+                    entry = [-1, os.lstat(full).st_mtime_ns]
+                except OSError:
+                    continue
+            if _is_path_only(tuple(relpath.split("/")), path_only):
+                entry = [1 if entry[0] else 0, 0]
+            files[relpath] = entry
+    return files
+
+
+def _subject_of(relpath: str) -> Optional[str]:
+    head, sep, _rest = relpath.partition("/")
+    return head if sep and head.startswith("sub-") else None
+
+
+def changed_subjects(
+    previous: dict[str, list[int]], current: dict[str, list[int]]
+) -> Optional[set[str]]:
+    """Subjects whose files differ, or None when a change lies outside them.
+
+    Added, removed or renamed files (and so added or removed subjects) count
+    as outside changes: they alter dataset-level results such as the
+    participants.tsv cross-check, subject consistency and summary counts.
+    """
+    if previous.keys() != current.keys():
+        return None
+    changed: set[str] = set()
+    for relpath in current:
+        if previous.get(relpath) == current.get(relpath):
+            continue
+        subject = _subject_of(relpath)
+        if subject is None:
+            return None
+        changed.add(subject)
+    return changed
+
+
+def build_subject_view(
+    root_dir: str | Path,
+    files: Iterable[str],
+    subjects: set[str],
+    view_dir: str | Path,
+) -> None:
+    """Populate ``view_dir`` with symlinks to top-level files and ``subjects``.
+
+    Raises OSError when symlinks cannot be created (e.g. Windows without
+    developer mode); callers fall back to a full run.
+    """
+    root = Path(root_dir).resolve()
+    view = Path(view_dir)
+    for relpath in files:
+        subject = _subject_of(relpath)
+        if "/" in relpath and subject not in subjects:
+            continue
+        target = view / relpath
+        target.parent.mkdir(parents=True, exist_ok=True)
+        os.symlink(root / relpath, target)
+
+
+def _in_subjects(location: Any, subjects: set[str]) -> bool:
+    loc = str(location or "").replace("\\", "/").lstrip("/")
+    return loc.partition("/")[0] in subjects
+
+
+def _deno_issue_list(report: dict) -> list:
+    issues = report.get("issues")
+    if isinstance(issues, dict):
+        return issues.get("issues") or []
+    if isinstance(issues, list):
+        return issues
+    return []
+
+
+def merge_deno_reports(cached: dict, partial: dict, subjects: set[str]) -> dict:
+    """Cached issues outside ``subjects`` plus partial-run issues inside them."""
+    merged = copy.deepcopy(cached)
+    issue_list = [
+        issue
+        for issue in _deno_issue_list(cached)
+        if not _in_subjects(issue.get("location"), subjects)
+    ]
+    issue_list.extend(
+        issue
+        for issue in _deno_issue_list(partial)
+        if _in_subjects(issue.get("location"), subjects)
+    )
+    if isinstance(merged.get("issues"), dict):
+        merged["issues"]["issues"] = issue_list
+        code_messages = merged["issues"].get("codeMessages")
+        partial_issues = partial.get("issues")
+        if isinstance(code_messages, dict) and isinstance(partial_issues, dict):
+            for code, message in (partial_issues.get("codeMessages") or {}).items():
+                code_messages.setdefault(code, message)
+    else:
+        merged["issues"] = issue_list
+    return merged
+
+
+def _legacy_file_path(entry: Any) -> str:
+    file_obj = entry.get("file") if isinstance(entry, dict) else None
+    return str((file_obj or {}).get("relativePath", "") or "")
+
+
+def merge_legacy_reports(cached: dict, partial: dict, subjects: set[str]) -> dict:
+    """Per issue key, cached file entries outside ``subjects`` plus partial
+    ones inside them; file-less (dataset-level) issues come from the cache."""
+    merged = copy.deepcopy(cached)
+    merged_issues = merged.setdefault("issues", {})
+    for issue_type in ("errors", "warnings"):
+        combined: list[dict] = []
+        by_key: dict[Any, dict] = {}
+        for issue in merged_issues.get(issue_type, []):
+            files = issue.get("files")
+            if files:
+                kept = [
+                    f for f in files if not _in_subjects(_legacy_file_path(f), subjects)
+                ]
+                if not kept:
+                    continue
+                issue["files"] = kept
+            combined.append(issue)
+            by_key.setdefault(issue.get("key"), issue)
+        for issue in (partial.get("issues") or {}).get(issue_type, []):
+            fresh = [
+                f
+                for f in issue.get("files") or []
+                if _in_subjects(_legacy_file_path(f), subjects)
+            ]
+            if not fresh:
+                continue
+            existing = by_key.get(issue.get("key"))
+            if existing is not None and existing.get("files"):
+                existing["files"].extend(fresh)
+            else:
+                issue = dict(issue, files=fresh)
+                combined.append(issue)
+                by_key.setdefault(issue.get("key"), issue)
+        merged_issues[issue_type] = combined
+    return merged
+
+
+@dataclass
+class ValidatorRun:
+    """Outcome of :func:`run_validator_cached`, shaped like a CompletedProcess."""
+
+    stdout: str
+    stderr: str
+    returncode: int
+    cache_status: str = "full"  # "hit", "partial", "full" or "disabled"
+    changed_subjects: list[str] = field(default_factory=list)
+
+
+def _load_cache(path: Path) -> dict:
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+    except Exception:
+        return {}
+    if not isinstance(payload, dict) or payload.get("version") != _CACHE_VERSION:
+        return {}
+    entries = payload.get("entries")
+    return entries if isinstance(entries, dict) else {}
+
+
+def _store_cache(path: Path, entries: dict) -> None:
+    payload = {"version": _CACHE_VERSION, "entries": entries}
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(
+            dir=path.parent, prefix=".bids_validator_cache.", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                json.dump(payload, handle, ensure_ascii=False, separators=(",", ":"))
+            os.replace(tmp_name, path)
+        except BaseException:
+            try:
+                os.unlink(tmp_name)
+            except OSError:
+                pass
+            raise
+    except OSError:
+        # Read-only dataset: validation still works, it just is not cached.
+        pass
+
+
+def _adjust_summary_size(
+    report: dict,
+    previous: dict[str, list[int]],
+    current: dict[str, list[int]],
+    path_only_folders: Iterable[str],
+) -> None:
+    """Shift the report's ``summary.size`` by the size change of edited files."""
+    summary = report.get("summary")
+    if not isinstance(summary, dict) or not isinstance(summary.get("size"), int):
+        return
+    path_only = frozenset(folder.lower() for folder in path_only_folders)
+    delta = 0
+    for relpath, entry in current.items():
+        before = previous.get(relpath)
+        if before is None or before == entry or min(before[0], entry[0]) < 0:
+            continue
+        if _is_path_only(tuple(relpath.split("/")), path_only):
+            continue
+        delta += entry[0] - before[0]
+    summary["size"] += delta
+
+
+def _has_errors(report: dict) -> bool:
+    """Whether a (merged) report would make the validator exit non-zero."""
+    if any(
+        str(issue.get("severity", "")).lower() == "error"
+        for issue in _deno_issue_list(report)
+        if isinstance(issue, dict)
+    ):
+        return True
+    issues = report.get("issues")
+    return isinstance(issues, dict) and bool(issues.get("errors"))
+
+
+def _parse_report(stdout: Optional[str]) -> Optional[dict]:
+    if not stdout:
+        return None
+    try:
+        report = json.loads(stdout)
+    except json.JSONDecodeError:
+        return None
+    return report if isinstance(report, dict) else None
+
+
+def run_validator_cached(
+    root_dir: str | Path,
+    backend: str,
+    build_command: Callable[[str], list[str]],
+    run: Callable[[list[str]], Any],
+    merge: Callable[[dict, dict, set[str]], dict],
+    *,
+    use_cache: bool = True,
+    path_only_folders: Iterable[str] = (),
+) -> ValidatorRun:
+    """Run a validator CLI through the result cache.
+
+    Args:
+        root_dir: Dataset root.
+        backend: Cache key identifying the validator and its version; a
+            different backend never reuses another backend's report.
+        build_command: Returns the command validating a given directory.
+        run: Executes a command and returns a CompletedProcess-like object.
+        merge: Combines ``(cached_report, partial_report, subjects)``.
+        use_cache: False runs the validator directly and leaves the cache
+            untouched.
+        path_only_folders: PRISM-only datatype folders whose file contents do
+            not affect the report.
+    """
+    root = os.fspath(root_dir)
+    if not (use_cache and cache_enabled()):
+        process = run(build_command(root))
+        return ValidatorRun(
+            process.stdout, process.stderr, process.returncode, cache_status="disabled"
+        )
+
+    cache_path = Path(root) / CACHE_RELATIVE_PATH
+    path_only_folders = tuple(path_only_folders)
+    files = dataset_fingerprint(root, path_only_folders)
+    entries = _load_cache(cache_path)
+    cached = entries.get(backend)
+    if not isinstance(cached, dict):
+        cached = {}
+    cached_report = cached.get("report")
+
+    if isinstance(cached_report, dict):
+        previous_files = cached.get("files") or {}
+        if previous_files == files:
+            return ValidatorRun(
+                json.dumps(cached_report),
+                cached.get("stderr", ""),
+                int(cached.get("returncode", 0)),
+                cache_status="hit",
+            )
+        subjects = changed_subjects(previous_files, files)
+        all_subjects = {s for s in map(_subject_of, files) if s}
+        if subjects and len(subjects) <= PARTIAL_RUN_MAX_SHARE * len(all_subjects):
+            result = _run_partial(
+                root,
+                files,
+                subjects,
+                build_command,
+                run,
+                merge,
+                cached,
+                path_only_folders,
+            )
+            if result is not None:
+                entries[backend] = {
+                    "files": files,
+                    "report": _parse_report(result.stdout),
+                    "stderr": result.stderr,
+                    "returncode": result.returncode,
+                }
+                _store_cache(cache_path, entries)
+                return result
+
+    process = run(build_command(root))
+    report = _parse_report(process.stdout)
+    if report is not None:
+        entries[backend] = {
+            "files": files,
+            "report": report,
+            "stderr": process.stderr or "",
+            "returncode": process.returncode,
+        }
+        _store_cache(cache_path, entries)
+    return ValidatorRun(process.stdout, process.stderr, process.returncode)
+
+
+def _run_partial(
+    root: str,
+    files: dict[str, list[int]],
+    subjects: set[str],
+    build_command: Callable[[str], list[str]],
+    run: Callable[[list[str]], Any],
+    merge: Callable[[dict, dict, set[str]], dict],
+    cached: dict,
+    path_only_folders: Iterable[str],
+) -> Optional[ValidatorRun]:
+    view_dir = tempfile.mkdtemp(prefix="prism-bids-view-")
+    try:
+        try:
+            build_subject_view(root, files, subjects, view_dir)
+        except OSError:
+            return None
+        process = run(build_command(view_dir))
+        partial = _parse_report(process.stdout)
+        if partial is None:
+            return None
+        merged = merge(cached["report"], partial, subjects)
+        _adjust_summary_size(
+            merged, cached.get("files") or {}, files, path_only_folders
+        )
+        return ValidatorRun(
+            json.dumps(merged),
+            process.stderr or "",
+            1 if _has_errors(merged) else 0,
+            cache_status="partial",
+            changed_subjects=sorted(subjects),
+        )
+    finally:
+        shutil.rmtree(view_dir, ignore_errors=True)
@@ -13,11 +13,15 @@ import pandas as pd
 
 from helpers.physio.convert_varioport import convert_varioport
 from src.converters.wide_to_long import (
+    check_wide_to_long_id_values,
     convert_wide_to_long_dataframe,
     detect_wide_session_prefixes,
     find_empty_data_rows,
     inspect_wide_to_long_columns,
+    prepare_wide_to_long_plan,
+    resolve_wide_to_long_id_column,
     resolve_wide_to_long_id_uniqueness,
+    stream_wide_to_long,
 )
 from src.cross_platform import normalize_path
 from src.entity_rules import load_entity_rules
@@ -346,6 +350,7 @@ def _wide_to_long_json_payload(
     plan: dict[str, Any],
     preview_limit: int,
     long_df: pd.DataFrame | None = None,
+    rows_total: int | None = None,
     output_path: Path | None = None,
     error: str | None = None,
     id_column_checked: str | None = None,
@@ -380,7 +385,9 @@ def _wide_to_long_json_payload(
         preview_df = long_df.head(preview_limit).fillna("").astype(str)
         payload.update(
             {
-                "rows_total": int(len(long_df)),
+                "rows_total": int(
+                    len(long_df) if rows_total is None else rows_total
+                ),
                 "rows_shown": int(len(preview_df)),
                 "columns": list(preview_df.columns),
                 "rows": preview_df.to_dict(orient="records"),
@@ -472,19 +479,48 @@ def cmd_convert_wide_to_long(args) -> None:
         sheet_arg: str | int
         preview_limit = max(1, int(args.preview_limit))
         sheet_arg = int(args.sheet) if str(args.sheet).isdigit() else args.sheet
-        df = _read_wide_to_long_input(input_path, sheet=sheet_arg)
-        id_check = resolve_wide_to_long_id_uniqueness(
-            df,
-            source_format=input_path.suffix.lower(),
-            explicit_id_column=getattr(args, "id_column", None),
+        chunk_rows = getattr(args, "chunk_size", None)
+        output_path = (
+            Path(args.output)
+            if args.output
+            else _default_wide_to_long_output_path(input_path)
         )
-        id_column_checked = str(id_check.get("id_column") or "")
-        id_uniqueness = id_check.get("id_uniqueness") or {}
+        if chunk_rows:
+            # Large CSV/TSV exports: read the header once, then stream row
+            # blocks through a precomputed plan instead of holding the wide
+            # and long tables in memory.
+            if output_path.suffix.lower() not in {".csv", ".tsv"}:
+                raise ValueError("--chunk-size writes .csv or .tsv output only")
+            from src.converters.file_reader import open_tabular_chunks
+
+            df = None
+            chunks = open_tabular_chunks(input_path, chunk_rows=chunk_rows)
+            columns = chunks.columns
+            id_column_checked, _id_resolution = resolve_wide_to_long_id_column(
+                columns,
+                source_format=input_path.suffix.lower(),
+                explicit_id_column=getattr(args, "id_column", None),
+            )
+            id_uniqueness = check_wide_to_long_id_values(
+                pd.concat(
+                    list(chunks.iter_chunks(columns=[id_column_checked])),
+                    ignore_index=True,
+                ),
+                id_column=id_column_checked,
+            )
+        else:
+            df = _read_wide_to_long_input(input_path, sheet=sheet_arg)
+            columns = [str(column) for column in df.columns]
+            id_check = resolve_wide_to_long_id_uniqueness(
+                df,
+                source_format=input_path.suffix.lower(),
+                explicit_id_column=getattr(args, "id_column", None),
+            )
+            id_column_checked = str(id_check.get("id_column") or "")
+            id_uniqueness = id_check.get("id_uniqueness") or {}
 
         indicators = _parse_session_indicators(args.session_indicators)
-        indicators = indicators or detect_wide_session_prefixes(
-            list(df.columns), min_count=2
-        )
+        indicators = indicators or detect_wide_session_prefixes(columns, min_count=2)
         if not indicators:
             raise ValueError(
                 "No session-coded columns detected. Provide --session-indicators like T1_,T2_,T3_ "
@@ -492,24 +528,46 @@ def cmd_convert_wide_to_long(args) -> None:
             )
 
         session_value_map = _parse_session_value_map(args.session_map)
-        plan = inspect_wide_to_long_columns(
-            list(df.columns), session_indicators=indicators
-        )
+        plan = inspect_wide_to_long_columns(columns, session_indicators=indicators)
         can_convert = not bool(plan["ambiguous_columns"])
-
-        data_columns = list(plan.get("rename_map") or {})
-        empty_data_rows = find_empty_data_rows(
-            df, id_column=id_column_checked, data_columns=data_columns
-        )
         drop_empty_rows = bool(getattr(args, "drop_empty_rows", False))
-        if drop_empty_rows and empty_data_rows:
-            df = df.drop(
-                index=[row["row_index"] for row in empty_data_rows], errors="ignore"
+        prepared = None
+        if chunk_rows and can_convert:
+            prepared = prepare_wide_to_long_plan(
+                columns,
+                session_indicators=indicators,
+                session_column_name=args.session_column,
+                session_value_map=session_value_map,
+                session_plan=plan,
             )
 
+        empty_data_rows: list[dict[str, Any]] = []
+        if df is not None:
+            data_columns = list(plan.get("rename_map") or {})
+            empty_data_rows = find_empty_data_rows(
+                df, id_column=id_column_checked, data_columns=data_columns
+            )
+            if drop_empty_rows and empty_data_rows:
+                df = df.drop(
+                    index=[row["row_index"] for row in empty_data_rows],
+                    errors="ignore",
+                )
+
         if args.inspect_only:
             long_df = None
-            if can_convert:
+            rows_total = None
+            if prepared is not None:
+                streamed = stream_wide_to_long(
+                    chunks,
+                    prepared,
+                    id_column=id_column_checked,
+                    drop_empty_rows=drop_empty_rows,
+                    preview_rows=preview_limit,
+                )
+                long_df = streamed["preview"]
+                rows_total = streamed["rows_out"]
+                empty_data_rows = streamed["empty_data_rows"]
+            elif can_convert and df is not None:
                 long_df = convert_wide_to_long_dataframe(
                     df,
                     session_indicators=indicators,
@@ -526,6 +584,7 @@ def cmd_convert_wide_to_long(args) -> None:
                             plan=plan,
                             preview_limit=preview_limit,
                             long_df=long_df,
+                            rows_total=rows_total,
                             id_column_checked=id_column_checked,
                             id_uniqueness=id_uniqueness,
                             empty_data_rows=empty_data_rows,
@@ -567,11 +626,6 @@ def cmd_convert_wide_to_long(args) -> None:
                 print(f"ID uniqueness check passed for column: {id_column_checked}")
             sys.exit(2)
 
-        output_path = (
-            Path(args.output)
-            if args.output
-            else _default_wide_to_long_output_path(input_path)
-        )
         if output_path.exists() and not args.force:
             message = (
                 f"Output file '{normalize_path(output_path)}' already exists. "
@@ -597,13 +651,29 @@ def cmd_convert_wide_to_long(args) -> None:
             sys.exit(1)
 
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        long_df = convert_wide_to_long_dataframe(
-            df,
-            session_indicators=indicators,
-            session_column_name=args.session_column,
-            session_value_map=session_value_map,
-        )
-        _write_wide_to_long_output(long_df, output_path)
+        if prepared is not None:
+            streamed = stream_wide_to_long(
+                chunks,
+                prepared,
+                id_column=id_column_checked,
+                output_path=output_path,
+                separator="\t" if output_path.suffix.lower() == ".tsv" else ",",
+                drop_empty_rows=drop_empty_rows,
+                preview_rows=preview_limit,
+            )
+            long_df = streamed["preview"]
+            rows_in, rows_out = streamed["rows_in"], streamed["rows_out"]
+            empty_data_rows = streamed["empty_data_rows"]
+        else:
+            assert df is not None  # streaming runs always have a prepared plan
+            long_df = convert_wide_to_long_dataframe(
+                df,
+                session_indicators=indicators,
+                session_column_name=args.session_column,
+                session_value_map=session_value_map,
+            )
+            _write_wide_to_long_output(long_df, output_path)
+            rows_in, rows_out = len(df), len(long_df)
 
         if args.json:
             print(
@@ -614,6 +684,7 @@ def cmd_convert_wide_to_long(args) -> None:
                         plan=plan,
                         preview_limit=preview_limit,
                         long_df=long_df,
+                        rows_total=rows_out,
                         output_path=output_path,
                         id_column_checked=id_column_checked,
                         id_uniqueness=id_uniqueness,
@@ -631,8 +702,8 @@ def cmd_convert_wide_to_long(args) -> None:
 
         print("\nConversion complete")
         print("=" * 50)
-        print(f"Input rows: {len(df)}")
-        print(f"Output rows: {len(long_df)}")
+        print(f"Input rows: {rows_in}")
+        print(f"Output rows: {rows_out}")
         print(f"Output columns: {len(long_df.columns)}")
         print(f"Wrote: {normalize_path(output_path)}")
     except ValueError as exc:
@@ -0,0 +1,78 @@
+"""Worker-daemon prism_tools command handlers (start/stop/status)."""
+
+from __future__ import annotations
+
+import sys
+import time
+from pathlib import Path
+
+from src.cli.daemon import (
+    DaemonUnavailable,
+    daemon_supported,
+    default_socket_path,
+    request,
+    run_daemon,
+    start_background_daemon,
+)
+
+
+def _socket_path(args) -> Path:
+    socket_arg = getattr(args, "socket", None)
+    return Path(socket_arg) if socket_arg else default_socket_path()
+
+
+def _require_support() -> None:
+    if not daemon_supported():
+        print("Error: the worker daemon needs Unix domain sockets.")
+        sys.exit(1)
+
+
+def cmd_daemon_start(args) -> None:
+    """Start the worker daemon (detached unless --foreground)."""
+    _require_support()
+    socket_path = _socket_path(args)
+    if getattr(args, "foreground", False):
+        run_daemon(socket_path)
+        return
+    try:
+        info = start_background_daemon(socket_path)
+    except DaemonUnavailable as error:
+        print(f"Error: {error}")
+        sys.exit(1)
+    print(f"✅ PRISM daemon running (pid {info['pid']}) on {socket_path}")
+    if socket_path != default_socket_path():
+        print(
+            f"   Export PRISM_DAEMON_SOCKET={socket_path} so prism.py and "
+            "prism_tools.py forward their jobs to it."
+        )
+
+
+def cmd_daemon_stop(args) -> None:
+    """Ask a running daemon to shut down."""
+    _require_support()
+    socket_path = _socket_path(args)
+    try:
+        request({"op": "shutdown"}, socket_path)
+    except (DaemonUnavailable, OSError):
+        print(f"No PRISM daemon running on {socket_path}")
+        return
+    deadline = time.monotonic() + 5.0
+    while socket_path.exists() and time.monotonic() < deadline:
+        time.sleep(0.05)
+    print(f"✅ PRISM daemon on {socket_path} stopped")
+
+
+def cmd_daemon_status(args) -> None:
+    """Report whether a daemon is running and how many jobs it served."""
+    _require_support()
+    socket_path = _socket_path(args)
+    try:
+        info = request({"op": "ping"}, socket_path)
+    except (DaemonUnavailable, OSError):
+        print(f"No PRISM daemon running on {socket_path}")
+        sys.exit(1)
+    uptime = time.time() - float(info.get("started_at") or time.time())
+    print(
+        f"PRISM daemon running on {socket_path}: pid {info.get('pid')}, "
+        f"{info.get('jobs', 0)} job(s), up {uptime:.0f}s"
+    )
@@ -35,6 +35,8 @@ def run_recipes_job(
     anonymized: bool = False,
     missing_policy: str = "system-missing",
     missing_numeric_value: float | None = None,
+    max_workers: int | None = None,
+    incremental: bool = False,
 ):
     """Run recipe computation using the same adapter path as prism_tools CLI."""
     return compute_survey_recipes(
@@ -54,6 +56,8 @@ def run_recipes_job(
         anonymized=anonymized,
         missing_policy=missing_policy,
         missing_numeric_value=missing_numeric_value,
+        max_workers=max_workers,
+        incremental=incremental,
     )
 
 
@@ -155,10 +159,16 @@ def cmd_recipes_surveys(args):
             anonymized=anonymized,
             missing_policy=missing_policy,
             missing_numeric_value=missing_numeric_value,
+            max_workers=getattr(args, "workers", None),
+            incremental=bool(getattr(args, "incremental", False)),
         )
         print(
             f"✅ Survey recipe scoring complete: {result.written_files} file(s) written"
         )
+        if result.up_to_date_recipe_ids:
+            print(
+                f"   Up to date (skipped): {', '.join(result.up_to_date_recipe_ids)}"
+            )
         _run_anonymization_if_requested(args, prism_root=prism_root, result=result)
         if result.flat_out_path:
             print(f"   Flat output: {result.flat_out_path}")
@@ -255,10 +265,16 @@ def cmd_recipes_biometrics(args):
             anonymized=anonymized,
             missing_policy=missing_policy,
             missing_numeric_value=missing_numeric_value,
+            max_workers=getattr(args, "workers", None),
+            incremental=bool(getattr(args, "incremental", False)),
         )
         print(
             f"✅ Biometric recipe scoring complete: {result.written_files} file(s) written"
         )
+        if result.up_to_date_recipe_ids:
+            print(
+                f"   Up to date (skipped): {', '.join(result.up_to_date_recipe_ids)}"
+            )
         _run_anonymization_if_requested(args, prism_root=prism_root, result=result)
         if result.flat_out_path:
             print(f"   Flat output: {result.flat_out_path}")
@@ -0,0 +1,700 @@
+"""Opt-in worker daemon for batch ``prism.py`` / ``prism_tools.py`` runs.
+
+Pipelines that call the CLIs hundreds of times pay interpreter start-up,
+pandas/jsonschema imports, schema loading and template-library parsing on
+every call. ``prism_tools.py daemon start`` keeps one warm interpreter
+listening on a Unix socket; while it is running, both CLIs forward their
+argv, working directory and ``PATH``/``PRISM_*`` environment variables to it
+and stream its stdout/stderr and exit code back. Without a reachable daemon
+they run in-process exactly as before.
+
+The socket directory and the socket must belong to the current user and
+grant no group/other permissions. The client checks both with ``lstat``
+before connecting and runs in-process otherwise; the daemon refuses to
+listen on a path that fails the same check.
+
+Jobs run one at a time in the daemon process with ``runpy``, so module
+imports, compiled schema validators and the stat-fingerprinted template
+library cache stay warm between jobs. A separate thread accepts connections:
+while a job is running, further jobs are answered with ``{"busy": true}`` and
+their clients run in-process, so parallel invocations never queue behind a
+long job. When a job reads stdin (e.g. an ``input()`` confirmation), the
+daemon asks the client for one line of its own stdin. Before each job the
+daemon stats the
+source files of every loaded module and the ``app/schemas`` tree; if any of
+them changed, the job is refused (the client runs it in-process) and the
+daemon re-executes itself so module-level state derived from code or schemas
+is rebuilt.
+
+Protocol: newline-delimited JSON over ``AF_UNIX``. The client sends one
+request (``{"op": "run" | "ping" | "shutdown", ...}``); for ``run`` the
+daemon answers with ``{"stream": "stdout" | "stderr", "data": ...}`` frames
+between ``{"accepted": true}`` and ``{"exit": code}``, or refuses the job
+with ``{"stale": true}`` or ``{"busy": true}``. A ``{"read": "stdin"}`` frame
+asks the client to reply ``{"stdin": line}`` (``""`` at end of input).
+
+This module only imports the standard library so the client side costs
+nothing for CLIs that never use the daemon.
+"""
+
+from __future__ import annotations
+
+import io
+import json
+import os
+import queue
+import runpy
+import socket
+import stat
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import traceback
+from pathlib import Path
+from typing import Any, Callable, Iterable, Mapping, TextIO
+
+APP_ROOT = Path(__file__).resolve().parents[2]
+PROGRAMS = {
+    "prism": APP_ROOT / "prism.py",
+    "prism_tools": APP_ROOT / "prism_tools.py",
+}
+SCHEMA_DIR = APP_ROOT / "schemas"
+
+SOCKET_ENV_VAR = "PRISM_DAEMON_SOCKET"
+# Set inside daemon jobs (and by callers that must never be forwarded).
+DISABLE_ENV_VAR = "PRISM_DAEMON_DISABLE"
+# Only these variables travel with a job; everything else comes from the
+# daemon's own environment.
+FORWARDED_ENV_VARS = frozenset({"PATH"})
+FORWARDED_ENV_PREFIX = "PRISM_"
+
+_START_TIMEOUT_SECONDS = 30.0
+# Longest a client waits for the daemon to accept or refuse a job; started
+# jobs may then run for as long as they need.
+_ACCEPT_TIMEOUT_SECONDS = 5.0
+
+
+class DaemonUnavailable(RuntimeError):
+    """No daemon is listening on the socket, or it declined the job."""
+
+
+def default_socket_path() -> Path:
+    """Per-user socket path: ``$PRISM_DAEMON_SOCKET`` or a 0700 temp folder."""
+    configured = os.environ.get(SOCKET_ENV_VAR)
+    if configured:
+        return Path(configured)
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir and os.path.isdir(runtime_dir):
+        return Path(runtime_dir) / "prism" / "daemon.sock"
+    uid = os.getuid() if hasattr(os, "getuid") else 0
+    return Path(tempfile.gettempdir()) / f"prism-{uid}" / "daemon.sock"
+
+
+def daemon_supported() -> bool:
+    # Ownership checks need POSIX uids as well as Unix domain sockets.
+    return hasattr(socket, "AF_UNIX") and hasattr(os, "getuid")
+
+
+def _is_forwarded(name: str) -> bool:
+    return name in FORWARDED_ENV_VARS or name.startswith(FORWARDED_ENV_PREFIX)
+
+
+def forwarded_env(environ: Mapping[str, str]) -> dict[str, str]:
+    """Return the subset of *environ* that is sent along with a job."""
+    return {name: value for name, value in environ.items() if _is_forwarded(name)}
+
+
+def _require_private(path: Path, kind: int) -> None:
+    """Raise :class:`DaemonUnavailable` unless *path* is private to this user.
+
+    *path* must be of file type *kind* (checked with ``lstat``, so symlinks
+    are rejected), owned by the current user and without group/other bits.
+    """
+    try:
+        info = os.lstat(path)
+    except OSError as exc:
+        raise DaemonUnavailable(f"Cannot stat {path}: {exc}") from exc
+    if stat.S_IFMT(info.st_mode) != kind:
+        raise DaemonUnavailable(f"Unexpected file type at {path}")
+    if info.st_uid != os.getuid() or info.st_mode & 0o077:
+        raise DaemonUnavailable(
+            f"{path} must be owned by the current user and not accessible "
+            "to group or others"
+        )
+
+
+def verify_socket_path(socket_path: Path) -> None:
+    """Check that the socket and its directory belong only to this user."""
+    _require_private(socket_path.parent, stat.S_IFDIR)
+    _require_private(socket_path, stat.S_IFSOCK)
+
+
+# ---------------------------------------------------------------------------
+# Client
+# ---------------------------------------------------------------------------
+
+
+def _connect(socket_path: Path, timeout: float | None = None) -> socket.socket:
+    if not daemon_supported() or not socket_path.exists():
+        raise DaemonUnavailable(f"No daemon socket at {socket_path}")
+    verify_socket_path(socket_path)
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(timeout)
+    try:
+        sock.connect(str(socket_path))
+    except OSError as exc:
+        sock.close()
+        raise DaemonUnavailable(f"Daemon at {socket_path} is not running") from exc
+    return sock
+
+
+def _send(sock: socket.socket, message: dict[str, Any]) -> None:
+    sock.sendall(json.dumps(message).encode("utf-8") + b"\n")
+
+
+def _frames(sock: socket.socket) -> Iterable[dict[str, Any]]:
+    with sock.makefile("r", encoding="utf-8", newline="\n") as reader:
+        for line in reader:
+            if line.strip():
+                yield json.loads(line)
+
+
+def request(
+    message: dict[str, Any],
+    socket_path: Path | None = None,
+    timeout: float | None = 5.0,
+) -> dict[str, Any]:
+    """Send a control request (``ping``/``shutdown``) and return the reply."""
+    with _connect(socket_path or default_socket_path(), timeout) as sock:
+        _send(sock, message)
+        for frame in _frames(sock):
+            return frame
+    raise DaemonUnavailable("Daemon closed the connection without replying")
+
+
+def _read_line(stream: TextIO | None) -> str:
+    if stream is None:
+        return ""
+    try:
+        return stream.readline()
+    except (OSError, ValueError):
+        return ""
+
+
+def submit(
+    program: str,
+    argv: list[str],
+    *,
+    socket_path: Path | None = None,
+    stdin: TextIO | None = None,
+    stdout: TextIO | None = None,
+    stderr: TextIO | None = None,
+) -> int:
+    """Run *program* with *argv* in the daemon, streaming its output.
+
+    Lines the job reads from stdin are read from *stdin* on request. Raises
+    :class:`DaemonUnavailable` when no daemon is reachable or it refuses the
+    job (its code is stale or it is busy with another job). Once the daemon
+    has accepted the job, a lost connection is reported as exit code 1
+    instead.
+    """
+    stdin = stdin or sys.stdin
+    stdout = stdout or sys.stdout
+    stderr = stderr or sys.stderr
+    path = socket_path or default_socket_path()
+    with _connect(path, timeout=_ACCEPT_TIMEOUT_SECONDS) as sock:
+        _send(
+            sock,
+            {
+                "op": "run",
+                "program": program,
+                "argv": list(argv),
+                "cwd": os.getcwd(),
+                "env": forwarded_env(os.environ),
+            },
+        )
+        accepted = False
+        try:
+            for frame in _frames(sock):
+                if "stream" in frame:
+                    target = stdout if frame["stream"] == "stdout" else stderr
+                    target.write(frame.get("data", ""))
+                    target.flush()
+                elif frame.get("read") == "stdin":
+                    _send(sock, {"stdin": _read_line(stdin)})
+                elif "exit" in frame:
+                    return int(frame["exit"])
+                elif frame.get("accepted"):
+                    accepted = True
+                    sock.settimeout(None)
+                elif frame.get("busy"):
+                    raise DaemonUnavailable("Daemon is busy with another job")
+                elif frame.get("stale") or frame.get("error"):
+                    raise DaemonUnavailable(str(frame.get("error") or "stale daemon"))
+        except (OSError, ValueError) as exc:
+            if not accepted:
+                raise DaemonUnavailable(str(exc)) from exc
+    if not accepted:
+        raise DaemonUnavailable("Daemon closed the connection before the job started")
+    # The job may have had side effects already; never re-run it in-process.
+    stderr.write("Error: the PRISM daemon stopped before the job finished.\n")
+    return 1
+
+
+def run_via_daemon(program: str, argv: list[str]) -> int | None:
+    """Exit code of *argv* run in the daemon, or None to run in-process.
+
+    Called first thing by ``prism.py`` and ``prism_tools.py``. Returns None
+    when the daemon is disabled, not running, or declined the job.
+    """
+    if os.environ.get(DISABLE_ENV_VAR) or not daemon_supported():
+        return None
+    if program == "prism_tools" and argv[:1] == ["daemon"]:
+        return None
+    try:
+        return submit(program, argv)
+    except DaemonUnavailable:
+        return None
+
+
+# ---------------------------------------------------------------------------
+# Server
+# ---------------------------------------------------------------------------
+
+
+class FileChangeWatcher:
+    """Report which watched files changed since the previous check.
+
+    Files are fingerprinted by ``(mtime_ns, size)``; new and deleted files
+    under a watched directory count as changes. Files returned by *files*
+    (e.g. the sources of loaded modules) are fingerprinted when first seen.
+    """
+
+    def __init__(
+        self,
+        directories: Iterable[Path] = (),
+        files: Callable[[], Iterable[str]] | None = None,
+    ):
+        self._directories = [Path(d) for d in directories]
+        self._files = files
+        self._seen: dict[str, tuple[int, int] | None] = {}
+        self._listing = self._list_directories()
+        for path in self._listing:
+            self._seen[path] = self._fingerprint(path)
+
+    def _list_directories(self) -> frozenset[str]:
+        found: set[str] = set()
+        for directory in self._directories:
+            for root, _dirs, names in os.walk(directory):
+                found.update(os.path.join(root, name) for name in names)
+        return frozenset(found)
+
+    @staticmethod
+    def _fingerprint(path: str) -> tuple[int, int] | None:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def changed(self) -> list[str]:
+        """Return the paths that changed since the last call (sorted)."""
+        listing = self._list_directories()
+        changed = set(listing.symmetric_difference(self._listing))
+        self._listing = listing
+        paths = set(listing)
+        if self._files is not None:
+            paths.update(self._files())
+        for path in paths:
+            fingerprint = self._fingerprint(path)
+            if path not in self._seen:
+                self._seen[path] = fingerprint
+            elif self._seen[path] != fingerprint:
+                self._seen[path] = fingerprint
+                changed.add(path)
+        return sorted(changed)
+
+
+def _loaded_module_files() -> list[str]:
+    files = []
+    for module in list(sys.modules.values()):
+        path = getattr(module, "__file__", None)
+        if path and path.endswith(".py"):
+            files.append(path)
+    return files
+
+
+class _FrameWriter(io.TextIOBase):
+    """``sys.stdout``/``sys.stderr`` replacement that streams to the client."""
+
+    def __init__(self, send: Callable[[dict[str, Any]], None], stream: str):
+        self._send = send
+        self._stream = stream
+
+    @property
+    def encoding(self) -> str:  # type: ignore[override]
+        return "utf-8"
+
+    def writable(self) -> bool:
+        return True
+
+    def isatty(self) -> bool:
+        return False
+
+    def write(self, text: str) -> int:
+        if text:
+            self._send({"stream": self._stream, "data": text})
+        return len(text)
+
+
+class _StdinReader(io.TextIOBase):
+    """``sys.stdin`` replacement that reads lines from the client's stdin."""
+
+    def __init__(self, send: Callable[[dict[str, Any]], None], reader: TextIO):
+        self._send = send
+        self._reader = reader
+
+    def readable(self) -> bool:
+        return True
+
+    def isatty(self) -> bool:
+        return False
+
+    def readline(self, size: int | None = -1) -> str:  # type: ignore[override]
+        self._send({"read": "stdin"})
+        reply = self._reader.readline()
+        if not reply:
+            return ""
+        return str(json.loads(reply).get("stdin") or "")
+
+    def read(self, size: int | None = -1) -> str:
+        lines = []
+        while line := self.readline():
+            lines.append(line)
+        return "".join(lines)
+
+
+def _exit_code(exc: SystemExit) -> int:
+    if exc.code is None:
+        return 0
+    if isinstance(exc.code, int):
+        return exc.code
+    print(exc.code, file=sys.stderr)
+    return 1
+
+
+class WorkerDaemon:
+    """Serve ``run``/``ping``/``shutdown`` requests on a Unix socket."""
+
+    def __init__(
+        self, socket_path: Path, *, watch_dirs: Iterable[Path] = (SCHEMA_DIR,)
+    ):
+        self.socket_path = Path(socket_path)
+        self.started_at = time.time()
+        self.jobs = 0
+        self._watcher = FileChangeWatcher(watch_dirs, _loaded_module_files)
+        self._stop = threading.Event()
+        self._restart = False
+        # Held from the moment a job is accepted until it has finished.
+        self._lock = threading.Lock()
+        self._jobs: queue.Queue[tuple[socket.socket, TextIO, dict[str, Any]]] = (
+            queue.Queue()
+        )
+        self._listener: socket.socket | None = None
+
+    def bind(self) -> None:
+        directory = self.socket_path.parent
+        directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+        try:
+            _require_private(directory, stat.S_IFDIR)
+        except DaemonUnavailable as exc:
+            raise RuntimeError(f"Refusing to listen on {self.socket_path}: {exc}")
+        try:
+            _connect(self.socket_path, timeout=1.0).close()
+        except DaemonUnavailable:
+            pass
+        else:
+            raise RuntimeError(f"A daemon is already listening on {self.socket_path}")
+        try:
+            self.socket_path.unlink()
+        except FileNotFoundError:
+            pass
+        listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        previous_umask = os.umask(0o177)
+        try:
+            listener.bind(str(self.socket_path))
+        finally:
+            os.umask(previous_umask)
+        try:
+            verify_socket_path(self.socket_path)
+        except DaemonUnavailable as exc:
+            listener.close()
+            raise RuntimeError(f"Refusing to listen on {self.socket_path}: {exc}")
+        listener.listen(16)
+        listener.settimeout(0.5)
+        self._listener = listener
+
+    def warm_up(self) -> None:
+        """Import both CLIs' modules so the first job is already warm."""
+        with _silenced():
+            for program in PROGRAMS:
+                self._execute(
+                    program, ["--help"], os.getcwd(), forwarded_env(os.environ)
+                )
+            from src.cli.dispatch import COMMAND_HANDLERS, resolve_command_handler
+
+            for target in COMMAND_HANDLERS.values():
+                try:
+                    resolve_command_handler(target)
+                except Exception:
+                    continue
+        self._watcher.changed()
+
+    def serve_forever(self) -> bool:
+        """Serve until shut down; return True when a restart was requested.
+
+        Jobs run on the calling thread; connections are accepted on a
+        helper thread so pings and busy replies never wait for a job.
+        """
+        if self._listener is None:
+            self.bind()
+        assert self._listener is not None
+        acceptor = threading.Thread(
+            target=self._accept_loop, name="prism-daemon-accept", daemon=True
+        )
+        acceptor.start()
+        try:
+            while not self._stop.is_set():
+                try:
+                    conn, reader, message = self._jobs.get(timeout=0.5)
+                except queue.Empty:
+                    continue
+                self._serve_job(conn, reader, message)
+        finally:
+            self._stop.set()
+            acceptor.join()
+            self._listener.close()
+            try:
+                self.socket_path.unlink()
+            except OSError:
+                pass
+            # Jobs accepted while shutting down run in-process instead.
+            while not self._jobs.empty():
+                conn, reader, _message = self._jobs.get_nowait()
+                self._refuse(conn, reader, {"busy": True})
+        return self._restart
+
+    def _accept_loop(self) -> None:
+        assert self._listener is not None
+        while not self._stop.is_set():
+            try:
+                conn, _ = self._listener.accept()
+            except socket.timeout:
+                continue
+            except OSError:
+                return
+            try:
+                self._handle(conn)
+            except (OSError, ValueError):
+                conn.close()
+
+    def _handle(self, conn: socket.socket) -> None:
+        conn.settimeout(_ACCEPT_TIMEOUT_SECONDS)
+        reader = conn.makefile("r", encoding="utf-8", newline="\n")
+        message = json.loads(reader.readline() or "{}")
+        op = message.get("op")
+        if op == "run":
+            program = str(message.get("program") or "")
+            if program not in PROGRAMS:
+                self._refuse(conn, reader, {"error": f"Unknown program: {program!r}"})
+            elif not self._lock.acquire(blocking=False):
+                self._refuse(conn, reader, {"busy": True})
+            else:
+                conn.settimeout(None)
+                self._jobs.put((conn, reader, message))
+            return
+        if op == "ping":
+            reply: dict[str, Any] = {
+                "pid": os.getpid(),
+                "started_at": self.started_at,
+                "jobs": self.jobs,
+                "busy": self._lock.locked(),
+                "socket": str(self.socket_path),
+            }
+        elif op == "shutdown":
+            self._stop.set()
+            reply = {"ok": True}
+        else:
+            reply = {"error": f"Unknown request: {op!r}"}
+        self._refuse(conn, reader, reply)
+
+    @staticmethod
+    def _refuse(conn: socket.socket, reader: TextIO, reply: dict[str, Any]) -> None:
+        """Send a single *reply* and close the connection."""
+        with conn, reader:
+            try:
+                _send(conn, reply)
+            except OSError:
+                pass
+
+    def _serve_job(
+        self, conn: socket.socket, reader: TextIO, message: dict[str, Any]
+    ) -> None:
+        def send(frame: dict[str, Any]) -> None:
+            conn.sendall(json.dumps(frame).encode("utf-8") + b"\n")
+
+        try:
+            with conn, reader:
+                try:
+                    code = self._run(message, send, reader)
+                finally:
+                    # Free the daemon before reporting the exit code, so a
+                    # client starting its next job right away is not refused.
+                    self._lock.release()
+                if code is not None:
+                    send({"exit": code})
+        except (OSError, ValueError):
+            pass
+
+    def _run(
+        self,
+        message: dict[str, Any],
+        send: Callable[[dict], None],
+        reader: TextIO,
+    ) -> int | None:
+        changed = self._watcher.changed()
+        if changed:
+            self._restart = True
+            self._stop.set()
+            send({"stale": True, "changed": changed[:20]})
+            return None
+        self.jobs += 1
+        send({"accepted": True})
+        return self._execute(
+            str(message.get("program")),
+            [str(arg) for arg in message.get("argv") or []],
+            str(message.get("cwd") or os.getcwd()),
+            forwarded_env(dict(message.get("env") or {})),
+            send,
+            reader,
+        )
+
+    def _execute(
+        self,
+        program: str,
+        argv: list[str],
+        cwd: str,
+        env: dict[str, str],
+        send: Callable[[dict], None] | None = None,
+        reader: TextIO | None = None,
+    ) -> int:
+        """Run one CLI invocation in this process and restore global state.
+
+        The job sees the daemon's environment with its ``PATH``/``PRISM_*``
+        variables replaced by the forwarded *env*. Output is streamed with
+        *send*, and stdin reads are answered by the client through *reader*.
+        """
+        script = str(PROGRAMS[program])
+        saved_argv, saved_path = sys.argv[:], sys.path[:]
+        saved_env, saved_cwd = dict(os.environ), os.getcwd()
+        saved_streams = sys.stdin, sys.stdout, sys.stderr
+        os.environ.clear()
+        os.environ.update(
+            {
+                name: value
+                for name, value in saved_env.items()
+                if not _is_forwarded(name)
+            }
+        )
+        os.environ.update(env)
+        os.environ[DISABLE_ENV_VAR] = "1"
+        sys.argv = [script, *argv]
+        sys.path.insert(0, str(APP_ROOT))
+        sys.stdin = io.StringIO("")
+        if send is not None:
+            if reader is not None:
+                sys.stdin = _StdinReader(send, reader)
+            sys.stdout = _FrameWriter(send, "stdout")
+            sys.stderr = _FrameWriter(send, "stderr")
+        try:
+            os.chdir(cwd)
+            runpy.run_path(script, run_name="__main__")
+            return 0
+        except SystemExit as exc:
+            return _exit_code(exc)
+        except BaseException:
+            traceback.print_exc()
+            return 1
+        finally:
+            sys.stdin, sys.stdout, sys.stderr = saved_streams
+            sys.argv, sys.path[:] = saved_argv, saved_path
+            os.environ.clear()
+            os.environ.update(saved_env)
+            os.chdir(saved_cwd)
+
+
+class _silenced:
+    def __enter__(self):
+        self._streams = sys.stdout, sys.stderr
+        sys.stdout = sys.stderr = io.StringIO()
+
+    def __exit__(self, *exc_info):
+        sys.stdout, sys.stderr = self._streams
+
+
+def run_daemon(socket_path: Path | None = None) -> None:
+    """Run the daemon in the foreground; re-exec itself when code is stale."""
+    daemon = WorkerDaemon(socket_path or default_socket_path())
+    daemon.bind()
+    daemon.warm_up()
+    print(f"PRISM daemon listening on {daemon.socket_path} (pid {os.getpid()})")
+    sys.stdout.flush()
+    if daemon.serve_forever():
+        print("Sources or schemas changed; restarting daemon.")
+        sys.stdout.flush()
+        # Re-executes this same interpreter with its own argv (no shell, no
+        # client input), so module state is rebuilt from the changed sources.
+        os.execv(sys.executable, [sys.executable, *sys.argv])  # noqa: S606
+
+
+def start_background_daemon(
+    socket_path: Path | None = None, log_path: Path | None = None
+) -> dict[str, Any]:
+    """Spawn a detached foreground daemon and wait until it answers."""
+    socket_path = Path(socket_path or default_socket_path())
+    try:
+        return request({"op": "ping"}, socket_path)
+    except (DaemonUnavailable, OSError):
+        pass
+    log_path = Path(log_path or socket_path.with_suffix(".log"))
+    log_path.parent.mkdir(parents=True, exist_ok=True)
+    env = dict(os.environ)
+    env.pop(DISABLE_ENV_VAR, None)
+    with open(log_path, "ab") as log:
+        subprocess.Popen(
+            [
+                sys.executable,
+                str(PROGRAMS["prism_tools"]),
+                "daemon",
+                "start",
+                "--foreground",
+                "--socket",
+                str(socket_path),
+            ],
+            stdin=subprocess.DEVNULL,
+            stdout=log,
+            stderr=subprocess.STDOUT,
+            start_new_session=True,
+            env=env,
+        )
+    deadline = time.monotonic() + _START_TIMEOUT_SECONDS
+    while time.monotonic() < deadline:
+        try:
+            return request({"op": "ping"}, socket_path)
+        except (DaemonUnavailable, OSError, ValueError):
+            time.sleep(0.1)
+    raise DaemonUnavailable(
+        f"Daemon did not start within {_START_TIMEOUT_SECONDS:.0f}s; see {log_path}"
+    )
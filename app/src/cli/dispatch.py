@@ -2,22 +2,111 @@
 
 This module provides a central dispatch function. Command registration is
 introduced incrementally as handlers are extracted from app/prism_tools.py.
+
+Handlers are registered as ``"module:function"`` strings in
+:data:`COMMAND_HANDLERS` and imported only when their command runs, so
+``--help`` and argument parsing never import pandas, the converters, or any
+other handler module.
 """
 
 from __future__ import annotations
 
+import importlib
 from argparse import ArgumentParser, Namespace
-from typing import Callable, Mapping
+from typing import Callable, Iterator, Mapping
 
 CommandHandler = Callable[[Namespace], None]
 
+COMMAND_HANDLERS: dict[str, str] = {
+    "anonymize": "src.cli.commands.anonymize:cmd_anonymize",
+    "template_export": "src.cli.commands.template_export:cmd_template_export",
+    "convert_physio": "src.cli.commands.convert:cmd_convert_physio",
+    "wide_to_long": "src.cli.commands.convert:cmd_convert_wide_to_long",
+    "demo_create": "src.cli.entrypoint:cmd_demo_create",
+    "survey_import_excel": "src.cli.commands.survey:cmd_survey_import_excel",
+    "survey_convert": "src.cli.commands.survey:cmd_survey_convert",
+    "survey_validate": "src.cli.commands.survey:cmd_survey_validate",
+    "survey_export_lss": "src.cli.commands.survey:cmd_survey_export_lss",
+    "survey_export_lss_customized": "src.cli.commands.survey:cmd_survey_export_lss_customized",
+    "survey_export_questionnaire_docx": "src.cli.commands.survey:cmd_survey_export_questionnaire_docx",
+    "survey_import_limesurvey": "src.cli.commands.survey:cmd_survey_import_limesurvey",
+    "survey_import_limesurvey_batch": "src.cli.commands.survey:cmd_survey_import_limesurvey_batch",
+    "survey_i18n_migrate": "src.cli.commands.survey:cmd_survey_i18n_migrate",
+    "survey_i18n_build": "src.cli.commands.survey:cmd_survey_i18n_build",
+    "survey_i18n_autotranslate": "src.cli.commands.survey:cmd_survey_i18n_autotranslate",
+    "participants_detect_id": "src.cli.commands.participants:cmd_participants_detect_id",
+    "participants_preview": "src.cli.commands.participants:cmd_participants_preview",
+    "participants_convert": "src.cli.commands.participants:cmd_participants_convert",
+    "participants_merge": "src.cli.commands.participants:cmd_participants_merge",
+    "participants_save_mapping": "src.cli.commands.participants:cmd_participants_save_mapping",
+    "participants_neurobagel_schema": "src.cli.commands.participants:cmd_participants_neurobagel_schema",
+    "participants_save_schema": "src.cli.commands.participants:cmd_participants_save_schema",
+    "environment_preview": "src.cli.commands.environment:cmd_environment_preview",
+    "environment_convert": "src.cli.commands.environment:cmd_environment_convert",
+    "environment_scan_mri": "src.cli.commands.environment:cmd_environment_scan_mri",
+    "biometrics_detect": "src.cli.commands.biometrics:cmd_biometrics_detect",
+    "biometrics_convert": "src.cli.commands.biometrics:cmd_biometrics_convert",
+    "biometrics_import_excel": "src.cli.commands.biometrics:cmd_biometrics_import_excel",
+    "physio_batch_convert": "src.cli.commands.convert:cmd_physio_batch_convert",
+    "library_generate_methods_text": "src.cli.commands.library:cmd_library_generate_methods_text",
+    "library_sync": "src.cli.commands.library:cmd_library_sync",
+    "library_catalog": "src.cli.commands.library:cmd_library_catalog",
+    "library_fill": "src.cli.commands.library:cmd_library_fill",
+    "library_template_save": "src.cli.commands.library:cmd_library_template_save",
+    "library_template_delete": "src.cli.commands.library:cmd_library_template_delete",
+    "dataset_build_biometrics_smoketest": "src.cli.commands.dataset:cmd_dataset_build_biometrics_smoketest",
+    "dataset_cleanup_project_metadata": "src.cli.commands.dataset:cmd_dataset_cleanup_project_metadata",
+    "dataset_rename_subjects": "src.cli.commands.dataset:cmd_dataset_rename_subjects",
+    "dataset_rewrite_entities": "src.cli.commands.dataset:cmd_dataset_rewrite_entities",
+    "file_management_delete_files": "src.cli.commands.file_management:cmd_file_management_delete_files",
+    "file_management_remove_scans_tsv": "src.cli.commands.file_management:cmd_file_management_remove_scans_tsv",
+    "file_management_rename_physio": "src.cli.commands.file_management:cmd_file_management_rename_physio",
+    "json_editor_save": "src.cli.commands.json_editor:cmd_json_editor_save",
+    "dataset_build_hostile_demo": "src.cli.commands.hostile_demo:cmd_dataset_build_hostile_demo",
+    "recipes_surveys": "src.cli.commands.recipes:cmd_recipes_surveys",
+    "recipes_biometrics": "src.cli.commands.recipes:cmd_recipes_biometrics",
+    "recipes_validate_file": "src.cli.commands.recipes:cmd_recipes_validate_file",
+    "daemon_start": "src.cli.commands.daemon:cmd_daemon_start",
+    "daemon_stop": "src.cli.commands.daemon:cmd_daemon_stop",
+    "daemon_status": "src.cli.commands.daemon:cmd_daemon_status",
+}
+
+
+def resolve_command_handler(target: str) -> CommandHandler:
+    """Import and return the handler named by a ``"module:function"`` target."""
+    module_name, _, attr = target.partition(":")
+    return getattr(importlib.import_module(module_name), attr)
+
+
+class LazyCommandHandlers(Mapping[str, CommandHandler]):
+    """Handler mapping that imports each command module on first lookup."""
+
+    def __init__(self, targets: Mapping[str, str] = COMMAND_HANDLERS):
+        self._targets = dict(targets)
+        self._resolved: dict[str, CommandHandler] = {}
+
+    def __getitem__(self, key: str) -> CommandHandler:
+        handler = self._resolved.get(key)
+        if handler is None:
+            handler = resolve_command_handler(self._targets[key])
+            self._resolved[key] = handler
+        return handler
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._targets)
+
+    def __len__(self) -> int:
+        return len(self._targets)
+
 
 def dispatch_prism_tools(
     args: Namespace,
     parsers: Mapping[str, ArgumentParser],
-    handlers: Mapping[str, CommandHandler],
+    handlers: Mapping[str, CommandHandler] | None = None,
 ) -> None:
     """Dispatch prism_tools commands with compatibility-preserving fallback help output."""
+    if handlers is None:
+        handlers = LazyCommandHandlers()
     root_parser = parsers["root"]
 
     if args.command == "anonymize":
@@ -146,5 +235,14 @@ def dispatch_prism_tools(
             handlers["recipes_validate_file"](args)
         else:
             parsers["recipes"].print_help()
+    elif args.command == "daemon":
+        if args.action == "start":
+            handlers["daemon_start"](args)
+        elif args.action == "stop":
+            handlers["daemon_stop"](args)
+        elif args.action == "status":
+            handlers["daemon_status"](args)
+        else:
+            parsers["daemon"].print_help()
     else:
         root_parser.print_help()
@@ -131,6 +131,18 @@ def build_prism_tools_parsers(
             "Without this flag, such rows are kept but reported as a warning."
         ),
     )
+    parser_wide_to_long.add_argument(
+        "--chunk-size",
+        type=int,
+        metavar="ROWS",
+        help=(
+            "Stream .csv/.tsv input in blocks of ROWS rows and append each "
+            "converted block to the .csv/.tsv output, keeping memory bounded "
+            "for very wide or long exports. Long rows are grouped by session "
+            "within each block, so the output row order depends on ROWS; "
+            "sort the result if a stable order is needed."
+        ),
+    )
 
     parser_participants = subparsers.add_parser(
         "participants",
@@ -764,8 +776,8 @@ def build_prism_tools_parsers(
     parser_deriv_surveys.add_argument(
         "--format",
         default="flat",
-        choices=["prism", "flat", "csv", "xlsx", "sav", "save"],
-        help="Output format: 'flat' (default), 'prism', 'csv', 'xlsx', 'sav' (SPSS; 'save' is legacy alias)",
+        choices=["prism", "flat", "csv", "xlsx", "sav", "save", "parquet", "feather"],
+        help="Output format: 'flat' (default), 'prism', 'csv', 'xlsx', 'sav' (SPSS; 'save' is legacy alias), 'parquet', 'feather' (need pyarrow)",
     )
     parser_deriv_surveys.add_argument(
         "--lang",
@@ -838,6 +850,16 @@ def build_prism_tools_parsers(
         type=float,
         help="Numeric sentinel used when --missing-policy is numeric-sentinel (e.g., -99)",
     )
+    parser_deriv_surveys.add_argument(
+        "--workers",
+        type=int,
+        help="Processes used to score independent recipes (default: PRISM_RECIPES_WORKERS or 1 = no worker processes; 0 = automatic)",
+    )
+    parser_deriv_surveys.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Only recompute outputs whose recipe, options or input files changed since the last run (uses the provenance sidecars)",
+    )
 
     parser_deriv_biometrics = recipes_subparsers.add_parser(
         "biometrics",
@@ -878,8 +900,8 @@ def build_prism_tools_parsers(
     parser_deriv_biometrics.add_argument(
         "--format",
         default="flat",
-        choices=["prism", "flat", "csv", "xlsx", "sav", "save"],
-        help="Output format: 'flat' (default), 'prism', 'csv', 'xlsx', 'sav' (SPSS; 'save' is legacy alias)",
+        choices=["prism", "flat", "csv", "xlsx", "sav", "save", "parquet", "feather"],
+        help="Output format: 'flat' (default), 'prism', 'csv', 'xlsx', 'sav' (SPSS; 'save' is legacy alias), 'parquet', 'feather' (need pyarrow)",
     )
     parser_deriv_biometrics.add_argument(
         "--lang",
@@ -916,6 +938,16 @@ def build_prism_tools_parsers(
         type=float,
         help="Numeric sentinel used when --missing-policy is numeric-sentinel (e.g., -99)",
     )
+    parser_deriv_biometrics.add_argument(
+        "--workers",
+        type=int,
+        help="Processes used to score independent recipes (default: PRISM_RECIPES_WORKERS or 1 = no worker processes; 0 = automatic)",
+    )
+    parser_deriv_biometrics.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Only recompute outputs whose recipe, options or input files changed since the last run (uses the provenance sidecars)",
+    )
     parser_deriv_biometrics.add_argument(
         "--anonymized",
         "-a",
@@ -1866,6 +1898,30 @@ def build_prism_tools_parsers(
         "--json", action="store_true", help="Emit machine-readable JSON"
     )
 
+    parser_daemon = subparsers.add_parser(
+        "daemon",
+        help="Opt-in warm worker process that prism.py/prism_tools.py "
+        "forward their jobs to while it is running (Unix only)",
+    )
+    daemon_subparsers = parser_daemon.add_subparsers(dest="action", help="Action")
+    for action, action_help in (
+        ("start", "Start the daemon in the background"),
+        ("stop", "Stop a running daemon"),
+        ("status", "Show whether a daemon is running"),
+    ):
+        parser_daemon_action = daemon_subparsers.add_parser(action, help=action_help)
+        parser_daemon_action.add_argument(
+            "--socket",
+            help="Socket path (default: $PRISM_DAEMON_SOCKET or a per-user "
+            "temp folder)",
+        )
+        if action == "start":
+            parser_daemon_action.add_argument(
+                "--foreground",
+                action="store_true",
+                help="Serve from this process instead of detaching",
+            )
+
     return parser, {
         "root": parser,
         "survey": parser_survey,
@@ -1878,4 +1934,5 @@ def build_prism_tools_parsers(
         "recipes": parser_recipes,
         "file_management": parser_file_management,
         "json_editor": parser_json_editor,
+        "daemon": parser_daemon,
     }
@@ -83,7 +83,7 @@ from .survey_templates import (
 )
 from .wide_to_long import detect_wide_session_prefixes
 
-from .file_reader import read_tabular_file as _read_tabular_file  # type: ignore[attr-defined]
+from .upload_staging import read_staged_tabular_file as _read_staged_tabular_file  # type: ignore[attr-defined]
 from . import survey_lsa as _survey_lsa  # type: ignore[attr-defined]
 from . import survey_io as _survey_io  # type: ignore[attr-defined]
 from . import survey_templates as _survey_templates
@@ -342,6 +342,9 @@ class SurveyConvertResult:
     near_match_applied: bool = False
     applied_value_offsets: dict[str, float] = field(default_factory=dict)
     value_offset_application_counts: dict[str, int] = field(default_factory=dict)
+    # First out-of-bounds error per task from the value pre-flight (dry runs);
+    # None when the pre-flight did not run.
+    out_of_bounds_errors: dict[str, Exception] | None = None
 
 
 class ParticipantsConverter:
@@ -1176,7 +1179,7 @@ def _read_table_as_dataframe(
     _debug_print_file_head(input_path)
 
     if kind in ("xlsx", "csv", "tsv"):
-        result = _read_tabular_file(
+        result = _read_staged_tabular_file(
             input_path, kind=kind, sheet=sheet, separator=separator
         )
         for w in result.warnings:
@@ -1664,6 +1667,32 @@ def _convert_survey_dataframe_to_prism_dataset(
         lsa_analysis=lsa_analysis,
     )
 
+    # --- Pre-flight Value Check ---
+    # Validate every response value (and profile each item's value range and
+    # workable offsets) before anything is written.
+    response_preflight = _survey_io._preflight_survey_responses(
+        df=df,
+        res_id_col=res_id_col,
+        res_ses_col=res_ses_col,
+        res_run_col=res_run_col,
+        session=session,
+        task_run_columns=task_run_columns,
+        selected_tasks=selected_tasks,
+        templates=templates,
+        task_context_templates=task_context_templates,
+        col_to_mapping=col_to_mapping,
+        strict_levels=strict_levels,
+        task_runs=task_runs,
+        non_item_toplevel_keys=_NON_ITEM_TOPLEVEL_KEYS,
+        normalize_sub_fn=_normalize_sub_id,
+        normalize_ses_fn=_normalize_ses_id,
+        normalize_item_fn=_normalize_item_value,
+        is_missing_fn=_is_missing_value,
+        validate_item_fn=_validate_survey_item_value,
+        task_value_offsets=normalized_task_value_offsets,
+        missing_token=_MISSING_TOKEN,
+    )
+
     if dry_run:
         # Generate detailed dry-run preview
         dry_run_preview = _generate_dry_run_preview(
@@ -1697,6 +1726,7 @@ def _convert_survey_dataframe_to_prism_dataset(
             dry_run_preview.setdefault("data_issues", []).append(
                 participant_registry_warning
             )
+        dry_run_preview["value_preflight"] = response_preflight.value_report
 
         return SurveyConvertResult(
             tasks_included=sorted(tasks_with_data),
@@ -1714,8 +1744,13 @@ def _convert_survey_dataframe_to_prism_dataset(
             participant_registry_warning=participant_registry_warning,
             near_match_candidates=near_match_candidates,
             near_match_applied=near_match_applied,
+            out_of_bounds_errors=dict(response_preflight.errors),
         )
 
+    first_out_of_bounds_error = response_preflight.first_error
+    if first_out_of_bounds_error is not None:
+        raise first_out_of_bounds_error
+
     # --- Write Output ---
     _ensure_dir(output_root)
     dataset_root = _resolve_dataset_root(output_root)
@@ -1777,9 +1812,11 @@ def _convert_survey_dataframe_to_prism_dataset(
         normalize_item_fn=_normalize_item_value,
         is_missing_fn=_is_missing_value,
         ensure_dir_fn=_ensure_dir,
-        process_survey_row_with_run_fn=_process_survey_row_with_run,
+        validate_item_fn=_validate_survey_item_value,
         build_bids_survey_filename_fn=_build_bids_survey_filename,
         task_value_offsets=normalized_task_value_offsets,
+        missing_token=_MISSING_TOKEN,
+        preflight=response_preflight,
     )
 
     applied_value_offsets: dict[str, float] = {}
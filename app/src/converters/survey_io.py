@@ -12,6 +12,7 @@ from __future__ import annotations
 import csv
 import re
 from collections import Counter
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
@@ -110,14 +111,245 @@ def _lookup_task_context_value(
 # -----------------------------------------------------------------------------
 
 
-def _process_and_write_responses(
+_INVALID_VALUE = object()
+
+
+def _value_memo_key(value: Any) -> tuple[type, Any]:
+    # Keep 1, 1.0 and True apart: they hash equal but normalize differently.
+    return (type(value), value)
+
+
+def _memoized_values(values, fn, memo: dict) -> list:
+    """Apply ``fn`` to each value, evaluating every distinct value only once."""
+    results = []
+    for value in values:
+        try:
+            key = _value_memo_key(value)
+            if key not in memo:
+                memo[key] = fn(value)
+            results.append(memo[key])
+        except TypeError:  # unhashable cell
+            results.append(fn(value))
+    return results
+
+
+def _missing_value_mask(values, *, is_missing_fn, memo: dict):
+    """Vectorized missing-value mask for an object array of cell values."""
+    import numpy as np
+    import pandas as pd
+
+    mask = np.asarray(pd.isna(values), dtype=bool)
+    present_idx = np.flatnonzero(~mask)
+    if len(present_idx):
+        flags = _memoized_values(values[present_idx], is_missing_fn, memo)
+        mask[present_idx] = np.asarray(flags, dtype=bool)
+    return mask
+
+
+def _resolve_item_source_columns(
+    *,
+    item_id: str,
+    schema: dict,
+    run_col_mapping: dict[str, str],
+    df_columns,
+) -> list[str]:
+    """Return the data columns that may hold an item, in lookup priority order."""
+    source_columns: list[str] = []
+    candidates = [item_id] + schema.get("_reverse_aliases", {}).get(item_id, [])
+    for cand in candidates:
+        if cand in run_col_mapping:
+            actual_col = run_col_mapping[cand]
+            if actual_col in df_columns:
+                source_columns.append(actual_col)
+        elif cand in df_columns:
+            source_columns.append(cand)
+    return source_columns
+
+
+def _attach_task_offset_evidence(
+    error,
+    *,
+    sampled: list[tuple[dict, Any, int]],
+    strict_levels: bool,
+    normalize_item_fn,
+    missing_token: str,
+) -> None:
+    """Attach task-wide offset evidence to an out-of-bounds error."""
+    candidate_offsets: list[float | int] = list(
+        getattr(error, "suggested_offsets", []) or []
+    )
+    configured_offset = getattr(error, "configured_offset", None)
+    try:
+        configured_offset_num = (
+            None if configured_offset is None else float(configured_offset)
+        )
+    except (TypeError, ValueError):
+        configured_offset_num = None
+    if configured_offset_num is not None:
+        has_configured_offset = any(
+            abs(float(offset) - configured_offset_num) <= 1e-9
+            for offset in candidate_offsets
+        )
+        if not has_configured_offset:
+            candidate_offsets.append(configured_offset_num)
+
+        # When a configured offset fails, also sample the opposite
+        # direction as a diagnostic candidate for UI guidance.
+        opposite_offset_num = -configured_offset_num
+        if abs(opposite_offset_num) > 1e-9:
+            has_opposite_offset = any(
+                abs(float(offset) - opposite_offset_num) <= 1e-9
+                for offset in candidate_offsets
+            )
+            if not has_opposite_offset:
+                candidate_offsets.append(opposite_offset_num)
+
+    evidence, safe_offsets = _survey_processing._offset_evidence_from_value_counts(
+        sampled=sampled,
+        strict_levels=strict_levels,
+        normalize_fn=normalize_item_fn,
+        missing_token=missing_token,
+        suggested_offsets=candidate_offsets,
+    )
+    error.offset_evidence = evidence
+    if evidence.get("sampled_numeric_values", 0) > 0:
+        error.suggested_offsets = safe_offsets
+
+
+def _format_single_row_tsv(fieldnames: list[str], values: list[str]) -> str:
+    import io
+
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, delimiter="\t", lineterminator="\n")
+    writer.writerow(fieldnames)
+    writer.writerow(values)
+    return buffer.getvalue()
+
+
+_PREFLIGHT_MAX_OBSERVED_VALUES = 25
+
+
+@dataclass
+class _ResponseBlock:
+    """Validated output for one task/session/run context of response rows."""
+
+    task: str
+    ses_id: str
+    effective_run: str | int | None
+    positions: list[int]
+    expected_cols: list[str]
+    item_outputs: list[Any]
+
+
+@dataclass
+class _ResponsePreflight:
+    """Result of validating every response cell before anything is written."""
+
+    sub_ids: list[str]
+    ses_ids: list[str]
+    blocks: list[_ResponseBlock]
+    missing_per_row: Any
+    processed_any_task: bool
+    items_using_tolerance: dict[str, set[str]]
+    offset_application_counts: dict[str, int]
+    errors: dict[str, Exception] = field(default_factory=dict)
+    error_order: dict[str, tuple[int, int, int]] = field(default_factory=dict)
+    value_report: dict[str, dict[str, Any]] = field(default_factory=dict)
+
+    @property
+    def first_error(self) -> Exception | None:
+        """The out-of-bounds error a row-by-row conversion would hit first."""
+        if not self.error_order:
+            return None
+        task = min(self.error_order, key=self.error_order.__getitem__)
+        return self.errors[task]
+
+
+def _merge_item_profiles(existing: dict[str, Any], update: dict[str, Any]) -> None:
+    """Fold the profile of another context block into an item's profile."""
+    existing["observed_values"] = sorted(
+        set(existing["observed_values"]) | set(update["observed_values"]),
+        key=lambda text: (
+            _survey_processing._to_float(text) is None,
+            _survey_processing._to_float(text) or 0.0,
+            text,
+        ),
+    )
+    for key, pick in (("numeric_min", min), ("numeric_max", max)):
+        values = [v for v in (existing[key], update[key]) if v is not None]
+        existing[key] = pick(values) if values else None
+    existing["invalid_values"] = sorted(
+        set(existing["invalid_values"]) | set(update["invalid_values"]),
+        key=lambda text: (_survey_processing._to_float(text) or 0.0, text),
+    )
+    if existing["invalid_values"] and update["invalid_values"]:
+        update_offsets = {float(offset) for offset in update["valid_offsets"]}
+        existing["valid_offsets"] = [
+            offset
+            for offset in existing["valid_offsets"]
+            if float(offset) in update_offsets
+        ]
+    elif update["invalid_values"]:
+        existing["valid_offsets"] = list(update["valid_offsets"])
+    existing["out_of_range_count"] += update["out_of_range_count"]
+
+
+def _build_task_value_report(
+    *,
+    item_profiles: dict[str, dict[str, Any]],
+    sampled: list[tuple[dict, Any, int]],
+    strict_levels: bool,
+    normalize_item_fn,
+    missing_token: str,
+) -> dict[str, Any]:
+    """Summarize per-item value profiles into a task-wide offset report."""
+    candidate_offsets: dict[float, float | int] = {}
+    for profile in item_profiles.values():
+        for offset in profile["valid_offsets"]:
+            candidate_offsets.setdefault(float(offset), offset)
+
+    evidence, _safe_offsets = _survey_processing._offset_evidence_from_value_counts(
+        sampled=sampled,
+        strict_levels=strict_levels,
+        normalize_fn=normalize_item_fn,
+        missing_token=missing_token,
+        suggested_offsets=sorted(candidate_offsets.values(), key=float),
+    )
+
+    items: dict[str, dict[str, Any]] = {}
+    for item_id, profile in item_profiles.items():
+        entry = dict(profile)
+        observed = entry["observed_values"]
+        entry["observed_value_count"] = len(observed)
+        entry["observed_values"] = observed[:_PREFLIGHT_MAX_OBSERVED_VALUES]
+        items[item_id] = entry
+
+    return {
+        "out_of_range_values": sum(
+            profile["out_of_range_count"] for profile in item_profiles.values()
+        ),
+        "out_of_range_items": sorted(
+            item_id
+            for item_id, profile in item_profiles.items()
+            if profile["out_of_range_count"] or profile["invalid_values"]
+        ),
+        "task_offsets": [
+            entry["offset"]
+            for entry in evidence.get("candidate_offsets", [])
+            if entry["invalid_after"] == 0
+        ],
+        "offset_evidence": evidence,
+        "items": items,
+    }
+
+
+def _preflight_survey_responses(
     *,
     df,
     res_id_col: str,
     res_ses_col: str | None,
     res_run_col: str | None = None,
     session: str | None,
-    output_root,
     task_run_columns: dict[tuple[str, int | None], list[str]],
     selected_tasks: set[str] | None,
     templates: dict,
@@ -125,25 +357,28 @@ def _process_and_write_responses(
     col_to_mapping: dict,
     strict_levels: bool,
     task_runs: dict[str, int | None],
-    task_context_acq_map: dict[tuple[str, str | None, str | int | None], str | None],
     non_item_toplevel_keys,
     normalize_sub_fn,
     normalize_ses_fn,
     normalize_item_fn,
     is_missing_fn,
-    ensure_dir_fn,
-    process_survey_row_with_run_fn,
-    build_bids_survey_filename_fn,
+    validate_item_fn,
     task_value_offsets: dict[str, float] | None = None,
-) -> tuple[dict[str, int], dict[str, set[str]], dict[str, int]]:
-    """Process all response rows and write survey TSV files."""
-    missing_cells_by_subject: dict[str, int] = {}
+    missing_token: str = "n/a",  # noqa: S107 - placeholder for missing survey answers, not a credential
+) -> _ResponsePreflight:
+    """Validate all response rows column-wise without writing anything.
+
+    Rows are grouped per (task, run, session, effective run) context so each
+    item column is resolved, validated and normalized for the whole block at
+    once; every distinct cell value is validated a single time. Alongside the
+    normalized outputs this collects, per task, the observed value set,
+    numeric range and the offsets that would make every value valid, plus the
+    first out-of-bounds error (with task-wide offset evidence) per task.
+    """
+    import numpy as np
+
     items_using_tolerance: dict[str, set[str]] = {}
     offset_application_counts: dict[str, int] = {}
-    task_offset_evidence_cache: dict[
-        tuple[str, str | None, str | int | None, tuple[str, ...]],
-        tuple[dict[str, Any], list[float | int]],
-    ] = {}
 
     # Sort rows by (session, run, participant) so files are created in a stable order.
     sort_cols = [
@@ -152,36 +387,61 @@ def _process_and_write_responses(
     if sort_cols:
         df = df.sort_values(sort_cols, kind="stable").reset_index(drop=True)
 
-    for _, row in df.iterrows():
-        sub_id = normalize_sub_fn(row[res_id_col])
-        ses_id = (
-            normalize_ses_fn(session)
-            if session and session != "all"
-            else (normalize_ses_fn(row[res_ses_col]) if res_ses_col else "ses-1")
-        )
-
-        # Determine row-level run number (from a dedicated run column in the data)
-        row_run: str | None = None
-        if res_run_col and res_run_col in df.columns:
-            row_run = _normalize_run_entity(row[res_run_col])
-
-        modality_dir = ensure_dir_fn(output_root / sub_id / ses_id / "survey")
-
-        for (task, run), columns in sorted(
-            task_run_columns.items(), key=lambda x: (x[0][0], x[0][1] or 0)
-        ):
-            if selected_tasks is not None and task not in selected_tasks:
-                continue
-
-            include_run = task_runs.get(task) is not None
-            # Row-level run (from a dedicated run column) takes priority over
-            # column-level run detection; use it when present and valid.
-            effective_run: str | int | None
-            if row_run is not None:
-                effective_run = row_run
-            else:
-                effective_run = run if include_run else None
+    n_rows = len(df)
+    sub_ids = [normalize_sub_fn(value) for value in df[res_id_col].tolist()]
+    if session and session != "all":
+        ses_ids = [normalize_ses_fn(session)] * n_rows
+    elif res_ses_col:
+        ses_ids = [normalize_ses_fn(value) for value in df[res_ses_col].tolist()]
+    else:
+        ses_ids = ["ses-1"] * n_rows
+
+    # Row-level run numbers (from a dedicated run column in the data)
+    row_runs: list[str | None] = [None] * n_rows
+    if res_run_col and res_run_col in df.columns:
+        row_runs = [_normalize_run_entity(value) for value in df[res_run_col].tolist()]
+
+    df_columns = df.columns
+    column_values: dict[str, Any] = {}
+
+    def _column(name: str):
+        if name not in column_values:
+            column_values[name] = df[name].to_numpy(dtype=object)
+        return column_values[name]
+
+    missing_memo: dict = {}
+    missing_per_row = np.zeros(n_rows, dtype=np.int64)
+    processed_any_task = False
+    blocks: list[_ResponseBlock] = []
+    first_errors: dict[str, tuple[tuple[int, int, int], dict[str, Any]]] = {}
+    item_profiles: dict[str, dict[str, dict[str, Any]]] = {}
+    task_samples: dict[str, list[tuple[dict, Any, int]]] = {}
+
+    ordered_task_runs = sorted(
+        task_run_columns.items(), key=lambda x: (x[0][0], x[0][1] or 0)
+    )
+    for task_order, ((task, run), columns) in enumerate(ordered_task_runs):
+        if selected_tasks is not None and task not in selected_tasks:
+            continue
+        processed_any_task = True
+
+        include_run = task_runs.get(task) is not None
+        run_col_mapping = {col_to_mapping[c].base_item: c for c in columns}
+
+        # Row-level run (from a dedicated run column) takes priority over
+        # column-level run detection; use it when present and valid.
+        context_positions: dict[tuple[str, str | int | None], list[int]] = {}
+        for position in range(n_rows):
+            row_run = row_runs[position]
+            effective_run = (
+                row_run if row_run is not None else (run if include_run else None)
+            )
+            context_positions.setdefault(
+                (ses_ids[position], effective_run), []
+            ).append(position)
 
+        for (ses_id, effective_run), block_positions in context_positions.items():
+            positions = np.asarray(block_positions, dtype=np.int64)
             schema = _lookup_task_context_value(
                 task_context_templates,
                 task=task,
@@ -191,124 +451,301 @@ def _process_and_write_responses(
             if schema is None:
                 schema = templates[task]["json"]
 
-            run_col_mapping = {col_to_mapping[c].base_item: c for c in columns}
+            aliases = schema.get("_aliases", {})
+            expected_cols = [
+                k
+                for k in schema.keys()
+                if k not in non_item_toplevel_keys and k not in aliases
+            ]
 
-            try:
-                out_row, missing_count = process_survey_row_with_run_fn(
-                    row=row,
-                    df_cols=df.columns,
-                    task=task,
-                    run=run,
+            block_output: list[Any] = []
+            for item_index, item_id in enumerate(expected_cols):
+                found = np.empty(len(positions), dtype=object)
+                found_mask = np.zeros(len(positions), dtype=bool)
+                for source_column in _resolve_item_source_columns(
+                    item_id=item_id,
                     schema=schema,
                     run_col_mapping=run_col_mapping,
-                    sub_id=sub_id,
-                    strict_levels=strict_levels,
-                    items_using_tolerance=items_using_tolerance,
-                    is_missing_fn=is_missing_fn,
-                    normalize_val_fn=normalize_item_fn,
-                    task_value_offsets=task_value_offsets,
-                    offset_application_counts=offset_application_counts,
-                )
-            except _survey_processing.SurveyValueOutOfBoundsError as error:
-                cache_key = (task, ses_id, effective_run, tuple(sorted(columns)))
-                evidence_payload = task_offset_evidence_cache.get(cache_key)
-                if evidence_payload is None:
-                    candidate_offsets: list[float | int] = list(
-                        getattr(error, "suggested_offsets", []) or []
+                    df_columns=df_columns,
+                ):
+                    values = _column(source_column)[positions]
+                    take = ~found_mask & ~_missing_value_mask(
+                        values, is_missing_fn=is_missing_fn, memo=missing_memo
                     )
-                    configured_offset = getattr(error, "configured_offset", None)
-                    try:
-                        configured_offset_num = (
-                            None
-                            if configured_offset is None
-                            else float(configured_offset)
+                    found[take] = values[take]
+                    found_mask |= take
+
+                item_output = np.full(len(positions), missing_token, dtype=object)
+                found_idx = np.flatnonzero(found_mask)
+                if len(found_idx):
+                    item_schema = schema.get(item_id)
+
+                    def _validate(value, _item_id=item_id, _item_schema=item_schema):
+                        local_tolerance: dict[str, set[str]] = {}
+                        local_counts: dict[str, int] = {}
+                        try:
+                            validated_value = validate_item_fn(
+                                item_id=_item_id,
+                                val=value,
+                                item_schema=_item_schema,
+                                sub_id="",
+                                task=task,
+                                strict_levels=strict_levels,
+                                items_using_tolerance=local_tolerance,
+                                normalize_fn=normalize_item_fn,
+                                is_missing_fn=is_missing_fn,
+                                task_value_offsets=task_value_offsets,
+                                offset_application_counts=local_counts,
+                            )
+                        except _survey_processing.SurveyValueOutOfBoundsError:
+                            return _INVALID_VALUE
+                        return (
+                            normalize_item_fn(validated_value),
+                            bool(local_tolerance),
+                            local_counts.get(task, 0),
                         )
-                    except (TypeError, ValueError):
-                        configured_offset_num = None
-                    if configured_offset_num is not None:
-                        has_configured_offset = any(
-                            abs(float(offset) - configured_offset_num) <= 1e-9
-                            for offset in candidate_offsets
+
+                    outcomes = _memoized_values(found[found_idx], _validate, {})
+                    offset_applications = 0
+                    out_of_range_count = 0
+                    for cell, outcome in zip(found_idx, outcomes):
+                        if outcome is _INVALID_VALUE:
+                            out_of_range_count += 1
+                            order_key = (int(positions[cell]), task_order, item_index)
+                            current = first_errors.get(task)
+                            if current is None or order_key < current[0]:
+                                first_errors[task] = (
+                                    order_key,
+                                    {
+                                        "positions": block_positions,
+                                        "columns": columns,
+                                        "schema": schema,
+                                        "item_id": item_id,
+                                        "value": found[cell],
+                                    },
+                                )
+                            continue
+                        norm, used_tolerance, applied = outcome
+                        item_output[cell] = norm
+                        offset_applications += applied
+                        if used_tolerance:
+                            items_using_tolerance.setdefault(task, set()).add(item_id)
+                    if offset_applications:
+                        offset_application_counts[task] = (
+                            offset_application_counts.get(task, 0)
+                            + offset_applications
                         )
-                        if not has_configured_offset:
-                            candidate_offsets.append(configured_offset_num)
-
-                        # When a configured offset fails, also sample the opposite
-                        # direction as a diagnostic candidate for UI guidance.
-                        opposite_offset_num = -configured_offset_num
-                        if abs(opposite_offset_num) > 1e-9:
-                            has_opposite_offset = any(
-                                abs(float(offset) - opposite_offset_num) <= 1e-9
-                                for offset in candidate_offsets
-                            )
-                            if not has_opposite_offset:
-                                candidate_offsets.append(opposite_offset_num)
-
-                    context_df = df
-                    if res_ses_col and res_ses_col in df.columns:
-                        session_mask = df[res_ses_col].map(normalize_ses_fn) == ses_id
-                        context_df = df[session_mask]
-                    if row_run is not None and res_run_col and res_run_col in context_df.columns:
-                        run_mask = context_df[res_run_col].map(_normalize_run_entity) == row_run
-                        context_df = context_df[run_mask]
-
-                    evidence_payload = _survey_processing._build_task_offset_evidence(
-                        df=context_df,
-                        column_items=[
-                            (column, col_to_mapping[column].base_item)
-                            for column in columns
-                            if column in col_to_mapping
-                        ],
-                        schema=schema,
+
+                    value_counts = _survey_processing._numeric_value_counts(
+                        found[found_idx], is_missing_fn=is_missing_fn
+                    )
+                    profile = _survey_processing._profile_item_values(
+                        value_counts=value_counts,
+                        item_schema=item_schema,
                         strict_levels=strict_levels,
                         normalize_fn=normalize_item_fn,
-                        is_missing_fn=is_missing_fn,
-                        missing_token="n/a",  # noqa: S106 - placeholder for missing survey answers, not a credential
-                        suggested_offsets=candidate_offsets,
+                        missing_token=missing_token,
                     )
-                    task_offset_evidence_cache[cache_key] = evidence_payload
-
-                evidence, safe_offsets = evidence_payload
-                error.offset_evidence = evidence
-                if evidence.get("sampled_numeric_values", 0) > 0:
-                    error.suggested_offsets = safe_offsets
-                raise
-            missing_cells_by_subject[sub_id] = (
-                missing_cells_by_subject.get(sub_id, 0) + missing_count
+                    profile["out_of_range_count"] = out_of_range_count
+                    task_profiles = item_profiles.setdefault(task, {})
+                    if item_id in task_profiles:
+                        _merge_item_profiles(task_profiles[item_id], profile)
+                    else:
+                        task_profiles[item_id] = profile
+                    if isinstance(item_schema, dict):
+                        task_samples.setdefault(task, []).extend(
+                            (item_schema, value, count) for value, count in value_counts
+                        )
+
+                missing_per_row[positions] += item_output == missing_token
+                block_output.append(item_output)
+
+            blocks.append(
+                _ResponseBlock(
+                    task=task,
+                    ses_id=ses_id,
+                    effective_run=effective_run,
+                    positions=block_positions,
+                    expected_cols=expected_cols,
+                    item_outputs=block_output,
+                )
             )
 
-            expected_cols = [
-                k
-                for k in schema.keys()
-                if k not in non_item_toplevel_keys
-                and k not in schema.get("_aliases", {})
-            ]
+    preflight = _ResponsePreflight(
+        sub_ids=sub_ids,
+        ses_ids=ses_ids,
+        blocks=blocks,
+        missing_per_row=missing_per_row,
+        processed_any_task=processed_any_task,
+        items_using_tolerance=items_using_tolerance,
+        offset_application_counts=offset_application_counts,
+    )
 
-            acq_value = _lookup_task_context_value(
-                task_context_acq_map,
+    for task, task_profiles in item_profiles.items():
+        preflight.value_report[task] = _build_task_value_report(
+            item_profiles=task_profiles,
+            sampled=task_samples.get(task, []),
+            strict_levels=strict_levels,
+            normalize_item_fn=normalize_item_fn,
+            missing_token=missing_token,
+        )
+
+    for task, ((position, _task_order, _item_index), context) in first_errors.items():
+        schema = context["schema"]
+        try:
+            validate_item_fn(
+                item_id=context["item_id"],
+                val=context["value"],
+                item_schema=schema.get(context["item_id"]),
+                sub_id=sub_ids[position],
                 task=task,
-                session=ses_id,
-                run=effective_run,
+                strict_levels=strict_levels,
+                items_using_tolerance={},
+                normalize_fn=normalize_item_fn,
+                is_missing_fn=is_missing_fn,
+                task_value_offsets=task_value_offsets,
+                offset_application_counts={},
+            )
+        except _survey_processing.SurveyValueOutOfBoundsError as error:
+            context_positions_array = np.asarray(context["positions"], dtype=np.int64)
+            sampled: list[tuple[dict, Any, int]] = []
+            for column in context["columns"]:
+                mapping = col_to_mapping.get(column)
+                item_schema = schema.get(mapping.base_item) if mapping else None
+                if not isinstance(item_schema, dict):
+                    continue
+                sampled.extend(
+                    (item_schema, value, count)
+                    for value, count in _survey_processing._numeric_value_counts(
+                        _column(column)[context_positions_array],
+                        is_missing_fn=is_missing_fn,
+                    )
+                )
+            _attach_task_offset_evidence(
+                error,
+                sampled=sampled,
+                strict_levels=strict_levels,
+                normalize_item_fn=normalize_item_fn,
+                missing_token=missing_token,
+            )
+            preflight.errors[task] = error
+            preflight.error_order[task] = first_errors[task][0]
+
+    return preflight
+
+
+def _process_and_write_responses(
+    *,
+    df,
+    res_id_col: str,
+    res_ses_col: str | None,
+    res_run_col: str | None = None,
+    session: str | None,
+    output_root,
+    task_run_columns: dict[tuple[str, int | None], list[str]],
+    selected_tasks: set[str] | None,
+    templates: dict,
+    task_context_templates: dict[tuple[str, str | None, str | int | None], dict],
+    col_to_mapping: dict,
+    strict_levels: bool,
+    task_runs: dict[str, int | None],
+    task_context_acq_map: dict[tuple[str, str | None, str | int | None], str | None],
+    non_item_toplevel_keys,
+    normalize_sub_fn,
+    normalize_ses_fn,
+    normalize_item_fn,
+    is_missing_fn,
+    ensure_dir_fn,
+    validate_item_fn,
+    build_bids_survey_filename_fn,
+    task_value_offsets: dict[str, float] | None = None,
+    missing_token: str = "n/a",  # noqa: S107 - placeholder for missing survey answers, not a credential
+    preflight: _ResponsePreflight | None = None,
+) -> tuple[dict[str, int], dict[str, set[str]], dict[str, int]]:
+    """Validate all response rows column-wise and write survey TSV files.
+
+    Validation runs through ``_preflight_survey_responses`` (or reuses a
+    ``preflight`` computed earlier by the caller). Nothing is written until
+    every block has validated, and each output TSV is then written exactly
+    once.
+    """
+    if preflight is None:
+        preflight = _preflight_survey_responses(
+            df=df,
+            res_id_col=res_id_col,
+            res_ses_col=res_ses_col,
+            res_run_col=res_run_col,
+            session=session,
+            task_run_columns=task_run_columns,
+            selected_tasks=selected_tasks,
+            templates=templates,
+            task_context_templates=task_context_templates,
+            col_to_mapping=col_to_mapping,
+            strict_levels=strict_levels,
+            task_runs=task_runs,
+            non_item_toplevel_keys=non_item_toplevel_keys,
+            normalize_sub_fn=normalize_sub_fn,
+            normalize_ses_fn=normalize_ses_fn,
+            normalize_item_fn=normalize_item_fn,
+            is_missing_fn=is_missing_fn,
+            validate_item_fn=validate_item_fn,
+            task_value_offsets=task_value_offsets,
+            missing_token=missing_token,
+        )
+    first_error = preflight.first_error
+    if first_error is not None:
+        raise first_error
+
+    sub_ids = preflight.sub_ids
+    missing_cells_by_subject: dict[str, int] = {}
+    if preflight.processed_any_task:
+        for position, sub_id in enumerate(sub_ids):
+            missing_cells_by_subject[sub_id] = missing_cells_by_subject.get(
+                sub_id, 0
+            ) + int(preflight.missing_per_row[position])
+
+    modality_dirs: dict[tuple[str, str], Path] = {}
+    for sub_id, ses_id in zip(sub_ids, preflight.ses_ids):
+        if (sub_id, ses_id) not in modality_dirs:
+            modality_dirs[(sub_id, ses_id)] = ensure_dir_fn(
+                output_root / sub_id / ses_id / "survey"
             )
 
+    pending_files: dict[Path, tuple[list[str], list[str]]] = {}
+    for block in preflight.blocks:
+        acq_value = _lookup_task_context_value(
+            task_context_acq_map,
+            task=block.task,
+            session=block.ses_id,
+            run=block.effective_run,
+        )
+        for block_row, position in enumerate(block.positions):
+            sub_id = sub_ids[position]
             filename = build_bids_survey_filename_fn(
                 sub_id,
-                ses_id,
-                task,
-                effective_run,
+                block.ses_id,
+                block.task,
+                block.effective_run,
                 "tsv",
                 acq_value,
             )
-            res_file = modality_dir / filename
+            res_file = modality_dirs[(sub_id, block.ses_id)] / filename
+            # Later rows for the same subject/session/task overwrite earlier ones.
+            pending_files.pop(res_file, None)
+            pending_files[res_file] = (
+                block.expected_cols,
+                [str(item_output[block_row]) for item_output in block.item_outputs],
+            )
 
-            with open(res_file, "w", encoding="utf-8", newline="") as f:
-                writer = csv.DictWriter(
-                    f, fieldnames=expected_cols, delimiter="\t", lineterminator="\n"
-                )
-                writer.writeheader()
-                writer.writerow(out_row)
+    for res_file, (fieldnames, values) in pending_files.items():
+        with open(res_file, "w", encoding="utf-8", newline="") as f:
+            f.write(_format_single_row_tsv(fieldnames, values))
 
-    return missing_cells_by_subject, items_using_tolerance, offset_application_counts
+    return (
+        missing_cells_by_subject,
+        preflight.items_using_tolerance,
+        preflight.offset_application_counts,
+    )
 
 
 def _build_tolerance_warnings(
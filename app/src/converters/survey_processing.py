@@ -9,6 +9,7 @@ This module consolidates logic for:
 from __future__ import annotations
 
 import re
+from collections import Counter
 from typing import Any
 
 
@@ -306,18 +307,45 @@ def _is_valid_survey_item_value(
     return False, False
 
 
-def _build_task_offset_evidence(
+def _numeric_value_counts(values, *, is_missing_fn) -> list[tuple[Any, int]]:
+    """Count distinct non-missing numeric cell values in an array of cells.
+
+    Values are keyed by (type, value) so ``1``, ``1.0`` and ``"1"`` stay apart;
+    each distinct value is checked with ``is_missing_fn`` only once.
+    """
+    import numpy as np
+    import pandas as pd
+
+    cells = np.asarray(values, dtype=object).ravel()
+    cells = cells[~np.asarray(pd.isna(cells), dtype=bool)]
+
+    counts: Counter = Counter()
+    for value in cells.tolist():
+        try:
+            counts[(type(value), value)] += 1
+        except TypeError:  # unhashable cell, never numeric
+            continue
+
+    return [
+        (value, count)
+        for (_value_type, value), count in counts.items()
+        if not is_missing_fn(value) and _to_float(value) is not None
+    ]
+
+
+def _offset_evidence_from_value_counts(
     *,
-    df,
-    column_items: list[tuple[str, str]],
-    schema: dict,
+    sampled: list[tuple[dict, Any, int]],
     strict_levels: bool,
     normalize_fn,
-    is_missing_fn,
     missing_token: str,
     suggested_offsets: list[float | int] | None,
 ) -> tuple[dict[str, Any], list[float | int]]:
-    """Summarize how a candidate task-wide offset behaves across numeric values."""
+    """Summarize a candidate task-wide offset from (schema, value, count) samples.
+
+    Every distinct value is validated once per candidate offset and weighted
+    by its count, so the cost depends on the value set, not the row count.
+    """
     evidence: dict[str, Any] = {
         "scope": "task",
         "classification": "item_issues_likely",
@@ -335,59 +363,53 @@ def _build_task_offset_evidence(
     }
 
     candidate_offsets = list(suggested_offsets or [])
-    if not column_items or not candidate_offsets:
+    if not sampled or not candidate_offsets:
         return evidence, []
 
-    sampled_values: list[tuple[str, Any, dict]] = []
-    for column, item_id in column_items:
-        item_schema = schema.get(item_id)
-        if not isinstance(item_schema, dict):
-            continue
-        for value in df[column].tolist():
-            if is_missing_fn(value):
-                continue
-            if _to_float(value) is None:
-                continue
-            sampled_values.append((column, value, item_schema))
-
-    sampled_numeric_values = len(sampled_values)
+    sampled_numeric_values = sum(count for _schema, _value, count in sampled)
     evidence["sampled_numeric_values"] = sampled_numeric_values
     if sampled_numeric_values == 0:
         return evidence, []
 
-    invalid_without_offset = 0
+    def _is_valid(value: Any, item_schema: dict) -> bool:
+        is_valid, _ = _is_valid_survey_item_value(
+            val=value,
+            item_schema=item_schema,
+            strict_levels=strict_levels,
+            normalize_fn=normalize_fn,
+            missing_token=missing_token,
+        )
+        return is_valid
+
+    valid_without_offset = [
+        _is_valid(value, item_schema) for item_schema, value, _count in sampled
+    ]
+    invalid_without_offset = sum(
+        count
+        for (_schema, _value, count), is_valid in zip(sampled, valid_without_offset)
+        if not is_valid
+    )
+
     candidate_stats: list[dict[str, Any]] = []
     for offset in candidate_offsets:
         corrected_by_offset = 0
         invalid_with_offset = 0
         newly_invalid_with_offset = 0
 
-        for _item_id, value, item_schema in sampled_values:
-            is_valid_without_offset, _ = _is_valid_survey_item_value(
-                val=value,
-                item_schema=item_schema,
-                strict_levels=strict_levels,
-                normalize_fn=normalize_fn,
-                missing_token=missing_token,
-            )
+        for (item_schema, value, count), is_valid_without_offset in zip(
+            sampled, valid_without_offset
+        ):
             adjusted_value = _apply_numeric_offset(value, float(offset))
-            is_valid_with_offset, _ = _is_valid_survey_item_value(
-                val=adjusted_value,
-                item_schema=item_schema,
-                strict_levels=strict_levels,
-                normalize_fn=normalize_fn,
-                missing_token=missing_token,
-            )
+            is_valid_with_offset = _is_valid(adjusted_value, item_schema)
 
             if not is_valid_without_offset:
-                invalid_without_offset += 1 if offset == candidate_offsets[0] else 0
                 if is_valid_with_offset:
-                    corrected_by_offset += 1
+                    corrected_by_offset += count
                 else:
-                    invalid_with_offset += 1
+                    invalid_with_offset += count
             elif not is_valid_with_offset:
-                newly_invalid_with_offset += 1
-                invalid_with_offset += 1
+                newly_invalid_with_offset += count
+                invalid_with_offset += count
 
         candidate_stats.append(
             {
@@ -464,6 +486,118 @@ def _build_task_offset_evidence(
 
     return evidence, safe_offsets
 
+
+def _build_task_offset_evidence(
+    *,
+    df,
+    column_items: list[tuple[str, str]],
+    schema: dict,
+    strict_levels: bool,
+    normalize_fn,
+    is_missing_fn,
+    missing_token: str,
+    suggested_offsets: list[float | int] | None,
+) -> tuple[dict[str, Any], list[float | int]]:
+    """Summarize how a candidate task-wide offset behaves across numeric values."""
+    sampled: list[tuple[dict, Any, int]] = []
+    if suggested_offsets:
+        for column, item_id in column_items:
+            item_schema = schema.get(item_id)
+            if not isinstance(item_schema, dict):
+                continue
+            for value, count in _numeric_value_counts(
+                df[column].to_numpy(dtype=object), is_missing_fn=is_missing_fn
+            ):
+                sampled.append((item_schema, value, count))
+
+    return _offset_evidence_from_value_counts(
+        sampled=sampled,
+        strict_levels=strict_levels,
+        normalize_fn=normalize_fn,
+        missing_token=missing_token,
+        suggested_offsets=suggested_offsets,
+    )
+
+
+def _profile_item_values(
+    *,
+    value_counts: list[tuple[Any, int]],
+    item_schema: dict | None,
+    strict_levels: bool,
+    normalize_fn,
+    missing_token: str,
+) -> dict[str, Any]:
+    """Describe the numeric values observed for one item and the shifts that fix them.
+
+    ``valid_offsets`` lists the offsets (derived from the nearest valid levels
+    of each out-of-range value) under which every observed value is valid.
+    """
+    numeric_values = [
+        number
+        for value, _count in value_counts
+        if (number := _to_float(value)) is not None
+    ]
+    profile: dict[str, Any] = {
+        "observed_values": sorted(
+            {normalize_fn(value) for value, _count in value_counts},
+            key=lambda text: (_to_float(text) is None, _to_float(text) or 0.0, text),
+        ),
+        "numeric_min": (
+            _coerce_numeric_offset_value(min(numeric_values)) if numeric_values else None
+        ),
+        "numeric_max": (
+            _coerce_numeric_offset_value(max(numeric_values)) if numeric_values else None
+        ),
+        "invalid_values": [],
+        "valid_offsets": [],
+    }
+    if not isinstance(item_schema, dict) or not value_counts:
+        return profile
+
+    def _is_valid(value: Any) -> bool:
+        is_valid, _ = _is_valid_survey_item_value(
+            val=value,
+            item_schema=item_schema,
+            strict_levels=strict_levels,
+            normalize_fn=normalize_fn,
+            missing_token=missing_token,
+        )
+        return is_valid
+
+    invalid_values = [value for value, _count in value_counts if not _is_valid(value)]
+    if not invalid_values:
+        return profile
+    profile["invalid_values"] = sorted(
+        {normalize_fn(value) for value in invalid_values},
+        key=lambda text: (_to_float(text) or 0.0, text),
+    )
+
+    levels = item_schema.get("Levels")
+    if not isinstance(levels, dict):
+        levels = {}
+    candidates: dict[str, float | int] = {}
+    for value in invalid_values:
+        for offset in _suggest_offsets_for_invalid_value(
+            value_num=_to_float(value),
+            levels=levels,
+            item_schema=item_schema,
+        ):
+            candidates.setdefault(f"{float(offset):.6f}", offset)
+
+    profile["valid_offsets"] = sorted(
+        (
+            offset
+            for offset in candidates.values()
+            if all(
+                _is_valid(_apply_numeric_offset(value, float(offset)))
+                for value, _count in value_counts
+            )
+        ),
+        key=float,
+    )
+    return profile
+
+
 # -----------------------------------------------------------------------------
 # Value Normalization
 # -----------------------------------------------------------------------------
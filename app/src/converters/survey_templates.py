@@ -11,6 +11,7 @@ from __future__ import annotations
 import logging
 import re
 import os
+import threading
 from copy import deepcopy
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -419,6 +420,144 @@ def _load_global_library_path() -> Path | None:
     return None
 
 
+# --- Template Library Cache ---
+
+
+@dataclass(frozen=True)
+class _TemplateItemIndex:
+    """Normalized item codes of a library template, precomputed once."""
+
+    run_normalized: frozenset[str]
+    ls_norm: dict[str, str]  # LS-sanitized code -> run-normalized code
+    norm_to_original: dict[str, str]  # run-normalized code -> original code
+
+
+def _build_template_item_index(structure: set[str]) -> _TemplateItemIndex:
+    """Precompute run-stripped and LS-normalized codes for a template structure."""
+    run_normalized, _ = _normalize_item_codes(structure)
+    norm_to_original: dict[str, str] = {}
+    for code in sorted(structure):
+        base, _ = _strip_run_suffix(code)
+        if base not in norm_to_original:
+            norm_to_original[base] = code
+    return _TemplateItemIndex(
+        run_normalized=frozenset(run_normalized),
+        ls_norm={_ls_normalize_code(c): c for c in sorted(run_normalized)},
+        norm_to_original=norm_to_original,
+    )
+
+
+@dataclass
+class _CachedTemplateFile:
+    fingerprint: tuple[int, int]  # (st_mtime_ns, st_size)
+    path: Path
+    sidecar: dict
+    task_raw: str
+    structure: set[str]
+    items: _TemplateItemIndex
+
+
+@dataclass
+class _CachedTemplateDir:
+    mtime_ns: int
+    paths: list[Path]
+    files: dict[Path, _CachedTemplateFile] = field(default_factory=dict)
+
+
+class _TemplateLibraryCache:
+    """Process-wide cache of parsed ``survey-*.json`` library templates.
+
+    Directory listings are re-globbed only when the directory mtime changes;
+    individual templates are re-parsed only when their (mtime, size)
+    fingerprint changes. Cached sidecars are shared between callers and must
+    be treated as read-only.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._dirs: dict[Path, _CachedTemplateDir] = {}
+
+    def clear(self) -> None:
+        with self._lock:
+            self._dirs.clear()
+
+    def load(self, survey_dir: Path) -> list[_CachedTemplateFile]:
+        try:
+            dir_mtime_ns = survey_dir.stat().st_mtime_ns
+        except OSError:
+            return []
+
+        with self._lock:
+            cached_dir = self._dirs.get(survey_dir)
+            if cached_dir is None or cached_dir.mtime_ns != dir_mtime_ns:
+                paths = [
+                    json_path
+                    for json_path in sorted(survey_dir.glob("survey-*.json"))
+                    if not _is_participant_template(json_path)
+                ]
+                previous = cached_dir.files if cached_dir else {}
+                cached_dir = _CachedTemplateDir(
+                    mtime_ns=dir_mtime_ns,
+                    paths=paths,
+                    files={p: previous[p] for p in paths if p in previous},
+                )
+                self._dirs[survey_dir] = cached_dir
+
+            entries: list[_CachedTemplateFile] = []
+            for json_path in cached_dir.paths:
+                entry = self._load_file(cached_dir, json_path)
+                if entry is not None:
+                    entries.append(entry)
+            return entries
+
+    @staticmethod
+    def _load_file(
+        cached_dir: _CachedTemplateDir, json_path: Path
+    ) -> _CachedTemplateFile | None:
+        try:
+            stat = json_path.stat()
+        except OSError:
+            cached_dir.files.pop(json_path, None)
+            return None
+        fingerprint = (stat.st_mtime_ns, stat.st_size)
+
+        entry = cached_dir.files.get(json_path)
+        if entry is not None and entry.fingerprint == fingerprint:
+            return entry
+
+        try:
+            sidecar = _read_json(json_path)
+        except Exception:
+            cached_dir.files.pop(json_path, None)
+            return None
+        if not isinstance(sidecar, dict):
+            cached_dir.files.pop(json_path, None)
+            return None
+
+        task_from_name = json_path.stem.replace("survey-", "")
+        structure = _extract_template_structure(sidecar)
+        entry = _CachedTemplateFile(
+            fingerprint=fingerprint,
+            path=json_path,
+            sidecar=sidecar,
+            task_raw=str(
+                sidecar.get("Study", {}).get("TaskName") or task_from_name
+            ).strip(),
+            structure=structure,
+            items=_build_template_item_index(structure),
+        )
+        cached_dir.files[json_path] = entry
+        return entry
+
+
+_TEMPLATE_LIBRARY_CACHE = _TemplateLibraryCache()
+
+
+def clear_template_library_cache() -> None:
+    """Drop all cached library templates (e.g. after bulk library edits)."""
+    _TEMPLATE_LIBRARY_CACHE.clear()
+
+
 def _load_global_templates() -> dict[str, dict]:
     """Load all templates from the global library."""
     global_path = _load_global_library_path()
@@ -426,22 +565,15 @@ def _load_global_templates() -> dict[str, dict]:
         return {}
 
     templates = {}
-    for json_path in sorted(global_path.glob("survey-*.json")):
-        if _is_participant_template(json_path):
-            continue
-        try:
-            sidecar = _read_json(json_path)
-        except Exception:
-            continue
-
-        task_from_name = json_path.stem.replace("survey-", "")
-        task = str(sidecar.get("Study", {}).get("TaskName") or task_from_name).strip()
-        task_norm = task.lower() or task_from_name.lower()
+    for entry in _TEMPLATE_LIBRARY_CACHE.load(global_path):
+        task_from_name = entry.path.stem.replace("survey-", "")
+        task_norm = entry.task_raw.lower() or task_from_name.lower()
 
         templates[task_norm] = {
-            "path": json_path,
-            "json": sidecar,
-            "structure": _extract_template_structure(sidecar),
+            "path": entry.path,
+            "json": entry.sidecar,
+            "structure": entry.structure,
+            "items": entry.items,
         }
 
     return templates
@@ -455,27 +587,18 @@ def _load_project_templates(project_path: str | Path) -> dict[str, dict]:
         return {}
 
     templates = {}
-    for json_path in sorted(survey_dir.glob("survey-*.json")):
-        if _is_participant_template(json_path):
-            continue
-        try:
-            sidecar = _read_json(json_path)
-        except Exception:
-            continue
-
-        task_from_name = json_path.stem.replace("survey-", "")
-        task_raw = str(
-            sidecar.get("Study", {}).get("TaskName") or task_from_name
-        ).strip()
+    for entry in _TEMPLATE_LIBRARY_CACHE.load(survey_dir):
+        task_from_name = entry.path.stem.replace("survey-", "")
         # Strip run suffixes from TaskName so templates saved from a specific
         # run (e.g., "scalerun2") can match other runs of the same scale.
-        task, _ = _strip_run_suffix(task_raw)
+        task, _ = _strip_run_suffix(entry.task_raw)
         task_norm = task.lower() or task_from_name.lower()
 
         templates[task_norm] = {
-            "path": json_path,
-            "json": sidecar,
-            "structure": _extract_template_structure(sidecar),
+            "path": entry.path,
+            "json": entry.sidecar,
+            "structure": entry.structure,
+            "items": entry.items,
             "source": "project",
         }
 
@@ -708,16 +831,38 @@ def _match_against_participants(
     )
 
 
-def match_against_library(
-    prism_json: dict,
-    global_templates: Optional[dict[str, dict]] = None,
-    group_name: str = "",
-    project_path: Optional[str | Path] = None,
-) -> Optional[TemplateMatch]:
-    """Match a single PRISM template against the template library."""
-    if global_templates is None:
-        global_templates = _load_global_templates()
+@dataclass
+class _TemplateLibraryIndex:
+    """Inverted index from normalized item codes to library templates.
+
+    Only templates that share at least one LimeSurvey-normalized item code
+    with an import (or whose abbreviation equals the PRISMMETA abbreviation)
+    can ever produce a match, so matching scores just those candidates.
+    """
 
+    templates: dict[str, dict]
+    items: dict[str, _TemplateItemIndex]
+    order: dict[str, int]
+    by_code: dict[str, set[str]]
+    by_abbrev: dict[str, set[str]]
+
+    def candidate_keys(
+        self, imported_ls_codes: set[str], prismmeta_abbrev: str
+    ) -> list[str]:
+        """Return template keys worth scoring, in library order."""
+        keys: set[str] = set()
+        for code in imported_ls_codes:
+            keys.update(self.by_code.get(code, ()))
+        if prismmeta_abbrev:
+            keys.update(self.by_abbrev.get(_ls_normalize_code(prismmeta_abbrev), ()))
+        return sorted(keys, key=self.order.__getitem__)
+
+
+def _combine_library_templates(
+    global_templates: Optional[dict[str, dict]],
+    project_path: Optional[str | Path],
+) -> dict[str, dict]:
+    """Merge global and project templates; project keys get a prefix."""
     all_templates: dict[str, dict] = {}
     if global_templates:
         for key, tdata in global_templates.items():
@@ -729,6 +874,65 @@ def match_against_library(
         for key, tdata in project_templates.items():
             proj_key = f"__project__{key}"
             all_templates[proj_key] = tdata
+    return all_templates
+
+
+def _build_template_library_index(
+    all_templates: dict[str, dict],
+) -> _TemplateLibraryIndex:
+    """Index templates by LS-normalized item code and abbreviation."""
+    items: dict[str, _TemplateItemIndex] = {}
+    order: dict[str, int] = {}
+    by_code: dict[str, set[str]] = {}
+    by_abbrev: dict[str, set[str]] = {}
+
+    for position, (task_key, tdata) in enumerate(all_templates.items()):
+        order[task_key] = position
+        lib_struct = tdata["structure"]
+        if not lib_struct:
+            continue
+
+        lib_items = tdata.get("items")
+        if not isinstance(lib_items, _TemplateItemIndex):
+            lib_items = _build_template_item_index(lib_struct)
+        items[task_key] = lib_items
+        for ls_code in lib_items.ls_norm:
+            by_code.setdefault(ls_code, set()).add(task_key)
+
+        lib_study = tdata.get("json", {}).get("Study", {})
+        lib_abbr = get_study_short_name(lib_study).strip()
+        if lib_abbr:
+            by_abbrev.setdefault(_ls_normalize_code(lib_abbr), set()).add(task_key)
+
+    return _TemplateLibraryIndex(
+        templates=all_templates,
+        items=items,
+        order=order,
+        by_code=by_code,
+        by_abbrev=by_abbrev,
+    )
+
+
+def match_against_library(
+    prism_json: dict,
+    global_templates: Optional[dict[str, dict]] = None,
+    group_name: str = "",
+    project_path: Optional[str | Path] = None,
+    *,
+    library_index: Optional[_TemplateLibraryIndex] = None,
+) -> Optional[TemplateMatch]:
+    """Match a single PRISM template against the template library.
+
+    ``library_index`` lets batch callers reuse one index across groups; when
+    given, ``global_templates`` and ``project_path`` are ignored.
+    """
+    if library_index is None:
+        if global_templates is None:
+            global_templates = _load_global_templates()
+        library_index = _build_template_library_index(
+            _combine_library_templates(global_templates, project_path)
+        )
+    all_templates = library_index.templates
 
     imported_struct = {
         k
@@ -752,24 +956,35 @@ def match_against_library(
     prismmeta_abbrev = prismmeta_fields.get("abbrev", "").strip()
     prismmeta_name = prismmeta_fields.get("name", "").strip()
 
+    imported_ls_keys = set(imported_ls_norm)
+    candidate_keys = library_index.candidate_keys(imported_ls_keys, prismmeta_abbrev)
+    # Name matching only influences the scoring of candidates, so restrict it
+    # to them (and their global twins, which propagate to "__project__" keys).
+    candidate_set = set(candidate_keys)
+    name_match_templates = {
+        key: tdata
+        for key, tdata in all_templates.items()
+        if key in candidate_set or f"__project__{key}" in candidate_set
+    }
+
     name_candidates = set()
     raw_name_candidates = set()
     if group_name:
-        raw_name_candidates.update(_match_by_name(group_name, all_templates))
+        raw_name_candidates.update(_match_by_name(group_name, name_match_templates))
 
     imp_study = prism_json.get("Study", {})
     imp_abbr = get_study_short_name(imp_study).strip()
     imp_task = str(imp_study.get("TaskName", "")).strip()
     for label in (imp_abbr, imp_task):
         if label:
-            raw_name_candidates.update(_match_by_name(label, all_templates))
+            raw_name_candidates.update(_match_by_name(label, name_match_templates))
 
     # Use PRISMMETA abbreviation and name as additional matching signals.
     # These come from the hidden metadata question that PRISM embeds in
     # exported .lss files — they identify the original template precisely.
     for label in (prismmeta_abbrev, prismmeta_name):
         if label:
-            raw_name_candidates.update(_match_by_name(label, all_templates))
+            raw_name_candidates.update(_match_by_name(label, name_match_templates))
 
     name_candidates = set(raw_name_candidates)
     for key in raw_name_candidates:
@@ -778,24 +993,17 @@ def match_against_library(
     best_match: Optional[TemplateMatch] = None
     best_overlap_ratio = 0.0
 
-    for task_key, tdata in all_templates.items() if all_templates else []:
-        lib_struct = tdata["structure"]
-        if not lib_struct:
-            continue
-
+    for task_key in candidate_keys:
+        tdata = all_templates[task_key]
         real_key = task_key.removeprefix("__project__")
         template_source = tdata.get("source", "global")
 
-        lib_run_normalized, _ = _normalize_item_codes(lib_struct)
-        lib_ls_norm = {_ls_normalize_code(c): c for c in lib_run_normalized}
+        lib_items = library_index.items[task_key]
+        lib_run_normalized = lib_items.run_normalized
+        lib_ls_norm = lib_items.ls_norm
+        lib_norm_to_original = lib_items.norm_to_original
 
-        lib_norm_to_original: dict[str, str] = {}
-        for code in lib_struct:
-            base, _ = _strip_run_suffix(code)
-            if base not in lib_norm_to_original:
-                lib_norm_to_original[base] = code
-
-        ls_overlap_keys = set(imported_ls_norm.keys()) & set(lib_ls_norm.keys())
+        ls_overlap_keys = imported_ls_keys & lib_ls_norm.keys()
         overlap_count = len(ls_overlap_keys)
 
         # Check if PRISMMETA abbreviation matches this library template.
@@ -1322,13 +1530,16 @@ def match_groups_against_library(
     if global_templates is None:
         global_templates = _load_global_templates()
 
+    library_index = _build_template_library_index(
+        _combine_library_templates(global_templates, project_path)
+    )
+
     results = {}
     for group_name, prism_json in groups.items():
         results[group_name] = match_against_library(
             prism_json,
-            global_templates,
             group_name=group_name,
-            project_path=project_path,
+            library_index=library_index,
         )
     return results
 
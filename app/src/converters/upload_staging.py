@@ -0,0 +1,19 @@
+"""Compatibility shim for the upload staging area.
+
+Delegates runtime symbols to canonical backend module:
+`src/converters/upload_staging.py`.
+"""
+
+from __future__ import annotations
+
+from src._compat import load_canonical_module
+
+_src_upload_staging = load_canonical_module(
+    current_file=__file__,
+    canonical_rel_path="converters/upload_staging.py",
+    alias="prism_backend_converters_upload_staging",
+)
+
+for _name in dir(_src_upload_staging):
+    if not _name.startswith("__"):
+        globals()[_name] = getattr(_src_upload_staging, _name)
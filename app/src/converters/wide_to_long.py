@@ -39,6 +39,46 @@ if TYPE_CHECKING:
         data_columns: list[str],
     ) -> list[dict[str, Any]]: ...
 
+    def resolve_wide_to_long_id_column(
+        columns: list[str],
+        *,
+        source_format: str,
+        explicit_id_column: str | None = None,
+    ) -> tuple[str, dict[str, Any]]: ...
+
+    def check_wide_to_long_id_values(
+        df: Any,
+        *,
+        id_column: str,
+        max_examples: int = 5,
+    ) -> dict[str, Any]: ...
+
+    def prepare_wide_to_long_plan(
+        columns: list[str],
+        *,
+        session_indicators: list[str] | None = None,
+        session_prefixes: list[str] | None = None,
+        session_column_name: str = "session",
+        session_value_map: dict[str, str] | None = None,
+        run_indicators: list[str] | None = None,
+        run_column_name: str = "run",
+        run_value_map: dict[str, str] | None = None,
+        session_plan: dict[str, Any] | None = None,
+    ) -> dict[str, Any]: ...
+
+    def convert_wide_to_long_chunk(df: Any, prepared: dict[str, Any]) -> Any: ...
+
+    def stream_wide_to_long(
+        chunks: Any,
+        prepared: dict[str, Any],
+        *,
+        id_column: str,
+        output_path: Any = None,
+        separator: str = ",",
+        drop_empty_rows: bool = False,
+        preview_rows: int = 0,
+    ) -> dict[str, Any]: ...
+
 else:
     _src_wide_to_long = load_canonical_module(
         current_file=__file__,
@@ -8,7 +8,6 @@ from flask import Blueprint, render_template, request, jsonify
 from pathlib import Path
 import os
 import sys
-from src.web.blueprints.conversion_utils import resolve_existing_project_root
 
 
 def _startup_detail_print(message: str) -> None:
@@ -98,6 +97,10 @@ def create_json_editor_blueprint(bids_folder=None):
         """Ensure JSON editor is using the currently selected project from session"""
         from flask import session
 
+        # Imported here: conversion_utils loads pandas, which app startup
+        # should not pay for.
+        from src.web.blueprints.conversion_utils import resolve_existing_project_root
+
         if not file_manager:
             return
 
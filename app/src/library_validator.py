@@ -3,6 +3,8 @@ import os
 from collections import defaultdict
 from pathlib import Path
 
+from src.library_item_index import LibraryItemIndex
+
 
 def check_uniqueness(library_path):
     """
@@ -52,8 +54,8 @@ def check_uniqueness(library_path):
     # Note: We don't import load_schema here to avoid circular imports if any.
     # But we can try to import it locally.
     try:
-        from .schema_manager import load_schema
-        from jsonschema import validate, ValidationError
+        from .schema_manager import load_schema, validate_against_schema
+        from jsonschema import ValidationError
         from src.survey_template_normalization import (
             normalize_survey_template_for_validation,
         )
@@ -84,7 +86,7 @@ def check_uniqueness(library_path):
                     # VariantID autofill, paper/software platform mapping)
                     # — see docs/_archive/GUI_BACKEND_AUDIT_2026-08-07.md, P1-4.
                     data = normalize_survey_template_for_validation(data)
-                validate(instance=data, schema=schema)
+                validate_against_schema(data, schema)
             except ValidationError as e:
                 print(f"❌ Schema error in {file_path.name}: {e.message}")
                 schema_errors += 1
@@ -118,65 +120,29 @@ class LibraryValidator:
             "Normative",
         }
 
-    def _template_files(self, exclude_file=None):
-        if not self.library_path.exists():
-            return []
-
-        return [
-            f
-            for f in sorted(self.library_path.glob("*.json"))
-            if (f.name.startswith("survey-") or f.name.startswith("biometrics-"))
-            and f.name != exclude_file
-        ]
-
-    def _iter_template_items(self, file_path):
-        try:
-            with open(file_path, encoding="utf-8") as f:
-                data = json.load(f)
-        except Exception:
-            return
-
-        if "Questions" in data and isinstance(data["Questions"], dict):
-            items = data["Questions"]
-        elif isinstance(data, dict):
-            items = {k: v for k, v in data.items() if k not in self.IGNORE_KEYS}
-        else:
-            return
-
-        for item_id, item_def in items.items():
-            yield item_id, item_def
-
-    def _item_signature(self, item_def):
-        # Items are considered identical if they share the same content,
-        # ignoring both "AliasOf" (backward pointer) and "Aliases" (forward list)
-        normalized = {
-            k: item_def[k] for k in sorted(item_def) if k not in ("AliasOf", "Aliases")
-        }
-        return json.dumps(normalized, sort_keys=True, ensure_ascii=False)
+    def _index(self):
+        return LibraryItemIndex.for_library(self.library_path)
 
     def find_redundant_items(self):
+        # Items are considered identical if they share the same content,
+        # ignoring both "AliasOf" (backward pointer) and "Aliases" (forward
+        # list); the index stores that signature per item.
         issues = []
-        for file_path in self._template_files():
-            signature_map = defaultdict(list)
-            for item_id, item_def in self._iter_template_items(file_path):
-                if not isinstance(item_def, dict):
-                    continue
-                signature = self._item_signature(item_def)
-                signature_map[signature].append((item_id, item_def))
+        if not self.library_path.exists():
+            return issues
 
-            for group in signature_map.values():
+        for template in self._index().templates():
+            if template.error is not None:
+                continue
+            for group in template.signature_groups(self.IGNORE_KEYS).values():
                 if len(group) <= 1:
                     continue
 
-                canonical = [
-                    item_id for item_id, item_def in group if "AliasOf" not in item_def
-                ]
+                canonical = [item.item_id for item in group if not item.has_alias_of]
                 alias_entries = [
-                    (item_id, item_def.get("AliasOf"))
-                    for item_id, item_def in group
-                    if "AliasOf" in item_def
+                    (item.item_id, item.alias_of) for item in group if item.has_alias_of
                 ]
-                sorted_items = sorted(item_id for item_id, _ in group)
+                sorted_items = sorted(item.item_id for item in group)
 
                 if (
                     alias_entries
@@ -188,14 +154,14 @@ class LibraryValidator:
                 ):
                     severity = "info"
                     alias_names = ", ".join(item for item, _ in alias_entries)
-                    message = f"{file_path.name}: canonical '{canonical[0]}' has aliases ({alias_names}) that duplicate its content."
+                    message = f"{template.name}: canonical '{canonical[0]}' has aliases ({alias_names}) that duplicate its content."
                 else:
                     severity = "warning"
-                    message = f"{file_path.name}: items {', '.join(sorted_items)} share identical content; remove duplicates or mark them with AliasOf."
+                    message = f"{template.name}: items {', '.join(sorted_items)} share identical content; remove duplicates or mark them with AliasOf."
 
                 issues.append(
                     {
-                        "file": file_path.name,
+                        "file": template.name,
                         "items": sorted_items,
                         "canonical": canonical,
                         "aliases": alias_entries,
@@ -211,38 +177,15 @@ class LibraryValidator:
         Returns a map of variable -> list of filenames for the entire library,
         optionally excluding a specific filename (useful when checking a draft against others).
         """
-        var_map = defaultdict(list)
-
         if not self.library_path.exists():
-            return var_map
-
-        # Look for both survey and biometrics files
-        files = [
-            f
-            for f in self.library_path.glob("*.json")
-            if (f.name.startswith("survey-") or f.name.startswith("biometrics-"))
-            and f.name != exclude_file
-        ]
+            return defaultdict(list)
 
-        for file_path in files:
-            try:
-                with open(file_path, "r") as f:
-                    data = json.load(f)
-
-                # Handle both flat structure and nested "Questions" structure
-                variables = []
-                if "Questions" in data and isinstance(data["Questions"], dict):
-                    variables = list(data["Questions"].keys())
-                else:
-                    variables = [k for k in data.keys() if k not in self.IGNORE_KEYS]
-
-                for var in variables:
-                    var_map[var].append(file_path.name)
-
-            except Exception as e:
-                print(f"Error reading {file_path.name}: {e}")
+        index = self._index()
+        for template in index.templates(exclude_file=exclude_file):
+            if template.error is not None:
+                print(f"Error reading {template.name}: {template.error}")
 
-        return var_map
+        return index.variable_map(self.IGNORE_KEYS, exclude_file=exclude_file)
 
     def validate_draft(self, draft_content, filename):
         """
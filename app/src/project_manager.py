@@ -49,6 +49,7 @@ from src.project_export_helpers import (
 )
 from src.constants import DEFAULT_BIDS_VERSION
 from src.cross_platform import CrossPlatformFile, describe_case_insensitive_id_collisions
+from src.export_copy import ExportCopier
 from src.entity_rules import load_entity_rules
 from src.issues import get_fix_hint, infer_code_from_message
 from src.schema_manager import load_schema
@@ -2009,8 +2010,14 @@ class ProjectManager:
         exclude_tasks: Optional[Dict[str, set[str]]] = None,
         materialize_annex_content: bool = False,
         export_phenotype_bridge: bool = False,
+        copy_mode: str = "auto",
     ) -> Dict[str, Any]:
-        """Export a project to a plain folder copy without Git/DataLad metadata."""
+        """Export a project to a plain folder copy without Git/DataLad metadata.
+
+        ``copy_mode="auto"`` lets :class:`src.export_copy.ExportCopier` use
+        reflinks, hardlinks (payload files only) or ``copy_file_range`` where
+        the filesystem supports them; ``"copy"`` always copies bytes.
+        """
         project_path = Path(path)
         status = self.get_datalad_status(project_path)
         result: Dict[str, Any] = {
@@ -2023,6 +2030,12 @@ class ProjectManager:
             result["error"] = f"Path does not exist or is not a directory: {project_path}"
             return result
 
+        try:
+            copier = ExportCopier(copy_mode, root=project_path)
+        except ValueError as exc:
+            result["error"] = str(exc)
+            return result
+
         # A source dataset can contain subject directories that differ only
         # by case (e.g. created on a case-sensitive filesystem, or by an
         # importer that predates the same check at conversion time). Copying
@@ -2912,7 +2925,7 @@ class ProjectManager:
 
         def _copy_with_missing_tolerance(src: str, dst: str) -> str:
             try:
-                return shutil.copy2(src, dst)
+                return copier(src, dst)
             except FileNotFoundError:
                 missing_source_paths.append(src)
                 return dst
@@ -2964,6 +2977,7 @@ class ProjectManager:
 
             return visible_file_count
 
+        copier.root = copy_source_path
         try:
             self._emit_backend_progress(
                 f'Starting filesystem copy for plain folder export "{export_path.name}".',
@@ -3011,6 +3025,7 @@ class ProjectManager:
 
                 missing_source_paths = []
                 copy_source_path = project_path
+                copier.root = copy_source_path
                 try:
                     self._emit_backend_progress(
                         (
@@ -3153,7 +3168,7 @@ class ProjectManager:
                 destination_candidate = export_path / rel_path
                 try:
                     destination_candidate.parent.mkdir(parents=True, exist_ok=True)
-                    shutil.copy2(str(original_candidate), str(destination_candidate))
+                    copier(str(original_candidate), str(destination_candidate))
                     recovered_missing_files += 1
                 except FileNotFoundError:
                     unresolved_source_paths.append(str(source_candidate))
@@ -3195,7 +3210,11 @@ class ProjectManager:
         if export_phenotype_bridge:
             result["phenotype_bridge_files"] = phenotype_bridge_file_count
         result["excluded_repository_metadata"] = sorted(ignored_names)
-        result["message"] = f"Project folder export created at {export_path} without Git/DataLad metadata."
+        result["copy_strategy"] = copier.summary()
+        result["message"] = (
+            f"Project folder export created at {export_path} without Git/DataLad "
+            f"metadata (files: {copier.describe()})."
+        )
         if bidsignore_rules_added:
             result["bidsignore_rules_added"] = sorted(bidsignore_rules_added)
         if materialized_export:
@@ -3255,6 +3274,7 @@ class ProjectManager:
         exclude_tasks: Optional[Dict[str, set[str]]] = None,
         init_git_lfs_repo: bool = True,
         export_phenotype_bridge: bool = False,
+        copy_mode: str = "auto",
     ) -> Dict[str, Any]:
         """Export a project to a Git LFS-ready folder copy.
 
@@ -3281,6 +3301,7 @@ class ProjectManager:
             exclude_tasks=exclude_tasks,
             materialize_annex_content=True,
             export_phenotype_bridge=export_phenotype_bridge,
+            copy_mode=copy_mode,
         )
         if not result.get("success"):
             return result
@@ -13,10 +13,10 @@ from copy import deepcopy
 from pathlib import Path
 from typing import Callable, Optional
 
-from jsonschema import validate, ValidationError
+from jsonschema import ValidationError
 
 from schema_manager import load_all_schemas
-from schema_manager import validate_schema_version
+from schema_manager import validate_against_schema, validate_schema_version
 from validator import (
     DatasetValidator,
     MODALITY_PATTERNS,
@@ -223,7 +223,7 @@ def validate_dataset(
                     for level, msg in version_issues:
                         issues.append((level, msg, dataset_desc_path))
 
-                    validate(instance=dataset_desc, schema=schema_for_validation)
+                    validate_against_schema(dataset_desc, schema_for_validation)
         except json.JSONDecodeError as e:
             if run_prism:
                 issues.append(
@@ -4,11 +4,21 @@ Schema management for prism
 
 import os
 import json
+import threading
+from collections import OrderedDict
 from copy import deepcopy
 
 # Default schema version to use when not specified
 DEFAULT_SCHEMA_VERSION = "stable"
 
+# Compiled jsonschema validators keyed by schema content. ``jsonschema.validate``
+# re-checks the schema against its metaschema on every call (~10 ms for the
+# survey schema); a compiled validator is reused across sidecars, and across
+# jobs in the worker daemon.
+_COMPILED_VALIDATOR_LIMIT = 64
+_compiled_validators: "OrderedDict[str, object]" = OrderedDict()
+_compiled_validators_lock = threading.Lock()
+
 
 def parse_version(version_string):
     """Parse semantic version string to tuple of integers"""
@@ -199,3 +209,41 @@ def apply_schema_validation_profile(schema, profile="project"):
         section_schema["required"] = [r for r in req if r not in keys]
 
     return adjusted
+
+
+def _compiled_validator(schema):
+    from jsonschema import validators
+
+    key = json.dumps(schema, sort_keys=True, default=str)
+    with _compiled_validators_lock:
+        validator = _compiled_validators.get(key)
+        if validator is not None:
+            _compiled_validators.move_to_end(key)
+            return validator
+
+    cls = validators.validator_for(schema)
+    cls.check_schema(schema)
+    validator = cls(schema)
+    with _compiled_validators_lock:
+        _compiled_validators[key] = validator
+        while len(_compiled_validators) > _COMPILED_VALIDATOR_LIMIT:
+            _compiled_validators.popitem(last=False)
+    return validator
+
+
+def validate_against_schema(instance, schema):
+    """Drop-in for ``jsonschema.validate`` that reuses compiled validators.
+
+    Raises the same ``ValidationError`` (best match) or ``SchemaError``.
+    """
+    from jsonschema import exceptions
+
+    error = exceptions.best_match(_compiled_validator(schema).iter_errors(instance))
+    if error is not None:
+        raise error
+
+
+def clear_compiled_validators():
+    """Forget compiled validators (e.g. after schema files changed)."""
+    with _compiled_validators_lock:
+        _compiled_validators.clear()
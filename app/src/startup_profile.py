@@ -0,0 +1,135 @@
+"""
+In-process import timing for ``prism-studio.py --profile-startup``.
+
+Works like ``python -X importtime`` but also inside PyInstaller builds, where
+interpreter flags cannot be passed: a meta-path hook times every module's
+execution and :meth:`StartupImportProfiler.format_report` prints the slowest
+modules by cumulative and self time, plus per-package totals.
+"""
+
+from __future__ import annotations
+
+import sys
+import threading
+import time
+from importlib.abc import MetaPathFinder
+from typing import Any
+
+
+class _TimedLoader:
+    """Delegating loader that reports ``exec_module`` timings."""
+
+    def __init__(self, loader: Any, fullname: str, profiler: "StartupImportProfiler"):
+        self._loader = loader
+        self._fullname = fullname
+        self._profiler = profiler
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._loader, name)
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module) -> None:
+        self._profiler._enter(self._fullname)
+        try:
+            self._loader.exec_module(module)
+        finally:
+            self._profiler._exit()
+
+
+class StartupImportProfiler(MetaPathFinder):
+    """Record self and cumulative import time per module, in microseconds."""
+
+    def __init__(self) -> None:
+        self.timings: dict[str, tuple[int, int]] = {}
+        self.order: list[str] = []
+        self._local = threading.local()
+        self._installed_at: float | None = None
+
+    def install(self) -> None:
+        if self not in sys.meta_path:
+            sys.meta_path.insert(0, self)
+            self._installed_at = time.perf_counter()
+
+    def uninstall(self) -> None:
+        if self in sys.meta_path:
+            sys.meta_path.remove(self)
+
+    def find_spec(self, fullname, path=None, target=None):
+        if getattr(self._local, "finding", False):
+            return None
+        self._local.finding = True
+        try:
+            for finder in sys.meta_path:
+                if finder is self or not hasattr(finder, "find_spec"):
+                    continue
+                spec = finder.find_spec(fullname, path, target)
+                if spec is not None:
+                    break
+            else:
+                return None
+        finally:
+            self._local.finding = False
+        if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+            spec.loader = _TimedLoader(spec.loader, fullname, self)
+        return spec
+
+    def _stack(self) -> list[list[Any]]:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def _enter(self, fullname: str) -> None:
+        self._stack().append([fullname, time.perf_counter(), 0.0])
+
+    def _exit(self) -> None:
+        fullname, started, children = self._stack().pop()
+        elapsed = time.perf_counter() - started
+        stack = self._stack()
+        if stack:
+            stack[-1][2] += elapsed
+        self.timings[fullname] = (
+            int((elapsed - children) * 1_000_000),
+            int(elapsed * 1_000_000),
+        )
+        self.order.append(fullname)
+
+    def total_us(self) -> int:
+        """Wall time since :meth:`install`, in microseconds."""
+        if self._installed_at is None:
+            return 0
+        return int((time.perf_counter() - self._installed_at) * 1_000_000)
+
+    def package_totals(self) -> dict[str, int]:
+        """Self time summed per top-level package."""
+        totals: dict[str, int] = {}
+        for fullname, (self_us, _cumulative_us) in self.timings.items():
+            package = fullname.split(".", 1)[0]
+            if package in {"src", "app"}:
+                package = ".".join(fullname.split(".")[:2])
+            totals[package] = totals.get(package, 0) + self_us
+        return totals
+
+    def format_report(self, limit: int = 25) -> str:
+        lines = [
+            f"Startup imports: {len(self.timings)} modules, "
+            f"{self.total_us() / 1000:.0f} ms since profiling started",
+            "",
+            f"{'cumulative':>12} {'self':>10}  module",
+        ]
+        slowest = sorted(
+            self.timings.items(), key=lambda item: item[1][1], reverse=True
+        )[:limit]
+        for fullname, (self_us, cumulative_us) in slowest:
+            lines.append(
+                f"{cumulative_us / 1000:>10.1f}ms {self_us / 1000:>8.1f}ms  {fullname}"
+            )
+        lines.extend(["", f"{'self total':>12}  package"])
+        packages = sorted(
+            self.package_totals().items(), key=lambda item: item[1], reverse=True
+        )[:limit]
+        for package, self_us in packages:
+            lines.append(f"{self_us / 1000:>10.1f}ms  {package}")
+        return "\n".join(lines)
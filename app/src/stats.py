@@ -29,8 +29,80 @@ def _extract_suffix_label(filename):
     return suffix
 
 
+# Entity patterns are compiled once; each is only searched when the modality
+# needs it and a cheap substring test says the entity can be present.
+_ACQ_PATTERN = re.compile(r"_acq-([A-Za-z0-9]+)")
+_SURVEY_ACQ_PATTERN = re.compile(r"_acq-([A-Za-z0-9]+)(?:_|$)")
+_SURVEY_PATTERN = re.compile(r"_survey-([a-zA-Z0-9]+)")
+_TASK_PATTERN = re.compile(r"_task-([a-zA-Z0-9]+)")
+_BIOMETRICS_PATTERN = re.compile(r"_biometrics-([a-zA-Z0-9]+)")
+_RECORDING_PATTERN = re.compile(r"_recording-([a-zA-Z0-9]+)")
+
+_MRI_SUFFIX_MODALITIES = frozenset({"anat", "dwi", "fmap", "perf"})
+
+# Modalities whose tasks are tracked in their own category, not in `tasks`.
+_OWN_TASK_CATEGORY_MODALITIES = frozenset(
+    {
+        "survey",
+        "biometrics",
+        "eyetracking",
+        "physio",
+        "physiological",
+        "environment",
+        "beh",
+        "func",
+        "eeg",
+    }
+)
+
+
+def _entity(pattern, marker, filename):
+    """First value of an entity, or None; ``marker`` is its ``_key-`` prefix."""
+    if marker not in filename:
+        return None
+    match = pattern.search(filename)
+    return match.group(1) if match else None
+
+
+def _iter_bits(mask):
+    """Positions of the set bits of ``mask``, lowest first."""
+    position = 0
+    while mask:
+        if mask & 1:
+            yield position
+        mask >>= 1
+        position += 1
+
+
+class _LabelTable:
+    """Interns labels as small integers (their bit position in presence masks)."""
+
+    __slots__ = ("index", "labels")
+
+    def __init__(self):
+        self.index = {}
+        self.labels = []
+
+    def intern(self, label):
+        position = self.index.get(label)
+        if position is None:
+            position = self.index[label] = len(self.labels)
+            self.labels.append(label)
+        return position
+
+    def decode(self, mask):
+        """Labels whose bits are set in ``mask``, in first-seen order."""
+        return [self.labels[position] for position in _iter_bits(mask)]
+
+
 class DatasetStats:
-    """Collect and analyze dataset statistics"""
+    """Collect and analyze dataset statistics
+
+    Per-subject presence (sessions, modalities, tasks) is kept compactly:
+    labels are interned once and each subject / subject-session records the
+    labels it has as an integer bitmask, so memory grows with the number of
+    distinct labels rather than with the number of files.
+    """
 
     def __init__(self):
         self.subjects = set()
@@ -50,10 +122,16 @@ class DatasetStats:
         self.descriptions = {}  # type -> name -> description
         self.total_files = 0
         self.sidecar_files = 0
-        # For consistency checking
-        self.subject_data = (
-            {}
-        )  # subject_id -> {sessions: {}, modalities: set(), tasks: set()}
+        # For consistency checking: interned labels and presence bitmasks
+        self._subject_labels = _LabelTable()
+        self._session_labels = _LabelTable()
+        self._modality_labels = _LabelTable()
+        self._task_labels = _LabelTable()
+        self._subject_sessions = []  # subject index -> session mask
+        self._subject_modalities = []  # subject index -> modality mask
+        self._subject_tasks = []  # subject index -> task mask
+        self._session_presence = {}  # (subject, session) -> [modality mask, task mask]
+        self._last_pair = (object(), object(), -1, None)
 
     def register_file(self, filename):
         """Register a generic file (non-subject specific)"""
@@ -65,97 +143,71 @@ class DatasetStats:
         """Add a file to the statistics"""
         if subject_id:
             self.subjects.add(subject_id)
-        if session_id:
-            self.sessions.add(f"{subject_id}/{session_id}")
         if modality:
-            if modality not in self.modalities:
-                self.modalities[modality] = 0
-            self.modalities[modality] += 1
+            self.modalities[modality] = self.modalities.get(modality, 0) + 1
             # Track modality differentiators as independent labels so filters can
             # target either MRI suffixes (e.g. dwi, sbref) or acq values.
-            acq_value = None
-            if filename:
-                acq_match = re.search(r"_acq-([A-Za-z0-9]+)", filename)
-                if acq_match:
-                    acq_value = acq_match.group(1)
+            acq_value = _entity(_ACQ_PATTERN, "_acq-", filename) if filename else None
 
             suffix_label = None
-            if modality in ["anat", "dwi", "fmap", "perf"]:
+            if modality in _MRI_SUFFIX_MODALITIES:
                 suffix_label = _extract_suffix_label(filename)
 
-            if suffix_label:
-                self.acq_labels.setdefault(modality, set()).add(suffix_label)
-            if acq_value:
-                self.acq_labels.setdefault(modality, set()).add(acq_value)
-
-        # Only add to tasks if it's not a modality that has its own specific category
-        if task and modality not in [
-            "survey",
-            "biometrics",
-            "eyetracking",
-            "physio",
-            "physiological",
-            "environment",
-            "beh",
-            "func",
-            "eeg",
-        ]:
-            self.tasks.add(task)
-
-        if modality == "beh" and task:
-            self.beh_tasks.add(task)
-
-        if modality == "func" and task:
-            self.func_tasks.add(task)
-
-        if modality == "eeg" and task:
-            self.eeg_tasks.add(task)
+            if suffix_label or acq_value:
+                labels = self.acq_labels.setdefault(modality, set())
+                if suffix_label:
+                    labels.add(suffix_label)
+                if acq_value:
+                    labels.add(acq_value)
+
+        if task:
+            # Only add to tasks if it's not a modality that has its own specific category
+            if modality not in _OWN_TASK_CATEGORY_MODALITIES:
+                self.tasks.add(task)
+            elif modality == "beh":
+                self.beh_tasks.add(task)
+            elif modality == "func":
+                self.func_tasks.add(task)
+            elif modality == "eeg":
+                self.eeg_tasks.add(task)
 
         if modality == "survey":
             if task:
                 self.surveys.add(task)
-                acq_match = (
-                    re.search(r"_acq-([A-Za-z0-9]+)(?:_|$)", filename)
+                variant = (
+                    _entity(_SURVEY_ACQ_PATTERN, "_acq-", filename)
                     if filename
                     else None
                 )
-                if acq_match:
-                    self.survey_variants.setdefault(task, set()).add(
-                        acq_match.group(1)
-                    )
-            match = re.search(r"_survey-([a-zA-Z0-9]+)", filename)
-            if match:
-                self.surveys.add(match.group(1))
-
-        elif modality in ["eyetracking", "eyetrack"]:
-            if task:
-                self.eyetracking.add(task)
-            else:
-                # Fallback task extraction
-                match = re.search(r"_task-([a-zA-Z0-9]+)", filename)
-                if match:
-                    self.eyetracking.add(match.group(1))
-
-        elif modality in ["physio", "physiological"]:
-            if task:
-                self.physio.add(task)
-            else:
-                # Fallback task extraction
-                match = re.search(r"_task-([a-zA-Z0-9]+)", filename)
-                if match:
-                    self.physio.add(match.group(1))
+                if variant:
+                    self.survey_variants.setdefault(task, set()).add(variant)
+            survey_label = _entity(_SURVEY_PATTERN, "_survey-", filename)
+            if survey_label:
+                self.surveys.add(survey_label)
+
+        elif modality in ("eyetracking", "eyetrack"):
+            # Fallback task extraction
+            label = task or _entity(_TASK_PATTERN, "_task-", filename)
+            if label:
+                self.eyetracking.add(label)
+
+        elif modality in ("physio", "physiological"):
+            # Fallback task extraction
+            label = task or _entity(_TASK_PATTERN, "_task-", filename)
+            if label:
+                self.physio.add(label)
 
         elif modality == "biometrics":
             if task:
                 self.biometrics.add(task)
-            match = re.search(r"_biometrics-([a-zA-Z0-9]+)", filename)
-            if match:
-                self.biometrics.add(match.group(1))
+            biometrics_label = _entity(_BIOMETRICS_PATTERN, "_biometrics-", filename)
+            if biometrics_label:
+                self.biometrics.add(biometrics_label)
 
         elif modality == "environment":
-            match = re.search(r"_recording-([a-zA-Z0-9]+)", filename)
-            if match:
-                self.environment.add(match.group(1))
+            recording = _entity(_RECORDING_PATTERN, "_recording-", filename)
+            if recording:
+                self.environment.add(recording)
 
         self.total_files += 1
 
@@ -163,30 +215,63 @@ class DatasetStats:
         if filename.endswith(".json"):
             self.sidecar_files += 1
 
-        # Track per-subject data for consistency checking
-        if subject_id not in self.subject_data:
-            self.subject_data[subject_id] = {
-                "sessions": set(),
-                "modalities": set(),
-                "tasks": set(),
-                "session_data": {},  # session_id -> {modalities: set(), tasks: set()}
-            }
-
-        subject_info = self.subject_data[subject_id]
-        subject_info["modalities"].add(modality)
+        # Track per-subject presence for consistency checking. Files arrive
+        # grouped by subject/session, so the last pair's slots are reused.
+        last = self._last_pair
+        if last[0] == subject_id and last[1] == session_id:
+            subject, presence = last[2], last[3]
+        else:
+            subject = self._subject_labels.intern(subject_id)
+            if subject == len(self._subject_sessions):
+                self._subject_sessions.append(0)
+                self._subject_modalities.append(0)
+                self._subject_tasks.append(0)
+            presence = None
+            if session_id:
+                session = self._session_labels.intern(session_id)
+                session_bit = 1 << session
+                if not self._subject_sessions[subject] & session_bit:
+                    self._subject_sessions[subject] |= session_bit
+                    self.sessions.add(f"{subject_id}/{session_id}")
+                presence = self._session_presence.get((subject, session))
+                if presence is None:
+                    presence = self._session_presence[(subject, session)] = [0, 0]
+            self._last_pair = (subject_id, session_id, subject, presence)
+
+        modality_bit = 1 << self._modality_labels.intern(modality)
+        self._subject_modalities[subject] |= modality_bit
         if task:
-            subject_info["tasks"].add(task)
-
-        if session_id:
-            subject_info["sessions"].add(session_id)
-            if session_id not in subject_info["session_data"]:
-                subject_info["session_data"][session_id] = {
-                    "modalities": set(),
-                    "tasks": set(),
-                }
-            subject_info["session_data"][session_id]["modalities"].add(modality)
+            task_bit = 1 << self._task_labels.intern(task)
+            self._subject_tasks[subject] |= task_bit
+        if presence is not None:
+            presence[0] |= modality_bit
             if task:
-                subject_info["session_data"][session_id]["tasks"].add(task)
+                presence[1] |= task_bit
+
+    @property
+    def subject_data(self):
+        """Per-subject sessions/modalities/tasks as nested dicts of sets.
+
+        Built on demand from the compact masks; modifying it has no effect.
+        """
+        data = {}
+        for subject, subject_id in enumerate(self._subject_labels.labels):
+            session_data = {}
+            for session in _iter_bits(self._subject_sessions[subject]):
+                modality_mask, task_mask = self._session_presence[(subject, session)]
+                session_data[self._session_labels.labels[session]] = {
+                    "modalities": set(self._modality_labels.decode(modality_mask)),
+                    "tasks": set(self._task_labels.decode(task_mask)),
+                }
+            data[subject_id] = {
+                "sessions": set(session_data),
+                "modalities": set(
+                    self._modality_labels.decode(self._subject_modalities[subject])
+                ),
+                "tasks": set(self._task_labels.decode(self._subject_tasks[subject])),
+                "session_data": session_data,
+            }
+        return data
 
     def add_description(self, entity_type, name, description):
         """Store description (OriginalName) for an entity"""
@@ -208,15 +293,14 @@ class DatasetStats:
         if len(self.subjects) < 2:
             return warnings  # Can't check consistency with less than 2 subjects
 
-        # Separate subjects with and without sessions
-        subjects_with_sessions = {}
-        subjects_without_sessions = {}
-
-        for subject_id, data in self.subject_data.items():
-            if data["sessions"]:
-                subjects_with_sessions[subject_id] = data
+        # Separate subjects (by interned index) with and without sessions
+        subjects_with_sessions = []
+        subjects_without_sessions = []
+        for subject, session_mask in enumerate(self._subject_sessions):
+            if session_mask:
+                subjects_with_sessions.append(subject)
             else:
-                subjects_without_sessions[subject_id] = data
+                subjects_without_sessions.append(subject)
 
         # Check consistency within session-based subjects
         if len(subjects_with_sessions) > 1:
@@ -243,20 +327,16 @@ class DatasetStats:
     def _check_session_consistency(self, subjects_with_sessions):
         """Check consistency among subjects with sessions"""
         warnings = []
-
-        # Find all unique sessions across subjects
-        all_sessions = set()
-        for data in subjects_with_sessions.values():
-            all_sessions.update(data["sessions"])
+        subject_labels = self._subject_labels.labels
+        session_masks = self._subject_sessions
 
         # Summarize session prevalence to avoid huge "missing for subjects" lists
-        subject_ids = sorted(subjects_with_sessions.keys())
-        total_subjects = len(subject_ids)
-        present_by_session = {s: 0 for s in all_sessions}
-        for _subject_id, data in subjects_with_sessions.items():
-            for ses in data["sessions"]:
-                if ses in present_by_session:
-                    present_by_session[ses] += 1
+        present_by_session = {}
+        for subject in subjects_with_sessions:
+            for session in _iter_bits(session_masks[subject]):
+                present_by_session[session] = present_by_session.get(session, 0) + 1
+
+        total_subjects = len(subjects_with_sessions)
 
         # Heuristic: if a session exists in very few subjects, it's more likely a mislabeled session
         # than "missing" for everyone else.
@@ -271,23 +351,24 @@ class DatasetStats:
         else:
             very_rare_threshold = 1
 
-        for session in sorted(all_sessions):
-            present = present_by_session.get(session, 0)
+        session_labels = self._session_labels.labels
+        for session in sorted(present_by_session, key=session_labels.__getitem__):
+            label = session_labels[session]
+            session_bit = 1 << session
+            present = present_by_session[session]
             missing = total_subjects - present
-            if present == 0:
-                continue
 
             if present <= very_rare_threshold and total_subjects >= 5:
                 # Find which subjects have this rare session
                 rare_subjects = [
-                    sid
-                    for sid, data in subjects_with_sessions.items()
-                    if session in data["sessions"]
+                    subject_labels[subject]
+                    for subject in subjects_with_sessions
+                    if session_masks[subject] & session_bit
                 ]
                 warnings.append(
                     (
                         "WARNING",
-                        f"Potential typo/mislabeled session: '{session}'",
+                        f"Potential typo/mislabeled session: '{label}'",
                         f"Appears only in {present} subject(s): {', '.join(rare_subjects)}",
                     )
                 )
@@ -299,19 +380,18 @@ class DatasetStats:
                 warnings.append(
                     (
                         "WARNING",
-                        f"Session {session} appears only in {present}/{total_subjects} subjects",
+                        f"Session {label} appears only in {present}/{total_subjects} subjects",
                         "This is often caused by a mislabeled session column/value (e.g., one accidental '2' among '1's).",
                     )
                 )
                 continue
 
             # Otherwise, list missing subjects, but keep it bounded.
-            missing_subjects = [
-                sid
-                for sid, data in subjects_with_sessions.items()
-                if session not in data["sessions"]
-            ]
-            missing_subjects = sorted(missing_subjects)
+            missing_subjects = sorted(
+                subject_labels[subject]
+                for subject in subjects_with_sessions
+                if not session_masks[subject] & session_bit
+            )
             if not missing_subjects:
                 continue
 
@@ -321,7 +401,7 @@ class DatasetStats:
                 warnings.append(
                     (
                         "WARNING",
-                        f"Session {session} missing for {len(missing_subjects)}/{total_subjects} subjects",
+                        f"Session {label} missing for {len(missing_subjects)}/{total_subjects} subjects",
                         f"Subjects (showing first {max_list}): {shown}",
                     )
                 )
@@ -329,7 +409,7 @@ class DatasetStats:
                 warnings.append(
                     (
                         "WARNING",
-                        f"Session {session} missing for subjects",
+                        f"Session {label} missing for subjects",
                         ", ".join(missing_subjects),
                     )
                 )
@@ -341,21 +421,22 @@ class DatasetStats:
         warnings = []
 
         # Find all modalities and tasks across subjects
-        all_modalities = set()
-        all_tasks = set()
-        for data in subjects_without_sessions.values():
-            all_modalities.update(data["modalities"])
-            all_tasks.update(data["tasks"])
+        all_modalities = 0
+        all_tasks = 0
+        for subject in subjects_without_sessions:
+            all_modalities |= self._subject_modalities[subject]
+            all_tasks |= self._subject_tasks[subject]
 
         # Check each subject has all modalities and tasks
-        for subject_id, data in subjects_without_sessions.items():
-            missing_modalities = all_modalities - data["modalities"]
-            missing_tasks = all_tasks - data["tasks"]
+        for subject in subjects_without_sessions:
+            subject_id = self._subject_labels.labels[subject]
+            missing_modalities = all_modalities & ~self._subject_modalities[subject]
+            missing_tasks = all_tasks & ~self._subject_tasks[subject]
 
-            for modality in missing_modalities:
+            for modality in self._modality_labels.decode(missing_modalities):
                 warnings.append(("WARNING", f"Missing {modality} data", subject_id))
 
-            for task in missing_tasks:
+            for task in self._task_labels.decode(missing_tasks):
                 warnings.append(("WARNING", f"Missing task {task}", subject_id))
 
         return warnings
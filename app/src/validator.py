@@ -10,8 +10,12 @@ import gzip
 from pathlib import Path
 from datetime import datetime
 from typing import Callable
-from jsonschema import validate, ValidationError
-from src.schema_manager import validate_schema_version, apply_schema_validation_profile
+from jsonschema import ValidationError
+from src.schema_manager import (
+    apply_schema_validation_profile,
+    validate_against_schema,
+    validate_schema_version,
+)
 from src.entity_rules import load_entity_rules
 from src.converters.survey_core import get_allowed_values
 from src.cross_platform import (
@@ -1341,7 +1345,7 @@ class DatasetValidator:
             if schema:
                 # Version compatibility checks (only warns when explicitly specified and incompatible)
                 issues.extend(validate_schema_version(sidecar_data, schema))
-                validate(instance=sidecar_data, schema=schema)
+                validate_against_schema(sidecar_data, schema)
 
         except ValidationError as e:
             # Format message to be more descriptive (include field path)
@@ -16,9 +16,18 @@ from flask import session
 
 from src.config import load_app_settings
 from src.cross_platform import normalize_path
-from src.project_manager import ProjectManager
 from src.project_session_logging import record_project_session_command
 
+
+def __getattr__(name: str):
+    # ProjectManager pulls in pandas and the validator; import it on first use
+    # so this per-request module stays cheap at app startup.
+    if name == "ProjectManager":
+        from src.project_manager import ProjectManager
+
+        return ProjectManager
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 _MUTATING_METHODS = {"POST", "PUT", "PATCH", "DELETE"}
 _ANSI_GREEN = "\033[32m"
 _ANSI_RESET = "\033[0m"
@@ -519,6 +528,8 @@ def _build_projects_datalad_enable_terminal_command(req) -> str:
         return ""
 
     message = str(payload.get("message") or "").strip() or "Enable DataLad for PRISM project"
+    from src.project_manager import ProjectManager
+
     status = ProjectManager().get_datalad_status(project_root)
 
     if not status.get("enabled"):
@@ -297,6 +297,8 @@ def api_participants_preview():
             )
 
             preview_stage = "reading input file"
+            # A full read, not preview_tabular_file: participant_count,
+            # column_values and the NeuroBagel schema summarize every row.
             try:
                 df = _read_participants_input_table(
                     input_path=input_path,
@@ -6,7 +6,11 @@ from pathlib import Path
 from flask import Response, jsonify, request
 from werkzeug.utils import secure_filename
 
-from src.converters.file_reader import infer_tabular_kind, read_tabular_file
+from src.converters.file_reader import (
+    infer_tabular_kind,
+    list_excel_sheets,
+    read_tabular_file,
+)
 
 from .conversion_utils import (
     expected_delimiter_for_suffix as _shared_expected_delimiter_for_suffix,
@@ -101,37 +105,7 @@ def _read_participants_input_table(
 
 
 def _get_excel_sheet_metadata(input_path: Path) -> dict[str, object]:
-    metadata: dict[str, object] = {
-        "sheet_names": [],
-        "non_empty_sheet_names": [],
-        "non_empty_sheet_indexes": [],
-    }
-
-    try:
-        import pandas as pd
-
-        with pd.ExcelFile(input_path) as workbook:
-            sheet_names = [str(name) for name in workbook.sheet_names]
-            non_empty_sheet_names: list[str] = []
-            non_empty_sheet_indexes: list[int] = []
-
-            for index, sheet_name in enumerate(sheet_names):
-                try:
-                    sheet_df = workbook.parse(sheet_name=sheet_name, dtype=str)
-                except Exception:
-                    continue
-
-                if sheet_df is not None and not sheet_df.empty:
-                    non_empty_sheet_names.append(sheet_name)
-                    non_empty_sheet_indexes.append(index)
-
-        metadata["sheet_names"] = sheet_names
-        metadata["non_empty_sheet_names"] = non_empty_sheet_names
-        metadata["non_empty_sheet_indexes"] = non_empty_sheet_indexes
-    except Exception:
-        return metadata
-
-    return metadata
+    return list_excel_sheets(input_path)
 
 
 def _resolve_participants_sheet_arg(
@@ -1,6 +1,8 @@
+import uuid
 from pathlib import Path
 
-from flask import request, session
+from flask import has_request_context, request, session
+from src.converters.upload_staging import StagedUpload, get_upload_staging_area
 from src.survey_workflow_service import SurveyWorkflowStageService
 
 from .conversion_utils import require_existing_project_root, resolve_existing_project_root
@@ -9,9 +11,13 @@ from .conversion_utils import require_existing_project_root, resolve_existing_pr
 class LocalPathUpload:
     """Minimal upload-like wrapper backed by a local filesystem path."""
 
-    def __init__(self, source_path: Path):
+    def __init__(self, source_path: Path, *, filename: str | None = None):
         self._source_path = source_path
-        self.filename = source_path.name
+        self.filename = filename or source_path.name
+
+    @property
+    def source_path(self) -> Path:
+        return self._source_path
 
     def save(self, destination: str):
         import shutil
@@ -29,11 +35,22 @@ def resolve_uploaded_or_source_file(
         if upload is not None and upload.filename:
             return upload, None
 
+    source_hash = (
+        (request.form.get("source_hash") or "").strip()
+        or (request.args.get("source_hash") or "").strip()
+    )
+    if source_hash:
+        staged = get_upload_staging_area().resolve(source_hash)
+        if staged is not None:
+            return LocalPathUpload(staged.path), None
+
     source_file_path = (
         (request.form.get("source_file_path") or "").strip()
         or (request.args.get("source_file_path") or "").strip()
     )
     if not source_file_path:
+        if source_hash:
+            return None, "Staged upload has expired. Please upload the file again."
         return None, missing_input_message
 
     source_path = Path(source_file_path).expanduser().resolve()
@@ -43,6 +60,38 @@ def resolve_uploaded_or_source_file(
     return LocalPathUpload(source_path), None
 
 
+def _staging_workflow() -> str | None:
+    """Return the browser session's id for holding staged uploads."""
+    if not has_request_context():
+        return None
+    workflow = session.get("upload_workflow_id")
+    if not workflow:
+        workflow = uuid.uuid4().hex
+        session["upload_workflow_id"] = workflow
+    return str(workflow)
+
+
+def stage_uploaded_file(upload, *, filename: str) -> StagedUpload:
+    """Store *upload* in the content-addressed staging area.
+
+    Re-submitting the same bytes (or a ``source_hash`` from an earlier step)
+    reuses the staged copy and its cached parse instead of a fresh temp copy.
+    The upload is held for the current browser session until discarded.
+    """
+    return get_upload_staging_area().stage_upload(
+        upload, filename=filename, workflow=_staging_workflow()
+    )
+
+
+def discard_staged_upload(staged: StagedUpload | None) -> None:
+    """Release *staged* once its workflow has finished.
+
+    The file is deleted unless another session has staged the same bytes.
+    """
+    if staged is not None:
+        get_upload_staging_area().discard(staged.digest, workflow=staged.workflow)
+
+
 def resolve_requested_project_root(
     *,
     require_project: bool,
@@ -14,6 +14,8 @@ try:
 except ImportError:
     import xml.etree.ElementTree as ET
 
+from .conversion_request_helpers import discard_staged_upload, stage_uploaded_file
+
 
 def handle_api_survey_convert(
     *,
@@ -182,11 +184,12 @@ def handle_api_survey_convert(
         return jsonify({"error": str(error)}), 400
     separator = expected_delimiter_for_suffix(suffix, separator_option)
 
+    staged_upload = None
     tmp_dir = tempfile.mkdtemp(prefix="prism_survey_convert_")
     try:
         tmp_dir_path = Path(tmp_dir)
-        input_path = tmp_dir_path / filename
-        uploaded_file.save(str(input_path))
+        staged_upload = stage_uploaded_file(uploaded_file, filename=filename)
+        input_path = staged_upload.path
 
         fallback_project_path = current_project_path or session.get(
             "current_project_path"
@@ -539,4 +542,5 @@ def handle_api_survey_convert(
             current_app.logger.exception("Survey conversion failed")
         return jsonify({"error": error_msg}), 500
     finally:
-        shutil.rmtree(tmp_dir, ignore_errors=True)
\ No newline at end of file
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        discard_staged_upload(staged_upload)
\ No newline at end of file
@@ -11,6 +11,7 @@ from src.datalad_project_copy import copy_files_into_project
 from src.system_files import filter_system_files
 from src.survey_workflow_service import SurveyWorkflowStageService
 from .conversion_job_store import ConversionJobStore
+from .conversion_request_helpers import discard_staged_upload, stage_uploaded_file
 
 _survey_convert_job_store = ConversionJobStore(log_level_key="level")
 
@@ -194,11 +195,12 @@ def handle_api_survey_convert_validate(
         return jsonify({"error": str(error), "log": log_messages}), 400
     separator = expected_delimiter_for_suffix(suffix, separator_option)
 
+    staged_upload = None
     tmp_dir = tempfile.mkdtemp(prefix="prism_survey_convert_validate_")
     try:
         tmp_dir_path = Path(tmp_dir)
-        input_path = tmp_dir_path / filename
-        uploaded_file.save(str(input_path))
+        staged_upload = stage_uploaded_file(uploaded_file, filename=filename)
+        input_path = staged_upload.path
 
         alias_path = None
         if alias_upload and getattr(alias_upload, "filename", ""):
@@ -806,6 +808,7 @@ def handle_api_survey_convert_validate(
         return jsonify({"error": str(error), "log": log_messages}), 500
     finally:
         shutil.rmtree(tmp_dir, ignore_errors=True)
+        discard_staged_upload(staged_upload)
 
 
 def handle_api_survey_convert_validate_start(
@@ -998,11 +1001,12 @@ def handle_api_survey_convert_validate_start(
             log_messages=log_messages,
         )
 
+    staged_upload = None
     tmp_dir = tempfile.mkdtemp(prefix="prism_survey_convert_validate_job_")
     try:
         tmp_dir_path = Path(tmp_dir)
-        input_path = tmp_dir_path / filename
-        uploaded_file.save(str(input_path))
+        staged_upload = stage_uploaded_file(uploaded_file, filename=filename)
+        input_path = staged_upload.path
 
         alias_path = None
         if alias_upload and getattr(alias_upload, "filename", ""):
@@ -1018,10 +1022,12 @@ def handle_api_survey_convert_validate_start(
             add_log(f"Using ID map file: {id_map_filename} ({saved_size} bytes)", "info")
     except Exception:
         shutil.rmtree(tmp_dir, ignore_errors=True)
+        discard_staged_upload(staged_upload)
         raise
 
     config: dict[str, Any] = {
         "tmp_dir": tmp_dir,
+        "staged_upload": staged_upload,
         "input_path": input_path,
         "alias_path": alias_path,
         "id_map_path": id_map_path,
@@ -1092,6 +1098,7 @@ def handle_api_survey_convert_validate_start(
             continue
     if not job_id:
         shutil.rmtree(tmp_dir, ignore_errors=True)
+        discard_staged_upload(staged_upload)
         return jsonify({"error": "Could not allocate conversion job id"}), 500
 
     for entry in upfront_logs:
@@ -1787,4 +1794,5 @@ def _run_survey_convert_validate_job(
     except Exception as error:
         _survey_convert_job_store.failure(job_id, str(error))
     finally:
-        shutil.rmtree(tmp_dir, ignore_errors=True)
\ No newline at end of file
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        discard_staged_upload(config.get("staged_upload"))
\ No newline at end of file
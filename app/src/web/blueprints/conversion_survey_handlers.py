@@ -51,6 +51,7 @@ from .conversion_request_helpers import (
     format_workflow_preparation_stale_response as _format_workflow_preparation_stale_response,
     resolve_requested_project_root as _shared_resolve_requested_project_root,
     resolve_uploaded_or_source_file as _resolve_uploaded_or_source_file,
+    stage_uploaded_file as _stage_uploaded_file,
 )
 from .conversion_survey_convert_handlers import (
     handle_api_survey_convert,
@@ -417,8 +418,7 @@ def _detect_survey_version_contexts(
     tmp_dir = tempfile.mkdtemp(prefix="prism_survey_version_context_")
     try:
         tmp_dir_path = Path(tmp_dir)
-        input_path = tmp_dir_path / filename
-        uploaded_file.save(str(input_path))
+        input_path = _stage_uploaded_file(uploaded_file, filename=filename).path
         output_root = tmp_dir_path / "context_rawdata"
         separator = expected_delimiter_for_suffix(suffix, separator_option)
 
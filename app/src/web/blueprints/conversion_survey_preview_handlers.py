@@ -36,6 +36,7 @@ from .conversion_request_helpers import (
     format_workflow_preparation_stale_response as _format_workflow_preparation_stale_response,
     resolve_requested_project_root as _shared_resolve_requested_project_root,
     resolve_uploaded_or_source_file as _resolve_uploaded_or_source_file,
+    stage_uploaded_file as _stage_uploaded_file,
 )
 
 _resolve_effective_template_version_overrides: (
@@ -113,7 +114,14 @@ def _collect_task_manual_review_payloads(
     validate_task_fn,
     survey_value_out_of_bounds_error_cls,
     format_value_offset_confirmation_response,
+    preflight_errors: dict[str, Exception] | None = None,
 ) -> dict[str, dict[str, object]]:
+    """Collect manual-review payloads for tasks with out-of-range values.
+
+    When the dry-run already carries the converter's value pre-flight
+    (``preflight_errors``), its per-task errors are used directly instead of
+    re-running one conversion per task.
+    """
     payloads: dict[str, dict[str, object]] = {}
 
     # Per-task validation is only needed when a specific out-of-bounds
@@ -126,26 +134,27 @@ def _collect_task_manual_review_payloads(
         return payloads
 
     for task in sorted({str(task).strip().lower() for task in tasks if str(task).strip()}):
-        try:
-            validate_task_fn(task)
-        except Exception as error:
-            if not (
-                isinstance(survey_value_out_of_bounds_error_cls, type)
-                and issubclass(survey_value_out_of_bounds_error_cls, BaseException)
-                and isinstance(error, survey_value_out_of_bounds_error_cls)
-            ):
-                continue
-
-            if callable(format_value_offset_confirmation_response):
-                payload = format_value_offset_confirmation_response(error)
-            else:
-                payload = {
-                    "error": "value_offset_manual_review_required",
-                    "message": str(error),
-                    "task": task,
-                }
-            payload_task = str(payload.get("task") or task).strip().lower()
-            payloads[payload_task] = payload
+        error: Exception | None = None
+        if preflight_errors is not None:
+            error = preflight_errors.get(task)
+        else:
+            try:
+                validate_task_fn(task)
+            except Exception as validation_error:
+                error = validation_error
+        if not isinstance(error, survey_value_out_of_bounds_error_cls):
+            continue
+
+        if callable(format_value_offset_confirmation_response):
+            payload = format_value_offset_confirmation_response(error)
+        else:
+            payload = {
+                "error": "value_offset_manual_review_required",
+                "message": str(error),
+                "task": task,
+            }
+        payload_task = str(payload.get("task") or task).strip().lower()
+        payloads[payload_task] = payload
 
     return payloads
 
@@ -511,8 +520,8 @@ def handle_api_survey_convert_preview(
     tmp_dir = tempfile.mkdtemp(prefix="prism_survey_preview_")
     try:
         tmp_dir_path = Path(tmp_dir)
-        input_path = tmp_dir_path / filename
-        uploaded_file.save(str(input_path))
+        staged_upload = _stage_uploaded_file(uploaded_file, filename=filename)
+        input_path = staged_upload.path
 
         alias_path = None
         if alias_filename and alias_upload is not None:
@@ -727,6 +736,7 @@ def handle_api_survey_convert_preview(
                 validate_task_fn=_validate_single_task,
                 survey_value_out_of_bounds_error_cls=survey_value_out_of_bounds_error_cls,
                 format_value_offset_confirmation_response=format_value_offset_confirmation_response,
+                preflight_errors=getattr(result, "out_of_bounds_errors", None),
             )
 
             if not task_manual_review_payloads:
@@ -960,6 +970,7 @@ def handle_api_survey_convert_preview(
         if conv_summary:
             response_data["conversion_summary"] = conv_summary
 
+        response_data["source_hash"] = staged_upload.digest
         return jsonify(response_data)
 
     except Exception as error:
@@ -3,12 +3,17 @@ Shared utilities for conversion blueprints.
 Helper functions and common logic used across survey, biometrics, physio converters.
 """
 
+import io
 import json
 import re
 from pathlib import Path
 from flask import current_app
 import pandas as pd
-from src.converters.file_reader import infer_tabular_kind, read_tabular_file
+from src.converters.file_reader import (
+    infer_tabular_kind,
+    preview_tabular_file,
+    read_tabular_file,
+)
 from src.utils.naming import normalize_filename
 from src.converters.survey_processing import normalize_run_entity as _normalize_run_entity
 
@@ -517,14 +522,21 @@ def read_tabular_dataframe_robust(
                 )
         attempts.append({"sep": None, "engine": "python", "on_bad_lines": "skip"})
 
+        # Decode once per encoding instead of once per attempt; an encoding
+        # that cannot decode the file would fail every attempt anyway.
+        raw = input_path.read_bytes()
         last_error: Exception | None = None
         for encoding in ("utf-8-sig", "cp1252", "latin-1"):
+            try:
+                text = raw.decode(encoding)
+            except UnicodeDecodeError as error:
+                last_error = error
+                continue
             for read_kwargs in attempts:
                 try:
                     df = pd.read_csv(
-                        input_path,
+                        io.StringIO(text),
                         dtype=dtype,
-                        encoding=encoding,
                         **read_kwargs,
                     )
                 except Exception as error:
@@ -618,7 +630,7 @@ def log_file_head(input_path: Path, suffix: str, log_func):
                     )
         elif suffix == ".xlsx":
             try:
-                df = read_tabular_file(input_path, kind="xlsx").df.head(4)
+                df = preview_tabular_file(input_path, kind="xlsx", max_rows=4).df
                 head_lines = []
                 # Header row
                 cols = [str(c) for c in df.columns]
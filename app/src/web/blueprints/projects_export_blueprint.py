@@ -654,6 +654,9 @@ def export_project_folder():
                 data.get("export_phenotype_bridge", False)
             )
 
+        if "copy_mode" in data:
+            manager_kwargs["copy_mode"] = str(data.get("copy_mode") or "auto")
+
         scope_keys = {
             "include_derivatives",
             "include_sourcedata",
@@ -756,6 +759,9 @@ def export_project_git_lfs():
                 data.get("export_phenotype_bridge", False)
             )
 
+        if "copy_mode" in data:
+            manager_kwargs["copy_mode"] = str(data.get("copy_mode") or "auto")
+
         scope_keys = {
             "include_derivatives",
             "include_sourcedata",
@@ -1257,6 +1263,7 @@ def anc_export_project():
             convert_to_git_lfs=convert_to_git_lfs,
             include_ci_examples=include_ci_examples,
             copy_data=True,
+            copy_mode=str(data.get("copy_mode") or "auto"),
         )
 
         return jsonify(
@@ -1264,6 +1271,7 @@ def anc_export_project():
                 "success": True,
                 "output_path": str(result_path),
                 "message": "ANC export completed successfully",
+                "copy_strategy": exporter.copy_summary,
                 "generated_files": {
                     "readme": str(result_path / "README.md"),
                     "citation": str(result_path / "CITATION.cff"),
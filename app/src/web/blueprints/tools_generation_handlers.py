@@ -4,8 +4,13 @@ import tempfile
 from pathlib import Path
 
 from flask import current_app, jsonify, request, send_file
-from src.converters.file_reader import read_tabular_file
+from werkzeug.utils import secure_filename
+from src.converters.upload_staging import read_staged_tabular_file
 
+from .conversion_request_helpers import (
+    resolve_uploaded_or_source_file,
+    stage_uploaded_file,
+)
 from .conversion_utils import (
     expected_delimiter_for_suffix,
     normalize_separator_option,
@@ -179,66 +184,47 @@ def handle_generate_boilerplate_endpoint():
 
 def handle_detect_columns():
     """Detect column names from uploaded file for ID column selection."""
-    file = request.files.get("file")
-    source_file_path = (request.form.get("source_file_path") or "").strip()
     session_column_override = (request.form.get("session_column_override") or "").strip()
     run_column_override = (request.form.get("run_column_override") or "").strip()
 
-    filename = ""
-    local_source_path: Path | None = None
-    if file and getattr(file, "filename", ""):
-        filename = file.filename.lower()
-    elif source_file_path:
-        candidate_path = Path(source_file_path).expanduser().resolve()
-        if not candidate_path.exists() or not candidate_path.is_file():
-            return jsonify({"error": f"File not found: {source_file_path}"}), 400
-        filename = candidate_path.name.lower()
-        local_source_path = candidate_path
-    else:
-        return jsonify({"error": "No file uploaded"}), 400
+    upload, upload_error = resolve_uploaded_or_source_file(
+        field_names=("file",),
+        missing_input_message="No file uploaded",
+    )
+    if upload is None:
+        return jsonify({"error": upload_error}), 400
+    filename = upload.filename.lower()
 
     try:
         columns = []
         df = None
+        staged_upload = None
 
         separator_option = normalize_separator_option(request.form.get("separator"))
 
         if filename.endswith(".lsa"):
-            import shutil
-
-            tmp_dir = tempfile.mkdtemp(prefix="prism_detect_cols_")
             try:
-                tmp_path = Path(tmp_dir) / filename
-                if local_source_path is not None:
-                    shutil.copy2(local_source_path, tmp_path)
-                else:
-                    file.save(str(tmp_path))
+                staged_upload = stage_uploaded_file(
+                    upload, filename=secure_filename(upload.filename)
+                )
                 from src.converters.limesurvey import parse_lsa_responses
 
-                df, _, _ = parse_lsa_responses(str(tmp_path))
+                df, _, _ = parse_lsa_responses(str(staged_upload.path))
                 columns = list(df.columns)
             except Exception as lsa_err:
                 return jsonify({"error": f"Failed to read .lsa: {lsa_err}"}), 400
-            finally:
-                shutil.rmtree(tmp_dir, ignore_errors=True)
 
         elif filename.endswith((".xlsx", ".csv", ".tsv")):
             suffix = Path(filename).suffix.lower()
-            with tempfile.NamedTemporaryFile(suffix=suffix, delete=False) as tmp:
-                if local_source_path is not None:
-                    tmp.write(local_source_path.read_bytes())
-                else:
-                    file.save(tmp.name)
-                tmp_path = Path(tmp.name)
-            try:
-                kind = "xlsx" if suffix == ".xlsx" else suffix.lstrip(".")
-                df = read_tabular_file(
-                    tmp_path,
-                    kind=kind,
-                    separator=expected_delimiter_for_suffix(suffix, separator_option),
-                ).df
-            finally:
-                tmp_path.unlink(missing_ok=True)
+            staged_upload = stage_uploaded_file(
+                upload, filename=secure_filename(upload.filename)
+            )
+            kind = "xlsx" if suffix == ".xlsx" else suffix.lstrip(".")
+            df = read_staged_tabular_file(
+                staged_upload.path,
+                kind=kind,
+                separator=expected_delimiter_for_suffix(suffix, separator_option),
+            ).df
             columns = list(df.columns)
 
         else:
@@ -320,6 +306,7 @@ def handle_detect_columns():
                 "detected_sessions": detected_sessions,
                 "run_column": run_column,
                 "detected_runs": detected_runs,
+                "source_hash": staged_upload.digest if staged_upload else None,
             }
         )
 
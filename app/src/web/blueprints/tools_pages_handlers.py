@@ -4,6 +4,7 @@ from pathlib import Path
 from flask import jsonify, render_template
 
 from src.constants import SUPPORTED_MODALITIES
+from src.runtime_dependencies import has_pyarrow_support
 
 from .tools_helpers import _default_library_root_for_templates, _global_recipes_root
 
@@ -125,6 +126,7 @@ def handle_recipes(project_path: str):
         "recipes.html",
         available_modalities=available_modalities,
         default_modality=default_modality,
+        pyarrow_available=has_pyarrow_support(),
     )
 
 
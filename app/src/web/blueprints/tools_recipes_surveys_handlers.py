@@ -6,7 +6,7 @@ from typing import Any
 from flask import current_app, jsonify, request, send_file
 
 from src.cross_platform import normalize_path
-from src.runtime_dependencies import has_pyreadstat_write_support
+from src.runtime_dependencies import has_pyarrow_support, has_pyreadstat_write_support
 from src.web.backend_monitoring import emit_backend_action
 
 from .tools_helpers import _global_recipes_root
@@ -16,6 +16,10 @@ def _pyreadstat_available() -> bool:
     return has_pyreadstat_write_support()
 
 
+def _pyarrow_available() -> bool:
+    return has_pyarrow_support()
+
+
 def _normalize_output_format(out_format: str | None) -> str:
     normalized = str(out_format or "").strip().lower()
     if normalized in {"save", "spss"}:
@@ -74,6 +78,7 @@ def _find_existing_recipe_output_files(
     merge_all: bool,
     modality: str,
     pyreadstat_available: bool,
+    pyarrow_available: bool = True,
 ) -> list[Path]:
     out_format = _normalize_output_format(out_format)
 
@@ -84,14 +89,16 @@ def _find_existing_recipe_output_files(
         out_stem = f"combined_{modality}"
         expected_names: set[str] = set()
 
-        if out_format == "csv":
+        if out_format in {"csv", "parquet", "feather"}:
             expected_names.update(
                 {
-                    f"{out_stem}.csv",
+                    f"{out_stem}.{out_format}",
                     f"{out_stem}_codebook.json",
                     f"{out_stem}_codebook.tsv",
                 }
             )
+            if out_format != "csv" and not pyarrow_available:
+                expected_names.add(f"{out_stem}.csv")
         elif out_format == "xlsx":
             expected_names.add(f"{out_stem}.xlsx")
         elif out_format == "sav":
@@ -118,11 +125,15 @@ def _find_existing_recipe_output_files(
         "csv": [".csv"],
         "xlsx": [".xlsx"],
         "sav": [".sav"],
+        "parquet": [".parquet"],
+        "feather": [".feather"],
     }
     codebook_suffixes = {
         "csv": ["_codebook.json", "_codebook.tsv"],
         "xlsx": [],
         "sav": ["_codebook.json"],
+        "parquet": ["_codebook.json", "_codebook.tsv"],
+        "feather": ["_codebook.json", "_codebook.tsv"],
     }
 
     exts = format_exts.get(out_format, [".csv"])
@@ -131,6 +142,8 @@ def _find_existing_recipe_output_files(
     if out_format == "sav" and not pyreadstat_available:
         exts = list(set(exts + [".csv"]))
         suffixes = list(set(suffixes + ["_codebook.json", "_codebook.tsv"]))
+    if out_format in {"parquet", "feather"} and not pyarrow_available:
+        exts = exts + [".csv"]
 
     for ext in exts:
         existing_files.extend(derivatives_dir.glob(f"*{ext}"))
@@ -241,6 +254,7 @@ def handle_api_recipes_surveys(data: dict):
             merge_all=merge_all,
             modality=modality,
             pyreadstat_available=_pyreadstat_available(),
+            pyarrow_available=_pyarrow_available(),
         )
 
         if existing_files:
@@ -360,6 +374,8 @@ def handle_api_recipes_surveys(data: dict):
                 anonymized=anonymize,
                 missing_policy=missing_policy,
                 missing_numeric_value=missing_numeric_value,
+                # No worker processes inside the threaded web server.
+                max_workers=1,
             )
         except ValueError as e:
             return jsonify({"error": str(e)}), 400
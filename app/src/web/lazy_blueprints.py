@@ -0,0 +1,246 @@
+"""
+Deferred registration of the modular Prism Studio blueprints.
+
+Importing a blueprint module pulls in its handler modules (pandas, the survey
+converters, ``project_manager``, DataLad helpers, ...), which dominated the
+cold start of ``prism-studio.py``. Instead, every route is registered up
+front from a committed manifest (``blueprint_routes.json``) with a
+placeholder view; the blueprint module is imported on the first request to
+any of its routes and its real view functions then replace the
+placeholders. ``url_for`` and endpoint checks work before that import,
+because the endpoints themselves already exist.
+
+Regenerate the manifest after adding, removing or changing a route:
+
+    python scripts/generate_blueprint_routes.py
+
+``tests/test_prism_studio_startup.py`` fails while the manifest is stale.
+"""
+
+from __future__ import annotations
+
+import importlib
+import json
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Iterable
+
+from flask import Flask, current_app
+
+ROUTE_MANIFEST_PATH = Path(__file__).with_name("blueprint_routes.json")
+_AUTOMATIC_METHODS = {"HEAD", "OPTIONS"}
+
+
+@dataclass(frozen=True)
+class BlueprintSpec:
+    """Where a modular blueprint lives and the label used in startup logs."""
+
+    module_name: str
+    blueprint_attr: str
+    label: str
+
+
+MODULAR_BLUEPRINTS: tuple[BlueprintSpec, ...] = (
+    BlueprintSpec("src.web.blueprints.neurobagel", "neurobagel_bp", "neurobagel"),
+    BlueprintSpec("src.web.blueprints.conversion", "conversion_bp", "conversion"),
+    BlueprintSpec(
+        "src.web.blueprints.conversion_survey_blueprint",
+        "conversion_survey_bp",
+        "conversion_survey",
+    ),
+    BlueprintSpec(
+        "src.web.blueprints.conversion_participants_blueprint",
+        "conversion_participants_bp",
+        "conversion_participants",
+    ),
+    BlueprintSpec("src.web.blueprints.validation", "validation_bp", "validation"),
+    BlueprintSpec("src.web.blueprints.tools", "tools_bp", "tools"),
+    BlueprintSpec(
+        "src.web.blueprints.tools_template_editor_blueprint",
+        "tools_template_editor_bp",
+        "tools_template_editor",
+    ),
+    BlueprintSpec("src.web.blueprints.projects", "projects_bp", "projects"),
+    BlueprintSpec(
+        "src.web.blueprints.projects_library_blueprint",
+        "projects_library_bp",
+        "projects_library",
+    ),
+    BlueprintSpec(
+        "src.web.blueprints.projects_export_blueprint",
+        "projects_export_bp",
+        "projects_export",
+    ),
+    BlueprintSpec(
+        "src.web.blueprints.projects_datalad_server_blueprint",
+        "projects_datalad_server_bp",
+        "projects_datalad_server",
+    ),
+    BlueprintSpec(
+        "src.web.blueprints.projects_rsync_server_blueprint",
+        "projects_rsync_server_bp",
+        "projects_rsync_server",
+    ),
+    BlueprintSpec(
+        "src.web.blueprints.projects_remote_browse_blueprint",
+        "projects_remote_browse_bp",
+        "projects_remote_browse",
+    ),
+)
+
+
+def _import_blueprint(spec: BlueprintSpec):
+    module = importlib.import_module(spec.module_name)
+    return getattr(module, spec.blueprint_attr)
+
+
+def _scratch_registration(spec: BlueprintSpec) -> Flask:
+    """Register the real blueprint on a throwaway app to read its routes."""
+    scratch = Flask(spec.module_name)
+    scratch.register_blueprint(_import_blueprint(spec))
+    return scratch
+
+
+def collect_blueprint_routes(spec: BlueprintSpec) -> list[dict[str, Any]]:
+    """Import *spec*'s blueprint and describe its routes for the manifest."""
+    scratch = _scratch_registration(spec)
+    routes = [
+        {
+            "rule": rule.rule,
+            "endpoint": rule.endpoint,
+            "methods": sorted((rule.methods or set()) - _AUTOMATIC_METHODS),
+        }
+        for rule in scratch.url_map.iter_rules()
+        if rule.endpoint != "static"
+    ]
+    return sorted(routes, key=lambda route: (route["endpoint"], route["rule"]))
+
+
+def build_route_manifest(
+    specs: Iterable[BlueprintSpec] = MODULAR_BLUEPRINTS,
+) -> dict[str, list[dict[str, Any]]]:
+    return {spec.module_name: collect_blueprint_routes(spec) for spec in specs}
+
+
+def write_route_manifest(
+    path: Path = ROUTE_MANIFEST_PATH,
+    specs: Iterable[BlueprintSpec] = MODULAR_BLUEPRINTS,
+) -> dict[str, list[dict[str, Any]]]:
+    manifest = build_route_manifest(specs)
+    Path(path).write_text(json.dumps(manifest, indent=2) + "\n", encoding="utf-8")
+    return manifest
+
+
+def load_route_manifest(path: Path = ROUTE_MANIFEST_PATH) -> dict[str, list[dict]]:
+    """Return the committed route manifest, or ``{}`` when it is unavailable."""
+    try:
+        manifest = json.loads(Path(path).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return manifest if isinstance(manifest, dict) else {}
+
+
+class LazyBlueprint:
+    """Placeholder views for one blueprint, resolved on first request."""
+
+    def __init__(self, spec: BlueprintSpec):
+        self.spec = spec
+        self._views: dict[str, Callable] | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def loaded(self) -> bool:
+        return self._views is not None
+
+    def load(self) -> dict[str, Callable]:
+        """Import the blueprint module once and return its views by endpoint."""
+        if self._views is None:
+            with self._lock:
+                if self._views is None:
+                    scratch = _scratch_registration(self.spec)
+                    self._views = {
+                        endpoint: view
+                        for endpoint, view in scratch.view_functions.items()
+                        if endpoint != "static"
+                    }
+        return self._views
+
+    def install(self, app: Flask) -> None:
+        """Swap the placeholders registered on *app* for the real views."""
+        for endpoint, view in self.load().items():
+            if endpoint in app.view_functions:
+                app.view_functions[endpoint] = view
+
+    def placeholder(self, endpoint: str) -> Callable:
+        def _lazy_view(**kwargs):
+            self.install(current_app)
+            return current_app.view_functions[endpoint](**kwargs)
+
+        _lazy_view.__name__ = endpoint.rsplit(".", 1)[-1]
+        _lazy_view.__qualname__ = _lazy_view.__name__
+        return _lazy_view
+
+
+def register_lazy_blueprint(
+    app: Flask, spec: BlueprintSpec, routes: list[dict[str, Any]]
+) -> LazyBlueprint:
+    """Register *routes* on *app* without importing the blueprint module."""
+    lazy = LazyBlueprint(spec)
+    placeholders: dict[str, Callable] = {}
+    for route in routes:
+        endpoint = str(route["endpoint"])
+        view = placeholders.setdefault(endpoint, lazy.placeholder(endpoint))
+        app.add_url_rule(
+            str(route["rule"]),
+            endpoint=endpoint,
+            view_func=view,
+            methods=list(route.get("methods") or ["GET"]),
+        )
+    return lazy
+
+
+def register_modular_blueprints(
+    app: Flask,
+    specs: Iterable[BlueprintSpec] = MODULAR_BLUEPRINTS,
+    *,
+    lazy: bool = True,
+    on_error: Callable[[str, Exception], None] | None = None,
+) -> dict[str, LazyBlueprint | None]:
+    """Register every modular blueprint, deferring imports where possible.
+
+    Blueprints missing from the manifest (or every blueprint when *lazy* is
+    False) are imported and registered eagerly, as before. Returns the
+    registered labels mapped to their :class:`LazyBlueprint` (None for eager
+    ones); failed registrations are reported through *on_error*.
+    """
+    manifest = load_route_manifest() if lazy else {}
+    registered: dict[str, LazyBlueprint | None] = {}
+    for spec in specs:
+        try:
+            routes = manifest.get(spec.module_name)
+            if routes:
+                registered[spec.label] = register_lazy_blueprint(app, spec, routes)
+            else:
+                app.register_blueprint(_import_blueprint(spec))
+                registered[spec.label] = None
+        except Exception as exc:
+            if on_error is not None:
+                on_error(spec.label, exc)
+    return registered
+
+
+def preload_lazy_blueprints(
+    app: Flask, blueprints: Iterable[LazyBlueprint | None]
+) -> None:
+    """Resolve deferred blueprints ahead of their first request.
+
+    Failures are left for the first request to surface, like a cold import.
+    """
+    for lazy in blueprints:
+        if lazy is None or lazy.loaded:
+            continue
+        try:
+            lazy.install(app)
+        except Exception:
+            continue
@@ -273,7 +273,11 @@ document.addEventListener('DOMContentLoaded', function() {
         if (!data.success || !data.preferences) return;
         const prefs = data.preferences;
         // Apply saved preferences to form controls
-        if (prefs.format && derivFormat) derivFormat.value = normalizeFormat(prefs.format);
+        if (prefs.format && derivFormat) {
+          derivFormat.value = normalizeFormat(prefs.format);
+          // Parquet/Feather are only offered when pyarrow is installed.
+          if (!derivFormat.value) derivFormat.value = defaultRecipesPreferences.format;
+        }
         if (prefs.layout) derivLayout.value = prefs.layout;
         if (prefs.lang) derivLang.value = prefs.lang;
         if (typeof prefs.include_raw === 'boolean') derivIncludeRaw.checked = prefs.include_raw;
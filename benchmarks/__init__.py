@@ -0,0 +1,6 @@
+"""Performance benchmarks for PRISM's validation, conversion and recipe paths.
+
+``datasets`` synthesizes parameterized PRISM projects; ``harness`` times the
+production entry points against them and keeps a JSONL history so runs can be
+compared across releases. Run it with ``python scripts/run_benchmarks.py``.
+"""
@@ -0,0 +1,386 @@
+"""Generate synthetic PRISM projects of a chosen size for benchmarking.
+
+Unlike ``hostile_demo_generator`` (small, adversarial edge cases), these
+projects are clean and only vary in size: N subjects × sessions × surveys,
+optional biometrics, raw physio recordings for ``batch_convert_folder``, and
+optional wide survey exports / LimeSurvey ``.lsa`` archives for the survey
+converter. The same :class:`BenchmarkSpec` and seed always produce the same
+files, so timings from different runs are comparable.
+"""
+
+from __future__ import annotations
+
+import json
+import random
+import shutil
+import struct
+import zipfile
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+from xml.sax.saxutils import escape
+
+from src.project_manager import ProjectManager
+from src.utils.io import ensure_dir, write_json
+
+_REPO_ROOT = Path(__file__).resolve().parents[1]
+_FITNESS_TEMPLATE = (
+    _REPO_ROOT / "official" / "library" / "biometrics" / "biometrics-fitness.json"
+)
+_LEVELS = {
+    "0": {"en": "Never"},
+    "1": {"en": "Rarely"},
+    "2": {"en": "Sometimes"},
+    "3": {"en": "Often"},
+    "4": {"en": "Always"},
+}
+
+
+@dataclass(frozen=True)
+class BenchmarkSpec:
+    """Size parameters of one synthetic project."""
+
+    subjects: int = 20
+    sessions: int = 2
+    surveys: int = 3
+    items_per_survey: int = 20
+    biometrics: bool = True
+    physio_seconds: int = 30
+    physio_sampling_rate: int = 128
+    physio_channels: int = 3
+    wide_exports: bool = True
+    lsa_archives: bool = False
+    seed: int = 20260101
+
+
+PROFILES: dict[str, BenchmarkSpec] = {
+    "tiny": BenchmarkSpec(
+        subjects=3,
+        sessions=1,
+        surveys=1,
+        items_per_survey=5,
+        physio_seconds=2,
+        physio_sampling_rate=32,
+        physio_channels=1,
+        lsa_archives=True,
+    ),
+    "small": BenchmarkSpec(lsa_archives=True),
+    "medium": BenchmarkSpec(
+        subjects=100, sessions=3, surveys=5, items_per_survey=30, lsa_archives=True
+    ),
+    "large": BenchmarkSpec(
+        subjects=500,
+        sessions=4,
+        surveys=10,
+        items_per_survey=40,
+        physio_seconds=120,
+        physio_sampling_rate=256,
+    ),
+}
+
+
+@dataclass
+class BenchmarkProject:
+    """Paths of a generated project, for the benchmark cases to use."""
+
+    root: Path
+    spec: BenchmarkSpec
+    survey_tasks: list[str] = field(default_factory=list)
+    library_dir: Path | None = None
+    physio_source_dir: Path | None = None
+    wide_exports: list[Path] = field(default_factory=list)
+    lsa_archives: list[Path] = field(default_factory=list)
+
+
+def subject_labels(spec: BenchmarkSpec) -> list[str]:
+    return [f"sub-{index:03d}" for index in range(1, spec.subjects + 1)]
+
+
+def session_labels(spec: BenchmarkSpec) -> list[str]:
+    return [f"ses-{index}" for index in range(1, spec.sessions + 1)]
+
+
+def build_benchmark_survey_template(task: str, item_codes: list[str]) -> dict[str, Any]:
+    template: dict[str, Any] = {
+        "Technical": {
+            "StimulusType": "Questionnaire",
+            "FileFormat": "tsv",
+            "SoftwarePlatform": "LimeSurvey",
+            "SoftwareVersion": "6.0",
+            "Language": "en",
+            "Respondent": "self",
+            "AdministrationMethod": "online",
+        },
+        "Metadata": {"SchemaVersion": "1.1.1", "CreationDate": "2026-01-01"},
+        "Study": {
+            "TaskName": task,
+            "OriginalName": {"en": f"Benchmark survey {task}"},
+            "ShortName": task.upper(),
+            "Authors": ["benchmark generator"],
+            "Year": 2026,
+            "ItemCount": len(item_codes),
+            "Citation": "Synthetic benchmark fixture, not a real instrument",
+            "LicenseID": "CC-BY-4.0",
+            "Source": "generated for benchmarking",
+            "Instructions": {"en": "Synthetic benchmark survey."},
+        },
+    }
+    for code in item_codes:
+        template[code] = {
+            "Description": {"en": f"Synthetic benchmark item {code}"},
+            "Reversed": False,
+            "Levels": dict(_LEVELS),
+            "DataType": "integer",
+            "MinValue": 0,
+            "MaxValue": 4,
+            "ScaleType": "likert",
+        }
+    return template
+
+
+def build_benchmark_survey_recipe(task: str, item_codes: list[str]) -> dict[str, Any]:
+    half = max(1, len(item_codes) // 2)
+    return {
+        "RecipeVersion": "1.0",
+        "Kind": "survey",
+        "Survey": {
+            "Name": f"Benchmark survey ({task})",
+            "TaskName": task,
+            "Description": "Synthetic recipe generated for benchmarking.",
+        },
+        "Scores": [
+            {
+                "Name": f"{task}_total",
+                "Description": "Mean of all items",
+                "Items": list(item_codes),
+                "Method": "mean",
+                "Range": {"min": 0, "max": 4},
+            },
+            {
+                "Name": f"{task}_first_half",
+                "Description": "Sum of the first half of the items",
+                "Items": item_codes[:half],
+                "Method": "sum",
+            },
+            {
+                "Name": f"{task}_first_minus_last",
+                "Description": "Formula score referencing the first and last item",
+                "Items": [item_codes[0], item_codes[-1]],
+                "Method": "formula",
+                "Formula": f"{{{item_codes[0]}}} - {{{item_codes[-1]}}}",
+            },
+        ],
+    }
+
+
+def write_edf(
+    path: Path,
+    *,
+    channels: list[str],
+    sampling_rate: int,
+    seconds: int,
+    rng: random.Random,
+) -> None:
+    """Write a minimal EDF file (one-second records, int16 samples)."""
+    signal_count = len(channels)
+    header_bytes = 256 + 256 * signal_count
+
+    def field_text(value: Any, width: int) -> bytes:
+        return str(value)[:width].ljust(width).encode("ascii")
+
+    header = b"".join(
+        [
+            field_text("0", 8),
+            field_text("X X X X", 80),
+            field_text("Startdate 01-JAN-2026 X X benchmark", 80),
+            field_text("01.01.26", 8),
+            field_text("00.00.00", 8),
+            field_text(header_bytes, 8),
+            field_text("", 44),
+            field_text(seconds, 8),
+            field_text(1, 8),
+            field_text(signal_count, 4),
+        ]
+    )
+    per_signal: list[tuple[str, int, list[Any]]] = [
+        ("label", 16, channels),
+        ("transducer", 80, [""] * signal_count),
+        ("dimension", 8, ["uV"] * signal_count),
+        ("physical_min", 8, ["-3276.8"] * signal_count),
+        ("physical_max", 8, ["3276.7"] * signal_count),
+        ("digital_min", 8, ["-32768"] * signal_count),
+        ("digital_max", 8, ["32767"] * signal_count),
+        ("prefilter", 80, [""] * signal_count),
+        ("samples", 8, [sampling_rate] * signal_count),
+        ("reserved", 32, [""] * signal_count),
+    ]
+    for _name, width, values in per_signal:
+        header += b"".join(field_text(value, width) for value in values)
+
+    record = struct.Struct(f"<{sampling_rate}h")
+    with open(path, "wb") as handle:
+        handle.write(header)
+        for _second in range(seconds):
+            for _channel in channels:
+                handle.write(
+                    record.pack(
+                        *(rng.randint(-2000, 2000) for _ in range(sampling_rate))
+                    )
+                )
+
+
+def _write_tsv(path: Path, header: list[str], rows: list[list[Any]]) -> None:
+    ensure_dir(path.parent)
+    lines = ["\t".join(header)]
+    lines.extend("\t".join(str(value) for value in row) for row in rows)
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+def _write_lsa(path: Path, item_codes: list[str], rows: list[dict[str, Any]]) -> None:
+    parts = [
+        "<?xml version='1.0' encoding='UTF-8'?>",
+        "<document>",
+        "<responses><rows>",
+    ]
+    for row in rows:
+        cells = "".join(
+            f"<{column}>{escape(str(row[column]))}</{column}>"
+            for column in ["id", "participant_id", *item_codes]
+        )
+        parts.append(f"<row>{cells}</row>")
+    parts.append("</rows></responses></document>")
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr("survey_900001_responses.lsr", "\n".join(parts))
+
+
+def generate_benchmark_project(
+    output_root: Path, spec: BenchmarkSpec | None = None, *, name: str = "benchmark"
+) -> BenchmarkProject:
+    """Create a PRISM project at *output_root* sized according to *spec*."""
+    spec = spec or BenchmarkSpec()
+    output_root = Path(output_root).resolve()
+    # Seeded for reproducible synthetic data; nothing here is security-relevant.
+    rng = random.Random(spec.seed)  # noqa: S311
+
+    created = ProjectManager().create_project(
+        str(output_root), {"name": name, "use_datalad": False}
+    )
+    if not created.get("success", False):
+        raise RuntimeError(
+            f"Failed to create benchmark project at {output_root}: "
+            f"{created.get('error')}"
+        )
+
+    project = BenchmarkProject(root=output_root, spec=spec)
+    subjects = subject_labels(spec)
+    sessions = session_labels(spec)
+
+    _write_tsv(
+        output_root / "participants.tsv",
+        ["participant_id", "age", "sex"],
+        [[sub, rng.randint(18, 80), rng.choice(["1", "2"])] for sub in subjects],
+    )
+
+    library_dir = ensure_dir(output_root / "code" / "library" / "survey")
+    recipes_dir = ensure_dir(output_root / "code" / "recipes" / "survey")
+    project.library_dir = library_dir
+    items_by_task: dict[str, list[str]] = {}
+    for index in range(1, spec.surveys + 1):
+        task = f"bench{index}"
+        item_codes = [
+            f"{task.upper()}_{item:02d}" for item in range(1, spec.items_per_survey + 1)
+        ]
+        items_by_task[task] = item_codes
+        project.survey_tasks.append(task)
+        template = build_benchmark_survey_template(task, item_codes)
+        write_json(library_dir / f"survey-{task}.json", template)
+        write_json(output_root / f"task-{task}_survey.json", template)
+        write_json(
+            recipes_dir / f"recipe-{task}.json",
+            build_benchmark_survey_recipe(task, item_codes),
+        )
+
+    # answers[(sub, ses)][item] — shared by the dataset TSVs and raw exports.
+    answers = {
+        (sub, ses): {
+            code: rng.randint(0, 4)
+            for codes in items_by_task.values()
+            for code in codes
+        }
+        for sub in subjects
+        for ses in sessions
+    }
+    for (sub, ses), values in answers.items():
+        for task, item_codes in items_by_task.items():
+            _write_tsv(
+                output_root
+                / sub
+                / ses
+                / "survey"
+                / f"{sub}_{ses}_task-{task}_survey.tsv",
+                item_codes,
+                [[values[code] for code in item_codes]],
+            )
+
+    if spec.biometrics and _FITNESS_TEMPLATE.exists():
+        fitness = json.loads(_FITNESS_TEMPLATE.read_text(encoding="utf-8"))
+        biometrics_library = ensure_dir(output_root / "code" / "library" / "biometrics")
+        shutil.copy2(_FITNESS_TEMPLATE, biometrics_library / _FITNESS_TEMPLATE.name)
+        write_json(output_root / "task-fitness_biometrics.json", fitness)
+        measures = [
+            key
+            for key, value in fitness.items()
+            if isinstance(value, dict) and "NormalRange" in value
+        ]
+        for sub in subjects:
+            for ses in sessions:
+                row = []
+                for measure in measures:
+                    bounds = fitness[measure]["NormalRange"]
+                    row.append(round(rng.uniform(bounds["min"], bounds["max"]), 1))
+                _write_tsv(
+                    output_root
+                    / sub
+                    / ses
+                    / "biometrics"
+                    / f"{sub}_{ses}_task-fitness_biometrics.tsv",
+                    measures,
+                    [row],
+                )
+
+    if spec.physio_seconds > 0:
+        physio_dir = ensure_dir(output_root / "sourcedata" / "physio_raw")
+        project.physio_source_dir = physio_dir
+        channels = ["ECG", "RESP", "EDA", "PPG"][: max(1, spec.physio_channels)]
+        for sub in subjects:
+            for ses in sessions:
+                write_edf(
+                    physio_dir / f"{sub}_{ses}_task-rest.edf",
+                    channels=channels,
+                    sampling_rate=spec.physio_sampling_rate,
+                    seconds=spec.physio_seconds,
+                    rng=rng,
+                )
+
+    rawdata_dir = ensure_dir(output_root / "code" / "rawdata")
+    all_items = [code for codes in items_by_task.values() for code in codes]
+    for ses in sessions:
+        rows = [
+            {"id": index, "participant_id": sub, **answers[(sub, ses)]}
+            for index, sub in enumerate(subjects, 1)
+        ]
+        if spec.wide_exports:
+            export_path = rawdata_dir / f"survey_wide_{ses}.csv"
+            lines = [",".join(["participant_id", *all_items])]
+            lines.extend(
+                ",".join(str(row[column]) for column in ["participant_id", *all_items])
+                for row in rows
+            )
+            export_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+            project.wide_exports.append(export_path)
+        if spec.lsa_archives:
+            archive_path = rawdata_dir / f"survey_{ses}.lsa"
+            _write_lsa(archive_path, all_items, rows)
+            project.lsa_archives.append(archive_path)
+
+    return project
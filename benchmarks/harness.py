@@ -0,0 +1,505 @@
+"""Time PRISM hot paths on synthetic projects and keep a run history.
+
+Each case runs in a fresh child interpreter by default, so imports, caches and
+the peak RSS of one case do not leak into the next. Results are appended to a
+JSONL history file, one record per run, tagged with the PRISM version and git
+commit; :func:`compare_to_history` checks a run against the last comparable
+record (same profile and spec) to surface regressions between releases.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import redirect_stderr, redirect_stdout
+from dataclasses import asdict, dataclass, field, replace
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable
+
+from .datasets import (
+    PROFILES,
+    BenchmarkProject,
+    BenchmarkSpec,
+    generate_benchmark_project,
+)
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+DEFAULT_HISTORY_PATH = REPO_ROOT / "benchmarks" / "history.jsonl"
+HISTORY_FORMAT = 1
+
+# A case regresses when its median is this much slower than the last run
+# *and* at least MIN_REGRESSION_SECONDS slower, so sub-millisecond jitter on
+# tiny profiles does not fail a comparison.
+DEFAULT_REGRESSION_THRESHOLD = 0.25
+MIN_REGRESSION_SECONDS = 0.05
+
+
+@dataclass(frozen=True)
+class BenchmarkCase:
+    """One timed entry point.
+
+    ``run`` receives the project and a scratch directory for outputs. Cases
+    that write into the project itself set ``mutates_project`` so every
+    repeat starts from an untouched copy.
+    """
+
+    name: str
+    description: str
+    run: Callable[[BenchmarkProject, Path], Any]
+    mutates_project: bool = False
+    applies: Callable[[BenchmarkSpec], bool] = lambda spec: True
+
+
+@dataclass
+class CaseResult:
+    name: str
+    repeats: int
+    seconds: list[float] = field(default_factory=list)
+    cold_seconds: float | None = None
+    min_seconds: float | None = None
+    median_seconds: float | None = None
+    peak_rss_mb: float | None = None
+    error: str | None = None
+
+
+def _run_validate(project: BenchmarkProject, workdir: Path) -> Any:
+    from src.runner import validate_dataset
+
+    issues, _stats = validate_dataset(str(project.root))
+    errors = [issue for issue in issues if issue[0] == "ERROR"]
+    if errors:
+        raise RuntimeError(f"validation reported {len(errors)} error(s): {errors[0]}")
+    return issues
+
+
+def _run_recipes(project: BenchmarkProject, workdir: Path) -> Any:
+    from src.recipes_surveys import compute_survey_recipes
+
+    return compute_survey_recipes(prism_root=project.root, repo_root=project.root)
+
+
+def _required_path(path: Path | None, what: str) -> Path:
+    if path is None:
+        raise ValueError(f"The benchmark project has no {what}")
+    return path
+
+
+def _run_survey_convert(project: BenchmarkProject, workdir: Path) -> Any:
+    from src.converters.survey import convert_survey_xlsx_to_prism_dataset
+
+    for index, export in enumerate(project.wide_exports, 1):
+        convert_survey_xlsx_to_prism_dataset(
+            input_path=export,
+            library_dir=_required_path(project.library_dir, "template library"),
+            output_root=workdir / "survey_convert",
+            id_column="participant_id",
+            session=f"ses-{index}",
+            force=True,
+            name="benchmark",
+        )
+
+
+def _run_survey_convert_lsa(project: BenchmarkProject, workdir: Path) -> Any:
+    from src.converters.survey import convert_survey_lsa_to_prism_dataset
+
+    for index, archive in enumerate(project.lsa_archives, 1):
+        convert_survey_lsa_to_prism_dataset(
+            input_path=archive,
+            library_dir=_required_path(project.library_dir, "template library"),
+            output_root=workdir / "survey_convert_lsa",
+            id_column="participant_id",
+            session=f"ses-{index}",
+            force=True,
+            name="benchmark",
+        )
+
+
+def _run_batch_convert(project: BenchmarkProject, workdir: Path) -> Any:
+    from src.batch_convert import batch_convert_folder
+
+    result = batch_convert_folder(
+        _required_path(project.physio_source_dir, "physio source folder"),
+        workdir / "batch_convert",
+    )
+    if result.error_count:
+        raise RuntimeError(f"batch conversion failed for {result.error_count} file(s)")
+    return result
+
+
+def _run_export(project: BenchmarkProject, workdir: Path) -> Any:
+    from src.web.export_project import export_project
+
+    return export_project(project.root, workdir / "export.zip")
+
+
+CASES: dict[str, BenchmarkCase] = {
+    case.name: case
+    for case in (
+        BenchmarkCase("validate", "runner.validate_dataset", _run_validate),
+        BenchmarkCase(
+            "recipes", "compute_survey_recipes", _run_recipes, mutates_project=True
+        ),
+        BenchmarkCase(
+            "survey_convert",
+            "convert_survey_xlsx_to_prism_dataset (wide CSV exports)",
+            _run_survey_convert,
+            applies=lambda spec: spec.wide_exports,
+        ),
+        BenchmarkCase(
+            "survey_convert_lsa",
+            "convert_survey_lsa_to_prism_dataset (LimeSurvey archives)",
+            _run_survey_convert_lsa,
+            applies=lambda spec: spec.lsa_archives,
+        ),
+        BenchmarkCase(
+            "batch_convert",
+            "batch_convert_folder (EDF physio)",
+            _run_batch_convert,
+            applies=lambda spec: spec.physio_seconds > 0,
+        ),
+        BenchmarkCase(
+            "export",
+            "export_project (anonymized ZIP)",
+            _run_export,
+            mutates_project=True,
+        ),
+    )
+}
+
+
+def peak_rss_mb() -> float | None:
+    """Peak resident set size of this process in MiB, if the OS reports it."""
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes.
+    divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return round(peak / divisor, 1)
+
+
+def relocate_project(project: BenchmarkProject, new_root: Path) -> BenchmarkProject:
+    """Return *project* with every path rebased onto a copy at *new_root*."""
+
+    def rebase(path: Path) -> Path:
+        return new_root / Path(path).relative_to(project.root)
+
+    def rebase_optional(path: Path | None) -> Path | None:
+        return None if path is None else rebase(path)
+
+    return replace(
+        project,
+        root=new_root,
+        library_dir=rebase_optional(project.library_dir),
+        physio_source_dir=rebase_optional(project.physio_source_dir),
+        wide_exports=[rebase(path) for path in project.wide_exports],
+        lsa_archives=[rebase(path) for path in project.lsa_archives],
+    )
+
+
+def run_case(
+    case: BenchmarkCase,
+    project: BenchmarkProject,
+    *,
+    repeats: int = 3,
+    quiet: bool = True,
+) -> CaseResult:
+    """Time *case* ``repeats`` times in the current process."""
+    result = CaseResult(name=case.name, repeats=repeats)
+    with tempfile.TemporaryDirectory(prefix=f"prism-bench-{case.name}-") as tmp:
+        for attempt in range(repeats):
+            workdir = Path(tmp) / f"run-{attempt}"
+            workdir.mkdir()
+            target = project
+            if case.mutates_project:
+                target = relocate_project(project, workdir / "project")
+                shutil.copytree(project.root, target.root, symlinks=True)
+            sink = open(os.devnull, "w", encoding="utf-8") if quiet else None
+            try:
+                started = time.perf_counter()
+                if sink is None:
+                    case.run(target, workdir)
+                else:
+                    with redirect_stdout(sink), redirect_stderr(sink):
+                        case.run(target, workdir)
+                result.seconds.append(time.perf_counter() - started)
+            except Exception as exc:
+                result.error = f"{type(exc).__name__}: {exc}"
+                break
+            finally:
+                if sink is not None:
+                    sink.close()
+                shutil.rmtree(workdir, ignore_errors=True)
+
+    if result.seconds:
+        # The first repeat pays for lazy imports and cold caches; report it
+        # separately so the median tracks steady-state cost.
+        warm = result.seconds[1:] or result.seconds
+        result.cold_seconds = round(result.seconds[0], 4)
+        result.min_seconds = round(min(warm), 4)
+        result.median_seconds = round(statistics.median(warm), 4)
+        result.seconds = [round(value, 4) for value in result.seconds]
+    result.peak_rss_mb = peak_rss_mb()
+    return result
+
+
+def _run_case_in_subprocess(
+    case: BenchmarkCase, project: BenchmarkProject, *, repeats: int
+) -> CaseResult:
+    with tempfile.TemporaryDirectory(prefix="prism-bench-child-") as tmp:
+        result_path = Path(tmp) / "result.json"
+        payload = {
+            "case": case.name,
+            "repeats": repeats,
+            "spec": asdict(project.spec),
+            "project": {
+                "root": str(project.root),
+                "survey_tasks": project.survey_tasks,
+                "library_dir": (
+                    str(project.library_dir) if project.library_dir else None
+                ),
+                "physio_source_dir": (
+                    str(project.physio_source_dir)
+                    if project.physio_source_dir
+                    else None
+                ),
+                "wide_exports": [str(path) for path in project.wide_exports],
+                "lsa_archives": [str(path) for path in project.lsa_archives],
+            },
+            "result_path": str(result_path),
+        }
+        env = dict(os.environ)
+        env["PYTHONPATH"] = os.pathsep.join(
+            [str(REPO_ROOT), str(REPO_ROOT / "app"), str(REPO_ROOT / "app" / "src")]
+            + ([env["PYTHONPATH"]] if env.get("PYTHONPATH") else [])
+        )
+        completed = subprocess.run(
+            [sys.executable, "-m", "benchmarks.harness", json.dumps(payload)],
+            cwd=str(REPO_ROOT),
+            env=env,
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+        if completed.returncode != 0 or not result_path.exists():
+            tail = (completed.stderr or completed.stdout).strip().splitlines()[-1:]
+            return CaseResult(
+                name=case.name,
+                repeats=repeats,
+                error=f"child exited with {completed.returncode}: {' '.join(tail)}",
+            )
+        return CaseResult(**json.loads(result_path.read_text(encoding="utf-8")))
+
+
+def _child_main(raw_payload: str) -> int:
+    payload = json.loads(raw_payload)
+    spec = BenchmarkSpec(**payload["spec"])
+    paths = payload["project"]
+    project = BenchmarkProject(
+        root=Path(paths["root"]),
+        spec=spec,
+        survey_tasks=list(paths["survey_tasks"]),
+        library_dir=Path(paths["library_dir"]) if paths["library_dir"] else None,
+        physio_source_dir=(
+            Path(paths["physio_source_dir"]) if paths["physio_source_dir"] else None
+        ),
+        wide_exports=[Path(path) for path in paths["wide_exports"]],
+        lsa_archives=[Path(path) for path in paths["lsa_archives"]],
+    )
+    result = run_case(CASES[payload["case"]], project, repeats=payload["repeats"])
+    Path(payload["result_path"]).write_text(
+        json.dumps(asdict(result)), encoding="utf-8"
+    )
+    return 0
+
+
+def _git_commit() -> str | None:
+    try:
+        completed = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=str(REPO_ROOT),
+            capture_output=True,
+            text=True,
+            check=False,
+            timeout=10,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return completed.stdout.strip() or None
+
+
+def _prism_version() -> str | None:
+    try:
+        from src import __version__
+    except ImportError:
+        return None
+    return __version__
+
+
+def run_benchmarks(
+    *,
+    profile: str = "small",
+    spec: BenchmarkSpec | None = None,
+    cases: list[str] | None = None,
+    repeats: int = 3,
+    isolate: bool = True,
+    work_dir: Path | None = None,
+    log: Callable[[str], None] | None = None,
+) -> dict[str, Any]:
+    """Generate a project and time the selected cases on it.
+
+    Returns a history record (see :func:`append_history`). With
+    ``isolate=False`` all cases share this process, which is faster but
+    makes ``peak_rss_mb`` the running peak rather than a per-case figure.
+    """
+    if spec is None:
+        if profile not in PROFILES:
+            raise ValueError(
+                f"Unknown benchmark profile {profile!r}; "
+                f"choose from {', '.join(PROFILES)}"
+            )
+        spec = PROFILES[profile]
+    selected = cases or list(CASES)
+    unknown = [name for name in selected if name not in CASES]
+    if unknown:
+        raise ValueError(f"Unknown benchmark case(s): {', '.join(unknown)}")
+
+    owned_dir = None
+    if work_dir is None:
+        owned_dir = tempfile.mkdtemp(prefix="prism-bench-")
+        work_dir = Path(owned_dir)
+    try:
+        started = time.perf_counter()
+        project = generate_benchmark_project(Path(work_dir) / "project", spec)
+        generate_seconds = round(time.perf_counter() - started, 4)
+        if log:
+            log(f"generated {profile} project in {generate_seconds:.2f}s")
+
+        results: dict[str, Any] = {}
+        for name in selected:
+            case = CASES[name]
+            if not case.applies(spec):
+                continue
+            if isolate:
+                result = _run_case_in_subprocess(case, project, repeats=repeats)
+            else:
+                result = run_case(case, project, repeats=repeats)
+            results[name] = asdict(result)
+            if log:
+                log(format_case_result(result))
+    finally:
+        if owned_dir is not None:
+            shutil.rmtree(owned_dir, ignore_errors=True)
+
+    return {
+        "format": HISTORY_FORMAT,
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "prism_version": _prism_version(),
+        "git_commit": _git_commit(),
+        "python": platform.python_version(),
+        "platform": f"{platform.system()}-{platform.machine()}",
+        "profile": profile,
+        "spec": asdict(spec),
+        "isolated": isolate,
+        "repeats": repeats,
+        "generate_seconds": generate_seconds,
+        "results": results,
+    }
+
+
+def format_case_result(result: CaseResult) -> str:
+    if result.error:
+        return f"{result.name:<20} FAILED  {result.error}"
+    memory = (
+        f"{result.peak_rss_mb:.1f} MiB" if result.peak_rss_mb is not None else "n/a"
+    )
+    return (
+        f"{result.name:<20} median {result.median_seconds:.3f}s  "
+        f"min {result.min_seconds:.3f}s  cold {result.cold_seconds:.3f}s  "
+        f"peak RSS {memory}"
+    )
+
+
+def load_history(path: Path = DEFAULT_HISTORY_PATH) -> list[dict[str, Any]]:
+    """Read all records from a history file, skipping unreadable lines."""
+    path = Path(path)
+    if not path.exists():
+        return []
+    records = []
+    for line in path.read_text(encoding="utf-8").splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            records.append(json.loads(line))
+        except json.JSONDecodeError:
+            continue
+    return records
+
+
+def append_history(record: dict[str, Any], path: Path = DEFAULT_HISTORY_PATH) -> Path:
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "a", encoding="utf-8") as handle:
+        handle.write(json.dumps(record, sort_keys=True) + "\n")
+    return path
+
+
+def compare_to_history(
+    record: dict[str, Any],
+    history: list[dict[str, Any]],
+    *,
+    threshold: float = DEFAULT_REGRESSION_THRESHOLD,
+    min_seconds: float = MIN_REGRESSION_SECONDS,
+) -> list[dict[str, Any]]:
+    """List cases in *record* that got slower than the last comparable run.
+
+    Runs are comparable when they used the same profile, spec and isolation
+    mode; records from other machines are still compared, so keep one
+    history file per machine when that matters.
+    """
+    baseline = next(
+        (
+            previous
+            for previous in reversed(history)
+            if previous is not record
+            and previous.get("profile") == record.get("profile")
+            and previous.get("spec") == record.get("spec")
+            and previous.get("isolated") == record.get("isolated")
+        ),
+        None,
+    )
+    if baseline is None:
+        return []
+
+    regressions = []
+    for name, current in record.get("results", {}).items():
+        before = baseline.get("results", {}).get(name) or {}
+        old, new = before.get("median_seconds"), current.get("median_seconds")
+        if old is None or new is None:
+            continue
+        if new - old >= min_seconds and new > old * (1 + threshold):
+            regressions.append(
+                {
+                    "case": name,
+                    "baseline_seconds": old,
+                    "current_seconds": new,
+                    "ratio": round(new / old, 2) if old else None,
+                    "baseline_commit": baseline.get("git_commit"),
+                    "baseline_version": baseline.get("prism_version"),
+                }
+            )
+    return regressions
+
+
+if __name__ == "__main__":
+    sys.exit(_child_main(sys.argv[1]))
@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
 import os
+import runpy
 import sys
 
 # Redirect to the consolidated app folder
@@ -7,7 +8,11 @@ if __name__ == "__main__":
     current_dir = os.path.dirname(os.path.abspath(__file__))
     app_script = os.path.join(current_dir, "app", "prism_tools.py")
     if os.path.exists(app_script):
-        os.execv(sys.executable, [sys.executable, app_script] + sys.argv[1:])
+        # Run the app script in this interpreter instead of exec'ing a second
+        # one; sys.path and argv are set up exactly as a direct launch would.
+        sys.argv[0] = app_script
+        sys.path[0] = os.path.dirname(app_script)
+        runpy.run_path(app_script, run_name="__main__")
     else:
         print(f"Error: {app_script} not found.")
         sys.exit(1)
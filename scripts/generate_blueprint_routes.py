@@ -0,0 +1,29 @@
+"""Regenerate app/src/web/blueprint_routes.json from the modular blueprints.
+
+Prism Studio registers these routes at startup without importing the
+blueprint modules (see app/src/web/lazy_blueprints.py). Run after adding,
+removing or changing a route in any modular blueprint:
+
+    python scripts/generate_blueprint_routes.py
+"""
+
+import os
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(REPO_ROOT, "app"))
+
+from src.web.lazy_blueprints import (  # noqa: E402
+    ROUTE_MANIFEST_PATH,
+    write_route_manifest,
+)
+
+
+def main() -> None:
+    manifest = write_route_manifest()
+    count = sum(len(routes) for routes in manifest.values())
+    print(f"Wrote {ROUTE_MANIFEST_PATH} ({len(manifest)} blueprints, {count} routes)")
+
+
+if __name__ == "__main__":
+    main()
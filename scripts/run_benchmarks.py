@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""Benchmark validation, conversion, recipe and export hot paths.
+
+Generates a synthetic PRISM project for the chosen profile, times each case
+in a fresh interpreter, prints a summary and appends the run to a JSONL
+history (default: ``benchmarks/history.jsonl``). With ``--compare`` the run
+is checked against the last record with the same profile.
+
+Examples:
+    python scripts/run_benchmarks.py --profile small
+    python scripts/run_benchmarks.py --profile medium --cases validate recipes
+    python scripts/run_benchmarks.py --profile small --compare --fail-on-regression
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+from pathlib import Path
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+sys.path.insert(1, os.path.join(REPO_ROOT, "app"))
+
+from benchmarks.datasets import PROFILES  # noqa: E402
+from benchmarks.harness import (  # noqa: E402
+    CASES,
+    DEFAULT_HISTORY_PATH,
+    DEFAULT_REGRESSION_THRESHOLD,
+    append_history,
+    compare_to_history,
+    load_history,
+    run_benchmarks,
+)
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Time PRISM hot paths on a synthetic project and record the results."
+    )
+    parser.add_argument(
+        "--profile",
+        choices=sorted(PROFILES),
+        default="small",
+        help="Size of the generated project (default: small)",
+    )
+    parser.add_argument(
+        "--cases",
+        nargs="+",
+        choices=sorted(CASES),
+        help="Only run these cases (default: all that apply to the profile)",
+    )
+    parser.add_argument(
+        "--repeats", type=int, default=3, help="Timed runs per case (default: 3)"
+    )
+    parser.add_argument(
+        "--history",
+        type=Path,
+        default=DEFAULT_HISTORY_PATH,
+        help=f"JSONL history file (default: {DEFAULT_HISTORY_PATH})",
+    )
+    parser.add_argument(
+        "--no-record", action="store_true", help="Do not append this run to the history"
+    )
+    parser.add_argument(
+        "--in-process",
+        action="store_true",
+        help="Run all cases in this interpreter (faster, peak memory is not per case)",
+    )
+    parser.add_argument(
+        "--work-dir",
+        type=Path,
+        help="Generate the project here and keep it (default: temporary directory)",
+    )
+    parser.add_argument(
+        "--compare",
+        action="store_true",
+        help="Compare against the last run with the same profile in the history",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_REGRESSION_THRESHOLD,
+        help="Relative slowdown that counts as a regression (default: 0.25)",
+    )
+    parser.add_argument(
+        "--fail-on-regression",
+        action="store_true",
+        help="Exit with status 1 when --compare finds a regression",
+    )
+    parser.add_argument(
+        "--json", action="store_true", help="Print the full run record as JSON"
+    )
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = _parse_args()
+    if args.repeats < 1:
+        print("--repeats must be at least 1", file=sys.stderr)
+        return 2
+
+    history = load_history(args.history) if args.compare else []
+    record = run_benchmarks(
+        profile=args.profile,
+        cases=args.cases,
+        repeats=args.repeats,
+        isolate=not args.in_process,
+        work_dir=args.work_dir,
+        log=print,
+    )
+    if args.json:
+        print(json.dumps(record, indent=2, sort_keys=True))
+    if not args.no_record:
+        print(f"recorded run in {append_history(record, args.history)}")
+
+    failed = [name for name, result in record["results"].items() if result["error"]]
+    if failed:
+        print(f"failed cases: {', '.join(failed)}", file=sys.stderr)
+
+    if args.compare:
+        regressions = compare_to_history(record, history, threshold=args.threshold)
+        if not regressions:
+            print("no regressions against the previous comparable run")
+        for item in regressions:
+            print(
+                f"REGRESSION {item['case']}: {item['baseline_seconds']:.3f}s -> "
+                f"{item['current_seconds']:.3f}s (x{item['ratio']}) since "
+                f"{item['baseline_version']} ({item['baseline_commit']})"
+            )
+        if regressions and args.fail_on_regression:
+            return 1
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
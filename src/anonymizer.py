@@ -16,7 +16,7 @@ import secrets
 import string
 import re
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional
 import hashlib
 
 
@@ -268,23 +268,21 @@ def anonymize_tsv_file(
         writer.writerows(rows)
 
 
-def replace_participant_ids_in_text(
-    value: str, participant_mapping: Dict[str, str]
-) -> str:
+def build_participant_id_replacer(
+    participant_mapping: Dict[str, str]
+) -> Callable[[str], str]:
     """
-    Replace participant IDs in free text without corrupting overlapping IDs.
+    Compile ``participant_mapping`` once into a reusable text replacer.
 
-    Uses token-style boundaries so an ID like ``sub-01`` is not replaced inside
-    a distinct ID like ``sub-010``.
+    The returned callable behaves like :func:`replace_participant_ids_in_text`
+    with a fixed mapping, so callers rewriting many files or cells do not
+    rebuild the alternation regex for every value.
     """
-    if not value or not participant_mapping:
-        return value
-
     participant_ids = [
         participant_id for participant_id in participant_mapping if participant_id
     ]
     if not participant_ids:
-        return value
+        return lambda value: value
 
     pattern = re.compile(
         r"(?<![A-Za-z0-9])("
@@ -294,8 +292,29 @@ def replace_participant_ids_in_text(
         )
         + r")(?![A-Za-z0-9])"
     )
+    mapping = dict(participant_mapping)
+
+    def _replace(value: str) -> str:
+        if not value:
+            return value
+        return pattern.sub(lambda match: mapping[match.group(0)], value)
+
+    return _replace
+
+
+def replace_participant_ids_in_text(
+    value: str, participant_mapping: Dict[str, str]
+) -> str:
+    """
+    Replace participant IDs in free text without corrupting overlapping IDs.
+
+    Uses token-style boundaries so an ID like ``sub-01`` is not replaced inside
+    a distinct ID like ``sub-010``.
+    """
+    if not value or not participant_mapping:
+        return value
 
-    return pattern.sub(lambda match: participant_mapping[match.group(0)], value)
+    return build_participant_id_replacer(participant_mapping)(value)
 
 
 def update_intendedfor_paths(
@@ -12,6 +12,7 @@ API Endpoints:
     GET  /api/v1/health         - Health check endpoint
 """
 
+import importlib.util
 import os
 import sys
 from datetime import datetime, timezone
@@ -32,13 +33,24 @@ _app_src_dir = os.path.join(os.path.dirname(current_dir), "app", "src")
 if os.path.isdir(_app_src_dir) and _app_src_dir not in sys.path:
     sys.path.insert(0, _app_src_dir)
 
+def validate_dataset(*args, **kwargs):
+    # runner pulls in the validator, the survey converters and pandas; load it
+    # on the first validation request instead of when the blueprint is built.
+    from runner import validate_dataset as _validate_dataset
+
+    return _validate_dataset(*args, **kwargs)
+
+
 try:
-    from runner import validate_dataset
+    if importlib.util.find_spec("runner") is None:
+        raise ImportError("No module named 'runner'")
     from schema_manager import get_available_schema_versions, load_all_schemas
     from issues import tuple_to_issue, issues_to_dict, summarize_issues
+
+    _VALIDATOR_AVAILABLE = True
 except ImportError as e:
     print(f"⚠️  API import error: {e}")
-    validate_dataset = None
+    _VALIDATOR_AVAILABLE = False
     get_available_schema_versions = None
     load_all_schemas = None
     tuple_to_issue = None
@@ -154,7 +166,7 @@ def create_api_blueprint(schema_dir: Optional[str] = None):
                 }
             }
         """
-        if not validate_dataset:
+        if not _VALIDATOR_AVAILABLE:
             return jsonify({"error": "Validator not available"}), 500
 
         # Parse request
@@ -296,7 +308,7 @@ def create_api_blueprint(schema_dir: Optional[str] = None):
                 }
             }
         """
-        if not validate_dataset:
+        if not _VALIDATOR_AVAILABLE:
             return jsonify({"error": "Validator not available"}), 500
 
         data = request.get_json()
@@ -7,6 +7,13 @@ from pathlib import Path
 from src.bids_entity_parser import BidsEntityParser
 from src.entity_rules import load_entity_rules
 from src.system_files import filter_system_files
+from src.text_rewrite_engine import (
+    PlannedTextChange,
+    RewriteJournal,
+    apply_text_rewrites,
+    plan_text_rewrites,
+    rewrite_fingerprint,
+)
 
 _IGNORED_DIR_NAMES = {
     ".git",
@@ -26,6 +33,7 @@ _TEXT_SUFFIXES = {
     ".md",
 }
 _TEXT_FILENAMES = {".bidsignore"}
+_JOURNAL_RELATIVE_PATH = Path(".prism") / "entity_rewrite_journal.jsonl"
 _DOUBLE_SUFFIXES = (".nii.gz", ".tsv.gz")
 _NON_EDITABLE_ENTITIES = {"sub"}
 # Sourced from app/schemas/stable/entities.schema.json (see src/entity_rules.py)
@@ -52,7 +60,7 @@ class _EntityRewritePlan:
     available_entities: list[str]
     subjects: list[str]
     file_ops: list[_RenameOperation]
-    preview_text_updates: list[Path]
+    preview_text_updates: list[PlannedTextChange]
     conflicts: list[str]
 
 
@@ -204,7 +212,11 @@ class BidsEntityRewriter:
             op.old_path.rename(op.new_path)
 
         replacements = self._build_text_replacements(plan.file_ops)
-        changed_text_files = self._rewrite_text_file_contents(replacements)
+        changed_text_files = self._rewrite_text_file_contents(
+            replacements,
+            plan.preview_text_updates,
+            renamed_paths={op.old_path: op.new_path for op in plan.file_ops},
+        )
         result = self._plan_to_dict(plan, applied=True)
         result["text_update_count"] = len(changed_text_files)
         result["text_update_files"] = [
@@ -620,38 +632,38 @@ class BidsEntityRewriter:
 
         return sorted(replacements.items(), key=lambda item: len(item[0]), reverse=True)
 
-    def _preview_text_updates(self, replacements: list[tuple[str, str]]) -> list[Path]:
+    def _preview_text_updates(
+        self, replacements: list[tuple[str, str]]
+    ) -> list[PlannedTextChange]:
         if not replacements:
             return []
 
-        updated: list[Path] = []
-        for file_path in self._iter_text_files():
-            original_text = self._read_text_file(file_path)
-            if original_text is None:
-                continue
-            rewritten_text = self._replace_text_tokens(original_text, replacements)
-            if rewritten_text != original_text:
-                updated.append(file_path)
-        return updated
+        return plan_text_rewrites(
+            self._iter_text_files(),
+            lambda text: self._replace_text_tokens(text, replacements),
+        )
 
     def _rewrite_text_file_contents(
         self,
         replacements: list[tuple[str, str]],
+        planned_changes: list[PlannedTextChange],
+        renamed_paths: dict[Path, Path] | None = None,
     ) -> list[Path]:
-        if not replacements:
+        if not replacements or not planned_changes:
             return []
 
-        changed: list[Path] = []
-        for file_path in self._iter_text_files():
-            original_text = self._read_text_file(file_path)
-            if original_text is None:
-                continue
-            rewritten_text = self._replace_text_tokens(original_text, replacements)
-            if rewritten_text == original_text:
-                continue
-            file_path.write_text(rewritten_text, encoding="utf-8")
-            changed.append(file_path)
-        return changed
+        renamed_paths = renamed_paths or {}
+        journal = RewriteJournal(
+            self.project_root / _JOURNAL_RELATIVE_PATH,
+            rewrite_fingerprint(replacements),
+        )
+        with journal:
+            return apply_text_rewrites(
+                planned_changes,
+                lambda text: self._replace_text_tokens(text, replacements),
+                relocate=lambda path: renamed_paths.get(path, path),
+                journal=journal,
+            )
 
     @staticmethod
     def _replace_text_tokens(
@@ -665,13 +677,6 @@ class BidsEntityRewriter:
             updated = updated.replace(old_text, new_text)
         return updated
 
-    @staticmethod
-    def _read_text_file(file_path: Path) -> str | None:
-        try:
-            return file_path.read_text(encoding="utf-8")
-        except (UnicodeDecodeError, OSError):
-            return None
-
     def _detect_rename_conflicts(self, ops: list[_RenameOperation]) -> list[str]:
         conflicts: list[str] = []
         old_paths = {op.old_path for op in ops}
@@ -734,8 +739,8 @@ class BidsEntityRewriter:
                 for op in cap(plan.file_ops)
             ],
             "text_update_files": [
-                path.relative_to(self.project_root).as_posix()
-                for path in cap(plan.preview_text_updates)
+                change.path.relative_to(self.project_root).as_posix()
+                for change in cap(plan.preview_text_updates)
             ],
             "conflicts": plan.conflicts,
         }
@@ -27,6 +27,8 @@ from urllib.parse import urlparse
 if __name__ == "__main__":
     sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
+from src.export_copy import ExportCopier
+
 try:
     from src.readme_generator import ReadmeGenerator
 
@@ -59,6 +61,7 @@ class ANCExporter:
         self.output_path = (
             Path(output_path) if output_path else Path(f"{dataset_path}_anc_export")
         )
+        self.copy_summary: Dict[str, Any] = {}
 
         if not self.dataset_path.exists():
             raise ValueError(f"Dataset not found: {dataset_path}")
@@ -69,6 +72,7 @@ class ANCExporter:
         convert_to_git_lfs: bool = False,
         copy_data: bool = True,
         include_ci_examples: bool = False,
+        copy_mode: str = "auto",
     ) -> Path:
         """
         Export dataset to ANC-compatible format.
@@ -78,6 +82,8 @@ class ANCExporter:
             convert_to_git_lfs: Convert from DataLad to Git LFS
             copy_data: Copy dataset files (vs creating symlinks)
             include_ci_examples: Include CI/CD example files
+            copy_mode: "auto" to use reflinks/hardlinks/copy_file_range where
+                the filesystem allows, "copy" to always copy bytes
 
         Returns:
             Path to exported dataset
@@ -89,7 +95,7 @@ class ANCExporter:
 
         # Step 1: Copy/link dataset structure
         if copy_data:
-            self._copy_dataset_structure()
+            self._copy_dataset_structure(copy_mode)
         else:
             logger.info("Skipping data copy (metadata only)")
 
@@ -126,9 +132,14 @@ class ANCExporter:
         logger.info(f"✓ AND export completed: {self.output_path}")
         return self.output_path
 
-    def _copy_dataset_structure(self):
-        """Copy dataset structure to export directory."""
+    def _copy_dataset_structure(self, copy_mode: str = "auto"):
+        """Copy dataset structure to export directory.
+
+        Later steps rewrite top-level files (README.md, CITATION.cff, ...),
+        which ``ExportCopier`` therefore never hardlinks.
+        """
         logger.info("Copying dataset structure...")
+        copier = ExportCopier(copy_mode, root=self.dataset_path)
 
         for item in self.dataset_path.iterdir():
             if item.name.startswith(".") and item.name not in [
@@ -141,10 +152,13 @@ class ANCExporter:
 
             if item.is_dir():
                 if not dest.exists():
-                    shutil.copytree(item, dest, symlinks=False)
+                    shutil.copytree(item, dest, symlinks=False, copy_function=copier)
             else:
                 if not dest.exists():
-                    shutil.copy2(item, dest)
+                    copier(item, dest)
+
+        self.copy_summary = copier.summary()
+        logger.info(f"✓ Copied dataset files ({copier.describe()})")
 
     def _extract_metadata(self) -> Dict[str, Any]:
         """Extract metadata from existing PRISM dataset."""
@@ -1004,6 +1018,8 @@ See the example files for customization options.
             "found": found,
             "missing": missing,
         }
+        if self.copy_summary:
+            report["copy_strategy"] = self.copy_summary
 
         if report["valid"]:
             logger.info("✓ All AND requirements met")
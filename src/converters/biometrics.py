@@ -21,6 +21,7 @@ import unicodedata
 from src.cross_platform import describe_case_insensitive_id_collisions
 from src.converters.file_reader import (
     infer_tabular_kind as _infer_tabular_kind,
+    preview_tabular_file as _preview_tabular_file,
     read_tabular_file as _read_tabular_file,
 )
 from src.entity_rules import load_entity_rules
@@ -94,14 +95,19 @@ def _normalize_ses_id(value: Any, *, default_session: str = "ses-1") -> str:
     return f"ses-{label}"
 
 
-def _read_table_as_dataframe(
-    *, input_path: Path, sheet: str | int | None = None
-) -> "Any":
+def _supported_table_kind(input_path: Path) -> str:
     kind = _infer_tabular_kind(input_path)
     if kind not in {"csv", "tsv", "xlsx", "sav", "rds", "rdata"}:
         raise ValueError(
             "Supported formats: .csv, .xlsx, .tsv, .sav, .rds, .rdata, .rda"
         )
+    return kind
+
+
+def _read_table_as_dataframe(
+    *, input_path: Path, sheet: str | int | None = None
+) -> "Any":
+    kind = _supported_table_kind(input_path)
     resolved_sheet: str | int = sheet if sheet is not None else 0
     result = _read_tabular_file(input_path, kind=kind, sheet=resolved_sheet)
     for w in result.warnings:
@@ -182,10 +188,16 @@ def detect_biometrics_in_table(
     input_path = Path(input_path).resolve()
     library_dir = Path(library_dir).resolve()
 
-    df = _read_table_as_dataframe(input_path=input_path, sheet=sheet)
+    # Detection only needs the header row.
+    preview = _preview_tabular_file(
+        input_path,
+        kind=_supported_table_kind(input_path),
+        sheet=sheet if sheet is not None else 0,
+        max_rows=0,
+    )
     task_to_items, _ = _load_biometrics_library(library_dir)
 
-    df_cols_norm = {_norm_col(c) for c in df.columns}
+    df_cols_norm = {_norm_col(c) for c in preview.columns}
 
     detected_tasks: list[str] = []
     for task, items in task_to_items.items():
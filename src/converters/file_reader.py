@@ -5,6 +5,7 @@ Centralises all file-format edge-case handling that would otherwise be
 duplicated across survey, biometrics, and participants converters:
 
   • Encoding detection & fallback  (UTF-8 → UTF-8-sig/BOM → latin-1 → cp1252)
+    from a head/tail byte sample, followed by a single streaming parse
   • Delimiter auto-sniff for CSV/TSV when the declared separator is wrong
   • Empty-file guard before pandas even opens the file
   • Column-name whitespace stripping
@@ -18,17 +19,25 @@ Usage::
     result = read_tabular_file(path, kind="csv")
     df = result.df
     # result.encoding_used, result.delimiter_used are available for provenance logging
+
+    preview = preview_tabular_file(path, max_rows=20)
+    preview.columns, preview.df, preview.row_count, preview.value_samples
+
+    chunks = open_tabular_chunks(path, chunk_rows=5000)  # CSV / TSV only
+    for block in chunks.iter_chunks(columns=["participant_id"]):
+        ...
 """
 
 from __future__ import annotations
 
+import codecs
 import csv
 import io
 import importlib
 import re
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
 
 # ---------------------------------------------------------------------------
 # Result container
@@ -45,6 +54,88 @@ class ReadResult:
     warnings: list[str] = field(default_factory=list)
 
 
+@dataclass
+class PreviewResult:
+    """Return value from :func:`preview_tabular_file`."""
+
+    df: Any  # pandas.DataFrame holding at most ``max_rows`` rows
+    row_count: int
+    row_count_exact: bool  # False when row_count is estimated from a sample
+    value_samples: dict[str, list[str]]
+    encoding_used: str
+    delimiter_used: str | None  # None for binary formats
+    warnings: list[str] = field(default_factory=list)
+
+    @property
+    def columns(self) -> list[str]:
+        return [str(column) for column in self.df.columns]
+
+
+@dataclass
+class TabularChunks:
+    """Return value from :func:`open_tabular_chunks`.
+
+    Holds the header and the dialect detected once; every call to
+    :meth:`iter_chunks` re-reads the file from the start, so callers can make
+    several bounded-memory passes (e.g. an ID column first, then all columns).
+    """
+
+    path: Path
+    columns: list[str]
+    chunk_rows: int
+    encoding_used: str
+    delimiter_used: str
+    warnings: list[str] = field(default_factory=list)
+
+    def __iter__(self) -> Iterator[Any]:
+        return self.iter_chunks()
+
+    def iter_chunks(self, columns: list[str] | None = None) -> Iterator[Any]:
+        """Yield DataFrames of at most ``chunk_rows`` rows (``dtype=str``).
+
+        *columns* restricts the read to those header names (first occurrence
+        of each). Chunks keep a running row index, so ``df.index`` matches
+        the row positions a full :func:`read_tabular_file` would report.
+        """
+        import pandas as pd
+
+        positions: list[int] | None = None
+        if columns is not None:
+            first_position: dict[str, int] = {}
+            for position, name in enumerate(self.columns):
+                first_position.setdefault(name, position)
+            missing = [name for name in columns if name not in first_position]
+            if missing:
+                raise ValueError(
+                    f"Column(s) not found in {self.path.name}: {', '.join(missing)}"
+                )
+            positions = sorted({first_position[name] for name in columns})
+
+        reader = pd.read_csv(
+            self.path,
+            sep=self.delimiter_used,
+            dtype=str,
+            encoding=self.encoding_used,
+            usecols=positions,
+            chunksize=self.chunk_rows,
+        )
+        names = (
+            self.columns
+            if positions is None
+            else [self.columns[position] for position in positions]
+        )
+        try:
+            with reader:
+                for chunk in reader:
+                    chunk.columns = names
+                    yield chunk
+        except UnicodeDecodeError as exc:
+            raise ValueError(
+                f"Cannot decode {self.path.name} with encoding "
+                f"'{self.encoding_used}': {exc}"
+            ) from exc
+
+
 # ---------------------------------------------------------------------------
 # Encoding candidates (ordered: most common / strict first)
 # ---------------------------------------------------------------------------
@@ -124,20 +215,153 @@ def _sniff_delimiter(text: str) -> str:
         return ","
 
 
+@dataclass
+class _TextSample:
+    """Head/tail bytes used to pick encoding and delimiter without a full read."""
+
+    head: bytes
+    tail: bytes
+    complete: bool  # head holds the entire file
+    has_content: bool
+
+
+_SAMPLE_CHUNK_SIZE = 64 * 1024
+_SNIFF_LINE_COUNT = 20
+
+
+def _read_text_sample(path: Path) -> _TextSample:
+    """Read enough leading bytes for :func:`_sniff_delimiter` plus a tail sample.
+
+    The head always covers the first ``_SNIFF_LINE_COUNT`` complete lines, so
+    sniffing the sample gives the same answer as sniffing the whole file.
+    """
+    try:
+        with open(path, "rb") as handle:
+            chunks: list[bytes] = []
+            line_feeds = carriage_returns = 0
+            has_content = complete = False
+            while True:
+                chunk = handle.read(_SAMPLE_CHUNK_SIZE)
+                if not chunk:
+                    complete = True
+                    break
+                chunks.append(chunk)
+                has_content = has_content or bool(chunk.strip())
+                line_feeds += chunk.count(b"\n")
+                carriage_returns += chunk.count(b"\r")
+                if has_content and max(line_feeds, carriage_returns) > _SNIFF_LINE_COUNT:
+                    break
+            head = b"".join(chunks)
+
+            tail = b""
+            if not complete:
+                size = handle.seek(0, io.SEEK_END)
+                handle.seek(max(len(head), size - _SAMPLE_CHUNK_SIZE))
+                tail = handle.read()
+                complete = not tail
+    except FileNotFoundError:
+        raise ValueError(f"File not found: {path}")
+    except PermissionError:
+        raise ValueError(f"Permission denied reading file: {path}")
+    except OSError as exc:
+        raise ValueError(f"Cannot read file {path.name}: {exc}") from exc
+
+    return _TextSample(head=head, tail=tail, complete=complete, has_content=has_content)
+
+
+def _sample_decodes(sample: _TextSample, encoding: str) -> bool:
+    """Return whether the head and tail samples are valid in *encoding*."""
+    try:
+        codecs.getincrementaldecoder(encoding)().decode(
+            sample.head, final=sample.complete
+        )
+        if sample.tail:
+            tail = sample.tail
+            if codecs.lookup(encoding).name.startswith("utf-8"):
+                # The tail may start inside a multi-byte sequence.
+                skip = 0
+                while skip < 3 and skip < len(tail) and 0x80 <= tail[skip] <= 0xBF:
+                    skip += 1
+                tail = tail[skip:]
+                encoding = "utf-8"
+            codecs.getincrementaldecoder(encoding)().decode(tail, final=True)
+    except (UnicodeDecodeError, LookupError):
+        return False
+    return True
+
+
+def _file_decodes(path: Path, encoding: str) -> bool:
+    """Stream-decode *path* without materialising the text."""
+    decoder = codecs.getincrementaldecoder(encoding)()
+    try:
+        with open(path, "rb") as handle:
+            for chunk in iter(lambda: handle.read(1024 * 1024), b""):
+                decoder.decode(chunk)
+            decoder.decode(b"", final=True)
+    except (UnicodeDecodeError, LookupError):
+        return False
+    return True
+
+
 def _strip_columns(df: Any) -> Any:
     """Strip whitespace from all column names in-place and return df."""
     return df.rename(columns={c: str(c).strip() for c in df.columns})
 
 
 def _coerce_values_to_str(df: Any, pd_module: Any) -> Any:
-    """Normalize imported dataframe values to string-like columns."""
+    """Normalize imported dataframe values to string-like columns.
+
+    Numeric columns are stringified once per distinct value (SPSS/R exports
+    are mostly low-cardinality codes) and object columns without a per-cell
+    ``isna`` call. Other dtypes (dates, categoricals, nullable extension
+    types) keep the per-cell ``str`` conversion so their text is unchanged.
+    """
+    import numpy as np
 
     def _coerce(value: Any) -> Any:
         if pd_module.isna(value):
             return pd_module.NA
         return str(value)
 
-    return df.apply(lambda series: series.map(_coerce))
+    coerced: dict[int, Any] = {}
+    for position in range(df.shape[1]):
+        series = df.iloc[:, position]
+        dtype = series.dtype
+        values = None
+        if isinstance(dtype, np.dtype) and dtype.kind in "iubf":
+            raw = series.to_numpy()
+            # float32 prints differently through numpy than through Python
+            # floats, and factorize folds -0.0 into 0.0.
+            exact_floats = dtype.kind != "f" or (
+                dtype == np.float64 and not np.any((raw == 0) & np.signbit(raw))
+            )
+            if exact_floats:
+                codes, uniques = pd_module.factorize(raw)
+                labels = np.array(
+                    [str(value) for value in uniques.tolist()] + [pd_module.NA],
+                    dtype=object,
+                )
+                values = labels[codes]
+        elif dtype == object or isinstance(dtype, pd_module.StringDtype):
+            values = series.to_numpy(dtype=object).copy()
+            missing = series.isna().to_numpy()
+            present = ~missing
+            values[present] = [
+                value if type(value) is str else str(value)
+                for value in values[present]
+            ]
+            values[missing] = pd_module.NA
+
+        if values is None:
+            coerced[position] = series.map(_coerce)
+        else:
+            coerced[position] = pd_module.Series(
+                values, index=series.index, name=series.name
+            ).infer_objects()
+
+    result = pd_module.DataFrame(coerced, index=df.index)
+    result.columns = df.columns
+    return result
 
 
 def _import_optional_module(module_name: str, *, feature_label: str):
@@ -176,6 +400,18 @@ def infer_tabular_kind(path: str | Path) -> str | None:
     return _SUPPORTED_SUFFIX_TO_KIND.get(Path(path).suffix.lower())
 
 
+def _probe_excel_sheet(workbook: Any, sheet_name: str) -> Any:
+    """Parse the first data row of a sheet, or all of it if that row is blank.
+
+    Sheets with data stop after one row; only sheets that look empty (which
+    are small) are parsed in full, so emptiness matches a full parse.
+    """
+    sheet_df = workbook.parse(sheet_name=sheet_name, dtype=str, nrows=1)
+    if sheet_df.empty:
+        sheet_df = workbook.parse(sheet_name=sheet_name, dtype=str)
+    return sheet_df
+
+
 def list_excel_sheets(path: str | Path) -> dict[str, Any]:
     """Return sheet names for an Excel workbook, flagging which ones have data.
 
@@ -201,7 +437,7 @@ def list_excel_sheets(path: str | Path) -> dict[str, Any]:
 
             for index, sheet_name in enumerate(sheet_names):
                 try:
-                    sheet_df = workbook.parse(sheet_name=sheet_name, dtype=str)
+                    sheet_df = _probe_excel_sheet(workbook, sheet_name)
                 except Exception:
                     continue
                 if sheet_df is not None and not sheet_df.empty:
@@ -365,35 +601,86 @@ def read_tabular_file(
     # ------------------------------------------------------------------
     # Text formats (CSV / TSV)
     # ------------------------------------------------------------------
-    raw = _try_read_bytes(path)
+    # Encoding and delimiter are chosen from a head/tail sample; the file is
+    # then decoded exactly once by a single streaming pandas parse.
+    sample = _read_text_sample(path)
 
-    if not raw.strip():
+    if not sample.has_content:
         raise ValueError(f"Input file is empty: {path.name}")
 
     if encoding:
-        try:
-            text = raw.decode(encoding)
-            enc_used = encoding
-        except (UnicodeDecodeError, LookupError) as exc:
-            raise ValueError(
-                f"Cannot decode {path.name} with encoding '{encoding}': {exc}"
-            ) from exc
+        encoding_candidates = [encoding]
     else:
-        text, enc_used = _decode_bytes(raw)
+        encoding_candidates = [
+            candidate
+            for candidate in _ENCODING_CANDIDATES
+            if _sample_decodes(sample, candidate)
+        ]
 
     warnings: list[str] = []
 
     default_sep = "\t" if kind == "tsv" else ","
     sep = separator if separator is not None else default_sep
 
+    enc_used = read_encoding = encoding_errors = ""
+
     def _do_read(sep_: str) -> Any:
-        return pd.read_csv(io.StringIO(text), sep=sep_, dtype=str)
+        return pd.read_csv(
+            path,
+            sep=sep_,
+            dtype=str,
+            encoding=read_encoding,
+            encoding_errors=encoding_errors,
+        )
 
-    try:
-        df = _do_read(sep)
-    except EmptyDataError:
-        raise ValueError(f"Input {kind.upper()} file is empty: {path.name}")
-    except Exception as exc:
+    df = None
+    read_error: Exception | None = None
+    for index, candidate in enumerate(encoding_candidates):
+        enc_used = read_encoding = candidate
+        encoding_errors = "strict"
+        try:
+            df = _do_read(sep)
+        except (UnicodeDecodeError, LookupError) as exc:
+            if encoding:
+                raise ValueError(
+                    f"Cannot decode {path.name} with encoding '{encoding}': {exc}"
+                ) from exc
+            continue
+        except EmptyDataError:
+            raise ValueError(f"Input {kind.upper()} file is empty: {path.name}")
+        except Exception as exc:
+            # A parse error may surface before an undecodable byte further
+            # down; only blame the dialect once the encoding is confirmed.
+            if encoding and not _file_decodes(path, encoding):
+                try:
+                    _try_read_bytes(path).decode(encoding)
+                except (UnicodeDecodeError, LookupError) as decode_exc:
+                    raise ValueError(
+                        f"Cannot decode {path.name} with encoding '{encoding}': {decode_exc}"
+                    ) from decode_exc
+            if (
+                not sample.complete
+                and index + 1 < len(encoding_candidates)
+                and not _file_decodes(path, candidate)
+            ):
+                continue
+            read_error = exc
+        break
+    else:
+        enc_used, read_encoding, encoding_errors = "utf-8 (lossy)", "utf-8", "replace"
+        try:
+            df = _do_read(sep)
+        except EmptyDataError:
+            raise ValueError(f"Input {kind.upper()} file is empty: {path.name}")
+        except Exception as exc:
+            read_error = exc
+
+    sniff_text = codecs.getincrementaldecoder(read_encoding)(
+        errors="replace"
+    ).decode(sample.head, final=sample.complete)
+
+    if read_error is not None:
+        read_exc = read_error
         # The default/explicit separator may simply be wrong (e.g. a
         # semicolon-delimited European export with comma-decimal numbers,
         # which makes a comma-delimited parse raise a ragged-row error
@@ -401,14 +688,18 @@ def read_tabular_file(
         # delimiter before giving up.
         recovered_df = None
         if separator is None:
-            sniffed = _sniff_delimiter(text)
+            sniffed = _sniff_delimiter(sniff_text)
             if sniffed != sep:
                 try:
-                    candidate = _do_read(sniffed)
+                    candidate_df = _do_read(sniffed)
                 except Exception:
-                    candidate = None
-                if candidate is not None and not candidate.empty and len(candidate.columns) > 1:
-                    recovered_df = candidate
+                    candidate_df = None
+                if (
+                    candidate_df is not None
+                    and not candidate_df.empty
+                    and len(candidate_df.columns) > 1
+                ):
+                    recovered_df = candidate_df
                     sep = sniffed
                     warnings.append(
                         f"{kind.upper()} file appears to use '{sniffed}' as delimiter "
@@ -416,12 +707,12 @@ def read_tabular_file(
                     )
 
         if recovered_df is None:
-            friendly = _rewrite_tokenization_error(str(exc), kind)
+            friendly = _rewrite_tokenization_error(str(read_exc), kind)
             if friendly:
-                raise ValueError(friendly) from exc
+                raise ValueError(friendly) from read_exc
             raise ValueError(
-                f"Failed to read {kind.upper()} file {path.name}: {exc}"
-            ) from exc
+                f"Failed to read {kind.upper()} file {path.name}: {read_exc}"
+            ) from read_exc
         df = recovered_df
 
     if df is None or df.empty:
@@ -433,7 +724,7 @@ def read_tabular_file(
     # ------------------------------------------------------------------
     if len(df.columns) == 1 and separator is None:
         col0 = str(df.columns[0])
-        sniffed = _sniff_delimiter(text)
+        sniffed = _sniff_delimiter(sniff_text)
         if sniffed != sep and sniffed in col0:
             warnings.append(
                 f"{kind.upper()} file appears to use '{sniffed}' as delimiter instead "
@@ -473,3 +764,317 @@ def read_tabular_file(
         delimiter_used=sep,
         warnings=warnings,
     )
+
+
+def _value_samples(df: Any, max_values: int) -> dict[str, list[str]]:
+    """Return up to *max_values* distinct non-empty values per column."""
+    samples: dict[str, list[str]] = {}
+    for position, column in enumerate(df.columns):
+        values: list[str] = []
+        seen: set[str] = set()
+        for value in df.iloc[:, position].dropna().tolist():
+            text = str(value).strip()
+            if not text or text in seen:
+                continue
+            seen.add(text)
+            values.append(text)
+            if len(values) >= max_values:
+                break
+        samples.setdefault(str(column), values)
+    return samples
+
+
+def _preview_text_file(
+    path: Path,
+    kind: str,
+    *,
+    pd: Any,
+    max_rows: int,
+    separator: str | None,
+    encoding: str | None,
+) -> tuple[Any, int, bool, str, str, list[str]]:
+    sample = _read_text_sample(path)
+    if not sample.has_content:
+        raise ValueError(f"Input file is empty: {path.name}")
+
+    if encoding:
+        encoding_candidates = [encoding]
+    else:
+        encoding_candidates = [
+            candidate
+            for candidate in _ENCODING_CANDIDATES
+            if _sample_decodes(sample, candidate)
+        ] or ["latin-1"]
+
+    default_sep = "\t" if kind == "tsv" else ","
+    sep = separator if separator is not None else default_sep
+    warnings: list[str] = []
+
+    # Small files are parsed completely for an exact row count.
+    nrows = None if sample.complete else max_rows
+
+    def _read(sep_: str, enc_: str) -> Any:
+        return pd.read_csv(path, sep=sep_, dtype=str, encoding=enc_, nrows=nrows)
+
+    df = None
+    last_error: Exception | None = None
+    enc_used = encoding_candidates[0]
+    for enc_used in encoding_candidates:
+        try:
+            df = _read(sep, enc_used)
+        except (UnicodeDecodeError, LookupError) as exc:
+            if encoding:
+                raise ValueError(
+                    f"Cannot decode {path.name} with encoding '{encoding}': {exc}"
+                ) from exc
+            last_error = exc
+            continue
+        except Exception as exc:
+            last_error = exc
+        break
+
+    if separator is None and (
+        df is None or len(df.columns) == 1
+    ):
+        sniff_text = codecs.getincrementaldecoder(enc_used)(errors="replace").decode(
+            sample.head, final=sample.complete
+        )
+        sniffed = _sniff_delimiter(sniff_text)
+        if sniffed != sep and (df is None or sniffed in str(df.columns[0])):
+            try:
+                recovered = _read(sniffed, enc_used)
+            except Exception:
+                recovered = None
+            if recovered is not None and len(recovered.columns) > 1:
+                df, sep = recovered, sniffed
+                warnings.append(
+                    f"{kind.upper()} file appears to use '{sniffed}' as delimiter "
+                    f"instead of the expected '{default_sep}'. Re-read with detected delimiter."
+                )
+
+    if df is None:
+        friendly = _rewrite_tokenization_error(str(last_error), kind)
+        if friendly:
+            raise ValueError(friendly) from last_error
+        raise ValueError(
+            f"Failed to read {kind.upper()} file {path.name}: {last_error}"
+        ) from last_error
+
+    if sample.complete:
+        return df.head(max_rows), len(df), True, enc_used, sep, warnings
+
+    # Estimate from the average line length in the head sample; quoted
+    # multi-line cells make this approximate.
+    line_breaks = max(sample.head.count(b"\n"), sample.head.count(b"\r"), 1)
+    bytes_per_line = len(sample.head) / line_breaks
+    estimate = max(len(df), int(path.stat().st_size / bytes_per_line) - 1)
+    return df, estimate, False, enc_used, sep, warnings
+
+
+def _preview_from_full_read(
+    path: Path, kind: str, *, sheet: str | int, max_rows: int, max_values: int
+) -> PreviewResult:
+    full = read_tabular_file(path, kind, sheet=sheet)
+    df = full.df.head(max_rows)
+    return PreviewResult(
+        df=df,
+        row_count=len(full.df),
+        row_count_exact=True,
+        value_samples=_value_samples(df, max_values),
+        encoding_used=full.encoding_used,
+        delimiter_used=full.delimiter_used,
+        warnings=full.warnings,
+    )
+
+
+def preview_tabular_file(
+    path: str | Path,
+    kind: str | None = None,
+    *,
+    sheet: str | int = 0,
+    separator: str | None = None,
+    encoding: str | None = None,
+    max_rows: int = 20,
+    max_values: int = 10,
+) -> PreviewResult:
+    """Read just enough of a tabular file to preview it.
+
+    Returns the header, the first *max_rows* rows (``dtype=str`` like
+    :func:`read_tabular_file`), a row count and up to *max_values* distinct
+    values per column from those rows. Text files are parsed with ``nrows``
+    and XLSX sheets are streamed, so the cost does not grow with the file;
+    the row count is then an estimate (``row_count_exact`` is False). SAV
+    files stop after *max_rows* and report the exact count from their
+    metadata. XLS and R files have no partial reader and are read fully.
+
+    Raises the same ``ValueError`` / ``RuntimeError`` as
+    :func:`read_tabular_file`.
+    """
+    try:
+        import pandas as pd
+    except Exception as exc:  # pragma: no cover
+        raise RuntimeError(
+            "pandas is required. Ensure dependencies are installed via setup.sh."
+        ) from exc
+
+    path = Path(path)
+    if kind is None:
+        kind = infer_tabular_kind(path) or "csv"
+    max_rows = max(0, int(max_rows))
+
+    if kind == "sav":
+        pyreadstat = _import_optional_module(
+            "pyreadstat", feature_label="SPSS .sav import"
+        )
+        try:
+            # The header alone carries the total row count; ``row_limit=0``
+            # would mean "no limit", hence the metadata-only read.
+            df, meta = pyreadstat.read_sav(str(path), metadataonly=True)
+            if max_rows:
+                df, _meta = pyreadstat.read_sav(str(path), row_limit=max_rows)
+        except Exception as exc:
+            raise ValueError(f"Failed to read SPSS .sav file {path.name}: {exc}") from exc
+
+        number_rows = getattr(meta, "number_rows", None)
+        if isinstance(number_rows, int) and number_rows >= 0:
+            row_count, exact = number_rows, True
+        else:
+            row_count, exact = len(df), False
+        if row_count == 0 or (df is None or len(df.columns) == 0):
+            raise ValueError(f"Input SPSS .sav file is empty: {path.name}")
+        df = _strip_columns(_coerce_values_to_str(df, pd))
+        return PreviewResult(
+            df=df,
+            row_count=row_count,
+            row_count_exact=exact,
+            value_samples=_value_samples(df, max_values),
+            encoding_used="binary/sav",
+            delimiter_used=None,
+        )
+
+    if kind == "xlsx":
+        resolved_sheet: str | int = sheet
+        if isinstance(resolved_sheet, str) and resolved_sheet.isdigit():
+            resolved_sheet = int(resolved_sheet)
+        # Read at least one data row so emptiness never depends on the
+        # sheet dimension, which some writers leave out or get wrong.
+        probe_rows = max(max_rows, 1)
+        try:
+            df = pd.read_excel(
+                path, sheet_name=resolved_sheet, dtype=str, nrows=probe_rows
+            )
+        except Exception as exc:
+            raise ValueError(f"Failed to read Excel file {path.name}: {exc}") from exc
+
+        if df is None or df.empty:
+            # Leading blank rows can hide data from a bounded read; an empty
+            # sheet is small, so settle it with a full read.
+            return _preview_from_full_read(
+                path, kind, sheet=sheet, max_rows=max_rows, max_values=max_values
+            )
+
+        row_count, exact = len(df), len(df) < probe_rows
+        if not exact:
+            try:
+                openpyxl = importlib.import_module("openpyxl")
+                workbook = openpyxl.load_workbook(path, read_only=True)
+                try:
+                    worksheet = (
+                        workbook.worksheets[resolved_sheet]
+                        if isinstance(resolved_sheet, int)
+                        else workbook[resolved_sheet]
+                    )
+                    if worksheet.max_row:
+                        row_count = max(row_count, worksheet.max_row - 1)
+                finally:
+                    workbook.close()
+            except Exception:
+                pass
+        df = df.head(max_rows)
+        df = _strip_columns(df)
+        return PreviewResult(
+            df=df,
+            row_count=row_count,
+            row_count_exact=exact,
+            value_samples=_value_samples(df, max_values),
+            encoding_used="binary/xlsx",
+            delimiter_used=None,
+        )
+
+    if kind in ("xls", "rds", "rdata"):
+        return _preview_from_full_read(
+            path, kind, sheet=sheet, max_rows=max_rows, max_values=max_values
+        )
+
+    df, row_count, exact, enc_used, sep, warnings = _preview_text_file(
+        path,
+        kind,
+        pd=pd,
+        max_rows=max_rows,
+        separator=separator,
+        encoding=encoding,
+    )
+    if row_count == 0:
+        raise ValueError(f"Input {kind.upper()} file is empty: {path.name}")
+    df = _strip_columns(df)
+    return PreviewResult(
+        df=df,
+        row_count=row_count,
+        row_count_exact=exact,
+        value_samples=_value_samples(df, max_values),
+        encoding_used=enc_used,
+        delimiter_used=sep,
+        warnings=warnings,
+    )
+
+
+def open_tabular_chunks(
+    path: str | Path,
+    kind: str | None = None,
+    *,
+    chunk_rows: int = 5000,
+    separator: str | None = None,
+    encoding: str | None = None,
+) -> TabularChunks:
+    """Prepare a CSV / TSV file for reading in blocks of *chunk_rows* rows.
+
+    Encoding and delimiter are detected once, the same way as
+    :func:`preview_tabular_file`, from a bounded sample. Only text formats
+    can be read incrementally; other kinds raise ``ValueError``.
+    """
+    try:
+        import pandas as pd
+    except Exception as exc:  # pragma: no cover
+        raise RuntimeError(
+            "pandas is required. Ensure dependencies are installed via setup.sh."
+        ) from exc
+
+    path = Path(path)
+    if kind is None:
+        kind = infer_tabular_kind(path) or "csv"
+    if kind not in ("csv", "tsv"):
+        raise ValueError(
+            f"Chunked reading supports .csv and .tsv files, not .{kind}: {path.name}"
+        )
+    chunk_rows = int(chunk_rows)
+    if chunk_rows < 1:
+        raise ValueError("chunk_rows must be at least 1")
+
+    df, row_count, _exact, enc_used, sep, warnings = _preview_text_file(
+        path,
+        kind,
+        pd=pd,
+        max_rows=1,
+        separator=separator,
+        encoding=encoding,
+    )
+    if row_count == 0:
+        raise ValueError(f"Input {kind.upper()} file is empty: {path.name}")
+    return TabularChunks(
+        path=path,
+        columns=list(_strip_columns(df).columns.astype(str)),
+        chunk_rows=chunk_rows,
+        encoding_used=enc_used,
+        delimiter_used=sep,
+        warnings=warnings,
+    )
@@ -11,7 +11,7 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Any
 
-from src.utils.io import read_json as _read_json
+from src.library_item_index import LibraryItemIndex
 
 _NON_ITEM_TOPLEVEL_KEYS = {
     "Technical",
@@ -93,39 +93,22 @@ class ItemRegistry:
             library_dir: Path to survey library directory
             source_type: "local", "official", or "import"
         """
-        for json_path in sorted(library_dir.glob("survey-*.json")):
-            # Skip participants templates
-            if "participant" in json_path.stem.lower():
+        index = LibraryItemIndex.for_library(library_dir)
+        for template in index.templates(prefixes=("survey-",)):
+            # Skip participants templates and unreadable files
+            if "participant" in template.stem.lower() or template.error is not None:
                 continue
 
-            try:
-                sidecar = _read_json(json_path)
-            except Exception:
-                continue
-
-            template_name = json_path.stem  # e.g., "survey-phq9"
-            task_name = sidecar.get("Study", {}).get(
-                "TaskName"
-            ) or template_name.replace("survey-", "")
+            template_name = template.stem  # e.g., "survey-phq9"
+            task_name = template.task_name or template_name.replace("survey-", "")
 
             # Register each item key
-            for item_id, item_data in sidecar.items():
-                if item_id in _NON_ITEM_TOPLEVEL_KEYS:
-                    continue
-                if not isinstance(item_data, dict):
+            for item in template.top_level:
+                if item.item_id in _NON_ITEM_TOPLEVEL_KEYS or not item.is_dict:
                     continue
 
-                # Extract description for error messages
-                desc = item_data.get("Description", "")
-                if isinstance(desc, dict):
-                    desc = (
-                        desc.get("en")
-                        or desc.get("de")
-                        or next(iter(desc.values()), "")
-                    )
-
                 # Register (but allow local to override official)
-                existing = self._items.get(item_id)
+                existing = self._items.get(item.item_id)
                 if (
                     existing
                     and existing["source_type"] == "official"
@@ -133,12 +116,13 @@ class ItemRegistry:
                 ):
                     # Local override is OK
                     pass
-                elif item_id not in self._items:
-                    self._items[item_id] = {
+                elif item.item_id not in self._items:
+                    self._items[item.item_id] = {
                         "source_template": template_name,
                         "source_task": task_name,
                         "source_type": source_type,
-                        "description": str(desc)[:100],  # Truncate for display
+                        # Truncated for display by the index
+                        "description": item.description,
                     }
 
     def register_item(
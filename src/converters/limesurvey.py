@@ -159,45 +159,121 @@ def _map_field_to_code(fieldname, qid_to_title):
     return qid_to_title.get(qid, fieldname)
 
 
-def parse_lsa_responses(lsa_path):
-    """Return (dataframe, qid->title mapping, groups_map) extracted from a LimeSurvey .lsa file."""
-    with zipfile.ZipFile(lsa_path, "r") as z:
-        xml_resp = z.read(next(n for n in z.namelist() if n.endswith("_responses.lsr")))
-        xml_lss = z.read(next(n for n in z.namelist() if n.endswith(".lss")))
+# Short answer codes ("A1", "Y", "3") repeat across thousands of responses;
+# interning them lets every cell share one string object.
+_LSA_INTERN_MAX_LENGTH = 32
+
+
+def _read_xml_rows_as_dataframe(
+    stream, *, row_parents=None, fieldnames=None, tag_fn=None
+) -> pd.DataFrame:
+    """Stream the ``<row>`` elements of an XML document into a DataFrame.
+
+    ``row_parents`` restricts matches to rows whose ancestors below the
+    document root have exactly these tags (``("responses", "rows")`` matches
+    ``./responses/rows/row``); ``None`` matches rows at any depth, like
+    ``.//row``. When ``fieldnames`` is a list, the text of every
+    ``<fieldname>`` element is appended to it; ``tag_fn`` maps cell tags to
+    column names.
+
+    Cells go straight into per-column buffers and each row is cleared and
+    detached once read, so peak memory is bounded by the resulting columns
+    rather than the parsed tree. The result matches
+    ``pd.DataFrame(list_of_row_dicts)``: columns appear in first-seen order,
+    a tag repeated within a row keeps its last value, and cells absent from
+    a row become NaN.
+    """
+    row_parents = tuple(row_parents) if row_parents is not None else None
+    nan = float("nan")
+    intern = sys.intern
+    ancestors = []
+    columns: dict[str, list] = {}
+    column_names: dict[str, str] = {}
+    n_rows = 0
+    for event, elem in ET.iterparse(stream, events=("start", "end")):
+        if event == "start":
+            ancestors.append(elem)
+            continue
+        ancestors.pop()
+        if elem.tag != "row":
+            if elem.tag == "fieldname" and fieldnames is not None and ancestors:
+                fieldnames.append(elem.text or "")
+            continue
+        if not ancestors or (
+            row_parents is not None
+            and tuple(el.tag for el in ancestors[1:]) != row_parents
+        ):
+            continue
 
-    lss_root = ET.fromstring(xml_lss)
+        filled = 0
+        for child in elem:
+            name = column_names.get(child.tag)
+            if name is None:
+                name = tag_fn(child.tag) if tag_fn is not None else child.tag
+                column_names[child.tag] = name
+            value = child.text
+            if value and len(value) <= _LSA_INTERN_MAX_LENGTH:
+                value = intern(value)
+            column = columns.get(name)
+            if column is None:
+                column = columns[name] = [nan] * n_rows
+            elif len(column) > n_rows:
+                column[-1] = value
+                continue
+            column.append(value)
+            filled += 1
+        n_rows += 1
+        if filled != len(columns):
+            for column in columns.values():
+                if len(column) < n_rows:
+                    column.append(nan)
 
-    # Helper to find text of a child element
-    def get_text(element, tag):
-        child = element.find(tag)
-        val = child.text if child is not None else ""
-        return val or ""
+        elem.clear()
+        ancestors[-1].remove(elem)
 
-    questions_map, groups_map = _parse_lss_structure(lss_root, get_text)
+    return pd.DataFrame(columns, index=pd.RangeIndex(n_rows))
 
-    # Build simple qid->title map for column renaming
-    qid_to_title = {qid: d["title"] for qid, d in questions_map.items()}
 
-    # Also include subquestions in qid_to_title if needed?
-    # The original code did this:
-    for row in lss_root.findall(".//subquestions/rows/row"):
-        qid = row.find("qid").text
-        title = row.find("title").text
-        qid_to_title[qid] = title
+def parse_lsa_responses(lsa_path):
+    """Return (dataframe, qid->title mapping, groups_map) extracted from a LimeSurvey .lsa file.
 
-    # Parse once; both the fieldname list and the row data come from this tree.
-    resp_root = ET.fromstring(xml_resp)
-    fieldnames = [el.text or "" for el in resp_root.findall(".//fieldname")]
-    rows = resp_root.findall("./responses/rows/row")
-    records = []
-    for row in rows:
-        rec = {}
-        for child in row:
-            tag = child.tag.lstrip("_")
-            rec[tag] = child.text
-        records.append(rec)
+    The responses member is streamed with ``iterparse`` into column buffers,
+    so peak memory is bounded by the resulting DataFrame rather than the
+    XML tree of the whole export.
+    """
+    with zipfile.ZipFile(lsa_path, "r") as z:
+        xml_lss = z.read(next(n for n in z.namelist() if n.endswith(".lss")))
 
-    df = pd.DataFrame(records)
+        lss_root = ET.fromstring(xml_lss)
+
+        # Helper to find text of a child element
+        def get_text(element, tag):
+            child = element.find(tag)
+            val = child.text if child is not None else ""
+            return val or ""
+
+        questions_map, groups_map = _parse_lss_structure(lss_root, get_text)
+
+        # Build simple qid->title map for column renaming
+        qid_to_title = {qid: d["title"] for qid, d in questions_map.items()}
+
+        # Also include subquestions in qid_to_title if needed?
+        # The original code did this:
+        for row in lss_root.findall(".//subquestions/rows/row"):
+            qid = row.find("qid").text
+            title = row.find("title").text
+            qid_to_title[qid] = title
+
+        # One streaming pass yields both the fieldname list and the row data.
+        fieldnames: list[str] = []
+        member = next(n for n in z.namelist() if n.endswith("_responses.lsr"))
+        with z.open(member) as resp_stream:
+            df = _read_xml_rows_as_dataframe(
+                resp_stream,
+                row_parents=("responses", "rows"),
+                fieldnames=fieldnames,
+                tag_fn=lambda tag: tag.lstrip("_"),
+            )
 
     rename_map = {f: _map_field_to_code(f, qid_to_title) for f in fieldnames}
     df = df.rename(columns={k: v for k, v in rename_map.items() if k in df.columns})
@@ -216,29 +292,13 @@ def parse_lsa_timings(lsa_path):
             if not timings_files:
                 return None
 
+            # Tags are like _244841X43550time
             with zf.open(timings_files[0]) as f:
-                xml_content = f.read()
+                df = _read_xml_rows_as_dataframe(f)
 
-        root = ET.fromstring(xml_content)
-        rows = root.findall(".//row")
-        if not rows:
-            return None
-
-        records = []
-        for row in rows:
-            rec = {}
-            for child in row:
-                # Tag is like _244841X43550time
-                tag = child.tag
-                val = child.text
-                rec[tag] = val
-            records.append(rec)
-
-        try:
-            return pd.DataFrame(records)
-        except Exception as e:
-            print(f"Error creating DataFrame in parse_lsa_timings: {e}")
+        if len(df.index) == 0:
             return None
+        return df
     except Exception as e:
         print(f"Warning: Failed to parse timings from {lsa_path}: {e}")
         return None
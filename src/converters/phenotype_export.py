@@ -20,8 +20,10 @@ rather than guessed at.
 
 from __future__ import annotations
 
+import csv
 import json
 import re
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Optional
@@ -38,6 +40,37 @@ _SURVEY_FILENAME_PATTERN = re.compile(
     r"(?:_run-(?P<run>[A-Za-z0-9]+))?_survey\.tsv$"
 )
 
+#: Upper bound for concurrent survey TSV reads while building phenotype tables.
+PHENOTYPE_READ_MAX_WORKERS = 8
+_PHENOTYPE_READ_BATCH = 64
+
+# pandas' default ``na_values``: cells read by ``_read_survey_tsv`` become NaN
+# exactly where ``pd.read_csv(..., dtype=str)`` would turn them into NaN.
+_PANDAS_NA_VALUES = frozenset(
+    {
+        "",
+        "#N/A",
+        "#N/A N/A",
+        "#NA",
+        "-1.#IND",
+        "-1.#QNAN",
+        "-NaN",
+        "-nan",
+        "1.#IND",
+        "1.#QNAN",
+        "<NA>",
+        "N/A",
+        "NA",
+        "NULL",
+        "NaN",
+        "None",
+        "n/a",
+        "nan",
+        "null",
+    }
+)
+
+
 @dataclass
 class PhenotypeExportFile:
     """One phenotype/<name>.tsv + sidecar, ready to be written out."""
@@ -118,6 +151,67 @@ def _group_survey_files(
     return groups, warnings
 
 
+def _read_survey_tsv(path: Path) -> tuple[list[str], list[list[Any]]]:
+    """Return ``(header, rows)`` of a survey TSV as ``pd.read_csv`` would.
+
+    Survey TSVs hold one header and one data row, so starting the pandas
+    parser per file dominates the cost of a large export. Regular files are
+    read with the ``csv`` module instead; anything pandas would reshape
+    (duplicate or blank headers, ragged rows, oversized fields) still goes
+    through ``pd.read_csv``.
+    """
+    try:
+        with open(path, encoding="utf-8-sig", newline="") as handle:
+            records = [
+                record for record in csv.reader(handle, delimiter="\t") if record
+            ]
+    except csv.Error:
+        records = []
+    if records:
+        header, data = records[0], records[1:]
+        if (
+            all(header)
+            and len(set(header)) == len(header)
+            and all(len(record) == len(header) for record in data)
+        ):
+            nan = float("nan")
+            return header, [
+                [nan if value in _PANDAS_NA_VALUES else value for value in record]
+                for record in data
+            ]
+
+    df = pd.read_csv(path, sep="\t", dtype=str)
+    return [str(column) for column in df.columns], [
+        [df.iat[row, col] for col in range(len(df.columns))] for row in range(len(df))
+    ]
+
+
+def _read_survey_tsv_batch(
+    paths: list[Path],
+) -> list[tuple[list[str], list[list[Any]]]]:
+    return [_read_survey_tsv(path) for path in paths]
+
+
+def _read_survey_tsvs(paths: list[Path]) -> list[tuple[list[str], list[list[Any]]]]:
+    """Read many small survey TSVs concurrently, preserving input order.
+
+    Threads overlap the file-system latency (network shares, cold caches);
+    paths are handed out in batches because a future per tiny file costs
+    more than reading it.
+    """
+    workers = min(PHENOTYPE_READ_MAX_WORKERS, len(paths) // _PHENOTYPE_READ_BATCH)
+    if workers < 2:
+        return _read_survey_tsv_batch(paths)
+    batch = -(-len(paths) // (workers * 4))
+    batches = [paths[start : start + batch] for start in range(0, len(paths), batch)]
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return [
+            content
+            for chunk in pool.map(_read_survey_tsv_batch, batches)
+            for content in chunk
+        ]
+
+
 def _load_sidecars(
     dataset_root: Path, task: str, variant: Optional[str]
 ) -> tuple[dict[str, Any], dict[str, Any]]:
@@ -189,7 +283,9 @@ def build_phenotype_sidecar(
     return sidecar
 
 
-def _phenotype_file_name(task: str, variant: Optional[str], has_multiple_variants: bool) -> str:
+def _phenotype_file_name(
+    task: str, variant: Optional[str], has_multiple_variants: bool
+) -> str:
     if variant and has_multiple_variants:
         return f"{task}-{variant}"
     return task
@@ -215,24 +311,26 @@ def collect_phenotype_bridge_files(
     for task, variant in groups:
         variants_per_task.setdefault(task, set()).add(variant)
 
+    all_paths = [path for paths in groups.values() for path in paths]
+    contents = dict(zip(all_paths, _read_survey_tsvs(all_paths)))
+
     results: list[PhenotypeExportFile] = []
     for (task, variant), paths in groups.items():
         rows: list[dict[str, Any]] = []
         has_session = False
-        columns_order: list[str] = []
+        # dict keys act as an insertion-ordered set of column names.
+        columns_order: dict[str, None] = {}
 
         for path in paths:
-            parsed = _parse_survey_filename(path)
-            assert parsed is not None
             subject_dir = path.parent.parent.parent
             session_dir = path.parent.parent
             subject_label = BidsEntityParser.subject_label_from_dir(subject_dir.name)
             session_label = BidsEntityParser.session_label_from_dir(session_dir.name)
 
-            df = pd.read_csv(path, sep="\t", dtype=str)
-            if len(df) != 1:
+            header, data_rows = contents[path]
+            if len(data_rows) != 1:
                 warnings.append(
-                    f"Expected exactly one data row in {path.name}, found {len(df)}; skipped."
+                    f"Expected exactly one data row in {path.name}, found {len(data_rows)}; skipped."
                 )
                 continue
 
@@ -240,21 +338,18 @@ def collect_phenotype_bridge_files(
             if session_label:
                 row["session_id"] = f"ses-{session_label}"
                 has_session = True
-            row.update(df.iloc[0].to_dict())
+            row.update(zip(header, data_rows[0]))
             rows.append(row)
-            for column in row:
-                if column not in columns_order:
-                    columns_order.append(column)
+            columns_order.update(dict.fromkeys(row))
 
         if not rows:
             continue
 
         if not has_session:
-            columns_order = [c for c in columns_order if c != "session_id"]
+            columns_order.pop("session_id", None)
 
-        wide_df = pd.DataFrame(rows)
-        ordered_columns = [c for c in columns_order if c in wide_df.columns]
-        wide_df = wide_df[ordered_columns]
+        ordered_columns = list(columns_order)
+        wide_df = pd.DataFrame(rows, columns=ordered_columns)
 
         _task_sidecar, variant_sidecar = _load_sidecars(dataset_root, task, variant)
         sidecar = build_phenotype_sidecar(
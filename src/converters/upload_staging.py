@@ -0,0 +1,468 @@
+"""
+Content-addressed staging area for uploaded source files.
+
+The survey conversion flow (detect columns → preview → convert → validate)
+receives the same export on every step. Instead of copying each upload into
+a fresh temporary directory and re-parsing it from scratch, uploads are
+stored once under their SHA-256 digest and the parsed DataFrame is cached in
+memory per set of read options:
+
+    <tmp>/prism_upload_staging-<uid>/   # private (0700) to the current user
+        <sha256>/
+            export.csv                  # the staged upload
+
+The staging root must be a directory owned by the current user without any
+group/other permissions; a shared or pre-existing directory that fails this
+check is never used. Parsed frames are kept in process memory only, never
+serialized to disk.
+
+Parsed frames are dropped least recently used first once there are more
+than ``max_cached_frames``, once their deep ``memory_usage`` adds up to more
+than ``max_cached_frame_bytes``, or once they have not been read for
+``frame_ttl_seconds``.
+
+Later steps may refer to a staged upload by its digest (``source_hash``).
+Each workflow that stages an upload (identified by the *workflow* argument)
+holds the entry until it discards it; the files are deleted once the last
+holder has discarded them, so two workflows that staged the same bytes do
+not pull the file out from under each other. Entries left behind by
+abandoned workflows are evicted once they have not been used for
+``ttl_seconds`` and, oldest first, whenever the staging area grows beyond
+``max_bytes``.
+
+Usage::
+
+    from src.converters.upload_staging import get_upload_staging_area
+
+    staged = get_upload_staging_area().stage_upload(upload, filename="export.csv")
+    result = read_staged_tabular_file(staged.path, kind="csv")
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import os
+import re
+import shutil
+import stat
+import tempfile
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from src.converters.file_reader import ReadResult, read_tabular_file
+
+STAGING_DIR_NAME = "prism_upload_staging"
+DEFAULT_TTL_SECONDS = 60 * 60
+DEFAULT_MAX_BYTES = 4 * 1024 * 1024 * 1024
+DEFAULT_MAX_CACHED_FRAMES = 8
+DEFAULT_MAX_CACHED_FRAME_BYTES = 512 * 1024 * 1024
+DEFAULT_FRAME_TTL_SECONDS = 10 * 60
+
+_HASH_CHUNK_SIZE = 1024 * 1024
+_DIGEST_RE = re.compile(r"^[0-9a-f]{64}$")
+
+
+@dataclass(frozen=True)
+class StagedUpload:
+    """A file stored in the staging area under its content digest."""
+
+    digest: str
+    path: Path
+    workflow: str | None = field(default=None, compare=False)
+
+
+@dataclass
+class _CachedFrame:
+    result: ReadResult
+    nbytes: int
+    last_used: float
+
+
+def _frame_nbytes(result: ReadResult) -> int:
+    try:
+        return int(result.df.memory_usage(deep=True).sum())
+    except (AttributeError, TypeError, ValueError):
+        return 0
+
+
+def _hash_file(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as handle:
+        for chunk in iter(lambda: handle.read(_HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _tree_size(path: Path) -> int:
+    total = 0
+    for root, _dirs, files in os.walk(path):
+        for name in files:
+            try:
+                total += os.stat(os.path.join(root, name)).st_size
+            except OSError:
+                continue
+    return total
+
+
+def default_staging_root() -> Path:
+    """Return the per-user staging root under the system temp directory."""
+    name = STAGING_DIR_NAME
+    if hasattr(os, "getuid"):
+        name = f"{name}-{os.getuid()}"
+    return Path(tempfile.gettempdir()) / name
+
+
+def _ensure_private_dir(path: Path) -> Path:
+    """Create *path* as a 0700 directory, or verify an existing one.
+
+    Raises :class:`PermissionError` when *path* is a symlink, not a directory,
+    owned by another user, or grants any group/other permission.
+    """
+    try:
+        path.mkdir(mode=0o700, parents=True)
+    except FileExistsError:
+        pass
+    info = os.lstat(path)
+    if not stat.S_ISDIR(info.st_mode):
+        raise PermissionError(f"Upload staging root is not a directory: {path}")
+    if hasattr(os, "getuid") and (info.st_uid != os.getuid() or info.st_mode & 0o077):
+        raise PermissionError(
+            f"Refusing to use upload staging root {path}: it must be owned by "
+            "the current user and not accessible to group or others"
+        )
+    return path
+
+
+class UploadStagingArea:
+    """Store uploads once by content hash and cache their parsed tables.
+
+    Without an explicit *root*, the per-user :func:`default_staging_root` is
+    used; if that path exists but is not private to the current user, a fresh
+    ``mkdtemp`` directory is used instead.
+    """
+
+    def __init__(
+        self,
+        root: str | Path | None = None,
+        *,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        max_cached_frames: int = DEFAULT_MAX_CACHED_FRAMES,
+        max_cached_frame_bytes: int = DEFAULT_MAX_CACHED_FRAME_BYTES,
+        frame_ttl_seconds: float = DEFAULT_FRAME_TTL_SECONDS,
+    ):
+        if root is None:
+            try:
+                root = _ensure_private_dir(default_staging_root())
+            except PermissionError:
+                root = tempfile.mkdtemp(prefix=f"{STAGING_DIR_NAME}-")
+        self.root = Path(root)
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self.max_cached_frames = max_cached_frames
+        self.max_cached_frame_bytes = max_cached_frame_bytes
+        self.frame_ttl_seconds = frame_ttl_seconds
+        self._lock = threading.RLock()
+        self._frames: OrderedDict[tuple, _CachedFrame] = OrderedDict()
+        self._holders: dict[str, set[str]] = {}
+
+    # ------------------------------------------------------------------
+    # Staging
+    # ------------------------------------------------------------------
+
+    def stage_upload(
+        self, upload: Any, *, filename: str, workflow: str | None = None
+    ) -> StagedUpload:
+        """Stage an upload-like object exposing ``save(destination)``.
+
+        Uploads backed by a local file (``source_path`` attribute) are hashed
+        in place, so re-submitting an already staged file costs one read and
+        no copy. The entry is held for *workflow* until it is discarded.
+        """
+        source_path = getattr(upload, "source_path", None)
+        if source_path is not None:
+            return self.stage_file(
+                Path(source_path), filename=filename, workflow=workflow
+            )
+
+        incoming = _ensure_private_dir(self.root) / f".incoming-{uuid.uuid4().hex}"
+        try:
+            upload.save(str(incoming))
+            digest = _hash_file(incoming)
+            return self._commit(
+                digest, filename, incoming, move=True, workflow=workflow
+            )
+        finally:
+            incoming.unlink(missing_ok=True)
+
+    def stage_file(
+        self,
+        source_path: Path,
+        *,
+        filename: str | None = None,
+        workflow: str | None = None,
+    ) -> StagedUpload:
+        """Stage a local file, copying it only if its content is not staged yet."""
+        source_path = Path(source_path)
+        _ensure_private_dir(self.root)
+        digest = _hash_file(source_path)
+        return self._commit(
+            digest,
+            filename or source_path.name,
+            source_path,
+            move=False,
+            workflow=workflow,
+        )
+
+    def _commit(
+        self,
+        digest: str,
+        filename: str,
+        source: Path,
+        *,
+        move: bool,
+        workflow: str | None,
+    ) -> StagedUpload:
+        """Place *source* in the entry for *digest*, moving it when *move*."""
+        filename = Path(filename).name or "upload"
+        with self._lock:
+            entry_dir = self.root / digest
+            target = entry_dir / filename
+            if not target.is_file():
+                entry_dir.mkdir(parents=True, exist_ok=True)
+                existing = self._staged_file(entry_dir)
+                partial = entry_dir / f".partial-{uuid.uuid4().hex}"
+                if existing is not None:
+                    # Same bytes under another name: keep one copy on disk.
+                    try:
+                        os.link(existing, partial)
+                    except OSError:
+                        shutil.copyfile(existing, partial)
+                elif move:
+                    os.replace(source, partial)
+                else:
+                    shutil.copyfile(source, partial)
+                os.replace(partial, target)
+            self._holders.setdefault(digest, set()).add(workflow or "")
+            self._touch(entry_dir)
+            self.evict(keep=digest)
+        return StagedUpload(digest=digest, path=target, workflow=workflow)
+
+    # ------------------------------------------------------------------
+    # Lookup
+    # ------------------------------------------------------------------
+
+    def resolve(self, digest: str) -> StagedUpload | None:
+        """Return the staged upload for *digest*, or None when unknown/evicted."""
+        digest = str(digest or "").strip().lower()
+        if not _DIGEST_RE.match(digest):
+            return None
+        entry_dir = self.root / digest
+        staged_file = self._staged_file(entry_dir)
+        if staged_file is None:
+            return None
+        self._touch(entry_dir)
+        return StagedUpload(digest=digest, path=staged_file)
+
+    def discard(self, digest: str, *, workflow: str | None = None) -> bool:
+        """Release *workflow*'s hold on a staged upload once it is done.
+
+        The upload and its cached parses are deleted when no other workflow
+        still holds it; otherwise they are kept for those workflows (and
+        expire as usual). Returns True when the entry was deleted.
+        """
+        digest = str(digest or "").strip().lower()
+        if not _DIGEST_RE.match(digest):
+            return False
+        with self._lock:
+            holders = self._holders.get(digest, set())
+            holders.discard(workflow or "")
+            if holders:
+                return False
+            self._holders.pop(digest, None)
+            self._forget_frames(digest)
+            shutil.rmtree(self.root / digest, ignore_errors=True)
+        return True
+
+    def digest_for_path(self, path: str | Path) -> str | None:
+        """Return the digest when *path* is a file inside this staging area."""
+        try:
+            resolved = Path(path).resolve()
+            root = self.root.resolve()
+        except OSError:
+            return None
+        parent = resolved.parent
+        if parent.parent != root or not _DIGEST_RE.match(parent.name):
+            return None
+        return parent.name
+
+    @staticmethod
+    def _staged_file(entry_dir: Path) -> Path | None:
+        try:
+            candidates = sorted(
+                child
+                for child in entry_dir.iterdir()
+                if child.is_file() and not child.name.startswith(".")
+            )
+        except OSError:
+            return None
+        return candidates[0] if candidates else None
+
+    @staticmethod
+    def _touch(entry_dir: Path) -> None:
+        try:
+            os.utime(entry_dir)
+        except OSError:
+            pass
+
+    # ------------------------------------------------------------------
+    # Parsed-table cache
+    # ------------------------------------------------------------------
+
+    def read_tabular(
+        self,
+        path: str | Path,
+        kind: str | None = None,
+        *,
+        sheet: str | int = 0,
+        separator: str | None = None,
+        encoding: str | None = None,
+    ) -> ReadResult:
+        """Read a staged table, parsing it only once per set of read options.
+
+        Every call returns a copy of the cached :class:`ReadResult`, so callers
+        may mutate the DataFrame without affecting later reads. Paths outside
+        the staging area are read directly.
+        """
+        digest = self.digest_for_path(path)
+        if digest is None:
+            return read_tabular_file(
+                path, kind, sheet=sheet, separator=separator, encoding=encoding
+            )
+
+        key = (digest, kind, str(sheet), separator, encoding)
+        now = time.time()
+        with self._lock:
+            self._prune_frames(now)
+            entry = self._frames.get(key)
+            if entry is not None:
+                entry.last_used = now
+                self._frames.move_to_end(key)
+        if entry is None:
+            result = read_tabular_file(
+                path, kind, sheet=sheet, separator=separator, encoding=encoding
+            )
+            entry = _CachedFrame(result, _frame_nbytes(result), now)
+            # A table larger than the whole budget is returned but not kept.
+            if entry.nbytes <= self.max_cached_frame_bytes:
+                with self._lock:
+                    self._frames[key] = entry
+                    self._prune_frames(now)
+        self._touch(self.root / digest)
+        cached = entry.result
+        return dataclasses.replace(
+            cached, df=cached.df.copy(), warnings=list(cached.warnings)
+        )
+
+    def _prune_frames(self, now: float) -> None:
+        """Drop stale frames, then the least recently used beyond the limits."""
+        with self._lock:
+            for key in [
+                key
+                for key, entry in self._frames.items()
+                if now - entry.last_used > self.frame_ttl_seconds
+            ]:
+                del self._frames[key]
+            total = sum(entry.nbytes for entry in self._frames.values())
+            while self._frames and (
+                len(self._frames) > self.max_cached_frames
+                or total > self.max_cached_frame_bytes
+            ):
+                _key, entry = self._frames.popitem(last=False)
+                total -= entry.nbytes
+
+    def _forget_frames(self, digest: str) -> None:
+        with self._lock:
+            for key in [key for key in self._frames if key[0] == digest]:
+                del self._frames[key]
+
+    # ------------------------------------------------------------------
+    # Eviction
+    # ------------------------------------------------------------------
+
+    def evict(self, *, keep: str | None = None, now: float | None = None) -> list[str]:
+        """Drop expired entries, then the least recently used beyond ``max_bytes``.
+
+        Returns the evicted digests. The entry named by *keep* is never evicted.
+        """
+        now = time.time() if now is None else now
+        evicted: list[str] = []
+        with self._lock:
+            try:
+                entries = [
+                    child
+                    for child in self.root.iterdir()
+                    if child.is_dir() and _DIGEST_RE.match(child.name)
+                ]
+            except OSError:
+                return evicted
+
+            live: list[tuple[float, int, Path]] = []
+            for entry_dir in entries:
+                try:
+                    last_used = entry_dir.stat().st_mtime
+                except OSError:
+                    continue
+                if entry_dir.name != keep and now - last_used > self.ttl_seconds:
+                    self._holders.pop(entry_dir.name, None)
+                    self._forget_frames(entry_dir.name)
+                    shutil.rmtree(entry_dir, ignore_errors=True)
+                    evicted.append(entry_dir.name)
+                    continue
+                live.append((last_used, _tree_size(entry_dir), entry_dir))
+
+            total = sum(size for _last_used, size, _entry in live)
+            for _last_used, size, entry_dir in sorted(live, key=lambda item: item[0]):
+                if total <= self.max_bytes:
+                    break
+                if entry_dir.name == keep:
+                    continue
+                self._holders.pop(entry_dir.name, None)
+                self._forget_frames(entry_dir.name)
+                shutil.rmtree(entry_dir, ignore_errors=True)
+                evicted.append(entry_dir.name)
+                total -= size
+        return evicted
+
+
+_default_area: UploadStagingArea | None = None
+_default_area_lock = threading.Lock()
+
+
+def get_upload_staging_area() -> UploadStagingArea:
+    """Return the process-wide staging area under the per-user staging root."""
+    global _default_area
+    with _default_area_lock:
+        if _default_area is None:
+            _default_area = UploadStagingArea()
+        return _default_area
+
+
+def read_staged_tabular_file(
+    path: str | Path,
+    kind: str | None = None,
+    *,
+    sheet: str | int = 0,
+    separator: str | None = None,
+    encoding: str | None = None,
+) -> ReadResult:
+    """Drop-in for :func:`read_tabular_file` that reuses staged parses."""
+    return get_upload_staging_area().read_tabular(
+        path, kind, sheet=sheet, separator=separator, encoding=encoding
+    )
@@ -6,20 +6,20 @@ and future converter pre-processing workflows.
 
 from __future__ import annotations
 
+import os
 import re
+import tempfile
+from collections.abc import Iterable
+from pathlib import Path
 from typing import Any
 
 from src.participants_id_selection import resolve_participants_id_selection
 
-_PREFIX_PATTERNS: tuple[re.Pattern[str], ...] = (
-    re.compile(r"^(?P<prefix>T\d+)[_-].+", re.IGNORECASE),
-    re.compile(r"^(?P<prefix>tp\d+)[_-].+", re.IGNORECASE),
-    re.compile(r"^(?P<prefix>wave\d+)[_-].+", re.IGNORECASE),
-    re.compile(r"^(?P<prefix>ses-[A-Za-z0-9]+)[_-].+", re.IGNORECASE),
-    re.compile(r"^(?P<prefix>pre)[_-].+", re.IGNORECASE),
-    re.compile(r"^(?P<prefix>post)[_-].+", re.IGNORECASE),
-    re.compile(r"^(?P<prefix>baseline)[_-].+", re.IGNORECASE),
-    re.compile(r"^(?P<prefix>fu\d+)[_-].+", re.IGNORECASE),
+# Session prefixes like T1_, tp2-, wave3_, ses-a_, pre_, baseline-, fu1_. The
+# alternatives are mutually exclusive, so one regex pass per column suffices.
+_PREFIX_PATTERN: re.Pattern[str] = re.compile(
+    r"^(?P<prefix>T\d+|tp\d+|wave\d+|ses-[A-Za-z0-9]+|pre|post|baseline|fu\d+)[_-].+",
+    re.IGNORECASE,
 )
 
 _SUFFIX_PATTERN: re.Pattern[str] = re.compile(
@@ -40,15 +40,13 @@ def detect_wide_session_prefixes(columns: list[str], min_count: int = 3) -> list
     case_map: dict[str, str] = {}
 
     for col in columns:
-        for pattern in _PREFIX_PATTERNS:
-            match = pattern.match(str(col))
-            if not match:
-                continue
-            prefix = match.group("prefix")
-            key = prefix.upper()
-            counts[key] += 1
-            case_map.setdefault(key, prefix)
-            break
+        match = _PREFIX_PATTERN.match(str(col))
+        if not match:
+            continue
+        prefix = match.group("prefix")
+        key = prefix.upper()
+        counts[key] += 1
+        case_map.setdefault(key, prefix)
 
     detected_prefixes = [
         case_map[key] for key, count in counts.items() if count >= min_count
@@ -87,6 +85,10 @@ def _find_indicator_spans(column_name: str, indicator: str) -> list[tuple[int, i
     indicator_text = str(indicator)
     if not indicator_text:
         return []
+    # Most (column, indicator) pairs do not match at all; a plain substring
+    # test rules them out without a regex scan.
+    if indicator_text.lower() not in column_text.lower():
+        return []
 
     spans: list[tuple[int, int]] = []
     for match in re.finditer(re.escape(indicator_text), column_text, re.IGNORECASE):
@@ -307,17 +309,19 @@ def summarize_non_unique_id_values(
     }
 
 
-def resolve_wide_to_long_id_uniqueness(
-    df: Any,
+def resolve_wide_to_long_id_column(
+    columns: list[str],
     *,
     source_format: str,
     explicit_id_column: str | None = None,
-    max_examples: int = 5,
-) -> dict[str, Any]:
-    """Resolve the wide-table ID column and enforce non-empty ID uniqueness."""
-    columns = [str(column) for column in df.columns]
+) -> tuple[str, dict[str, Any]]:
+    """Resolve the wide-table ID column from the header alone.
+
+    Returns ``(id_column, resolution)``; raises ``ValueError`` when the user
+    still has to pick the ID column.
+    """
     resolution = resolve_participants_id_selection(
-        columns,
+        [str(column) for column in columns],
         source_format,
         explicit_id_column=explicit_id_column,
     )
@@ -335,7 +339,20 @@ def resolve_wide_to_long_id_uniqueness(
         raise ValueError(
             "Could not resolve an ID column for wide-to-long uniqueness checks."
         )
+    return id_column, resolution
+
+
+def check_wide_to_long_id_values(
+    df: Any,
+    *,
+    id_column: str,
+    max_examples: int = 5,
+) -> dict[str, Any]:
+    """Summarize *id_column* in *df* and raise ``ValueError`` on duplicates.
 
+    *df* only needs the ID column, so streaming callers can pass a frame
+    read with just that column.
+    """
     summary = summarize_non_unique_id_values(
         df,
         id_column=id_column,
@@ -358,6 +375,27 @@ def resolve_wide_to_long_id_uniqueness(
             f"{example_text} "
             "Ensure each ID appears only once in the wide table before conversion."
         )
+    return summary
+
+
+def resolve_wide_to_long_id_uniqueness(
+    df: Any,
+    *,
+    source_format: str,
+    explicit_id_column: str | None = None,
+    max_examples: int = 5,
+) -> dict[str, Any]:
+    """Resolve the wide-table ID column and enforce non-empty ID uniqueness."""
+    id_column, resolution = resolve_wide_to_long_id_column(
+        [str(column) for column in df.columns],
+        source_format=source_format,
+        explicit_id_column=explicit_id_column,
+    )
+    summary = check_wide_to_long_id_values(
+        df,
+        id_column=id_column,
+        max_examples=max_examples,
+    )
 
     return {
         "id_column": id_column,
@@ -458,64 +496,81 @@ def convert_wide_to_long_dataframe(
         session_indicators=session_indicators,
         session_prefixes=session_prefixes,
     )
-    indicators = plan["indicators"]
-    indicator_upper_to_cols = plan["indicator_upper_to_cols"]
-    matched_set = set(plan["rename_map"])
+    _raise_for_unusable_plan(plan, kind="session")
+
+    long_df = _apply_indicator_pass(
+        df,
+        plan=plan,
+        meta_cols=[],
+        value_column_name=session_column_name,
+        value_map=session_value_map,
+        kind="session",
+    )
+
+    if run_indicators:
+        long_df = _apply_run_pass(
+            long_df,
+            run_indicators=run_indicators,
+            run_column_name=run_column_name,
+            run_value_map=run_value_map,
+            session_column_name=session_column_name,
+        )
+
+    return long_df
+
+
+def _raise_for_unusable_plan(plan: dict[str, Any], *, kind: str) -> None:
     if plan["ambiguous_columns"]:
         raise ValueError(_format_ambiguous_indicator_error(plan["ambiguous_columns"]))
-    if not matched_set:
+    if not plan["rename_map"]:
         raise ValueError(
-            "No columns found for the selected session indicators: "
-            + ", ".join(indicators)
+            f"No columns found for the selected {kind} indicators: "
+            + ", ".join(plan["indicators"])
         )
 
-    shared_cols = plan["shared_columns"]
 
-    long_frames = []
+def _apply_indicator_pass(
+    df: Any,
+    *,
+    plan: dict[str, Any],
+    meta_cols: list[str],
+    value_column_name: str,
+    value_map: dict[str, str] | None,
+    kind: str,
+) -> Any:
+    """Stack the column groups of *plan* into rows tagged with their indicator."""
+    import pandas as pd
+
+    shared_cols = plan["shared_columns"]
     normalized_value_map = {
         str(key).strip().upper(): str(value).strip()
-        for key, value in (session_value_map or {}).items()
+        for key, value in (value_map or {}).items()
         if str(key).strip() and str(value).strip()
     }
 
-    for indicator in indicators:
+    frames = []
+    for indicator in plan["indicators"]:
         indicator_upper = indicator.upper()
-        matched_cols = indicator_upper_to_cols[indicator_upper]
+        matched_cols = plan["indicator_upper_to_cols"][indicator_upper]
         if not matched_cols:
             continue
 
-        sub = df[shared_cols + matched_cols].copy()
-
+        sub = df[meta_cols + shared_cols + matched_cols].copy()
         rename_map = {col: plan["rename_map"].get(col, col) for col in matched_cols}
-
         sub = sub.rename(columns=rename_map)
         stripped_names = set(rename_map.values())
         duplicate_shared = [col for col in shared_cols if col in stripped_names]
         if duplicate_shared:
             sub = sub.drop(columns=duplicate_shared, errors="ignore")
+        sub[value_column_name] = normalized_value_map.get(indicator_upper, indicator)
+        frames.append(sub)
 
-        sub[session_column_name] = normalized_value_map.get(indicator_upper, indicator)
-        long_frames.append(sub)
-
-    if not long_frames:
+    if not frames:
         raise ValueError(
-            "No data could be converted. Ensure session indicators match your column names."
+            f"No data could be converted. Ensure {kind} indicators match your column names."
         )
 
-    import pandas as pd
-
-    long_df = pd.concat(long_frames, ignore_index=True)
-
-    if run_indicators:
-        long_df = _apply_run_pass(
-            long_df,
-            run_indicators=run_indicators,
-            run_column_name=run_column_name,
-            run_value_map=run_value_map,
-            session_column_name=session_column_name,
-        )
-
-    return long_df
+    return pd.concat(frames, ignore_index=True)
 
 
 def _apply_run_pass(
@@ -525,50 +580,232 @@ def _apply_run_pass(
     run_column_name: str,
     run_value_map: dict[str, str] | None,
     session_column_name: str,
+    plan: dict[str, Any] | None = None,
 ) -> Any:
     """Second-pass: expand run-coded columns in an already-session-long DataFrame."""
-    import pandas as pd
-
     meta_cols = [c for c in df.columns if c == session_column_name]
-    data_cols = [c for c in df.columns if c != session_column_name]
+    if plan is None:
+        data_cols = [c for c in df.columns if c != session_column_name]
+        plan = inspect_wide_to_long_columns(data_cols, session_indicators=run_indicators)
+        _raise_for_unusable_plan(plan, kind="run")
 
-    plan = inspect_wide_to_long_columns(data_cols, session_indicators=run_indicators)
-    if plan["ambiguous_columns"]:
-        raise ValueError(_format_ambiguous_indicator_error(plan["ambiguous_columns"]))
-    matched_set = set(plan["rename_map"])
-    if not matched_set:
-        raise ValueError(
-            "No columns found for the selected run indicators: "
-            + ", ".join(run_indicators)
-        )
+    return _apply_indicator_pass(
+        df,
+        plan=plan,
+        meta_cols=meta_cols,
+        value_column_name=run_column_name,
+        value_map=run_value_map,
+        kind="run",
+    )
 
-    shared_cols = plan["shared_columns"]
-    normalized_value_map = {
-        str(k).strip().upper(): str(v).strip()
-        for k, v in (run_value_map or {}).items()
-        if str(k).strip() and str(v).strip()
+
+def prepare_wide_to_long_plan(
+    columns: list[str],
+    *,
+    session_indicators: list[str] | None = None,
+    session_prefixes: list[str] | None = None,
+    session_column_name: str = "session",
+    session_value_map: dict[str, str] | None = None,
+    run_indicators: list[str] | None = None,
+    run_column_name: str = "run",
+    run_value_map: dict[str, str] | None = None,
+    session_plan: dict[str, Any] | None = None,
+) -> dict[str, Any]:
+    """Resolve the column → (session, run, item) mapping once from a header.
+
+    The result feeds :func:`convert_wide_to_long_chunk` for every row block
+    of a large export, so the per-column indicator matching runs once
+    instead of once per block. ``output_columns`` fixes the long header, and
+    ``rows_per_input_row`` is the number of long rows each wide row becomes.
+    Raises the same ``ValueError`` as :func:`convert_wide_to_long_dataframe`
+    for ambiguous or unmatched indicators. Pass *session_plan* when the
+    header was already inspected with :func:`inspect_wide_to_long_columns`.
+    """
+    header = [str(column) for column in columns]
+    if session_plan is None:
+        session_plan = inspect_wide_to_long_columns(
+            header,
+            session_indicators=session_indicators,
+            session_prefixes=session_prefixes,
+        )
+    _raise_for_unusable_plan(session_plan, kind="session")
+
+    prepared: dict[str, Any] = {
+        "columns": header,
+        "session_plan": session_plan,
+        "session_column_name": session_column_name,
+        "session_value_map": dict(session_value_map or {}),
+        "run_plan": None,
+        "run_column_name": run_column_name,
+        "run_value_map": dict(run_value_map or {}),
     }
 
-    run_frames = []
-    for indicator in plan["indicators"]:
-        indicator_upper = indicator.upper()
-        matched_cols = plan["indicator_upper_to_cols"][indicator_upper]
-        if not matched_cols:
-            continue
+    # Converting an empty frame yields the exact long header (column order
+    # included) that every block will produce.
+    long_header = _apply_indicator_pass(
+        _empty_frame(header),
+        plan=session_plan,
+        meta_cols=[],
+        value_column_name=session_column_name,
+        value_map=session_value_map,
+        kind="session",
+    )
+    rows_per_input_row = sum(
+        1 for cols in session_plan["indicator_upper_to_cols"].values() if cols
+    )
+    if run_indicators:
+        run_plan = inspect_wide_to_long_columns(
+            [c for c in long_header.columns if c != session_column_name],
+            session_indicators=run_indicators,
+        )
+        _raise_for_unusable_plan(run_plan, kind="run")
+        prepared["run_plan"] = run_plan
+        long_header = _apply_run_pass(
+            long_header,
+            run_indicators=run_indicators,
+            run_column_name=run_column_name,
+            run_value_map=run_value_map,
+            session_column_name=session_column_name,
+            plan=run_plan,
+        )
+        rows_per_input_row *= sum(
+            1 for cols in run_plan["indicator_upper_to_cols"].values() if cols
+        )
 
-        sub = df[meta_cols + shared_cols + matched_cols].copy()
-        rename_map = {col: plan["rename_map"].get(col, col) for col in matched_cols}
-        sub = sub.rename(columns=rename_map)
-        stripped_names = set(rename_map.values())
-        duplicate_shared = [col for col in shared_cols if col in stripped_names]
-        if duplicate_shared:
-            sub = sub.drop(columns=duplicate_shared, errors="ignore")
-        sub[run_column_name] = normalized_value_map.get(indicator_upper, indicator)
-        run_frames.append(sub)
+    prepared["output_columns"] = [str(column) for column in long_header.columns]
+    prepared["rows_per_input_row"] = rows_per_input_row
+    return prepared
 
-    if not run_frames:
-        raise ValueError(
-            "No data could be converted. Ensure run indicators match your column names."
+
+def convert_wide_to_long_chunk(df: Any, prepared: dict[str, Any]) -> Any:
+    """Convert one row block with a plan from :func:`prepare_wide_to_long_plan`.
+
+    Produces the same rows as :func:`convert_wide_to_long_dataframe` on that
+    block, with the columns of ``prepared["output_columns"]``.
+    """
+    long_df = _apply_indicator_pass(
+        df,
+        plan=prepared["session_plan"],
+        meta_cols=[],
+        value_column_name=prepared["session_column_name"],
+        value_map=prepared["session_value_map"],
+        kind="session",
+    )
+    run_plan = prepared.get("run_plan")
+    if run_plan is not None:
+        long_df = _apply_run_pass(
+            long_df,
+            run_indicators=run_plan["indicators"],
+            run_column_name=prepared["run_column_name"],
+            run_value_map=prepared["run_value_map"],
+            session_column_name=prepared["session_column_name"],
+            plan=run_plan,
+        )
+    return long_df.reindex(columns=prepared["output_columns"])
+
+
+def stream_wide_to_long(
+    chunks: Iterable[Any],
+    prepared: dict[str, Any],
+    *,
+    id_column: str,
+    output_path: str | Path | None = None,
+    separator: str = ",",
+    drop_empty_rows: bool = False,
+    preview_rows: int = 0,
+) -> dict[str, Any]:
+    """Convert wide row blocks and append them to a CSV/TSV file.
+
+    Each block from *chunks* (e.g. ``open_tabular_chunks(...)``) is checked
+    for participants without session-coded data, optionally filtered, and
+    converted with the *prepared* plan, so memory stays bounded by the block
+    size rather than the long table. Blocks must carry a running row index
+    for ``empty_data_rows`` to report file positions. The output is written
+    to a temporary file next to *output_path* and moved into place once
+    every block succeeded. Without *output_path* the blocks are only
+    scanned (e.g. for inspect-only runs).
+
+    Long rows are grouped per block: within a block all rows of the first
+    session come first, as in :func:`convert_wide_to_long_dataframe`, so the
+    output row order depends on the block size.
+    """
+    data_columns = list(prepared["session_plan"]["rename_map"])
+    preview_rows = max(int(preview_rows or 0), 0)
+    empty_data_rows: list[dict[str, Any]] = []
+    preview_frames: list[Any] = []
+    preview_count = 0
+    rows_in = rows_kept = 0
+
+    target = Path(output_path) if output_path is not None else None
+    temp_path: Path | None = None
+    handle = None
+    if target is not None:
+        target.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_name = tempfile.mkstemp(
+            prefix=f".{target.name}.", suffix=".tmp", dir=str(target.parent)
         )
+        temp_path = Path(temp_name)
+        handle = os.fdopen(fd, "w", encoding="utf-8", newline="")
+
+    try:
+        if handle is not None:
+            _empty_frame(prepared["output_columns"]).to_csv(
+                handle, sep=separator, index=False
+            )
+
+        for chunk in chunks:
+            rows_in += len(chunk)
+            empty_rows = find_empty_data_rows(
+                chunk, id_column=id_column, data_columns=data_columns
+            )
+            empty_data_rows.extend(empty_rows)
+            if drop_empty_rows and empty_rows:
+                chunk = chunk.drop(
+                    index=[row["row_index"] for row in empty_rows], errors="ignore"
+                )
+            rows_kept += len(chunk)
+
+            wants_preview = preview_count < preview_rows
+            if handle is None and not wants_preview:
+                continue
+            long_chunk = convert_wide_to_long_chunk(chunk, prepared)
+            if wants_preview:
+                head = long_chunk.head(preview_rows - preview_count)
+                preview_frames.append(head)
+                preview_count += len(head)
+            if handle is not None:
+                long_chunk.to_csv(handle, sep=separator, index=False, header=False)
+
+        if handle is not None:
+            assert temp_path is not None and target is not None
+            handle.close()
+            handle = None
+            os.replace(temp_path, target)
+            temp_path = None
+    finally:
+        if handle is not None:
+            handle.close()
+        if temp_path is not None:
+            temp_path.unlink(missing_ok=True)
+
+    import pandas as pd
+
+    preview = (
+        pd.concat(preview_frames, ignore_index=True)
+        if preview_frames
+        else _empty_frame(prepared["output_columns"])
+    )
+    return {
+        "rows_in": rows_in,
+        "rows_out": rows_kept * int(prepared["rows_per_input_row"]),
+        "output_columns": list(prepared["output_columns"]),
+        "empty_data_rows": empty_data_rows,
+        "preview": preview,
+        "output_path": target,
+    }
+
+
+def _empty_frame(columns: list[str]) -> Any:
+    import pandas as pd
 
-    return pd.concat(run_frames, ignore_index=True)
+    return pd.DataFrame(columns=columns, dtype=str)
@@ -0,0 +1,340 @@
+"""
+Persistent item index for survey/biometrics template libraries.
+
+``LibraryValidator`` (variable uniqueness, redundant items, draft checks) and
+``ItemRegistry`` (import collision checks) all need the item keys of every
+``survey-*``/``biometrics-*`` template in a library. Instead of each of them
+parsing every JSON file on every call, they share one :class:`LibraryItemIndex`
+per library directory:
+
+* Each template is summarized once into an :class:`IndexedTemplate`: its
+  top-level keys, the keys of a nested ``Questions`` block, and per item the
+  content signature (ignoring ``AliasOf``/``Aliases``), ``AliasOf`` target and
+  a short description.
+* The summaries are stored in ``<library>/.prism/item_index.json`` together
+  with each file's ``(st_mtime_ns, st_size)`` fingerprint. A refresh stats
+  the templates and re-parses only new or changed files; unchanged libraries
+  cost one directory listing.
+* The index is also kept in memory per process, so consecutive template
+  editor saves do not even re-read the index file. Libraries on read-only
+  locations simply keep the in-memory index.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from collections import defaultdict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Iterable
+
+from src.utils.io import read_json as _read_json
+
+INDEX_RELATIVE_PATH = Path(".prism") / "item_index.json"
+TEMPLATE_PREFIXES = ("survey-", "biometrics-")
+_INDEX_VERSION = 1
+_DESCRIPTION_LIMIT = 100
+
+
+@dataclass(frozen=True)
+class IndexedItem:
+    """Summary of one key in a template (an item or a metadata block)."""
+
+    item_id: str
+    is_dict: bool
+    signature: str | None = None
+    has_alias_of: bool = False
+    alias_of: Any = None
+    description: str = ""
+
+
+@dataclass(frozen=True)
+class IndexedTemplate:
+    """Summary of one library template file."""
+
+    name: str
+    fingerprint: tuple[int, int]
+    task_name: str | None = None
+    top_level: tuple[IndexedItem, ...] = ()
+    questions: tuple[IndexedItem, ...] | None = None
+    error: str | None = None
+
+    @property
+    def stem(self) -> str:
+        return self.name[: -len(".json")] if self.name.endswith(".json") else self.name
+
+    def items(self, ignore_keys: Iterable[str] = ()) -> tuple[IndexedItem, ...]:
+        """Items of a nested ``Questions`` block, else top-level keys not ignored."""
+        if self.questions is not None:
+            return self.questions
+        ignored = set(ignore_keys)
+        return tuple(item for item in self.top_level if item.item_id not in ignored)
+
+    def signature_groups(
+        self, ignore_keys: Iterable[str] = ()
+    ) -> dict[str, list[IndexedItem]]:
+        """Map content signature -> items sharing it, in template order."""
+        groups: dict[str, list[IndexedItem]] = defaultdict(list)
+        for item in self.items(ignore_keys):
+            if item.signature is not None:
+                groups[item.signature].append(item)
+        return groups
+
+
+def item_signature(item_def: dict) -> str:
+    """Digest of an item's content, ignoring ``AliasOf`` and ``Aliases``."""
+    normalized = {
+        k: item_def[k] for k in sorted(item_def) if k not in ("AliasOf", "Aliases")
+    }
+    payload = json.dumps(normalized, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha1(payload.encode("utf-8"), usedforsecurity=False).hexdigest()
+
+
+def _item_description(item_def: dict) -> str:
+    desc = item_def.get("Description", "")
+    if isinstance(desc, dict):
+        desc = desc.get("en") or desc.get("de") or next(iter(desc.values()), "")
+    return str(desc)[:_DESCRIPTION_LIMIT]
+
+
+def _summarize_items(mapping: dict) -> tuple[IndexedItem, ...]:
+    items = []
+    for item_id, item_def in mapping.items():
+        if isinstance(item_def, dict):
+            items.append(
+                IndexedItem(
+                    item_id=str(item_id),
+                    is_dict=True,
+                    signature=item_signature(item_def),
+                    has_alias_of="AliasOf" in item_def,
+                    alias_of=item_def.get("AliasOf"),
+                    description=_item_description(item_def),
+                )
+            )
+        else:
+            items.append(IndexedItem(item_id=str(item_id), is_dict=False))
+    return tuple(items)
+
+
+def summarize_template(
+    name: str, data: Any, fingerprint: tuple[int, int] = (0, 0)
+) -> IndexedTemplate:
+    """Build the index entry for one parsed template."""
+    fingerprint = (int(fingerprint[0]), int(fingerprint[1]))
+    if not isinstance(data, dict):
+        return IndexedTemplate(
+            name=name, fingerprint=fingerprint, error="template is not a JSON object"
+        )
+    study = data.get("Study")
+    task_name = study.get("TaskName") if isinstance(study, dict) else None
+    questions = data.get("Questions")
+    return IndexedTemplate(
+        name=name,
+        fingerprint=fingerprint,
+        task_name=str(task_name) if task_name else None,
+        top_level=_summarize_items(data),
+        questions=_summarize_items(questions) if isinstance(questions, dict) else None,
+    )
+
+
+def _item_to_json(item: IndexedItem) -> list:
+    if not item.is_dict:
+        return [item.item_id]
+    return [
+        item.item_id,
+        item.signature,
+        item.description,
+        [item.alias_of] if item.has_alias_of else [],
+    ]
+
+
+def _item_from_json(raw: list) -> IndexedItem:
+    if len(raw) == 1:
+        return IndexedItem(item_id=raw[0], is_dict=False)
+    item_id, signature, description, alias = raw
+    return IndexedItem(
+        item_id=item_id,
+        is_dict=True,
+        signature=signature,
+        has_alias_of=bool(alias),
+        alias_of=alias[0] if alias else None,
+        description=description,
+    )
+
+
+def _template_to_json(entry: IndexedTemplate) -> dict:
+    payload: dict[str, Any] = {"fingerprint": list(entry.fingerprint)}
+    if entry.error is not None:
+        payload["error"] = entry.error
+        return payload
+    payload["task_name"] = entry.task_name
+    payload["top_level"] = [_item_to_json(item) for item in entry.top_level]
+    if entry.questions is not None:
+        payload["questions"] = [_item_to_json(item) for item in entry.questions]
+    return payload
+
+
+def _template_from_json(name: str, payload: dict) -> IndexedTemplate:
+    questions = payload.get("questions")
+    return IndexedTemplate(
+        name=name,
+        fingerprint=tuple(payload["fingerprint"]),
+        task_name=payload.get("task_name"),
+        top_level=tuple(_item_from_json(raw) for raw in payload.get("top_level", [])),
+        questions=(
+            tuple(_item_from_json(raw) for raw in questions)
+            if questions is not None
+            else None
+        ),
+        error=payload.get("error"),
+    )
+
+
+class LibraryItemIndex:
+    """Incrementally maintained item index of one library directory.
+
+    Use :meth:`for_library` to get the shared, refreshed instance; entries are
+    immutable and may be handed to any number of callers.
+    """
+
+    def __init__(self, library_dir: str | Path) -> None:
+        self.library_dir = Path(library_dir)
+        self.index_path = self.library_dir / INDEX_RELATIVE_PATH
+        self._lock = threading.Lock()
+        self._entries: dict[str, IndexedTemplate] | None = None
+
+    @classmethod
+    def for_library(cls, library_dir: str | Path) -> LibraryItemIndex:
+        """Return the process-wide index for ``library_dir``, refreshed."""
+        key = Path(library_dir).resolve()
+        with _INDEXES_LOCK:
+            index = _INDEXES.get(key)
+            if index is None:
+                index = _INDEXES[key] = cls(key)
+        index.refresh()
+        return index
+
+    def _load_persisted(self) -> dict[str, IndexedTemplate]:
+        try:
+            payload = json.loads(self.index_path.read_text(encoding="utf-8"))
+            if payload.get("version") != _INDEX_VERSION:
+                return {}
+            return {
+                name: _template_from_json(name, raw)
+                for name, raw in payload.get("files", {}).items()
+            }
+        except Exception:
+            return {}
+
+    def _persist(self, entries: dict[str, IndexedTemplate]) -> None:
+        payload = {
+            "version": _INDEX_VERSION,
+            "files": {
+                name: _template_to_json(entries[name]) for name in sorted(entries)
+            },
+        }
+        try:
+            self.index_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(
+                dir=self.index_path.parent, prefix=".item_index.", suffix=".tmp"
+            )
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                    json.dump(
+                        payload, handle, ensure_ascii=False, separators=(",", ":")
+                    )
+                os.replace(tmp_name, self.index_path)
+            except BaseException:
+                try:
+                    os.unlink(tmp_name)
+                except OSError:
+                    pass
+                raise
+        except OSError:
+            # Read-only library (e.g. a bundled official library): keep the
+            # in-memory index only.
+            pass
+
+    def refresh(self) -> bool:
+        """Re-index new or changed templates; return True if anything changed."""
+        with self._lock:
+            previous = self._entries
+            if previous is None:
+                previous = self._load_persisted()
+                # Force one write when the persisted index was missing/stale.
+                changed = not previous
+            else:
+                changed = False
+
+            entries: dict[str, IndexedTemplate] = {}
+            try:
+                paths = sorted(self.library_dir.glob("*.json"))
+            except OSError:
+                paths = []
+            for path in paths:
+                if not path.name.startswith(TEMPLATE_PREFIXES):
+                    continue
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+                fingerprint = (stat.st_mtime_ns, stat.st_size)
+                entry = previous.get(path.name)
+                if entry is None or entry.fingerprint != fingerprint:
+                    try:
+                        data = _read_json(path)
+                    except Exception as exc:
+                        entry = IndexedTemplate(
+                            name=path.name, fingerprint=fingerprint, error=str(exc)
+                        )
+                    else:
+                        entry = summarize_template(path.name, data, fingerprint)
+                    changed = True
+                entries[path.name] = entry
+
+            if set(entries) != set(previous):
+                changed = True
+            self._entries = entries
+            if changed and entries:
+                self._persist(entries)
+            return changed
+
+    def templates(
+        self,
+        prefixes: Iterable[str] = TEMPLATE_PREFIXES,
+        exclude_file: str | None = None,
+    ) -> list[IndexedTemplate]:
+        """Indexed templates whose name starts with one of ``prefixes``, by name."""
+        prefixes = tuple(prefixes)
+        with self._lock:
+            entries = self._entries or {}
+            return [
+                entries[name]
+                for name in sorted(entries)
+                if name.startswith(prefixes) and name != exclude_file
+            ]
+
+    def variable_map(
+        self, ignore_keys: Iterable[str] = (), exclude_file: str | None = None
+    ) -> dict[str, list[str]]:
+        """Map variable -> template file names defining it."""
+        var_map: dict[str, list[str]] = defaultdict(list)
+        for entry in self.templates(exclude_file=exclude_file):
+            if entry.error is None:
+                for item in entry.items(ignore_keys):
+                    var_map[item.item_id].append(entry.name)
+        return var_map
+
+
+_INDEXES: dict[Path, LibraryItemIndex] = {}
+_INDEXES_LOCK = threading.Lock()
+
+
+def clear_library_item_indexes() -> None:
+    """Drop the in-memory indexes (persisted index files are kept)."""
+    with _INDEXES_LOCK:
+        _INDEXES.clear()
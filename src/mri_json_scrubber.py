@@ -15,21 +15,22 @@ Defacing detection for anatomical (T1w/T2w/FLAIR…) NIfTI files checks whether
 a *_T1w.json sidecar (or equivalent) lives next to a NIfTI whose filename
 suggests it has already been defaced (common suffixes: _defaced, _desc-defaced).
 Because actual pixel-level analysis is out-of-scope (and slow), we only do a
-*filename heuristic* plus an optional NIfTI header check via nibabel when
-available.
+*filename heuristic* plus a header-only NIfTI check (see src/nifti_header.py).
 """
 
 from __future__ import annotations
 
 import json
 import logging
+import os
 import re
 import shutil
 import subprocess
 import sys
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
 from src.datalad_execution import (
     DATALAD_DOCS_URL,
@@ -40,6 +41,7 @@ from src.datalad_execution import (
     run_datalad_get_paths,
     run_datalad_run,
 )
+from src.nifti_header import read_nifti_header
 from src.project_export_helpers import (
     extract_terminal_suffix_label as _extract_terminal_suffix_label,
 )
@@ -432,7 +434,7 @@ def is_mri_json_sidecar(path: Path) -> bool:
 
 
 # ---------------------------------------------------------------------------
-# Defacing detection (filename heuristic + optional nibabel header check)
+# Defacing detection (filename heuristic + NIfTI header check)
 # ---------------------------------------------------------------------------
 
 _DEFACED_FILENAME_RE = re.compile(
@@ -545,35 +547,24 @@ def _has_defaced_filename(nifti_path: Path) -> bool:
 
 def _nibabel_defacing_heuristic(nifti_path: Path) -> Optional[bool]:
     """
-    Use nibabel to check whether the NIfTI header suggests defacing.
+    Check whether the NIfTI header suggests defacing.
 
-    This is a *very coarse* heuristic: defaced images typically have a
-    high proportion of zero-valued voxels in the frontal region.  We check
-    whether the 'descrip' field in the header contains the word 'defaced'
-    or 'skull' as set by tools like pydeface / fsl_deface.
+    This is a *very coarse* heuristic: we check whether the 'descrip' field
+    in the header contains the word 'defaced' or 'skull' as set by tools
+    like pydeface / fsl_deface.  Only the header block is read (see
+    ``src.nifti_header``), so nibabel is no longer required; the name is
+    kept for existing callers.
 
     Returns:
         True   — header carries a defacing marker
         False  — header present but no marker found
-        None   — nibabel not available or file unreadable
+        None   — file missing, unreadable or not a NIfTI-1/NIfTI-2 image
     """
-    try:
-        import nibabel as nib  # type: ignore
-
-        img = nib.load(str(nifti_path))
-        descrip = ""
-        try:
-            descrip_bytes = img.header["descrip"]  # type: ignore[index]
-            if isinstance(descrip_bytes, (bytes, bytearray)):
-                descrip = descrip_bytes.decode("utf-8", errors="ignore")
-            else:
-                descrip = str(descrip_bytes)
-        except Exception:
-            pass
-        lower_desc = descrip.lower()
-        return "deface" in lower_desc or "skull" in lower_desc or "brain" in lower_desc
-    except Exception:
+    header = read_nifti_header(nifti_path)
+    if header is None:
         return None
+    lower_desc = header.descrip.lower()
+    return "deface" in lower_desc or "skull" in lower_desc or "brain" in lower_desc
 
 
 def _json_metadata_defacing_heuristic(json_sidecar: Path) -> Optional[bool]:
@@ -601,9 +592,15 @@ def _json_metadata_defacing_heuristic(json_sidecar: Path) -> Optional[bool]:
     return None
 
 
-def _has_defacing_sidecar_artifact(nifti_path: Path) -> bool:
-    """Return True when nearby files indicate defacing artifacts or outputs."""
-    parent = nifti_path.parent
+def _has_defacing_sidecar_artifact(
+    nifti_path: Path,
+    sibling_names: Optional[Iterable[str]] = None,
+) -> bool:
+    """Return True when nearby files indicate defacing artifacts or outputs.
+
+    *sibling_names* may carry a pre-computed listing of the NIfTI's parent
+    folder so batch callers list each directory only once.
+    """
     name_lower = nifti_path.name.lower()
     base_name = name_lower
     if base_name.endswith(".nii.gz"):
@@ -611,10 +608,13 @@ def _has_defacing_sidecar_artifact(nifti_path: Path) -> bool:
     elif base_name.endswith(".nii"):
         base_name = base_name[: -len(".nii")]
 
+    if sibling_names is None:
+        sibling_names = [sibling.name for sibling in nifti_path.parent.iterdir()]
+
     # Keep matching narrow to avoid unrelated derivatives in the same folder.
     subject_prefix = base_name.rsplit("_", 1)[0] if "_" in base_name else base_name
-    for sibling in parent.iterdir():
-        sibling_name = sibling.name.lower()
+    for sibling_name in sibling_names:
+        sibling_name = sibling_name.lower()
         if subject_prefix and not sibling_name.startswith(subject_prefix):
             continue
         if "deface" in sibling_name or "skullstrip" in sibling_name:
@@ -622,6 +622,49 @@ def _has_defacing_sidecar_artifact(nifti_path: Path) -> bool:
     return False
 
 
+def _normalize_label_set(labels: Optional[Set[str]]) -> Set[str]:
+    return {str(label).strip() for label in (labels or set()) if str(label).strip()}
+
+
+def _walk_subject_directories(
+    project_path: Path,
+    excluded_subjects: Optional[Set[str]] = None,
+    excluded_sessions: Optional[Set[str]] = None,
+) -> Iterator[Tuple[Path, List[str], List[str]]]:
+    """Yield ``(directory, dirnames, filenames)`` for every folder below sub-*/.
+
+    Each directory is listed exactly once. Excluded subject and session
+    folders are pruned before descending into them.
+    """
+    normalized_excluded_subjects = _normalize_label_set(excluded_subjects)
+    normalized_excluded_sessions = _normalize_label_set(excluded_sessions)
+
+    for sub_dir in sorted(project_path.iterdir()):
+        if not (sub_dir.is_dir() and sub_dir.name.startswith("sub-")):
+            continue
+        if sub_dir.name in normalized_excluded_subjects:
+            continue
+        for dirpath, dirnames, filenames in os.walk(sub_dir):
+            if normalized_excluded_sessions:
+                dirnames[:] = [
+                    name
+                    for name in dirnames
+                    if not (
+                        name.startswith("ses-")
+                        and name in normalized_excluded_sessions
+                    )
+                ]
+            dirnames.sort()
+            yield Path(dirpath), dirnames, sorted(filenames)
+
+
+def _is_anatomical_nifti_name(filename: str) -> bool:
+    return any(
+        f"_{suffix}.nii" in filename or f"_{suffix}.nii.gz" in filename
+        for suffix in ANAT_SUFFIXES
+    )
+
+
 def _iter_anatomical_nifti_files(
     project_path: Path,
     selected_variants: Optional[Set[str]] = None,
@@ -629,41 +672,22 @@ def _iter_anatomical_nifti_files(
     excluded_sessions: Optional[Set[str]] = None,
 ) -> List[Path]:
     """Return anatomical NIfTI files under sub-*/anat/ that match known suffixes."""
-    normalized_excluded_subjects = {
-        str(label).strip()
-        for label in (excluded_subjects or set())
-        if str(label).strip()
-    }
-    normalized_excluded_sessions = {
-        str(label).strip()
-        for label in (excluded_sessions or set())
-        if str(label).strip()
-    }
-
     results: List[Path] = []
-    for sub_dir in project_path.iterdir():
-        if not (sub_dir.is_dir() and sub_dir.name.startswith("sub-")):
-            continue
-        if sub_dir.name in normalized_excluded_subjects:
+    for directory, _dirnames, filenames in _walk_subject_directories(
+        project_path,
+        excluded_subjects=excluded_subjects,
+        excluded_sessions=excluded_sessions,
+    ):
+        if detect_modality_from_path(directory) != "anat":
             continue
-        for nifti_file in sub_dir.rglob("*.nii*"):
-            relative_parts = nifti_file.relative_to(project_path).parts
-            if normalized_excluded_sessions and any(
-                part.startswith("ses-") and part in normalized_excluded_sessions
-                for part in relative_parts
-            ):
-                continue
-            if detect_modality_from_path(nifti_file) != "anat":
+        for filename in filenames:
+            if ".nii" not in filename:
                 continue
-            filename = nifti_file.name
-            if not any(
-                f"_{suffix}.nii" in filename or f"_{suffix}.nii.gz" in filename
-                for suffix in ANAT_SUFFIXES
-            ):
+            if not _is_anatomical_nifti_name(filename):
                 continue
             if not _matches_selected_defacing_variants(filename, selected_variants):
                 continue
-            results.append(nifti_file)
+            results.append(directory / filename)
     return sorted(set(results))
 
 
@@ -1398,31 +1422,33 @@ print(json.dumps({\"counts\": counts, \"items\": items}, ensure_ascii=False))
     }
 
 
-def is_anatomical_defaced(
+def _find_sibling_nifti(
     json_sidecar: Path,
-    check_nibabel: bool = True,
-) -> Dict[str, Any]:
-    """Determine whether an anatomical scan appears to be defaced.
-
-    Checks (in order):
-      1. Whether a sibling NIfTI file (.nii or .nii.gz) has a defacing
-         marker in its filename.
-      2. If nibabel is available, inspects the NIfTI header description.
-
-    Returns a dict with:
-      ``status`` — one of: ``"defaced"``, ``"not_defaced"``, ``"unknown"``
-      ``reason`` — human-readable explanation
-      ``nifti_found`` — whether a sibling NIfTI was located
-    """
-    # Find a sibling NIfTI file (same stem, ignoring the .json extension)
+    sibling_names: Optional[Set[str]] = None,
+) -> Optional[Path]:
+    """Return the .nii.gz/.nii file sharing *json_sidecar*'s stem, if any."""
     stem = json_sidecar.stem  # e.g. "sub-01_T1w"
     parent = json_sidecar.parent
-    nifti: Optional[Path] = None
-    for candidate in [parent / f"{stem}.nii.gz", parent / f"{stem}.nii"]:
-        if candidate.exists():
-            nifti = candidate
-            break
+    for candidate_name in (f"{stem}.nii.gz", f"{stem}.nii"):
+        if sibling_names is None:
+            candidate = parent / candidate_name
+            if candidate.exists():
+                return candidate
+        elif candidate_name in sibling_names:
+            return parent / candidate_name
+    return None
 
+
+def _defacing_precheck(
+    json_sidecar: Path,
+    nifti: Optional[Path],
+    sibling_names: Optional[Iterable[str]] = None,
+) -> Optional[Dict[str, Any]]:
+    """Run the cheap (filename / metadata / folder) defacing checks.
+
+    Returns a final result dict, or None when the NIfTI header still needs
+    to be inspected.
+    """
     if nifti is None:
         return {
             "status": "unknown",
@@ -1448,36 +1474,64 @@ def is_anatomical_defaced(
         }
 
     # 3. Nearby defacing artifacts (mask or helper outputs).
-    if _has_defacing_sidecar_artifact(nifti):
+    if _has_defacing_sidecar_artifact(nifti, sibling_names):
         return {
             "status": "defaced",
             "reason": "Found nearby defacing artifact/output in same folder",
             "nifti_found": True,
         }
+    return None
 
-    # 4. nibabel header heuristic
-    if check_nibabel:
-        header_result = _nibabel_defacing_heuristic(nifti)
-        if header_result is True:
-            return {
-                "status": "defaced",
-                "reason": "NIfTI header describes defaced / skull-stripped image",
-                "nifti_found": True,
-            }
-        if header_result is False:
-            return {
-                "status": "not_defaced",
-                "reason": "No defacing marker found in filename or NIfTI header",
-                "nifti_found": True,
-            }
 
+def _defacing_header_verdict(header_result: Optional[bool]) -> Dict[str, Any]:
+    """Map a NIfTI header heuristic result onto the report dict."""
+    if header_result is True:
+        return {
+            "status": "defaced",
+            "reason": "NIfTI header describes defaced / skull-stripped image",
+            "nifti_found": True,
+        }
+    if header_result is False:
+        return {
+            "status": "not_defaced",
+            "reason": "No defacing marker found in filename or NIfTI header",
+            "nifti_found": True,
+        }
     return {
         "status": "unknown",
-        "reason": "Cannot determine defacing status (nibabel unavailable or unreadable)",
+        "reason": "Cannot determine defacing status (NIfTI header unreadable)",
         "nifti_found": True,
     }
 
 
+def is_anatomical_defaced(
+    json_sidecar: Path,
+    check_nibabel: bool = True,
+) -> Dict[str, Any]:
+    """Determine whether an anatomical scan appears to be defaced.
+
+    Checks (in order):
+      1. Whether a sibling NIfTI file (.nii or .nii.gz) has a defacing
+         marker in its filename.
+      2. JSON metadata and nearby defacing artifacts.
+      3. When *check_nibabel* is set, the NIfTI header description.
+
+    Returns a dict with:
+      ``status`` — one of: ``"defaced"``, ``"not_defaced"``, ``"unknown"``
+      ``reason`` — human-readable explanation
+      ``nifti_found`` — whether a sibling NIfTI was located
+    """
+    nifti = _find_sibling_nifti(json_sidecar)
+    result = _defacing_precheck(json_sidecar, nifti)
+    if result is not None:
+        return result
+    assert nifti is not None
+
+    if check_nibabel:
+        return _defacing_header_verdict(_nibabel_defacing_heuristic(nifti))
+    return _defacing_header_verdict(None)
+
+
 # ---------------------------------------------------------------------------
 # Batch helpers used by the export pipeline
 # ---------------------------------------------------------------------------
@@ -1486,65 +1540,81 @@ def is_anatomical_defaced(
 def scan_mri_jsons(project_path: Path) -> List[Path]:
     """Return all MRI sidecar JSON paths under *project_path*."""
     results: List[Path] = []
-    for sub_dir in project_path.iterdir():
-        if not (sub_dir.is_dir() and sub_dir.name.startswith("sub-")):
+    for directory, _dirnames, filenames in _walk_subject_directories(project_path):
+        if detect_modality_from_path(directory) not in MRI_MODALITIES:
             continue
-        for json_file in sub_dir.rglob("*.json"):
-            if is_mri_json_sidecar(json_file):
-                results.append(json_file)
+        for filename in filenames:
+            if filename.lower().endswith(".json"):
+                results.append(directory / filename)
     return results
 
 
+#: Upper bound for concurrent NIfTI header reads in batch defacing reports.
+DEFACING_REPORT_MAX_WORKERS = 8
+
+
 def build_defacing_report(
     project_path: Path,
     selected_variants: Optional[Set[str]] = None,
     excluded_subjects: Optional[Set[str]] = None,
     excluded_sessions: Optional[Set[str]] = None,
+    max_workers: Optional[int] = None,
 ) -> List[Dict[str, Any]]:
     """
     Scan all anatomical JSON sidecars in *project_path* and report defacing status.
 
+    Every directory is listed once; the listing doubles as the sibling index
+    for NIfTI lookup and artifact detection. Header reads for scans that the
+    cheap checks cannot classify are fanned out to a thread pool.
+
     Returns a list of dicts, one per anat JSON, with keys:
       ``file``    — path relative to project_path
       ``status``  — "defaced" / "not_defaced" / "unknown"
       ``reason``  — human-readable detail
     """
     report: List[Dict[str, Any]] = []
-    normalized_excluded_subjects = {
-        str(label).strip()
-        for label in (excluded_subjects or set())
-        if str(label).strip()
-    }
-    normalized_excluded_sessions = {
-        str(label).strip()
-        for label in (excluded_sessions or set())
-        if str(label).strip()
-    }
+    pending: List[Tuple[int, Path]] = []
 
-    for sub_dir in project_path.iterdir():
-        if not (sub_dir.is_dir() and sub_dir.name.startswith("sub-")):
-            continue
-        if sub_dir.name in normalized_excluded_subjects:
+    for directory, dirnames, filenames in _walk_subject_directories(
+        project_path,
+        excluded_subjects=excluded_subjects,
+        excluded_sessions=excluded_sessions,
+    ):
+        if detect_modality_from_path(directory) != "anat":
             continue
-        for json_file in sub_dir.rglob("*.json"):
-            relative_parts = json_file.relative_to(project_path).parts
-            if normalized_excluded_sessions and any(
-                part.startswith("ses-") and part in normalized_excluded_sessions
-                for part in relative_parts
-            ):
-                continue
-            if detect_modality_from_path(json_file) != "anat":
+        sibling_names = [*dirnames, *filenames]
+        sibling_name_set = set(sibling_names)
+        for filename in filenames:
+            if not filename.lower().endswith(".json"):
                 continue
             # Only check files whose stem suggests an anatomical suffix
-            stem_upper = json_file.stem.upper()
+            stem_upper = Path(filename).stem.upper()
             if not any(suf.upper() in stem_upper for suf in ANAT_SUFFIXES):
                 continue
-            if not _matches_selected_defacing_variants(
-                json_file.name,
-                selected_variants,
-            ):
+            if not _matches_selected_defacing_variants(filename, selected_variants):
                 continue
-            result = is_anatomical_defaced(json_file)
+
+            json_file = directory / filename
+            nifti = _find_sibling_nifti(json_file, sibling_name_set)
+            result = _defacing_precheck(json_file, nifti, sibling_names)
+            if result is None:
+                assert nifti is not None
+                pending.append((len(report), nifti))
+                result = {}
             result["file"] = json_file.relative_to(project_path).as_posix()
             report.append(result)
+
+    if pending:
+        workers = max_workers or min(DEFACING_REPORT_MAX_WORKERS, len(pending))
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+            header_results = list(
+                pool.map(
+                    lambda item: _nibabel_defacing_heuristic(item[1]),
+                    pending,
+                )
+            )
+        for (index, _nifti), header_result in zip(pending, header_results):
+            entry = _defacing_header_verdict(header_result)
+            entry["file"] = report[index]["file"]
+            report[index] = entry
     return report
@@ -26,6 +26,43 @@ def _ensure_dir_local(path: Path) -> Path:
     return path
 
 
+def _factorized_text(series: Any) -> tuple[Any, Any]:
+    """Return ``(codes, stripped_uniques)`` for the text form of ``series``.
+
+    Survey exports hold few distinct values per column, so string cleanup and
+    numeric parsing run once per distinct value instead of once per cell.
+    ``codes`` is a NumPy array indexing into ``stripped_uniques`` (a string
+    Series); missing values get code ``-1``.
+    """
+    import pandas as pd
+
+    codes, uniques = pd.factorize(series.astype("string"), use_na_sentinel=True)
+    return codes, pd.Series(uniques, dtype="string").str.strip()
+
+
+def _expand_unique_mask(codes: Any, unique_mask: Any) -> Any:
+    """Broadcast a per-unique boolean mask to rows (missing rows -> False)."""
+    import numpy as np
+
+    lookup = np.append(np.asarray(unique_mask, dtype=bool), False)
+    return lookup[codes]
+
+
+def _expand_unique_values(codes: Any, unique_values: Any, index: Any) -> Any:
+    """Broadcast per-unique values to a row Series (missing rows -> NA)."""
+    import pandas as pd
+
+    values = pd.api.extensions.take(unique_values.array, codes, allow_fill=True)
+    return pd.Series(values, index=index)
+
+
+def _parse_unique_numbers(stripped: Any) -> Any:
+    """Parse stripped unique texts as numbers, accepting decimal commas."""
+    import pandas as pd
+
+    return pd.to_numeric(stripped.str.replace(",", ".", regex=False), errors="coerce")
+
+
 def _coerce_value_labeled_columns_for_sav(
     df: Any,
     value_labels: dict[str, dict],
@@ -79,6 +116,7 @@ def _prepare_dataframe_for_sav(df: Any) -> Any:
     SPSS stores numeric values locale-independently in SAV files. This helper
     converts decimal-comma strings (e.g. "3,14") to numeric values, maps common
     textual NA markers to missing values, and leaves non-numeric columns as text.
+    All checks run on each column's distinct values (see ``_factorized_text``).
     """
     import pandas as pd
 
@@ -89,33 +127,29 @@ def _prepare_dataframe_for_sav(df: Any) -> Any:
     missing_tokens = _MISSING_TEXT_TOKENS
 
     for col in out.columns:
-        series = out[col]
-        text = series.astype("string").str.strip()
-        lower = text.str.lower()
-        non_missing_mask = text.notna() & (~lower.isin(missing_tokens))
+        codes, stripped = _factorized_text(out[col])
+        unique_missing = stripped.str.lower().isin(missing_tokens).to_numpy()
 
         # Normalize textual missing markers for every column.
-        missing_mask = text.notna() & lower.isin(missing_tokens)
+        missing_mask = _expand_unique_mask(codes, unique_missing)
         if bool(missing_mask.any()):
             out.loc[missing_mask, col] = pd.NA
 
-        if int(non_missing_mask.sum()) == 0:
+        present = ~unique_missing
+        if not bool(present.any()):
             continue
 
         # Accept both decimal separators in input while writing canonical numerics.
-        numeric = pd.to_numeric(
-            text.str.replace(",", ".", regex=False),
-            errors="coerce",
-        )
-        if int(numeric[non_missing_mask].notna().sum()) != int(non_missing_mask.sum()):
+        unique_numeric = _parse_unique_numbers(stripped)
+        if bool(unique_numeric[present].isna().any()):
             continue
 
         # Preserve identifier-like text codes (e.g., "001", "010") as strings.
-        non_missing_text = text[non_missing_mask]
-        if bool(non_missing_text.astype("string").str.match(r"^0\d+$").any()):
+        if bool(stripped[present].str.match(r"^0\d+$").any()):
             continue
 
-        non_na_numeric = numeric.dropna()
+        numeric = _expand_unique_values(codes, unique_numeric, out.index)
+        non_na_numeric = unique_numeric.dropna()
         if not non_na_numeric.empty and bool(((non_na_numeric % 1) == 0).all()):
             out[col] = numeric.round().astype("Int64")
         else:
@@ -168,17 +202,16 @@ def _apply_declared_datatypes(df: Any, declared_datatypes: dict[str, Any]) -> An
             out[col] = out[col].astype("string")
             continue
 
-        text = out[col].astype("string").str.strip()
-        lower = text.str.lower()
-        non_missing_mask = text.notna() & (~lower.isin(_MISSING_TEXT_TOKENS))
-        numeric = pd.to_numeric(
-            text.str.replace(",", ".", regex=False),
-            errors="coerce",
-        )
+        codes, stripped = _factorized_text(out[col])
+        lower = stripped.str.lower()
+        present = (~lower.isin(_MISSING_TEXT_TOKENS)).to_numpy()
+        unique_numeric = _parse_unique_numbers(stripped)
 
-        if int(numeric[non_missing_mask].notna().sum()) != int(non_missing_mask.sum()):
+        if bool(unique_numeric[present].isna().any()):
             continue
 
+        numeric = _expand_unique_values(codes, unique_numeric, out.index)
+
         if normalized_type == "integer":
             out[col] = numeric.round().astype("Int64")
             continue
@@ -197,10 +230,11 @@ def _apply_declared_datatypes(df: Any, declared_datatypes: dict[str, Any]) -> An
                 "no": False,
             }
             mapped = lower.map(bool_map)
-            valid_mask = text.notna() & (~lower.isin(_MISSING_TEXT_TOKENS))
-            if int(mapped[valid_mask].notna().sum()) != int(valid_mask.sum()):
+            if bool(mapped[present].isna().any()):
                 continue
-            out[col] = mapped.astype("boolean")
+            out[col] = _expand_unique_values(
+                codes, mapped.astype("boolean"), out.index
+            )
 
     return out
 
@@ -224,10 +258,13 @@ def _apply_missing_export_policy(
         )
 
     out = df.copy()
-    text = out.astype("string")
-    missing_mask = text.apply(lambda col: col.str.strip().str.lower().isin(_MISSING_TEXT_TOKENS))
-    if bool(missing_mask.any().any()):
-        out = out.mask(missing_mask, pd.NA)
+    for col_index in range(out.shape[1]):
+        codes, stripped = _factorized_text(out.iloc[:, col_index])
+        unique_missing = stripped.str.lower().isin(_MISSING_TEXT_TOKENS).to_numpy()
+        if not bool(unique_missing.any()):
+            continue
+        missing_mask = _expand_unique_mask(codes, unique_missing)
+        out.iloc[missing_mask, col_index] = pd.NA
 
     if policy == "system-missing":
         return out
@@ -435,21 +472,37 @@ def _write_codebook_json(
     _write_json_local(path, codebook)
 
 
-def _write_codebook_tsv(
-    path: Path,
+CODEBOOK_COLUMNS = ["variable", "label", "values", "score_details"]
+
+
+def _format_score_details(details: dict) -> str:
+    """Render score metadata as ``method=...; items=...; range=...``."""
+    parts = []
+    if details.get("method"):
+        parts.append(f"method={details['method']}")
+    if details.get("items"):
+        parts.append(f"items={'+'.join(details['items'])}")
+    if details.get("range"):
+        r = details["range"]
+        parts.append(f"range={r.get('min', '?')}-{r.get('max', '?')}")
+    if details.get("min_valid") is not None:
+        parts.append(f"min_valid={details['min_valid']}")
+    return "; ".join(parts)
+
+
+def _codebook_rows(
+    variables: Any,
     variable_labels: dict,
     value_labels: dict,
     score_details: Optional[dict] = None,
-) -> None:
-    """Write a companion codebook TSV file with all metadata."""
+) -> list[dict[str, str]]:
+    """Build the codebook table (one row per variable, ``CODEBOOK_COLUMNS``).
+
+    Export writers build this once and reuse it for the TSV codebook and the
+    xlsx ``Codebook`` sheet.
+    """
     rows = []
-    all_vars = (
-        set(variable_labels.keys())
-        | set(value_labels.keys())
-        | set(score_details.keys() if score_details else [])
-    )
-    for var in sorted(all_vars):
-        label = variable_labels.get(var, "")
+    for var in variables:
         values = value_labels.get(var, {})
         if values:
             values_str = "; ".join(
@@ -457,35 +510,37 @@ def _write_codebook_tsv(
             )
         else:
             values_str = ""
-        # Add score details as extra info
-        details_str = ""
-        if score_details and var in score_details:
-            d = score_details[var]
-            parts = []
-            if d.get("method"):
-                parts.append(f"method={d['method']}")
-            if d.get("items"):
-                parts.append(f"items={'+'.join(d['items'])}")
-            if d.get("range"):
-                r = d["range"]
-                parts.append(f"range={r.get('min', '?')}-{r.get('max', '?')}")
-            if d.get("min_valid") is not None:
-                parts.append(f"min_valid={d['min_valid']}")
-            details_str = "; ".join(parts)
+        details = (score_details or {}).get(var)
         rows.append(
             {
                 "variable": var,
-                "label": label,
+                "label": variable_labels.get(var, ""),
                 "values": values_str,
-                "score_details": details_str,
+                "score_details": _format_score_details(details) if details else "",
             }
         )
+    return rows
+
+
+def _write_codebook_tsv(
+    path: Path,
+    variable_labels: dict,
+    value_labels: dict,
+    score_details: Optional[dict] = None,
+) -> None:
+    """Write a companion codebook TSV file with all metadata."""
+    all_vars = (
+        set(variable_labels.keys())
+        | set(value_labels.keys())
+        | set(score_details.keys() if score_details else [])
+    )
+    rows = _codebook_rows(sorted(all_vars), variable_labels, value_labels, score_details)
 
     _ensure_dir_local(path.parent)
     with open(path, "w", encoding="utf-8", newline="") as f:
         writer = csv.DictWriter(
             f,
-            fieldnames=["variable", "label", "values", "score_details"],
+            fieldnames=CODEBOOK_COLUMNS,
             delimiter="\t",
             lineterminator="\n",
         )
@@ -0,0 +1,176 @@
+"""Output writers for aggregated recipe exports.
+
+``compute_survey_recipes`` writes score tables with hundreds of columns.
+``pandas.DataFrame.to_excel`` builds an openpyxl cell object per value and
+keeps the whole workbook in memory, which made large ``merge_all`` exports
+take minutes. This module provides:
+
+* :func:`write_xlsx` – a streaming writer on top of openpyxl's write-only
+  workbook. Rows are converted column by column in fixed-size chunks and
+  each distinct text value of a column is cleaned once, so memory stays
+  bounded by one chunk. Text that openpyxl would turn into a formula or an
+  error value (``=1+1``, ``#N/A``) is kept as text.
+* :func:`write_columnar` – Parquet/Feather output for analysis pipelines.
+  Numeric-looking columns get real numeric dtypes (the same rules as the
+  SPSS export), everything else is written as string columns. Requires
+  ``pyarrow``.
+"""
+
+from __future__ import annotations
+
+import math
+import re
+from pathlib import Path
+from typing import Any, Iterable, Sequence
+
+from src.recipes_export_helpers import _prepare_dataframe_for_sav
+
+COLUMNAR_OUTPUT_FORMATS = ("parquet", "feather")
+
+XLSX_CHUNK_ROWS = 5000
+_XLSX_MAX_SHEET_NAME = 31
+
+_ILLEGAL_XML_CHARS = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f\ufffe\uffff]")
+_INVALID_SHEET_NAME_CHARS = re.compile(r"[\[\]:*?/\\]")
+
+
+def _text_value(sheet: Any, value: str) -> Any:
+    """Return ``value`` as a cell value openpyxl writes as plain text."""
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.cell.cell import ERROR_CODES
+
+    text = _ILLEGAL_XML_CHARS.sub("", value)
+    if (len(text) > 1 and text.startswith("=")) or text in ERROR_CODES:
+        cell = WriteOnlyCell(sheet, text)
+        cell.data_type = "s"
+        return cell
+    return text
+
+
+def _column_values(sheet: Any, values: list) -> list:
+    """Convert one column chunk; missing values become empty cells."""
+    import pandas as pd
+
+    converted: list = []
+    append = converted.append
+    texts: dict[str, Any] = {}
+    for value in values:
+        kind = type(value)
+        if kind is str:
+            text = texts.get(value)
+            if text is None:
+                text = texts[value] = _text_value(sheet, value)
+            append(text)
+        elif value is None or value is pd.NA or value is pd.NaT:
+            append(None)
+        elif kind is bool or kind is int:
+            append(value)
+        elif kind is float:
+            append(value if math.isfinite(value) else None)
+        else:
+            append(_text_value(sheet, str(value)))
+    return converted
+
+
+def _sheet_name(name: str, used: set[str]) -> str:
+    base = _INVALID_SHEET_NAME_CHARS.sub("_", str(name)).strip("'")
+    base = (base or "Sheet")[:_XLSX_MAX_SHEET_NAME]
+    candidate, counter = base, 2
+    while candidate.lower() in used:
+        suffix = f" ({counter})"
+        candidate = base[: _XLSX_MAX_SHEET_NAME - len(suffix)] + suffix
+        counter += 1
+    used.add(candidate.lower())
+    return candidate
+
+
+def _write_sheet(sheet: Any, df: Any, chunk_rows: int) -> None:
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import Font
+
+    bold = Font(bold=True)
+    header = []
+    for col in df.columns:
+        cell = WriteOnlyCell(sheet, _ILLEGAL_XML_CHARS.sub("", str(col)))
+        cell.data_type = "s"
+        cell.font = bold
+        header.append(cell)
+    sheet.append(header)
+    for start in range(0, len(df), chunk_rows):
+        chunk = df.iloc[start : start + chunk_rows]
+        columns = [
+            _column_values(sheet, chunk.iloc[:, j].astype(object).tolist())
+            for j in range(chunk.shape[1])
+        ]
+        for row in zip(*columns):
+            sheet.append(row)
+
+
+def write_xlsx(
+    path: str | Path,
+    sheets: Sequence[tuple[str, Any]],
+    *,
+    chunk_rows: int = XLSX_CHUNK_ROWS,
+) -> Path:
+    """Write ``(sheet_name, DataFrame)`` pairs to an .xlsx workbook.
+
+    The header row is bold; missing values (None/NaN/NA) are left empty. The
+    index is not written, matching ``to_excel(index=False)``.
+    """
+    from openpyxl import Workbook
+
+    path = Path(path)
+    workbook = Workbook(write_only=True)
+    used: set[str] = set()
+    for name, df in sheets:
+        sheet = workbook.create_sheet(title=_sheet_name(name, used))
+        _write_sheet(sheet, df, chunk_rows)
+    workbook.save(path)
+    return path
+
+
+def columnar_frame(df: Any, *, string_columns: Iterable[str] = ()) -> Any:
+    """Return ``df`` with typed columns suitable for Parquet/Feather.
+
+    Numeric-looking columns become ``Int64``/``float`` (textual NA markers
+    become missing); ``string_columns`` and all remaining object columns are
+    stored as strings.
+    """
+    out = _prepare_dataframe_for_sav(df)
+    forced = {str(col) for col in string_columns}
+    for col in out.columns:
+        if str(col) in forced or out[col].dtype == object:
+            out[col] = out[col].astype("string")
+    out.columns = [str(col) for col in out.columns]
+    return out.reset_index(drop=True)
+
+
+def write_columnar(
+    path: str | Path,
+    df: Any,
+    out_format: str,
+    *,
+    string_columns: Iterable[str] = (),
+) -> Path:
+    """Write ``df`` as Parquet or Feather.
+
+    Raises:
+        ValueError: For formats other than ``parquet``/``feather``.
+        ImportError: When ``pyarrow`` is not installed.
+    """
+    if out_format not in COLUMNAR_OUTPUT_FORMATS:
+        raise ValueError(f"Unsupported columnar format: {out_format}")
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError as exc:
+        raise ImportError(
+            f"pyarrow is required for {out_format} output (pip install pyarrow)"
+        ) from exc
+
+    path = Path(path)
+    frame = columnar_frame(df, string_columns=string_columns)
+    if out_format == "parquet":
+        frame.to_parquet(path, index=False)
+    else:
+        frame.to_feather(path)
+    return path
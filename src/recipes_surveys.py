@@ -15,13 +15,15 @@ output dataset.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field, replace
 from datetime import datetime
 from pathlib import Path
 import csv
 import hashlib
+import os
 import re
 import json
+import sys
 from typing import Any, Dict, Optional
 
 from src.datalad_execution import (
@@ -44,6 +46,12 @@ from src.reporting import _pick_references
 
 RECIPE_FILENAME_GLOB = "recipe-*.json"
 
+#: Environment opt-in for recipe scoring processes (``0`` = automatic).
+RECIPES_WORKERS_ENV_VAR = "PRISM_RECIPES_WORKERS"
+#: With automatic workers, runs with fewer input files are still scored
+#: in-process; starting worker processes costs more than it saves.
+RECIPES_PARALLEL_MIN_FILES = 200
+
 _MISSING_TEXT_TOKENS = {"", "n/a", "na", "nan", "none", "null"}
 
 
@@ -68,6 +76,8 @@ class SurveyRecipesResult:
     """Input tasks detected in data files without a matching loaded recipe."""
     raw_only_tasks: tuple[str, ...] = ()
     """Input tasks exported as raw-only because no matching recipe was available."""
+    up_to_date_recipe_ids: tuple[str, ...] = ()
+    """Recipe IDs an incremental run left untouched because nothing changed."""
 
 
 def _ensure_dir(path: Path) -> Path:
@@ -137,9 +147,9 @@ def _ensure_bidsignore_prism_rules(dataset_root: Path, modality: str) -> None:
             f.write(f"{rule}\n")
 
 
-def _get_sidecar_for_task(dataset_path: Path, prefix: str, name: str) -> dict:
-    """Find and load sidecar JSON for a given task/biometric."""
-    candidates = [
+def _sidecar_candidates_for_task(dataset_path: Path, prefix: str, name: str) -> list[Path]:
+    """Sidecar locations for a task/biometric, in lookup order."""
+    return [
         dataset_path
         / "code"
         / "library"
@@ -150,6 +160,17 @@ def _get_sidecar_for_task(dataset_path: Path, prefix: str, name: str) -> dict:
         dataset_path / f"{name}.json",
         dataset_path / f"task-{name}_{prefix}.json",  # BIDS-style sidecar
     ]
+
+
+def _existing_sidecar_files(dataset_path: Path, prefix: str, name: str) -> list[Path]:
+    return [
+        p for p in _sidecar_candidates_for_task(dataset_path, prefix, name) if p.is_file()
+    ]
+
+
+def _get_sidecar_for_task(dataset_path: Path, prefix: str, name: str) -> dict:
+    """Find and load sidecar JSON for a given task/biometric."""
+    candidates = _sidecar_candidates_for_task(dataset_path, prefix, name)
     for p in candidates:
         if p.exists():
             try:
@@ -159,6 +180,33 @@ def _get_sidecar_for_task(dataset_path: Path, prefix: str, name: str) -> dict:
     return {}
 
 
+class _SidecarCache:
+    """Per-run memo of task sidecars and their template versions.
+
+    A sidecar is located and parsed once per (dataset, modality, task) instead
+    of once per input file. Cached sidecars are shared and must not be mutated.
+    """
+
+    def __init__(self) -> None:
+        self._sidecars: dict[tuple[Path, str, str], dict] = {}
+        self._versions: dict[tuple[Path, str, str], str | None] = {}
+
+    def get(self, dataset_path: Path, prefix: str, name: str) -> dict:
+        key = (dataset_path, prefix, name)
+        sidecar = self._sidecars.get(key)
+        if sidecar is None:
+            sidecar = self._sidecars[key] = _get_sidecar_for_task(
+                dataset_path, prefix, name
+            )
+        return sidecar
+
+    def template_version(self, dataset_path: Path, prefix: str, name: str) -> str | None:
+        key = (dataset_path, prefix, name)
+        if key not in self._versions:
+            self._versions[key] = _template_version(self.get(dataset_path, prefix, name))
+        return self._versions[key]
+
+
 # Structural metadata keys in a survey/biometrics template, never item IDs.
 _TEMPLATE_RESERVED_KEYS = {
     "@context",
@@ -184,7 +232,11 @@ _TEMPLATE_RESERVED_KEYS = {
 
 
 def _known_item_ids_for_recipe_task(
-    dataset_path: Path | None, *, modality: str, task: str
+    dataset_path: Path | None,
+    *,
+    modality: str,
+    task: str,
+    sidecars: _SidecarCache | None = None,
 ) -> set[str] | None:
     """Return the item IDs declared in the template matched to a recipe's task.
 
@@ -196,7 +248,7 @@ def _known_item_ids_for_recipe_task(
     """
     if not dataset_path or not task:
         return None
-    sidecar = _get_sidecar_for_task(dataset_path, modality, task)
+    sidecar = (sidecars or _SidecarCache()).get(dataset_path, modality, task)
     if not isinstance(sidecar, dict) or (
         "Technical" not in sidecar and "Study" not in sidecar
     ):
@@ -514,6 +566,7 @@ def _build_combined_output_metadata(
     lang: str = "en",
     dataset_path: Optional[Path] = None,
     modality: str = "survey",
+    sidecars: _SidecarCache | None = None,
 ) -> tuple[dict[str, str], dict[str, dict], dict[str, dict]]:
     """Build metadata for combined outputs with recipe prefixes when needed."""
     variable_labels: dict[str, str] = {
@@ -538,9 +591,11 @@ def _build_combined_output_metadata(
 
     # Per-recipe sidecar item labels (e.g. ADS01 -> selten/manchmal/...)
     col_set = set(columns)
+    if sidecars is None:
+        sidecars = _SidecarCache()
     for recipe_id in recipe_by_id:
         if dataset_path:
-            sidecar = _get_sidecar_for_task(dataset_path, modality, recipe_id)
+            sidecar = sidecars.get(dataset_path, modality, recipe_id)
             for sidecar_key, col_meta in sidecar.items():
                 if not isinstance(col_meta, dict):
                     continue
@@ -620,9 +675,19 @@ from src.recipes_export_helpers import (  # noqa: E402
     _normalize_declared_data_type,
     _prepare_dataframe_for_sav,
     _sanitize_spss_variable_name,
+    CODEBOOK_COLUMNS,
+    _codebook_rows,
     _write_codebook_json,
     _write_codebook_tsv,
 )
+from src.recipes_output_writers import (  # noqa: E402
+    COLUMNAR_OUTPUT_FORMATS,
+    write_columnar,
+    write_xlsx,
+)
+
+# Formats written as one aggregated table per recipe (or one combined table).
+_TABULAR_OUTPUT_FORMATS = ("csv", "xlsx", "sav") + COLUMNAR_OUTPUT_FORMATS
 
 # Path / filename / participant-ID utilities have been extracted to
 # ``src.recipes_path_utils``. They are re-exported below so existing
@@ -639,6 +704,7 @@ from src.recipes_path_utils import (  # noqa: E402
     _strip_acq_from_task,
     _strip_suffix,
 )
+from src.recipes_wide_pivot import context_codes, pivot_wide  # noqa: E402
 
 
 def _build_participant_value_lookup(participants_df: Any) -> dict[str, dict[str, str]]:
@@ -732,21 +798,42 @@ def _resolve_recipe_scores(recipe: dict, resolved_version: str | None) -> list[d
     return recipe.get("Scores") or []
 
 
-def _resolve_recipe_score_names(recipe: dict, resolved_version: str | None) -> set[str]:
-    """Return score variable names for the active recipe/version."""
-    names: set[str] = set()
-    for score in _resolve_recipe_scores(recipe, resolved_version):
-        name = str((score or {}).get("Name", "")).strip()
-        if name:
-            names.add(name)
-    return names
+@dataclass(frozen=True)
+class _ScoreBlock:
+    """One resolved score list with its output column names."""
+
+    scores: list[dict]
+    names: list[str]
+    name_set: frozenset[str]
+
+
+def _score_block(scores: list[dict]) -> _ScoreBlock:
+    names = [
+        str(s.get("Name", "")).strip() for s in scores if str(s.get("Name", "")).strip()
+    ]
+    return _ScoreBlock(scores=scores, names=names, name_set=frozenset(names))
+
+
+def _recipe_score_table(recipe: dict) -> dict[str | None, _ScoreBlock]:
+    """Precompute ``resolved_version -> score block`` for one recipe.
+
+    The ``None`` entry holds the top-level ``Scores``; look up versions with
+    ``table.get(version or None, table[None])`` to match ``_resolve_recipe_scores``.
+    """
+    table: dict[str | None, _ScoreBlock] = {
+        None: _score_block(recipe.get("Scores") or [])
+    }
+    for version, scores in (recipe.get("VersionedScores") or {}).items():
+        if version:
+            table[version] = _score_block(scores or [])
+    return table
 
 
 def _merge_all_output_column_name(
     recipe_id: str,
     column: str,
     *,
-    score_names: set[str],
+    score_names: frozenset[str],
     include_recipe_prefix: bool,
 ) -> str:
     """Pick a merge-all column name with score columns always recipe-prefixed."""
@@ -781,6 +868,7 @@ def _apply_survey_derivative_recipe_to_rows(
     include_raw: bool = False,
     resolved_version: str | None = None,
     raw_exclude_columns: set[str] | None = None,
+    score_block: _ScoreBlock | None = None,
 ) -> tuple[list[str], list[dict[str, str]]]:
     transforms = recipe.get("Transforms", {}) or {}
     invert_cfg = transforms.get("Invert") or {}
@@ -796,10 +884,11 @@ def _apply_survey_derivative_recipe_to_rows(
 
     # VersionedScores: if recipe defines per-variant score lists and a version is
     # resolved for this file, use that variant's scores; fall back to top-level Scores.
-    scores = _resolve_recipe_scores(recipe, resolved_version)
-    score_names = [
-        str(s.get("Name", "")).strip() for s in scores if str(s.get("Name", "")).strip()
-    ]
+    # Callers scoring many files pass the block precomputed for resolved_version.
+    if score_block is None:
+        score_block = _score_block(_resolve_recipe_scores(recipe, resolved_version))
+    scores = score_block.scores
+    score_names = score_block.names
 
     out_header = []
     if include_raw and rows:
@@ -924,6 +1013,72 @@ def _hash_file_sha256(
     return hex_digest
 
 
+def _recipe_sha256(recipe: dict) -> str:
+    """Digest of a recipe's JSON content (key order and formatting ignored)."""
+    payload = json.dumps(recipe, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class _ProvenanceHasher:
+    """Per-run file hashing state for provenance sidecars.
+
+    Like the ``_hash_file_sha256`` cache, create one per
+    compute_survey_recipes() call: every file is resolved, stat'ed and hashed
+    at most once per run. Incremental runs seed it with the hashes recorded
+    for files whose size and mtime did not change.
+    """
+
+    def __init__(self, prism_root: Path) -> None:
+        self.prism_root = prism_root.resolve()
+        self.hash_cache: dict[Path, str] = {}
+        self._stats: dict[Path, list[int]] = {}
+        self._resolved: dict[Path, Path] = {}
+        self._rel_paths: dict[Path, str] = {}
+
+    def resolve(self, path: Path) -> Path:
+        resolved = self._resolved.get(path)
+        if resolved is None:
+            resolved = self._resolved[path] = path.resolve()
+        return resolved
+
+    def rel_path(self, path: Path) -> str:
+        rel_path = self._rel_paths.get(path)
+        if rel_path is None:
+            try:
+                rel_path = self.resolve(path).relative_to(self.prism_root).as_posix()
+            except ValueError:
+                rel_path = str(path)
+            self._rel_paths[path] = rel_path
+        return rel_path
+
+    def digest(self, path: Path) -> tuple[str, list[int]]:
+        """Return ``(sha256, [size, mtime_ns])``.
+
+        Stats are taken before hashing, so recorded stats never describe
+        newer content than the recorded hash.
+        """
+        resolved = self.resolve(path)
+        digest = self.hash_cache.get(resolved)
+        if digest is None:
+            st = resolved.stat()
+            self._stats[resolved] = [st.st_size, st.st_mtime_ns]
+            digest = _hash_file_sha256(resolved, cache=self.hash_cache)
+        return digest, self._stats[resolved]
+
+    def reuse_recorded(
+        self, path: Path, recorded_hash: str | None, recorded_stats: Any
+    ) -> None:
+        """Adopt ``recorded_hash`` if the file's size and mtime are unchanged."""
+        resolved = self.resolve(path)
+        if recorded_hash is None or resolved in self.hash_cache:
+            return
+        st = resolved.stat()
+        stats = [st.st_size, st.st_mtime_ns]
+        if stats == recorded_stats:
+            self.hash_cache[resolved] = recorded_hash
+            self._stats[resolved] = stats
+
+
 def _write_recipe_provenance_sidecar(
     *,
     out_root: Path,
@@ -932,7 +1087,10 @@ def _write_recipe_provenance_sidecar(
     prism_root: Path,
     input_files: list[Path],
     participants_files: list[Path],
-    hash_cache: dict[Path, str],
+    hasher: _ProvenanceHasher,
+    sidecar_files: list[Path] | None = None,
+    export_options: dict | None = None,
+    output_files: list[Path] | None = None,
 ) -> None:
     """Write a per-recipe provenance sidecar recording exact inputs and versions.
 
@@ -940,28 +1098,36 @@ def _write_recipe_provenance_sidecar(
     output layout, which varies: a subfolder per recipe for "prism" format,
     a flat per-recipe file for csv/xlsx/sav, a single dataset-wide file for
     "flat") so there is one predictable location regardless of out_format.
+
+    Besides the hashes, the sidecar records the recipe digest, the export
+    options, the written output files and each hashed file's size/mtime;
+    incremental runs compare against these (see ``_plan_incremental_jobs``).
     """
     from src import __version__ as prism_version
 
+    stats_by_path: dict[str, list[int]] = {}
+
     def _describe(paths: list[Path]) -> list[dict[str, str]]:
         described = []
         for p in paths:
-            try:
-                rel_path = p.resolve().relative_to(prism_root.resolve()).as_posix()
-            except ValueError:
-                rel_path = str(p)
-            described.append(
-                {"Path": rel_path, "SHA256": _hash_file_sha256(p, cache=hash_cache)}
-            )
+            rel_path = hasher.rel_path(p)
+            digest, stats = hasher.digest(p)
+            stats_by_path[rel_path] = stats
+            described.append({"Path": rel_path, "SHA256": digest})
         return described
 
     provenance = {
         "RecipeId": recipe_id,
         "RecipeVersion": recipe.get("RecipeVersion"),
+        "RecipeSHA256": _recipe_sha256(recipe),
         "GeneratedBy": {"Name": "prism-tools", "Version": prism_version},
         "GeneratedOn": datetime.now().isoformat(timespec="seconds"),
+        "ExportOptions": export_options or {},
         "InputFiles": _describe(input_files),
         "ParticipantsFiles": _describe(participants_files),
+        "SidecarFiles": _describe(sidecar_files or []),
+        "OutputFiles": [hasher.rel_path(p) for p in (output_files or [])],
+        "FileStats": stats_by_path,
     }
     _write_json(out_root / f"{recipe_id}_provenance.json", provenance)
 
@@ -1185,6 +1351,7 @@ def _load_and_validate_recipes(
     recipe_dir: str | Path | None = None,
     prism_root: Path | None = None,
     allow_empty_recipes: bool = False,
+    sidecars: _SidecarCache | None = None,
 ) -> tuple[dict[str, dict], Path | None]:
     """Locate, load and validate recipe JSON files.
 
@@ -1300,12 +1467,14 @@ def _load_and_validate_recipes(
     info_key = "Survey" if modality == "survey" else "Biometrics"
     task_key = "TaskName" if modality == "survey" else "BiometricName"
 
+    if sidecars is None:
+        sidecars = _SidecarCache()
     recipe_errors: list[str] = []
     for recipe_id, rec in sorted(all_recipes.items()):
         recipe_json = rec.get("json") or {}
         task = str((recipe_json.get(info_key) or {}).get(task_key) or "").strip()
         known_items = _known_item_ids_for_recipe_task(
-            template_dataset_path, modality=modality, task=task
+            template_dataset_path, modality=modality, task=task, sidecars=sidecars
         )
         errs = validate_recipe(
             recipe_json, recipe_id=recipe_id, known_items=known_items
@@ -1402,8 +1571,6 @@ def _handle_wide_pivot(
     When multiple run values are present, the composite key 'session_run' is
     used so that columns such as ``total_score_ses-1_run-01`` are produced.
     """
-    import pandas as pd
-
     try:
         valid_sessions = (
             _distinct_export_context_values(df["session"])
@@ -1419,42 +1586,36 @@ def _handle_wide_pivot(
         include_session = len(valid_sessions) > 1
         include_run = "run" in df.columns and len(valid_runs) > 1
 
-        df = df.copy()
-        if include_session and include_run:
-            df["_pivot_key"] = (
-                df["session"].astype(str) + "_" + df["run"].fillna("").astype(str)
-            ).str.rstrip("_")
-        elif include_session:
-            df["_pivot_key"] = df["session"].astype(str)
-        elif include_run:
-            df["_pivot_key"] = df["run"].fillna("").astype(str)
-        else:
-            df["_pivot_key"] = ""
-
-        pivot_col = "_pivot_key"
-
-        # Pivot the score columns
-        df_wide = df.pivot(index="participant_id", columns=pivot_col, values=out_header)
-        # Flatten multi-index columns: "total_score_ses-1", "total_score_run-01",
-        # or "total_score_ses-1_run-01" depending on the exported context.
-        if isinstance(df_wide.columns, pd.MultiIndex):
-            df_wide.columns = [
-                val if not key else f"{val}_{key}" for val, key in df_wide.columns
-            ]
-        else:
-            df_wide.columns = [
-                out_header[0] if not key else f"{out_header[0]}_{key}"
-                for key in df_wide.columns
-            ]
-
-        df = df_wide.reset_index().fillna("n/a")
+        context_cols = (["session"] if include_session else []) + (
+            ["run"] if include_run else []
+        )
+        # Key labels: "ses-1", "run-01" or "ses-1_run-01" (a missing run drops out).
+        key_codes, key_labels = context_codes(
+            df,
+            context_cols,
+            lambda values: "_".join(_wide_context_text(v) for v in values).rstrip("_"),
+        )
+        wide = pivot_wide(
+            df,
+            out_header,
+            key_codes,
+            key_labels,
+            column_name=lambda value, key: value if not key else f"{value}_{key}",
+        )
         # Update out_header to reflect new columns for metadata building
-        new_header = [c for c in df.columns if c != "participant_id"]
-        return df, new_header, None
+        new_header = [c for c in wide.columns if c != "participant_id"]
+        return wide, new_header, None
     except Exception as e:
         return df, out_header, f"Could not create wide layout: {e}"
 
 
+def _wide_context_text(value: Any) -> str:
+    """Session/run value as used in wide column names (NaN -> empty)."""
+    import pandas as pd
+
+    return "" if pd.isna(value) else str(value)
+
+
 def _normalize_sessions(sessions: str | list[str] | None) -> list[str] | None:
     """Normalize user-provided sessions to ['ses-<id>', ...] or None for all."""
     if sessions is None:
@@ -1527,10 +1688,13 @@ def _export_recipe_aggregated(
     selected_sessions: list[str] | None,
     missing_policy: str,
     missing_numeric_value: float | None,
+    inputs: _RecipeInputs | None = None,
 ) -> tuple[int, int, Path | None, str | None, list[str]]:
     """Process all files for one recipe and write a single aggregated output file."""
     import pandas as pd
 
+    if inputs is None:
+        inputs = _RecipeInputs()
     rows_accum: list[dict[str, Any]] = []
     processed_count = 0
     final_header = []
@@ -1550,7 +1714,7 @@ def _export_recipe_aggregated(
             ses_id = "ses-1"
         run_id = _infer_run_from_path(in_path)
 
-        in_header, in_rows = _read_tsv_rows(in_path)
+        in_header, in_rows = inputs.read(in_path)
         if not in_header or not in_rows:
             continue
 
@@ -1560,7 +1724,7 @@ def _export_recipe_aggregated(
         )
         scoring_rows = _inject_participant_values_into_rows(in_rows, participant_values)
 
-        resolved_ver = _resolve_variant_for_path(
+        resolved_ver = inputs.variant(
             output_prism_root,
             survey_task,
             in_path,
@@ -1572,6 +1736,7 @@ def _export_recipe_aggregated(
             include_raw=include_raw,
             resolved_version=resolved_ver,
             raw_exclude_columns=raw_exclude_columns,
+            score_block=inputs.scores(recipe_id, recipe, resolved_ver),
         )
         if not out_header:
             continue
@@ -1623,7 +1788,7 @@ def _export_recipe_aggregated(
         pass
 
     # Metadata building
-    sidecar_meta = _get_sidecar_for_task(output_prism_root, modality, survey_task)
+    sidecar_meta = inputs.sidecars.get(output_prism_root, modality, survey_task)
     var_labels, val_labels, score_details = _build_variable_metadata(
         list(df.columns),
         participants_meta,
@@ -1667,56 +1832,49 @@ def _export_recipe_aggregated(
     elif out_format == "xlsx":
         out_fname = out_root / f"{prefix}{recipe_id}.xlsx"
         try:
-            with pd.ExcelWriter(out_fname, engine="openpyxl") as writer:
-                df_for_write.to_excel(writer, sheet_name="Data", index=False)
-                # Codebook sheet
-                cb_rows = []
-                for var in df_for_write.columns:
-                    v_labels = val_labels.get(var, {})
-                    v_str = (
-                        "; ".join(
-                            f"{k}={v}"
-                            for k, v in sorted(
-                                v_labels.items(), key=lambda x: str(x[0])
-                            )
-                        )
-                        if v_labels
-                        else ""
-                    )
-                    det_str = ""
-                    if var in score_details:
-                        d = score_details[var]
-                        parts = []
-                        if d.get("method"):
-                            parts.append(f"method={d['method']}")
-                        if d.get("items"):
-                            parts.append(f"items={'+'.join(d['items'])}")
-                        if d.get("range"):
-                            r = d["range"]
-                            parts.append(
-                                f"range={r.get('min', '?')}-{r.get('max', '?')}"
-                            )
-                        det_str = "; ".join(parts)
-                    cb_rows.append(
-                        {
-                            "variable": var,
-                            "label": var_labels.get(var, ""),
-                            "values": v_str,
-                            "score_details": det_str,
-                        }
-                    )
-                pd.DataFrame(cb_rows).to_excel(
-                    writer, sheet_name="Codebook", index=False
-                )
-                if survey_meta:
-                    s_rows = [
-                        {"property": k, "value": str(v)} for k, v in survey_meta.items()
-                    ]
-                    pd.DataFrame(s_rows).to_excel(
-                        writer, sheet_name="Survey Info", index=False
-                    )
+            codebook_df = pd.DataFrame(
+                _codebook_rows(
+                    list(df_for_write.columns), var_labels, val_labels, score_details
+                ),
+                columns=CODEBOOK_COLUMNS,
+            )
+            sheets = [("Data", df_for_write), ("Codebook", codebook_df)]
+            if survey_meta:
+                s_rows = [
+                    {"property": k, "value": str(v)} for k, v in survey_meta.items()
+                ]
+                sheets.append(("Survey Info", pd.DataFrame(s_rows)))
+            write_xlsx(out_fname, sheets)
         except Exception:
-            df_for_write.to_excel(out_fname, index=False)
+            write_xlsx(out_fname, [("Data", df_for_write)])
+    elif out_format in COLUMNAR_OUTPUT_FORMATS:
+        out_fname = out_root / f"{prefix}{recipe_id}.{out_format}"
+        try:
+            write_columnar(
+                out_fname,
+                df_for_write,
+                out_format,
+                string_columns=_participants_categorical_columns(participants_meta),
+            )
+        except Exception as e:
+            if out_fname.exists():
+                out_fname.unlink()
+            out_fname = out_root / f"{prefix}{recipe_id}.csv"
+            df_for_write.to_csv(out_fname, index=False)
+            fallback_note = f"{out_format} export failed ({e}); wrote CSV instead"
+        _write_codebook_json(
+            out_root / f"{prefix}{recipe_id}_codebook.json",
+            var_labels,
+            val_labels,
+            score_details,
+            survey_meta,
+        )
+        _write_codebook_tsv(
+            out_root / f"{prefix}{recipe_id}_codebook.tsv",
+            var_labels,
+            val_labels,
+            score_details,
+        )
     elif out_format == "sav":
         out_fname = out_root / f"{prefix}{recipe_id}.sav"
         codebook_json_path = out_root / f"{prefix}{recipe_id}_codebook.json"
@@ -1804,6 +1962,25 @@ def _export_recipe_aggregated(
     return processed_count, 1, out_fname, fallback_note, nan_cols
 
 
+def _prism_output_path(
+    out_root: Path, recipe_id: str, in_path: Path, modality: str
+) -> Path | None:
+    """Per-file ``prism`` format output for one input (None without a subject)."""
+    sub_id, ses_id = _infer_sub_ses_from_path(in_path)
+    sub_id = _normalize_participant_id_for_join(sub_id) if sub_id else None
+    if not sub_id:
+        return None
+    base_stem, _in_suffix = _strip_suffix(in_path.stem)
+    return (
+        out_root
+        / recipe_id
+        / sub_id
+        / (ses_id or "ses-1")
+        / modality
+        / f"{base_stem}_desc-scores_{modality}.tsv"
+    )
+
+
 def _export_recipe_legacy(
     recipe_id: str,
     recipe: dict,
@@ -1816,8 +1993,11 @@ def _export_recipe_legacy(
     flat_key_to_idx: dict[tuple, int],
     participants_df: Optional[Any] = None,
     output_prism_root: Path | None = None,
+    inputs: _RecipeInputs | None = None,
 ) -> tuple[int, int]:
     """Process all files for one recipe using legacy (PRISM/Flat) per-file logic."""
+    if inputs is None:
+        inputs = _RecipeInputs()
     processed_count = 0
     written_count = 0
     participant_lookup = _build_participant_value_lookup(participants_df)
@@ -1842,7 +2022,7 @@ def _export_recipe_legacy(
             ses_id = "ses-1"
         run_id = _infer_run_from_path(in_path)
 
-        in_header, in_rows = _read_tsv_rows(in_path)
+        in_header, in_rows = inputs.read(in_path)
         if not in_header or not in_rows:
             continue
 
@@ -1853,7 +2033,7 @@ def _export_recipe_legacy(
         scoring_rows = _inject_participant_values_into_rows(in_rows, participant_values)
 
         resolved_ver = (
-            _resolve_variant_for_path(
+            inputs.variant(
                 output_prism_root,
                 survey_task,
                 in_path,
@@ -1868,6 +2048,7 @@ def _export_recipe_legacy(
             include_raw=include_raw,
             resolved_version=resolved_ver,
             raw_exclude_columns=raw_exclude_columns,
+            score_block=inputs.scores(recipe_id, recipe, resolved_ver),
         )
         if not out_header:
             break
@@ -1901,11 +2082,9 @@ def _export_recipe_legacy(
             written_count += 1
         else:
             # PRISM format: sub-*/ses-*/survey/*.tsv
-            out_dir = out_root / recipe_id / sub_id / ses_id / modality
-            stem = in_path.stem
-            base_stem, _in_suffix = _strip_suffix(stem)
-            new_stem = f"{base_stem}_desc-scores_{modality}"
-            out_path = out_dir / f"{new_stem}.tsv"
+            out_path = _prism_output_path(out_root, recipe_id, in_path, modality)
+            if out_path is None:
+                continue
             _write_tsv_rows(out_path, out_header, out_rows)
             written_count += 1
 
@@ -1937,29 +2116,31 @@ def _finalize_flat_output(
     if layout == "wide":
         try:
             df_flat = pd.DataFrame(flat_rows)
-            # Melt and Pivot to handle session-specific columns
+            # Pivot to session-specific columns; rows lacking an id value are
+            # skipped and missing scores do not create columns.
             _run_id_vars = ["run"] if has_run else []
             id_vars = ["participant_id", "session"] + _run_id_vars + ["survey"]
-            df_melt = df_flat.melt(id_vars=id_vars, value_vars=score_cols).dropna()
-            if has_run:
-                df_melt["col_name"] = (
-                    df_melt["variable"]
-                    + "_"
-                    + df_melt["session"]
-                    + "_"
-                    + df_melt["run"].fillna("").astype(str)
-                ).str.rstrip("_")
-            else:
-                df_melt["col_name"] = df_melt["variable"] + "_" + df_melt["session"]
-
-            df_wide = df_melt.pivot(
-                index="participant_id", columns="col_name", values="value"
+            df_flat = df_flat.loc[df_flat[id_vars].notna().all(axis=1)]
+            key_codes, key_labels = context_codes(
+                df_flat,
+                ["session"] + _run_id_vars,
+                lambda values: "_".join(str(v) for v in values),
             )
-            df_flat = df_wide.reset_index().fillna("n/a")
-
-            flat_header = ["participant_id"] + sorted(
-                [c for c in df_flat.columns if c != "participant_id"]
+            df_flat = pivot_wide(
+                df_flat,
+                score_cols,
+                key_codes,
+                key_labels,
+                column_name=(
+                    (lambda variable, key: f"{variable}_{key}".rstrip("_"))
+                    if has_run
+                    else (lambda variable, key: f"{variable}_{key}")
+                ),
+                drop_missing=True,
+                sort_columns=True,
             )
+
+            flat_header = list(df_flat.columns)
             final_rows = df_flat.to_dict("records")
         except Exception as e:
             if fallback_note is None:
@@ -1986,12 +2167,24 @@ def _finalize_flat_output(
     return flat_out_path, fallback_note, nan_cols
 
 
+def _template_version(metadata: dict) -> str | None:
+    """Return a template's ``Study.Version``, if declared."""
+    if isinstance(metadata, dict):
+        study = metadata.get("Study", {})
+        if isinstance(study, dict):
+            version = study.get("Version")
+            if version:
+                return str(version)
+    return None
+
+
 def _resolve_variant_for_path(
     prism_root: Path,
     task_name: str,
     in_path: Path,
     *,
     modality: str = "survey",
+    sidecars: _SidecarCache | None = None,
 ) -> str | None:
     """Resolve variant from filename acq, then from template Study.Version."""
     acq_value = _extract_acq_from_filename(in_path)
@@ -1999,16 +2192,463 @@ def _resolve_variant_for_path(
         return acq_value
 
     if prism_root and task_name:
-        metadata = _get_sidecar_for_task(prism_root, modality, task_name)
-        if isinstance(metadata, dict):
-            study = metadata.get("Study", {})
-            if isinstance(study, dict):
-                version = study.get("Version")
-                if version:
-                    return str(version)
+        if sidecars is None:
+            return _template_version(
+                _get_sidecar_for_task(prism_root, modality, task_name)
+            )
+        return sidecars.template_version(prism_root, modality, task_name)
     return None
 
 
+class _RecipeInputs:
+    """Per-run memo of parsed input TSVs, sidecars and recipe score tables.
+
+    Recipes that share input files are scored against one instance, so each
+    TSV is parsed once. Variants depend only on the file's ``acq-`` label and
+    the task template, so templates are resolved once per task. Cached rows
+    are shared between recipes and must not be mutated; the scoring helpers
+    copy rows first.
+    """
+
+    def __init__(self, sidecars: _SidecarCache | None = None) -> None:
+        self.sidecars = sidecars if sidecars is not None else _SidecarCache()
+        self._tables: dict[Path, tuple[list[str], list[dict[str, str]]]] = {}
+        self._score_tables: dict[str, dict[str | None, _ScoreBlock]] = {}
+
+    def read(self, path: Path) -> tuple[list[str], list[dict[str, str]]]:
+        table = self._tables.get(path)
+        if table is None:
+            table = self._tables[path] = _read_tsv_rows(path)
+        return table
+
+    def variant(
+        self,
+        prism_root: Path,
+        task_name: str,
+        in_path: Path,
+        *,
+        modality: str = "survey",
+    ) -> str | None:
+        return _resolve_variant_for_path(
+            prism_root, task_name, in_path, modality=modality, sidecars=self.sidecars
+        )
+
+    def scores(
+        self, recipe_id: str, recipe: dict, resolved_version: str | None
+    ) -> _ScoreBlock:
+        table = self._score_tables.get(recipe_id)
+        if table is None:
+            table = self._score_tables[recipe_id] = _recipe_score_table(recipe)
+        return table.get(resolved_version or None, table[None])
+
+
+@dataclass(frozen=True)
+class _RecipeRunOptions:
+    """Export settings shared by all recipe jobs of one run."""
+
+    out_root: Path
+    out_format: str
+    modality: str
+    lang: str
+    layout: str
+    include_raw: bool
+    merge_all: bool
+    include_recipe_prefix: bool
+    participants_df: Any
+    participants_meta: dict
+    output_prism_root: Path
+    selected_sessions: list[str] | None
+    missing_policy: str
+    missing_numeric_value: float | None
+    # Shipped to worker processes with the templates already loaded.
+    sidecars: _SidecarCache = field(default_factory=_SidecarCache)
+
+
+@dataclass(frozen=True)
+class _RecipeJob:
+    """One recipe (or raw-only task) and the input files it applies to."""
+
+    index: int
+    recipe_id: str
+    recipe: dict
+    matching: tuple[Path, ...]
+    survey_task: str
+    raw_only: bool = False
+
+
+@dataclass
+class _RecipeOutcome:
+    """What one recipe job produced; merged into the run result in job order."""
+
+    index: int
+    processed: int = 0
+    written: int = 0
+    out_path: Path | None = None
+    fallback_note: str | None = None
+    nan_cols: list[str] = field(default_factory=list)
+    merge_frame: Any = None
+    flat_rows: list[dict] = field(default_factory=list)
+    flat_keys: dict[tuple, int] = field(default_factory=dict)
+
+
+def _collect_merge_all_frame(
+    job: _RecipeJob, options: _RecipeRunOptions, inputs: _RecipeInputs
+) -> tuple[int, Any]:
+    """Score one recipe into its (prefixed) ``merge_all`` frame."""
+    import pandas as pd
+
+    rows_accum: list[dict[str, Any]] = []
+    processed = 0
+    participant_lookup = (
+        {} if job.raw_only else _build_participant_value_lookup(options.participants_df)
+    )
+    raw_exclude_columns = _participant_raw_exclude_columns(options.participants_df)
+
+    for in_path in job.matching:
+        processed += 1
+        sub_id, ses_id = _infer_sub_ses_from_path(in_path)
+        if not sub_id:
+            continue
+        sub_id = _normalize_participant_id_for_join(sub_id)
+        if not sub_id:
+            continue
+        if not ses_id:
+            ses_id = "ses-1"
+        run_id = _infer_run_from_path(in_path)
+
+        in_header, in_rows = inputs.read(in_path)
+        if not in_header or not in_rows:
+            continue
+
+        if job.raw_only:
+            scoring_rows = in_rows
+            resolved_ver = None
+        else:
+            participant_key = _participant_join_key(sub_id)
+            participant_values = (
+                participant_lookup.get(participant_key, {}) if participant_key else {}
+            )
+            scoring_rows = _inject_participant_values_into_rows(
+                in_rows, participant_values
+            )
+            resolved_ver = inputs.variant(
+                options.output_prism_root,
+                job.survey_task,
+                in_path,
+                modality=options.modality,
+            )
+        score_block = inputs.scores(job.recipe_id, job.recipe, resolved_ver)
+        out_header, out_rows = _apply_survey_derivative_recipe_to_rows(
+            job.recipe,
+            scoring_rows,
+            include_raw=job.raw_only or options.include_raw,
+            resolved_version=resolved_ver,
+            raw_exclude_columns=raw_exclude_columns,
+            score_block=score_block,
+        )
+        if not out_header:
+            continue
+
+        score_names = score_block.name_set
+
+        for score_row in out_rows:
+            merged = {"participant_id": sub_id, "session": ses_id}
+            if run_id is not None:
+                merged["run"] = run_id
+            for col in out_header:
+                prefixed_col = _merge_all_output_column_name(
+                    job.recipe_id,
+                    col,
+                    score_names=score_names,
+                    include_recipe_prefix=options.include_recipe_prefix,
+                )
+                merged[prefixed_col] = score_row.get(col, "n/a")
+            rows_accum.append(merged)
+
+    return processed, pd.DataFrame(rows_accum) if rows_accum else None
+
+
+def _run_recipe_job(
+    job: _RecipeJob, options: _RecipeRunOptions, inputs: _RecipeInputs
+) -> _RecipeOutcome:
+    outcome = _RecipeOutcome(index=job.index)
+    include_raw = job.raw_only or options.include_raw
+    if options.out_format in _TABULAR_OUTPUT_FORMATS:
+        if options.merge_all:
+            outcome.processed, outcome.merge_frame = _collect_merge_all_frame(
+                job, options, inputs
+            )
+            return outcome
+        (
+            outcome.processed,
+            outcome.written,
+            outcome.out_path,
+            outcome.fallback_note,
+            outcome.nan_cols,
+        ) = _export_recipe_aggregated(
+            recipe_id=job.recipe_id,
+            recipe=job.recipe,
+            matching=list(job.matching),
+            out_root=options.out_root,
+            out_format=options.out_format,
+            modality=options.modality,
+            lang=options.lang,
+            layout=options.layout,
+            include_raw=include_raw,
+            participants_df=options.participants_df,
+            participants_meta=options.participants_meta,
+            output_prism_root=options.output_prism_root,
+            survey_task=job.survey_task,
+            selected_sessions=options.selected_sessions,
+            missing_policy=options.missing_policy,
+            missing_numeric_value=options.missing_numeric_value,
+            inputs=inputs,
+        )
+        return outcome
+
+    # legacy behaviour (prism/flat per-participant outputs)
+    outcome.processed, outcome.written = _export_recipe_legacy(
+        recipe_id=job.recipe_id,
+        recipe=job.recipe,
+        matching=list(job.matching),
+        out_root=options.out_root,
+        out_format=options.out_format,
+        modality=options.modality,
+        include_raw=include_raw,
+        flat_rows=outcome.flat_rows,
+        flat_key_to_idx=outcome.flat_keys,
+        participants_df=options.participants_df,
+        output_prism_root=options.output_prism_root if job.raw_only else None,
+        inputs=inputs,
+    )
+    return outcome
+
+
+def _run_recipe_group(
+    jobs: list[_RecipeJob], options: _RecipeRunOptions
+) -> list[_RecipeOutcome]:
+    """Run jobs sharing input files against one input memo (worker entry point)."""
+    inputs = _RecipeInputs(options.sidecars)
+    return [_run_recipe_job(job, options, inputs) for job in jobs]
+
+
+def _group_recipe_jobs(jobs: list[_RecipeJob]) -> list[list[_RecipeJob]]:
+    """Group jobs connected by shared input files, in first-job order."""
+    parent = list(range(len(jobs)))
+
+    def _root(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    owner: dict[Path, int] = {}
+    for i, job in enumerate(jobs):
+        for path in job.matching:
+            first = _root(owner.setdefault(path, i))
+            current = _root(i)
+            if first != current:
+                parent[max(first, current)] = min(first, current)
+
+    groups: dict[int, list[_RecipeJob]] = {}
+    for i, job in enumerate(jobs):
+        groups.setdefault(_root(i), []).append(job)
+    return list(groups.values())
+
+
+def _recipe_worker_count(
+    max_workers: int | None, groups: list[list[_RecipeJob]]
+) -> int:
+    if getattr(sys, "frozen", False) or len(groups) < 2:
+        # Frozen desktop builds cannot re-launch themselves as workers.
+        return 1
+    if max_workers is None:
+        # Worker processes are opt-in: forking from a threaded server or
+        # re-importing a frozen/GUI entry point is not safe by default.
+        try:
+            max_workers = int(os.environ.get(RECIPES_WORKERS_ENV_VAR, "") or 1)
+        except ValueError:
+            max_workers = 1
+    if max_workers < 1:
+        file_count = sum(len(job.matching) for group in groups for job in group)
+        if file_count < RECIPES_PARALLEL_MIN_FILES:
+            return 1
+        max_workers = os.cpu_count() or 1
+    return max(1, min(max_workers, len(groups)))
+
+
+def _execute_recipe_jobs(
+    jobs: list[_RecipeJob],
+    options: _RecipeRunOptions,
+    max_workers: int | None = None,
+) -> list[_RecipeOutcome]:
+    """Score all jobs, in worker processes when worthwhile; returns job order."""
+    groups = _group_recipe_jobs(jobs)
+    workers = _recipe_worker_count(max_workers, groups)
+    if workers < 2:
+        outcomes = [
+            outcome for group in groups for outcome in _run_recipe_group(group, options)
+        ]
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+
+        # Largest groups first, so a big instrument does not start last.
+        by_size = sorted(
+            groups, key=lambda group: -sum(len(job.matching) for job in group)
+        )
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(_run_recipe_group, group, options) for group in by_size
+            ]
+            outcomes = [outcome for future in futures for outcome in future.result()]
+    return sorted(outcomes, key=lambda outcome: outcome.index)
+
+
+@dataclass
+class _IncrementalPlan:
+    """Outcome of comparing planned recipe jobs with their provenance sidecars."""
+
+    jobs: list[_RecipeJob]
+    """Jobs that still have to run; ``prism`` jobs narrowed to changed inputs."""
+    up_to_date: dict[str, list[Path]] = field(default_factory=dict)
+    """Recipe ids left untouched, with their recorded output files."""
+    pruned: list[str] = field(default_factory=list)
+    """Recipe ids whose ``prism`` outputs of deleted inputs were removed."""
+
+
+def _read_recipe_provenance(out_root: Path, recipe_id: str) -> dict | None:
+    try:
+        provenance = _read_json(out_root / f"{recipe_id}_provenance.json")
+    except Exception:
+        return None
+    return provenance if isinstance(provenance, dict) else None
+
+
+def _recorded_hashes(provenance: dict, key: str) -> dict[str, str]:
+    return {
+        str(entry.get("Path")): str(entry.get("SHA256"))
+        for entry in provenance.get(key) or []
+        if isinstance(entry, dict)
+    }
+
+
+def _current_hashes(
+    paths: list[Path], provenance: dict, hasher: _ProvenanceHasher
+) -> dict[str, str]:
+    """Hash ``paths``, reusing recorded hashes of files with unchanged size+mtime."""
+    recorded_stats = provenance.get("FileStats") or {}
+    recorded = {
+        **_recorded_hashes(provenance, "InputFiles"),
+        **_recorded_hashes(provenance, "ParticipantsFiles"),
+        **_recorded_hashes(provenance, "SidecarFiles"),
+    }
+    hashes: dict[str, str] = {}
+    for path in paths:
+        rel_path = hasher.rel_path(path)
+        hasher.reuse_recorded(
+            path, recorded.get(rel_path), recorded_stats.get(rel_path)
+        )
+        hashes[rel_path], _stats = hasher.digest(path)
+    return hashes
+
+
+def _remove_empty_parents(directory: Path, stop: Path) -> None:
+    """Remove *directory* and its parents up to (excluding) *stop* while empty."""
+    while directory != stop and stop in directory.parents:
+        try:
+            directory.rmdir()
+        except OSError:
+            return
+        directory = directory.parent
+
+
+def _plan_incremental_jobs(
+    jobs: list[_RecipeJob],
+    *,
+    out_root: Path,
+    prism_root: Path,
+    modality: str,
+    out_format: str,
+    combined_output: bool,
+    export_options: dict,
+    participants_files: list[Path],
+    hasher: _ProvenanceHasher,
+) -> _IncrementalPlan:
+    """Decide which recipe jobs an incremental run has to (re)compute.
+
+    A recipe is up to date when its provenance sidecar records the same
+    recipe digest, export options, PRISM version, participants files,
+    template sidecars and input files, and its recorded outputs still exist.
+    ``prism`` outputs are per input file, so only changed or new inputs are
+    re-scored there. A combined output (``flat``, ``merge_all``) is rebuilt
+    as a whole as soon as one of its recipes changed.
+    """
+    from src import __version__ as prism_version
+
+    run: list[_RecipeJob] = []
+    plan = _IncrementalPlan(jobs=run)
+    for job in jobs:
+        provenance = None if job.raw_only else _read_recipe_provenance(
+            out_root, job.recipe_id
+        )
+        if (
+            provenance is None
+            or (provenance.get("GeneratedBy") or {}).get("Version") != prism_version
+            or provenance.get("RecipeSHA256") != _recipe_sha256(job.recipe)
+            or provenance.get("ExportOptions") != export_options
+        ):
+            run.append(job)
+            continue
+
+        sidecars = _existing_sidecar_files(prism_root, modality, job.survey_task)
+        outputs = [prism_root / rel for rel in provenance.get("OutputFiles") or []]
+        if (
+            _current_hashes(participants_files, provenance, hasher)
+            != _recorded_hashes(provenance, "ParticipantsFiles")
+            or _current_hashes(sidecars, provenance, hasher)
+            != _recorded_hashes(provenance, "SidecarFiles")
+            or not all(path.is_file() for path in outputs)
+        ):
+            run.append(job)
+            continue
+
+        current = _current_hashes(list(job.matching), provenance, hasher)
+        recorded = _recorded_hashes(provenance, "InputFiles")
+        removed = sorted(set(recorded) - set(current))
+
+        if out_format == "prism":
+            changed = []
+            for path in job.matching:
+                rel_path = hasher.rel_path(path)
+                out_path = _prism_output_path(out_root, job.recipe_id, path, modality)
+                if current[rel_path] != recorded.get(rel_path) or (
+                    out_path is not None and not out_path.is_file()
+                ):
+                    changed.append(path)
+            for rel_path in removed:
+                stale = _prism_output_path(
+                    out_root, job.recipe_id, prism_root / rel_path, modality
+                )
+                if stale is not None and stale.is_file():
+                    stale.unlink()
+                    _remove_empty_parents(stale.parent, out_root / job.recipe_id)
+            if changed:
+                run.append(replace(job, matching=tuple(changed)))
+            if removed:
+                plan.pruned.append(job.recipe_id)
+            elif not changed:
+                plan.up_to_date[job.recipe_id] = outputs
+        elif current != recorded:
+            run.append(job)
+        else:
+            plan.up_to_date[job.recipe_id] = outputs
+
+    if combined_output and run:
+        # One changed recipe invalidates the shared output file.
+        return _IncrementalPlan(jobs=list(jobs))
+    return plan
+
+
 def compute_survey_recipes(
     *,
     prism_root: str | Path,
@@ -2027,6 +2667,8 @@ def compute_survey_recipes(
     anonymized: bool = False,
     missing_policy: str = "system-missing",
     missing_numeric_value: float | None = None,
+    max_workers: int | None = None,
+    incremental: bool = False,
 ) -> SurveyRecipesResult:
     """Compute survey scores in a PRISM dataset using recipes.
 
@@ -2036,7 +2678,8 @@ def compute_survey_recipes(
             recipe_dir: Optional custom folder containing recipe JSONs.
             survey: Optional comma-separated recipe ids to apply.
             sessions: Optional comma-separated session ids (e.g., "ses-1,ses-2").
-            out_format: "flat" (default), "prism", "csv", "xlsx", "sav".
+            out_format: "flat" (default), "prism", "csv", "xlsx", "sav",
+                "parquet", "feather" (the last two need pyarrow).
             lang: Language for metadata labels (e.g., "en", "de").
             layout: "long" (default) or "wide" for repeated measures.
             include_raw: If True, include original columns in the output.
@@ -2056,6 +2699,15 @@ def compute_survey_recipes(
                 (system-missing, text-na, text-nan, numeric-sentinel).
             missing_numeric_value: Numeric sentinel used when policy is
                 ``numeric-sentinel``.
+            max_workers: Processes used to score independent recipes. ``None``
+                reads ``PRISM_RECIPES_WORKERS`` and otherwise scores
+                in-process; ``0`` uses all cores for runs with many input
+                files. Outputs are identical either way.
+            incremental: If True, compare each recipe with its provenance
+                sidecar and only recompute outputs whose recipe, options,
+                templates, participants files or input files changed. With
+                ``prism`` format only changed subjects/sessions are
+                re-scored; outputs of deleted inputs are removed.
 
     Raises:
             ValueError: For user errors (missing paths, unknown recipes, etc.).
@@ -2075,8 +2727,10 @@ def compute_survey_recipes(
     out_format = _normalize_output_format(out_format or "prism")
     final_format = out_format
 
-    if out_format not in {"prism", "flat", "csv", "xlsx", "sav"}:
-        raise ValueError("--format must be one of: prism, flat, csv, xlsx, sav")
+    if out_format not in {"prism", "flat", *_TABULAR_OUTPUT_FORMATS}:
+        raise ValueError(
+            "--format must be one of: prism, flat, csv, xlsx, sav, parquet, feather"
+        )
 
     layout = str(layout or "long").strip().lower()
     if layout not in {"long", "wide"}:
@@ -2104,11 +2758,11 @@ def compute_survey_recipes(
             )
         raise ValueError(f"No {modality} TSV files found under: {prism_root}")
 
-    observed_task_ids = {
-        task for task in (_extract_task_from_survey_filename(p) for p in tsv_files) if task
-    }
+    file_tasks = {p: _extract_task_from_survey_filename(p) for p in tsv_files}
+    observed_task_ids = {task for task in file_tasks.values() if task}
 
     # 2. Load and validate recipes — project first, official fallback
+    sidecars = _SidecarCache()
     allow_empty_recipes = bool(include_raw and modality == "survey" and not survey)
     recipes, _loaded_recipes_dir = _load_and_validate_recipes(
         repo_root,
@@ -2117,6 +2771,7 @@ def compute_survey_recipes(
         recipe_dir=recipe_dir,
         prism_root=prism_root,
         allow_empty_recipes=allow_empty_recipes,
+        sidecars=sidecars,
     )
 
     # 3. Load participants data (for merging demographic data)
@@ -2148,6 +2803,7 @@ def compute_survey_recipes(
     raw_only_tasks: set[str] = set()
     matched_task_ids: set[str] = set()
     recipe_inputs: dict[str, list[Path]] = {}
+    recipe_tasks: dict[str, str] = {}
 
     flat_out_path: Path | None = None
     fallback_note: str | None = None
@@ -2156,7 +2812,8 @@ def compute_survey_recipes(
     merge_all_frames: list[tuple[str, Any]] = []
     merge_all_recipe_by_id: dict[str, dict] = {}
 
-    # If modality=survey/biometrics we will write one flat file per survey/biometric (recipe)
+    # Plan one job per matched recipe (one flat file per survey/biometric).
+    jobs: list[_RecipeJob] = []
     for recipe_id, rec in sorted(recipes.items()):
         recipe = rec["json"]
         # For biometrics, we might use BiometricName instead of TaskName
@@ -2172,7 +2829,7 @@ def compute_survey_recipes(
 
         matching = []
         for p in tsv_files:
-            task = _extract_task_from_survey_filename(p)
+            task = file_tasks[p]
             if (survey_acq and task == survey_key) or (
                 not survey_acq and _strip_acq_from_task(task) == survey_task
             ):
@@ -2185,134 +2842,16 @@ def compute_survey_recipes(
         applied_recipe_ids.add(recipe_id)
         applied_recipes_list.append(recipe)
         recipe_inputs[recipe_id] = list(matching)
-
-        if out_format in ("csv", "xlsx", "sav"):
-            if merge_all:
-                import pandas as pd
-
-                rows_accum: list[dict[str, Any]] = []
-                participant_lookup = _build_participant_value_lookup(participants_df)
-                raw_exclude_columns = _participant_raw_exclude_columns(participants_df)
-
-                for in_path in matching:
-                    processed_files += 1
-                    sub_id, ses_id = _infer_sub_ses_from_path(in_path)
-                    if not sub_id:
-                        continue
-                    sub_id = _normalize_participant_id_for_join(sub_id)
-                    if not sub_id:
-                        continue
-                    if not ses_id:
-                        ses_id = "ses-1"
-                    run_id = _infer_run_from_path(in_path)
-
-                    in_header, in_rows = _read_tsv_rows(in_path)
-                    if not in_header or not in_rows:
-                        continue
-
-                    participant_key = _participant_join_key(sub_id)
-                    participant_values = (
-                        participant_lookup.get(participant_key, {})
-                        if participant_key
-                        else {}
-                    )
-                    scoring_rows = _inject_participant_values_into_rows(
-                        in_rows, participant_values
-                    )
-
-                    resolved_ver = _resolve_variant_for_path(
-                        output_prism_root,
-                        survey_task,
-                        in_path,
-                        modality=modality,
-                    )
-                    out_header, out_rows = _apply_survey_derivative_recipe_to_rows(
-                        recipe,
-                        scoring_rows,
-                        include_raw=include_raw,
-                        resolved_version=resolved_ver,
-                        raw_exclude_columns=raw_exclude_columns,
-                    )
-                    if not out_header:
-                        continue
-
-                    score_names = _resolve_recipe_score_names(recipe, resolved_ver)
-
-                    for score_row in out_rows:
-                        merged = {"participant_id": sub_id, "session": ses_id}
-                        if run_id is not None:
-                            merged["run"] = run_id
-                        for col in out_header:
-                            prefixed_col = _merge_all_output_column_name(
-                                recipe_id,
-                                col,
-                                score_names=score_names,
-                                include_recipe_prefix=include_recipe_prefix,
-                            )
-                            merged[prefixed_col] = score_row.get(col, "n/a")
-                        rows_accum.append(merged)
-
-                if rows_accum:
-                    df = pd.DataFrame(rows_accum)
-                    merge_all_frames.append((recipe_id, df))
-                    merge_all_recipe_by_id[recipe_id] = recipe
-                    written_recipe_ids.add(recipe_id)
-            else:
-                (
-                    p_count,
-                    w_count,
-                    o_path,
-                    f_note,
-                    n_cols,
-                ) = _export_recipe_aggregated(
-                    recipe_id=recipe_id,
-                    recipe=recipe,
-                    matching=matching,
-                    out_root=out_root,
-                    out_format=out_format,
-                    modality=modality,
-                    lang=lang,
-                    layout=layout,
-                    include_raw=include_raw,
-                    participants_df=participants_df,
-                    participants_meta=participants_meta,
-                    output_prism_root=output_prism_root,
-                    survey_task=survey_task,
-                    selected_sessions=selected_sessions,
-                    missing_policy=missing_policy,
-                    missing_numeric_value=missing_numeric_value,
-                )
-                processed_files += p_count
-                written_files += w_count
-                if w_count > 0:
-                    written_recipe_ids.add(recipe_id)
-                    if written_files == 1:
-                        flat_out_path = o_path
-                    else:
-                        flat_out_path = out_root
-                if f_note:
-                    fallback_note = f_note
-                if n_cols:
-                    nan_report[recipe_id] = n_cols
-
-        else:
-            # legacy behaviour (prism/flat per-participant outputs)
-            p_count, w_count = _export_recipe_legacy(
+        recipe_tasks[recipe_id] = survey_task
+        jobs.append(
+            _RecipeJob(
+                index=len(jobs),
                 recipe_id=recipe_id,
                 recipe=recipe,
-                matching=matching,
-                out_root=out_root,
-                out_format=out_format,
-                modality=modality,
-                include_raw=include_raw,
-                flat_rows=flat_rows,
-                flat_key_to_idx=flat_key_to_idx,
-                participants_df=participants_df,
+                matching=tuple(matching),
+                survey_task=survey_task,
             )
-            processed_files += p_count
-            written_files += w_count
-            if w_count > 0:
-                written_recipe_ids.add(recipe_id)
+        )
 
     missing_input_tasks: tuple[str, ...] = ()
     if modality == "survey" and not survey and observed_task_ids:
@@ -2322,132 +2861,125 @@ def compute_survey_recipes(
     # rather than skipping them.
     if include_raw and modality == "survey" and missing_input_tasks:
         for missing_task in missing_input_tasks:
-            matching = [
-                path
-                for path in tsv_files
-                if _extract_task_from_survey_filename(path) == missing_task
-            ]
+            matching = [path for path in tsv_files if file_tasks[path] == missing_task]
             if not matching:
                 continue
+            jobs.append(
+                _RecipeJob(
+                    index=len(jobs),
+                    recipe_id=missing_task,
+                    recipe={
+                        "Kind": "survey",
+                        "Survey": {"TaskName": missing_task},
+                        "Scores": [],
+                    },
+                    matching=tuple(matching),
+                    survey_task=missing_task,
+                    raw_only=True,
+                )
+            )
 
-            raw_only_recipe = {
-                "Kind": "survey",
-                "Survey": {"TaskName": missing_task},
-                "Scores": [],
-            }
-
-            if out_format in ("csv", "xlsx", "sav"):
-                if merge_all:
-                    import pandas as pd
-
-                    raw_rows_accum: list[dict[str, Any]] = []
-                    raw_exclude_columns = _participant_raw_exclude_columns(participants_df)
-
-                    for in_path in matching:
-                        processed_files += 1
-                        sub_id, ses_id = _infer_sub_ses_from_path(in_path)
-                        if not sub_id:
-                            continue
-                        sub_id = _normalize_participant_id_for_join(sub_id)
-                        if not sub_id:
-                            continue
-                        if not ses_id:
-                            ses_id = "ses-1"
-                        run_id = _infer_run_from_path(in_path)
-
-                        in_header, in_rows = _read_tsv_rows(in_path)
-                        if not in_header or not in_rows:
-                            continue
-
-                        out_header, out_rows = _apply_survey_derivative_recipe_to_rows(
-                            raw_only_recipe,
-                            in_rows,
-                            include_raw=True,
-                            resolved_version=None,
-                            raw_exclude_columns=raw_exclude_columns,
-                        )
-                        if not out_header:
-                            continue
+    participants_files = [
+        p
+        for p in (
+            output_prism_root / "participants.tsv",
+            output_prism_root / "participants.json",
+        )
+        if p.is_file()
+    ]
+    hasher = _ProvenanceHasher(output_prism_root)
+    combined_output = out_format == "flat" or (
+        merge_all and out_format in _TABULAR_OUTPUT_FORMATS
+    )
+    export_options = {
+        "Modality": modality,
+        "Format": out_format,
+        "Layout": layout,
+        "Lang": lang,
+        "IncludeRaw": include_raw,
+        "MergeAll": merge_all,
+        "IncludeRecipePrefix": include_recipe_prefix,
+        "MissingPolicy": missing_policy,
+        "MissingNumericValue": missing_numeric_value,
+        "Sessions": selected_sessions or [],
+    }
+    if combined_output:
+        # The shared output depends on every recipe that goes into it.
+        export_options["CombinedWith"] = [job.recipe_id for job in jobs]
+
+    up_to_date: dict[str, list[Path]] = {}
+    if incremental:
+        plan = _plan_incremental_jobs(
+            jobs,
+            out_root=out_root,
+            prism_root=output_prism_root,
+            modality=modality,
+            out_format=out_format,
+            combined_output=combined_output,
+            export_options=export_options,
+            participants_files=participants_files,
+            hasher=hasher,
+        )
+        jobs = plan.jobs
+        up_to_date = plan.up_to_date
+        written_recipe_ids.update(plan.pruned)
 
-                        score_names = _resolve_recipe_score_names(
-                            raw_only_recipe,
-                            None,
-                        )
+    run_options = _RecipeRunOptions(
+        out_root=out_root,
+        out_format=out_format,
+        modality=modality,
+        lang=lang,
+        layout=layout,
+        include_raw=include_raw,
+        merge_all=merge_all,
+        include_recipe_prefix=include_recipe_prefix,
+        participants_df=participants_df,
+        participants_meta=participants_meta,
+        output_prism_root=output_prism_root,
+        selected_sessions=selected_sessions,
+        missing_policy=missing_policy,
+        missing_numeric_value=missing_numeric_value,
+        sidecars=sidecars,
+    )
+    outcomes = _execute_recipe_jobs(jobs, run_options, max_workers=max_workers)
+
+    # Apply outcomes in job order so results match a serial run exactly.
+    recipe_outputs: dict[str, list[Path]] = {}
+    for job, outcome in zip(jobs, outcomes):
+        processed_files += outcome.processed
+        done_ids = raw_only_tasks if job.raw_only else written_recipe_ids
+        if out_format in _TABULAR_OUTPUT_FORMATS and merge_all:
+            if outcome.merge_frame is not None:
+                merge_all_frames.append((job.recipe_id, outcome.merge_frame))
+                merge_all_recipe_by_id[job.recipe_id] = job.recipe
+                done_ids.add(job.recipe_id)
+            continue
 
-                        for raw_row in out_rows:
-                            merged = {"participant_id": sub_id, "session": ses_id}
-                            if run_id is not None:
-                                merged["run"] = run_id
-                            for col in out_header:
-                                prefixed_col = _merge_all_output_column_name(
-                                    missing_task,
-                                    col,
-                                    score_names=score_names,
-                                    include_recipe_prefix=include_recipe_prefix,
-                                )
-                                merged[prefixed_col] = raw_row.get(col, "n/a")
-                            raw_rows_accum.append(merged)
-
-                    if raw_rows_accum:
-                        df = pd.DataFrame(raw_rows_accum)
-                        merge_all_frames.append((missing_task, df))
-                        merge_all_recipe_by_id[missing_task] = raw_only_recipe
-                        raw_only_tasks.add(missing_task)
-                else:
-                    (
-                        p_count,
-                        w_count,
-                        o_path,
-                        f_note,
-                        n_cols,
-                    ) = _export_recipe_aggregated(
-                        recipe_id=missing_task,
-                        recipe=raw_only_recipe,
-                        matching=matching,
-                        out_root=out_root,
-                        out_format=out_format,
-                        modality=modality,
-                        lang=lang,
-                        layout=layout,
-                        include_raw=True,
-                        participants_df=participants_df,
-                        participants_meta=participants_meta,
-                        output_prism_root=output_prism_root,
-                        survey_task=missing_task,
-                        selected_sessions=selected_sessions,
-                        missing_policy=missing_policy,
-                        missing_numeric_value=missing_numeric_value,
-                    )
-                    processed_files += p_count
-                    written_files += w_count
-                    if w_count > 0:
-                        raw_only_tasks.add(missing_task)
-                        if written_files == 1:
-                            flat_out_path = o_path
-                        else:
-                            flat_out_path = out_root
-                    if f_note:
-                        fallback_note = f_note
-                    if n_cols:
-                        nan_report[f"{missing_task}_raw"] = n_cols
+        written_files += outcome.written
+        if outcome.written > 0:
+            done_ids.add(job.recipe_id)
+            if out_format in _TABULAR_OUTPUT_FORMATS:
+                flat_out_path = outcome.out_path if written_files == 1 else out_root
+                if outcome.out_path is not None:
+                    recipe_outputs[job.recipe_id] = [outcome.out_path]
+                    if (
+                        out_format in COLUMNAR_OUTPUT_FORMATS
+                        and outcome.out_path.suffix == ".csv"
+                    ):
+                        # Reported so anonymization rewrites the CSV fallback.
+                        final_format = "csv"
+        if outcome.fallback_note:
+            fallback_note = outcome.fallback_note
+        if outcome.nan_cols:
+            nan_key = f"{job.recipe_id}_raw" if job.raw_only else job.recipe_id
+            nan_report[nan_key] = outcome.nan_cols
+        for key, row_index in outcome.flat_keys.items():
+            row = outcome.flat_rows[row_index]
+            if key in flat_key_to_idx:
+                flat_rows[flat_key_to_idx[key]].update(row)
             else:
-                p_count, w_count = _export_recipe_legacy(
-                    recipe_id=missing_task,
-                    recipe=raw_only_recipe,
-                    matching=matching,
-                    out_root=out_root,
-                    out_format=out_format,
-                    modality=modality,
-                    include_raw=True,
-                    flat_rows=flat_rows,
-                    flat_key_to_idx=flat_key_to_idx,
-                    participants_df=participants_df,
-                    output_prism_root=output_prism_root,
-                )
-                processed_files += p_count
-                written_files += w_count
-                if w_count > 0:
-                    raw_only_tasks.add(missing_task)
+                flat_key_to_idx[key] = len(flat_rows)
+                flat_rows.append(row)
 
     # In merge_all mode, combine per-recipe frames into a single output file.
     if merge_all and merge_all_frames:
@@ -2498,13 +3030,11 @@ def compute_survey_recipes(
 
         _ensure_dir(out_root)
         out_stem = f"combined_{modality}"
-        ext_map = {"csv": ".csv", "xlsx": ".xlsx", "sav": ".sav"}
+        ext_map = {fmt: f".{fmt}" for fmt in _TABULAR_OUTPUT_FORMATS}
         out_path = out_root / f"{out_stem}{ext_map.get(out_format, '.csv')}"
 
         if layout == "wide":
             try:
-                import pandas as pd
-
                 id_cols = ["participant_id", "session"]
                 include_run_in_wide = False
                 if "run" in combined_df.columns:
@@ -2522,53 +3052,29 @@ def compute_survey_recipes(
                 ]
 
                 if score_cols:
-                    df_melt = combined_df.melt(
-                        id_vars=id_cols,
-                        value_vars=score_cols,
-                        var_name="variable",
-                        value_name="value",
-                    ).dropna(subset=["value"])
-                    if include_session_in_wide and include_run_in_wide:
-                        df_melt["col_name"] = (
-                            df_melt["variable"].astype(str)
-                            + "_"
-                            + df_melt["session"].astype(str)
-                            + "_"
-                            + df_melt["run"].fillna("").astype(str)
-                        ).str.rstrip("_")
-                    elif include_session_in_wide:
-                        df_melt["col_name"] = (
-                            df_melt["variable"].astype(str)
-                            + "_"
-                            + df_melt["session"].astype(str)
-                        )
-                    elif include_run_in_wide:
-                        df_melt["col_name"] = (
-                            df_melt["variable"].astype(str)
-                            + "_"
-                            + df_melt["run"].fillna("").astype(str)
-                        ).str.rstrip("_")
-                    else:
-                        df_melt["col_name"] = df_melt["variable"].astype(str)
-
-                    pivot_index = ["participant_id"]
-                    df_wide = df_melt.pivot(
-                        index=pivot_index,
-                        columns="col_name",
-                        values="value",
+                    context_cols = (
+                        ["session"] if include_session_in_wide else []
+                    ) + (["run"] if include_run_in_wide else [])
+                    strip_suffix = include_run_in_wide
+                    key_codes, key_labels = context_codes(
+                        combined_df,
+                        context_cols,
+                        lambda values: "_".join(_wide_context_text(v) for v in values),
                     )
-                    combined_df = df_wide.reset_index().fillna("n/a")
-
-                    ordered_cols = ["participant_id"] + sorted(
-                        [
-                            c
-                            for c in combined_df.columns
-                            if c != "participant_id"
-                        ]
+
+                    def _combined_column_name(variable: str, key: str) -> str:
+                        name = f"{variable}_{key}" if context_cols else variable
+                        return name.rstrip("_") if strip_suffix else name
+
+                    combined_df = pivot_wide(
+                        combined_df,
+                        score_cols,
+                        key_codes,
+                        key_labels,
+                        column_name=_combined_column_name,
+                        drop_missing=True,
+                        sort_columns=True,
                     )
-                    combined_df = combined_df.loc[
-                        :, [c for c in ordered_cols if c in combined_df.columns]
-                    ]
             except Exception as e:
                 if fallback_note is None:
                     fallback_note = f"Could not create wide combined layout: {e}"
@@ -2611,10 +3117,11 @@ def compute_survey_recipes(
                 lang=lang,
                 dataset_path=output_prism_root,
                 modality=modality,
+                sidecars=sidecars,
             )
         )
 
-        if out_format in {"csv", "sav"}:
+        if out_format in {"csv", "sav", *COLUMNAR_OUTPUT_FORMATS}:
             _write_codebook_json(
                 out_root / f"{out_stem}_codebook.json",
                 combined_var_labels,
@@ -2641,7 +3148,41 @@ def compute_survey_recipes(
                 missing_policy=missing_policy,
                 missing_numeric_value=missing_numeric_value,
             )
-            combined_for_write.to_excel(out_path, index=False)
+            combined_codebook_df = pd.DataFrame(
+                _codebook_rows(
+                    list(combined_for_write.columns),
+                    combined_var_labels,
+                    combined_value_labels,
+                    combined_score_details,
+                ),
+                columns=CODEBOOK_COLUMNS,
+            )
+            write_xlsx(
+                out_path,
+                [("Data", combined_for_write), ("Codebook", combined_codebook_df)],
+            )
+        elif out_format in COLUMNAR_OUTPUT_FORMATS:
+            combined_for_write = _apply_missing_export_policy(
+                combined_df,
+                missing_policy=missing_policy,
+                missing_numeric_value=missing_numeric_value,
+            )
+            try:
+                write_columnar(
+                    out_path,
+                    combined_for_write,
+                    out_format,
+                    string_columns=_participants_categorical_columns(
+                        participants_meta
+                    ),
+                )
+            except Exception as e:
+                if out_path.exists():
+                    out_path.unlink()
+                out_path = out_path.with_suffix(".csv")
+                combined_for_write.to_csv(out_path, index=False)
+                fallback_note = f"{out_format} export failed ({e}); wrote CSV instead"
+                final_format = "csv"
         elif out_format == "sav":
             try:
                 import pyreadstat
@@ -2713,7 +3254,7 @@ def compute_survey_recipes(
         flat_out_path = out_path
         print(f"✓ Combined {len(merge_all_frames)} surveys into: {out_path.name}")
 
-    if written_files == 0:
+    if written_files == 0 and not (written_recipe_ids or up_to_date):
         raise ValueError(f"No matching {modality} recipes applied.")
 
     # Copy only recipes that were actually matched to data files in this project.
@@ -2723,7 +3264,7 @@ def compute_survey_recipes(
         modality=modality,
     )
 
-    if out_format == "flat":
+    if out_format == "flat" and jobs:
         flat_out_path, fallback_note, flat_nan_cols = _finalize_flat_output(
             flat_rows=flat_rows,
             modality=modality,
@@ -2739,15 +3280,16 @@ def compute_survey_recipes(
         out_root=out_root, modality=modality, prism_root=output_prism_root
     )
 
-    participants_files = [
-        p
-        for p in (
-            output_prism_root / "participants.tsv",
-            output_prism_root / "participants.json",
+    if flat_out_path is None and up_to_date and out_format != "prism":
+        recorded_outputs = sorted({p for paths in up_to_date.values() for p in paths})
+        flat_out_path = (
+            recorded_outputs[0] if len(recorded_outputs) == 1 else out_root
         )
-        if p.is_file()
-    ]
-    hash_cache: dict[Path, str] = {}
+    if combined_output and flat_out_path is not None:
+        recipe_outputs = {
+            recipe_id: [flat_out_path] for recipe_id in written_recipe_ids
+        }
+
     for recipe_id in sorted(written_recipe_ids):
         input_files = recipe_inputs.get(recipe_id)
         if not input_files:
@@ -2759,7 +3301,12 @@ def compute_survey_recipes(
             prism_root=output_prism_root,
             input_files=input_files,
             participants_files=participants_files,
-            hash_cache=hash_cache,
+            hasher=hasher,
+            sidecar_files=_existing_sidecar_files(
+                output_prism_root, modality, recipe_tasks[recipe_id]
+            ),
+            export_options=export_options,
+            output_files=recipe_outputs.get(recipe_id, []),
         )
 
     _ensure_bidsignore_prism_rules(output_prism_root, modality)
@@ -2813,6 +3360,7 @@ def compute_survey_recipes(
         written_recipe_ids=tuple(sorted(written_recipe_ids)),
         missing_input_tasks=missing_input_tasks,
         raw_only_tasks=tuple(sorted(raw_only_tasks)),
+        up_to_date_recipe_ids=tuple(sorted(up_to_date)),
     )
 
 
@@ -2862,7 +3410,8 @@ def anonymize_recipe_output(
         out_root: Directory the recipe run already wrote output into
             (`SurveyRecipesResult.out_root`).
         out_format: The format the output was written in
-            (`sav`/`spss`, `csv`/`tsv`/`flat`/`prism`, or `xlsx`/`excel`).
+            (`sav`/`spss`, `csv`/`tsv`/`flat`/`prism`, `xlsx`/`excel`, or
+            `parquet`/`feather`, which also covers their CSV fallback files).
         id_length: Length of the random portion of a newly generated pseudonym.
         random_ids: If True, generate non-deterministic pseudonyms instead of
             deterministic ones.
@@ -2974,10 +3523,14 @@ def anonymize_recipe_output(
                     variable_value_labels=getattr(meta, "variable_value_labels", None),
                 )
 
-    elif out_format in ("csv", "tsv", "flat", "prism"):
+    elif out_format in ("csv", "tsv", "flat", "prism", *COLUMNAR_OUTPUT_FORMATS):
+        # Columnar exports fall back to CSV files when pyarrow is missing.
+        text_suffixes = (
+            (".csv",) if out_format in COLUMNAR_OUTPUT_FORMATS else (".tsv", ".csv")
+        )
         for root, _dirs, files in os.walk(output_dir):
             for file in files:
-                if not (file.endswith(".tsv") or file.endswith(".csv")):
+                if not file.endswith(text_suffixes):
                     continue
                 file_path = os.path.join(root, file)
                 sep = "\t" if file.endswith(".tsv") else ","
@@ -3032,15 +3585,44 @@ def anonymize_recipe_output(
                     if mask_questions and "question" in df_data.columns:
                         df_data["question"] = "[MASKED]"
 
-                with pd.ExcelWriter(file_path, engine="openpyxl") as writer:
-                    for sheet_name in sheet_names:
-                        sheet_frames[sheet_name].to_excel(
-                            writer, sheet_name=sheet_name, index=False
-                        )
+                write_xlsx(
+                    file_path,
+                    [(sheet_name, sheet_frames[sheet_name]) for sheet_name in sheet_names],
+                )
 
                 if file_had_participant_ids:
                     anonymized_count += 1
 
+    if out_format in COLUMNAR_OUTPUT_FORMATS:
+        for root, _dirs, files in os.walk(output_dir):
+            for file in files:
+                if not file.endswith(f".{out_format}"):
+                    continue
+                file_path = os.path.join(root, file)
+                if out_format == "parquet":
+                    df_data = pd.read_parquet(file_path)
+                else:
+                    df_data = pd.read_feather(file_path)
+
+                if "participant_id" in df_data.columns:
+                    before = df_data["participant_id"].copy()
+                    df_data["participant_id"] = df_data["participant_id"].map(
+                        lambda x: _map_pid(x, participant_mapping, canonical_mapping)
+                    )
+                    changed = int(
+                        (before.astype(str) != df_data["participant_id"].astype(str)).sum()
+                    )
+                    if changed > 0:
+                        anonymized_count += 1
+
+                if mask_questions and "question" in df_data.columns:
+                    df_data["question"] = "[MASKED]"
+
+                if out_format == "parquet":
+                    df_data.to_parquet(file_path, index=False)
+                else:
+                    df_data.reset_index(drop=True).to_feather(file_path)
+
     return anonymized_count, mapping_file_path
 
 
@@ -0,0 +1,266 @@
+"""Columnar long-to-wide pivot for recipe exports.
+
+Wide layouts turn one row per participant/session/run into one row per
+participant with ``<column>_<session>[_<run>]`` columns. Doing this with
+``DataFrame.melt`` + ``DataFrame.pivot`` materialises a long frame with one
+row per *cell* plus a string key built per row, which dominated memory for
+cohorts with many sessions, runs and score columns. This module pivots with
+integer codes instead:
+
+* :func:`context_codes` factorizes the session/run columns into categorical
+  codes and builds each distinct key label once.
+* :func:`pivot_wide` scatters value columns straight into one participant x
+  output-column matrix, moving cell values by reference so the formatted
+  score strings are never copied. The matrix (one pointer plus a one-byte
+  mask per cell) is allocated in full; the remaining memory budget
+  (``PRISM_WIDE_PIVOT_MEMORY_MB``) sizes the chunks of source columns read
+  in at once.
+
+Both reproduce the column names, column order, dtypes and ``n/a`` filling of
+the previous pandas pivot, including its upcast of integer (to ``float64``)
+and boolean (to ``object``) value columns when the pivot grid has gaps. Only
+value columns mixing strings with other dtypes differ: they all become
+``object``.
+"""
+
+from __future__ import annotations
+
+import os
+from typing import Any, Callable, Sequence
+
+WIDE_PIVOT_MEMORY_ENV_VAR = "PRISM_WIDE_PIVOT_MEMORY_MB"
+WIDE_PIVOT_MEMORY_MB = 256
+
+_DUPLICATE_ENTRIES = "Index contains duplicate entries, cannot reshape"
+
+
+def wide_pivot_memory_budget(memory_budget_mb: float | None = None) -> int:
+    """Return the pivot memory budget in bytes.
+
+    An explicit value wins, then ``PRISM_WIDE_PIVOT_MEMORY_MB``, then
+    :data:`WIDE_PIVOT_MEMORY_MB`.
+    """
+    if memory_budget_mb is None:
+        try:
+            memory_budget_mb = float(os.environ.get(WIDE_PIVOT_MEMORY_ENV_VAR, ""))
+        except ValueError:
+            memory_budget_mb = WIDE_PIVOT_MEMORY_MB
+    return max(1, int(memory_budget_mb * 1024 * 1024))
+
+
+def context_codes(
+    frame: Any,
+    columns: Sequence[str],
+    label: Callable[[tuple], str],
+) -> tuple[Any, list[str]]:
+    """Return per-row key codes and key labels for the context columns.
+
+    ``label`` maps one distinct tuple of context values to its key label; it is
+    called once per distinct combination, not per row. Combinations sharing a
+    label share a code.
+    """
+    import numpy as np
+    import pandas as pd
+
+    combined = np.zeros(len(frame), dtype=np.int64)
+    uniques: list[Any] = []
+    for column in columns:
+        codes, values = pd.factorize(frame[column], use_na_sentinel=False)
+        combined = combined * max(len(values), 1) + codes
+        uniques.append(values)
+
+    combo_ids, combo_codes = np.unique(combined, return_inverse=True)
+    labels: list[str] = []
+    for combo_id in combo_ids.tolist():
+        parts = []
+        for values in reversed(uniques):
+            combo_id, position = divmod(combo_id, max(len(values), 1))
+            parts.append(values[position])
+        labels.append(label(tuple(reversed(parts))))
+
+    label_codes, key_labels = pd.factorize(pd.Index(labels, dtype=object))
+    return label_codes[combo_codes.reshape(-1)], list(key_labels)
+
+
+def pivot_wide(
+    frame: Any,
+    value_columns: Sequence[str],
+    key_codes: Any,
+    key_labels: Sequence[str],
+    *,
+    column_name: Callable[[str, str], str],
+    index: str = "participant_id",
+    drop_missing: bool = False,
+    sort_columns: bool = False,
+    fill: str = "n/a",
+    memory_budget: int | None = None,
+) -> Any:
+    """Pivot ``value_columns`` to one row per ``index`` value.
+
+    Columns are named ``column_name(value_column, key_label)`` and ordered by
+    value column, then key label (or by name with ``sort_columns``). Missing
+    cells are filled with ``fill``. As with ``DataFrame.pivot`` (or, with
+    ``drop_missing``, ``melt`` + ``pivot``), output columns take the common
+    dtype of the value columns, upcast to ``float64`` for integers and
+    ``object`` for booleans when some participant lacks some output column;
+    columns holding a ``fill`` that does not fit the dtype are ``object``.
+    Value columns mixing strings with other dtypes (never produced by the
+    recipe exports, which pivot formatted strings) all come out ``object``.
+
+    ``memory_budget`` bounds the output matrix plus the source-column chunk
+    being scattered. The output matrix is always allocated in full, so a
+    budget below its size only reduces the chunks to one column.
+
+    With ``drop_missing`` (the melt + ``dropna`` semantics), missing values do
+    not count as entries: output columns and participants without any value
+    are omitted, columns with the same generated name are combined, and
+    duplicate entries are only an error when both hold a value. Otherwise
+    every (value column, key) pair becomes a column and a repeated
+    (participant, key) pair raises ``ValueError``.
+    """
+    import numpy as np
+    import pandas as pd
+
+    if memory_budget is None:
+        memory_budget = wide_pivot_memory_budget()
+
+    participant_codes, participants = pd.factorize(frame[index], sort=True)
+    if (participant_codes < 0).any():
+        raise ValueError(f"Missing {index} values, cannot reshape")
+    key_codes = np.asarray(key_codes, dtype=np.int64)
+    n_rows = len(frame)
+    n_keys = len(key_labels)
+    cells = participant_codes * n_keys + key_codes
+    unique_cells = len(np.unique(cells)) == n_rows
+    if not unique_cells and not drop_missing:
+        raise ValueError(_DUPLICATE_ENTRIES)
+
+    # Output position of every (value column, key) pair, in final column order.
+    key_order = sorted(range(n_keys), key=lambda k: key_labels[k])
+    names = [
+        column_name(str(value_columns[j]), key_labels[k])
+        for j in range(len(value_columns))
+        for k in key_order
+    ]
+    if drop_missing:
+        distinct = sorted(set(names)) if sort_columns else list(dict.fromkeys(names))
+        out_names = distinct
+        slot = {name: i for i, name in enumerate(distinct)}
+        ranked = np.array([slot[name] for name in names], dtype=np.int64)
+    else:
+        order = (
+            sorted(range(len(names)), key=names.__getitem__) if sort_columns else None
+        )
+        out_names = [names[i] for i in order] if order else names
+        ranked = np.empty(len(names), dtype=np.int64)
+        ranked[order if order else slice(None)] = np.arange(len(names))
+    key_rank = np.empty(n_keys, dtype=np.int64)
+    key_rank[key_order] = np.arange(n_keys)
+    # positions[j, k] -> output column of value column j under key k.
+    positions = ranked.reshape(len(value_columns), n_keys)[:, key_rank]
+    shared_slots = len(out_names) < len(names)
+
+    # Filled via ndarray.fill so every empty cell shares one ``fill`` object.
+    out = np.empty((len(participants), len(out_names)), dtype=object)
+    out.fill(fill)
+    # Cells that received a value; everything else holds ``fill``.
+    present = np.zeros(out.shape, dtype=bool)
+    check_entries = drop_missing and (not unique_cells or shared_slots)
+    # Columns are read in chunks from what the output matrix leaves of the
+    # budget: an object copy plus a missing mask per source cell.
+    chunk_budget = memory_budget - out.size * (out.itemsize + present.itemsize)
+    chunk = max(1, chunk_budget // max(n_rows * 9, 1))
+    for start in range(0, len(value_columns), chunk):
+        stop = min(start + chunk, len(value_columns))
+        block = frame.iloc[
+            :, frame.columns.get_indexer(list(value_columns[start:stop]))
+        ]
+        values = block.to_numpy(dtype=object, copy=True)
+        missing = block.isna().to_numpy()
+        for j in range(stop - start):
+            targets = positions[start + j][key_codes]
+            rows = ~missing[:, j]
+            if not drop_missing:
+                column = values[:, j]
+                column[~rows] = fill
+                out[participant_codes, targets] = column
+                present[participant_codes[rows], targets[rows]] = True
+                continue
+            row_participants = participant_codes[rows]
+            row_targets = targets[rows]
+            if check_entries and (
+                len(np.unique(cells[rows])) < len(row_participants)
+                or present[row_participants, row_targets].any()
+            ):
+                raise ValueError(_DUPLICATE_ENTRIES)
+            out[row_participants, row_targets] = values[rows, j]
+            present[row_participants, row_targets] = True
+        del block, values, missing
+
+    row_labels = np.asarray(participants, dtype=object)
+    if drop_missing:
+        keep_columns = present.any(axis=0)
+        keep_rows = present.any(axis=1)
+        if not keep_columns.all():
+            out, present = out[:, keep_columns], present[:, keep_columns]
+            out_names = [out_names[i] for i in np.flatnonzero(keep_columns).tolist()]
+        if not keep_rows.all():
+            out, present = out[keep_rows], present[keep_rows]
+            row_labels = row_labels[keep_rows]
+
+    # ``pivot`` unstacks the value columns as one block (``melt`` stacks them
+    # into one column), so all output columns share their common dtype.
+    if drop_missing:
+        grid_complete = bool(present.all())
+    else:
+        grid_complete = n_rows == len(participants) * n_keys
+    source_dtypes = [
+        frame.dtypes.iloc[i] for i in frame.columns.get_indexer(list(value_columns))
+    ]
+    dtype = _pivot_dtype(_common_dtype(source_dtypes), grid_complete)
+    if dtype == object or pd.api.types.is_string_dtype(dtype):
+        wide = pd.DataFrame(out, columns=out_names, dtype=dtype)
+    else:
+        if any(source_dtype != dtype for source_dtype in source_dtypes):
+            # Integers upcast by ``pivot`` stay floats next to a fill, too.
+            out[present] = out[present].astype(dtype)
+        # Like ``fillna(fill)``: only columns that received a fill become object.
+        complete = present.all(axis=0)
+        wide = pd.DataFrame(out, dtype=object)
+        wide = wide.astype({i: dtype for i in np.flatnonzero(complete).tolist()})
+        wide.columns = out_names
+    wide.insert(0, index, row_labels)
+    return wide
+
+
+def _common_dtype(dtypes: Sequence[Any]) -> Any:
+    """Dtype of the column ``melt`` builds from value columns of *dtypes*."""
+    import numpy as np
+    import pandas as pd
+
+    distinct = set(dtypes)
+    if len(distinct) == 1:
+        return distinct.pop()
+    if distinct and all(
+        pd.api.types.is_numeric_dtype(dtype) and not pd.api.types.is_bool_dtype(dtype)
+        for dtype in distinct
+    ):
+        try:
+            return np.result_type(*distinct)
+        except TypeError:
+            return object
+    return object
+
+
+def _pivot_dtype(dtype: Any, grid_complete: bool) -> Any:
+    """Dtype ``pivot`` gives a value column; gaps upcast ints and bools."""
+    import numpy as np
+    import pandas as pd
+
+    if grid_complete:
+        return dtype
+    if pd.api.types.is_bool_dtype(dtype):
+        return object
+    if pd.api.types.is_integer_dtype(dtype):
+        return np.dtype(np.float64)
+    return dtype
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import importlib
+import importlib.util
 from pathlib import Path
 from typing import Any
 
@@ -121,6 +122,11 @@ def inspect_pandas_support(bundle_root: str | Path | None = None) -> dict[str, A
     )
 
 
+def has_pyarrow_support() -> bool:
+    """Return whether pyarrow is installed for Parquet/Feather output."""
+    return importlib.util.find_spec("pyarrow") is not None
+
+
 def has_pyreadstat_write_support() -> bool:
     """Return whether pyreadstat can write SPSS .sav files in this runtime."""
 
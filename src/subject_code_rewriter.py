@@ -5,9 +5,17 @@ import re
 from dataclasses import dataclass
 from pathlib import Path
 
-from src.anonymizer import replace_participant_ids_in_text
+from src.anonymizer import build_participant_id_replacer
 from src.bids_entity_parser import BidsEntityParser
 from src.system_files import filter_system_files
+from src.text_rewrite_engine import (
+    PlannedTextChange,
+    RewriteJournal,
+    apply_text_rewrites,
+    find_stale_text_changes,
+    plan_text_rewrites,
+    rewrite_fingerprint,
+)
 
 _SUBJECT_TOKEN_PATTERN = re.compile(r"sub-[A-Za-z0-9]+")
 _IGNORED_DIR_NAMES = {
@@ -28,6 +36,7 @@ _TEXT_SUFFIXES = {
     ".md",
 }
 _TEXT_FILENAMES = {".bidsignore"}
+_JOURNAL_RELATIVE_PATH = Path(".prism") / "subject_rewrite_journal.jsonl"
 
 
 @dataclass(frozen=True)
@@ -47,7 +56,7 @@ class _RewritePlan:
     mapping: dict[str, str]
     directory_ops: list[_RenameOperation]
     file_ops: list[_RenameOperation]
-    preview_text_updates: list[Path]
+    preview_text_updates: list[PlannedTextChange]
     conflicts: list[str]
 
 
@@ -60,6 +69,10 @@ class SubjectCodeRewriter:
 
     def __init__(self, project_root: Path):
         self.project_root = Path(project_root)
+        # Most recent preview plan, keyed by its arguments, so an apply() that
+        # immediately follows preview() on the same instance consumes that
+        # plan (and its per-file content hashes) instead of re-scanning.
+        self._cached_plan: tuple[str, _RewritePlan] | None = None
 
     @staticmethod
     def _path_present(path: Path) -> bool:
@@ -111,6 +124,17 @@ class SubjectCodeRewriter:
             subjects=subjects,
             explicit_mapping=explicit_mapping,
         )
+        self._cached_plan = (
+            self._plan_key(
+                mode,
+                example_subject,
+                keep_fragment,
+                allow_many_to_one,
+                subjects,
+                explicit_mapping,
+            ),
+            plan,
+        )
         return self._plan_to_dict(plan, applied=False, cap_results=cap_results)
 
     def apply(
@@ -122,56 +146,52 @@ class SubjectCodeRewriter:
         subjects: list[str] | None = None,
         explicit_mapping: dict[str, str] | None = None,
     ) -> dict:
-        plan = self._build_plan(
-            mode,
-            example_subject=example_subject,
-            keep_fragment=keep_fragment,
-            allow_many_to_one=allow_many_to_one,
-            subjects=subjects,
-            explicit_mapping=explicit_mapping,
+        # Finish a rewrite that crashed partway before planning anything new:
+        # its renames already changed the tree a fresh plan would scan.
+        resumed = self._resume_pending_rewrite()
+        plan = self._take_cached_plan(
+            self._plan_key(
+                mode,
+                example_subject,
+                keep_fragment,
+                allow_many_to_one,
+                subjects,
+                explicit_mapping,
+            )
         )
+        if plan is None or resumed is not None:
+            plan = self._build_plan(
+                mode,
+                example_subject=example_subject,
+                keep_fragment=keep_fragment,
+                allow_many_to_one=allow_many_to_one,
+                subjects=subjects,
+                explicit_mapping=explicit_mapping,
+            )
         if plan.conflicts:
             raise ValueError(
                 "Subject rewrite cannot be applied due to conflicts: "
                 + "; ".join(plan.conflicts)
             )
-
-        for op in sorted(
-            plan.file_ops,
-            key=lambda item: (-len(item.old_path.parts), str(item.old_path)),
-        ):
-            if not self._path_present(op.old_path):
-                continue
-            op.new_path.parent.mkdir(parents=True, exist_ok=True)
-            op.old_path.rename(op.new_path)
-
-        for op in sorted(
-            plan.directory_ops,
-            key=lambda item: (-len(item.old_path.parts), str(item.old_path)),
-        ):
-            if not op.old_path.exists():
-                continue
-            op.new_path.parent.mkdir(parents=True, exist_ok=True)
-            # On case-insensitive filesystems, a pure case-change rename
-            # (e.g. SUB-01 -> sub-01) makes new_path.exists() true even
-            # though it's the same directory, not a real merge target.
-            is_case_only_change = (
-                op.old_path != op.new_path
-                and str(op.old_path).casefold() == str(op.new_path).casefold()
+        stale = find_stale_text_changes(plan.preview_text_updates)
+        if stale:
+            raise ValueError(
+                "Text files changed after the rewrite was previewed: "
+                + ", ".join(self._rel(path) for path in stale[:20])
+                + ("" if len(stale) <= 20 else ", ...")
             )
-            if (
-                allow_many_to_one
-                and not is_case_only_change
-                and op.old_path.is_dir()
-                and op.new_path.exists()
-                and op.new_path.is_dir()
-            ):
-                self._merge_directories(op.old_path, op.new_path)
-                continue
-            op.old_path.rename(op.new_path)
 
-        changed_text_files = self._rewrite_text_file_contents(plan.mapping)
+        changed_text_files = list(resumed or [])
+        if plan.mapping:
+            payload = self._journal_payload(plan)
+            journal = RewriteJournal(
+                self.project_root / _JOURNAL_RELATIVE_PATH,
+                rewrite_fingerprint(payload),
+                plan=payload,
+            )
+            changed_text_files.extend(self._run_journaled(journal))
         result = self._plan_to_dict(plan, applied=True)
+        result["resumed"] = resumed is not None
         result["text_update_count"] = len(changed_text_files)
         result["text_update_files"] = [
             path.relative_to(self.project_root).as_posix()
@@ -179,6 +199,126 @@ class SubjectCodeRewriter:
         ]
         return result
 
+    def _resume_pending_rewrite(self) -> list[Path] | None:
+        """Finish an interrupted apply; None when no journal is pending."""
+        journal = RewriteJournal.pending(self.project_root / _JOURNAL_RELATIVE_PATH)
+        if journal is None:
+            return None
+        try:
+            return self._run_journaled(journal)
+        except ValueError as exc:
+            raise ValueError(
+                f"{exc} (while resuming the interrupted rewrite recorded in "
+                f"{_JOURNAL_RELATIVE_PATH.as_posix()})"
+            ) from exc
+
+    def _journal_payload(self, plan: _RewritePlan) -> dict:
+        """Everything needed to finish *plan* without re-scanning the tree."""
+
+        def ops(items: list[_RenameOperation]) -> list[list[str]]:
+            ordered = sorted(
+                items, key=lambda item: (-len(item.old_path.parts), str(item.old_path))
+            )
+            return [[self._rel(op.old_path), self._rel(op.new_path)] for op in ordered]
+
+        return {
+            "mapping": dict(sorted(plan.mapping.items())),
+            "allow_many_to_one": bool(plan.allow_many_to_one),
+            "file_ops": ops(plan.file_ops),
+            "directory_ops": ops(plan.directory_ops),
+            "text_updates": [
+                [self._rel(change.path), change.sha256, change.rewritten_sha256]
+                for change in plan.preview_text_updates
+            ],
+        }
+
+    def _run_journaled(self, journal: RewriteJournal) -> list[Path]:
+        """Apply the journal's plan, skipping renames it records as done."""
+        payload = journal.plan or {}
+        root = self.project_root
+        mapping = {str(k): str(v) for k, v in (payload.get("mapping") or {}).items()}
+        allow_many_to_one = bool(payload.get("allow_many_to_one"))
+        file_ops = [
+            _RenameOperation(root / old, root / new)
+            for old, new in payload.get("file_ops") or []
+        ]
+        directory_ops = [
+            _RenameOperation(root / old, root / new)
+            for old, new in payload.get("directory_ops") or []
+        ]
+        text_updates = [
+            PlannedTextChange(root / rel, digest, rewritten)
+            for rel, digest, rewritten in payload.get("text_updates") or []
+        ]
+
+        with journal:
+            for index, op in enumerate(file_ops):
+                step = f"file:{index}"
+                if step in journal.steps:
+                    continue
+                if self._path_present(op.old_path):
+                    op.new_path.parent.mkdir(parents=True, exist_ok=True)
+                    op.old_path.rename(op.new_path)
+                journal.record_step(step)
+
+            for index, op in enumerate(directory_ops):
+                step = f"directory:{index}"
+                if step in journal.steps:
+                    continue
+                if op.old_path.exists():
+                    self._rename_directory(op, allow_many_to_one)
+                journal.record_step(step)
+
+            return self._rewrite_text_file_contents(
+                mapping, directory_ops, file_ops, text_updates, journal
+            )
+
+    def _rename_directory(self, op: _RenameOperation, allow_many_to_one: bool) -> None:
+        op.new_path.parent.mkdir(parents=True, exist_ok=True)
+        # On case-insensitive filesystems, a pure case-change rename
+        # (e.g. SUB-01 -> sub-01) makes new_path.exists() true even
+        # though it's the same directory, not a real merge target.
+        is_case_only_change = (
+            op.old_path != op.new_path
+            and str(op.old_path).casefold() == str(op.new_path).casefold()
+        )
+        if (
+            allow_many_to_one
+            and not is_case_only_change
+            and op.old_path.is_dir()
+            and op.new_path.exists()
+            and op.new_path.is_dir()
+        ):
+            self._merge_directories(op.old_path, op.new_path)
+            return
+        op.old_path.rename(op.new_path)
+
+    @staticmethod
+    def _plan_key(
+        mode: str,
+        example_subject: str | None,
+        keep_fragment: str | None,
+        allow_many_to_one: bool,
+        subjects: list[str] | None,
+        explicit_mapping: dict[str, str] | None,
+    ) -> str:
+        return rewrite_fingerprint(
+            [
+                mode,
+                example_subject,
+                keep_fragment,
+                bool(allow_many_to_one),
+                list(subjects) if subjects is not None else None,
+                explicit_mapping,
+            ]
+        )
+
+    def _take_cached_plan(self, key: str) -> _RewritePlan | None:
+        cached, self._cached_plan = self._cached_plan, None
+        if cached is None or cached[0] != key:
+            return None
+        return cached[1]
+
     def _build_plan(
         self,
         mode: str,
@@ -492,8 +632,9 @@ class SubjectCodeRewriter:
 
     def _build_file_rename_ops(self, mapping: dict[str, str]) -> list[_RenameOperation]:
         ops: list[_RenameOperation] = []
+        replace_ids = build_participant_id_replacer(mapping)
         for file_path in self._iter_files():
-            new_name = replace_participant_ids_in_text(file_path.name, mapping)
+            new_name = replace_ids(file_path.name)
             if new_name == file_path.name:
                 continue
             new_path = file_path.with_name(new_name)
@@ -501,29 +642,41 @@ class SubjectCodeRewriter:
                 ops.append(_RenameOperation(old_path=file_path, new_path=new_path))
         return ops
 
-    def _preview_text_updates(self, mapping: dict[str, str]) -> list[Path]:
-        updated: list[Path] = []
-        for file_path in self._iter_text_files():
-            original_text = self._read_text_file(file_path)
-            if original_text is None:
-                continue
-            rewritten_text = replace_participant_ids_in_text(original_text, mapping)
-            if rewritten_text != original_text:
-                updated.append(file_path)
-        return updated
-
-    def _rewrite_text_file_contents(self, mapping: dict[str, str]) -> list[Path]:
-        changed: list[Path] = []
-        for file_path in self._iter_text_files():
-            original_text = self._read_text_file(file_path)
-            if original_text is None:
-                continue
-            rewritten_text = replace_participant_ids_in_text(original_text, mapping)
-            if rewritten_text == original_text:
-                continue
-            file_path.write_text(rewritten_text, encoding="utf-8")
-            changed.append(file_path)
-        return changed
+    def _preview_text_updates(self, mapping: dict[str, str]) -> list[PlannedTextChange]:
+        return plan_text_rewrites(
+            self._iter_text_files(), build_participant_id_replacer(mapping)
+        )
+
+    def _rewrite_text_file_contents(
+        self,
+        mapping: dict[str, str],
+        directory_ops: list[_RenameOperation],
+        file_ops: list[_RenameOperation],
+        text_updates: list[PlannedTextChange],
+        journal: RewriteJournal,
+    ) -> list[Path]:
+        """Rewrite the planned text files at their post-rename locations."""
+        if not text_updates:
+            return []
+
+        directory_names = {op.old_path: op.new_path.name for op in directory_ops}
+        file_names = {op.old_path: op.new_path.name for op in file_ops}
+
+        def relocate(path: Path) -> Path:
+            parts = list(path.relative_to(self.project_root).parts)
+            current = self.project_root
+            for index, part in enumerate(parts[:-1]):
+                current = current / part
+                parts[index] = directory_names.get(current, part)
+            parts[-1] = file_names.get(path, parts[-1])
+            return self.project_root.joinpath(*parts)
+
+        return apply_text_rewrites(
+            text_updates,
+            build_participant_id_replacer(mapping),
+            relocate=relocate,
+            journal=journal,
+        )
 
     def _merge_directories(self, source_dir: Path, target_dir: Path) -> None:
         for child in source_dir.iterdir():
@@ -542,9 +695,10 @@ class SubjectCodeRewriter:
 
     def _detect_final_file_path_collisions(self, mapping: dict[str, str]) -> list[str]:
         rewritten_to_sources: dict[str, list[str]] = {}
+        replace_ids = build_participant_id_replacer(mapping)
         for file_path in self._iter_files():
             rel = file_path.relative_to(self.project_root).as_posix()
-            rewritten_rel = replace_participant_ids_in_text(rel, mapping)
+            rewritten_rel = replace_ids(rel)
             rewritten_to_sources.setdefault(rewritten_rel, []).append(rel)
 
         conflicts: list[str] = []
@@ -561,13 +715,6 @@ class SubjectCodeRewriter:
             )
         return conflicts
 
-    @staticmethod
-    def _read_text_file(file_path: Path) -> str | None:
-        try:
-            return file_path.read_text(encoding="utf-8")
-        except (UnicodeDecodeError, OSError):
-            return None
-
     def _detect_rename_conflicts(
         self,
         ops: list[_RenameOperation],
@@ -688,8 +835,8 @@ class SubjectCodeRewriter:
                 for op in cap(plan.file_ops)
             ],
             "text_update_files": [
-                path.relative_to(self.project_root).as_posix()
-                for path in cap(plan.preview_text_updates)
+                change.path.relative_to(self.project_root).as_posix()
+                for change in cap(plan.preview_text_updates)
             ],
             "conflicts": plan.conflicts,
         }
@@ -0,0 +1,352 @@
+"""
+Shared text-content rewrite engine for the project rewriters.
+
+``SubjectCodeRewriter`` and ``BidsEntityRewriter`` both rewrite identifiers
+inside small metadata files (JSON sidecars, TSV tables, ``.bidsignore``)
+after renaming the files themselves. This module does the file I/O for both:
+
+* :func:`plan_text_rewrites` reads candidate files in a thread pool and
+  returns one :class:`PlannedTextChange` per file whose content would change,
+  carrying the SHA-256 of the current bytes and of the bytes that will be
+  written.
+* :func:`apply_text_rewrites` consumes that plan directly: each planned file
+  is re-read once, checked against its planned hashes, and replaced through a
+  temporary file and ``os.replace`` so a crash never leaves a half-written
+  sidecar behind.
+* A :class:`RewriteJournal` records every completed file. When an interrupted
+  apply is retried with the same rewrite, files the journal already marks as
+  done are recognised by their hash and not rewritten a second time. A
+  journal can also carry the whole rewrite plan and its completed rename
+  steps, so a rewriter can finish a crashed run before planning new work.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Iterable
+
+TEXT_REWRITE_MAX_WORKERS = 8
+_JOURNAL_VERSION = 2
+
+
+@dataclass(frozen=True)
+class PlannedTextChange:
+    """One text file whose content a rewrite will change."""
+
+    path: Path
+    sha256: str
+    rewritten_sha256: str
+
+
+def rewrite_fingerprint(spec: Any) -> str:
+    """Return a stable digest identifying one rewrite (mapping/replacements)."""
+    payload = json.dumps(spec, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _read_text(path: Path) -> tuple[str, str] | None:
+    """Return ``(text, sha256 of raw bytes)``, or None if unreadable/not UTF-8.
+
+    Newlines are translated exactly like ``Path.read_text`` does, so the
+    rewritten output matches what the previous ``read_text``/``write_text``
+    round trip produced.
+    """
+    try:
+        data = path.read_bytes()
+        text = data.decode("utf-8")
+    except (UnicodeDecodeError, OSError):
+        return None
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text, hashlib.sha256(data).hexdigest()
+
+
+def _encoded_sha256(text: str) -> str:
+    if os.linesep != "\n":
+        text = text.replace("\n", os.linesep)
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _atomic_write_text(path: Path, text: str) -> None:
+    # Write through symlinks (unlocked DataLad content, user links) rather
+    # than replacing the link itself with a regular file.
+    target = Path(os.path.realpath(path))
+    fd, tmp_name = tempfile.mkstemp(
+        dir=str(target.parent), prefix=f".{target.name}.", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            handle.write(text)
+        try:
+            shutil.copymode(target, tmp_name)
+        except OSError:
+            pass
+        os.replace(tmp_name, target)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+
+
+def _load_digest(path: Path) -> str | None:
+    loaded = _read_text(path)
+    return loaded[1] if loaded is not None else None
+
+
+def _worker_count(max_workers: int | None, item_count: int) -> int:
+    workers = max_workers or min(TEXT_REWRITE_MAX_WORKERS, item_count)
+    return max(1, workers)
+
+
+def plan_text_rewrites(
+    paths: Iterable[Path],
+    rewrite: Callable[[str], str],
+    *,
+    max_workers: int | None = None,
+) -> list[PlannedTextChange]:
+    """Return the planned changes for *paths*, in input order.
+
+    Files that cannot be read as UTF-8 are skipped, as are files whose
+    content *rewrite* leaves untouched.
+    """
+    candidates = list(paths)
+    if not candidates:
+        return []
+
+    def _plan_one(path: Path) -> PlannedTextChange | None:
+        loaded = _read_text(path)
+        if loaded is None:
+            return None
+        text, digest = loaded
+        rewritten = rewrite(text)
+        if rewritten == text:
+            return None
+        return PlannedTextChange(
+            path=path, sha256=digest, rewritten_sha256=_encoded_sha256(rewritten)
+        )
+
+    with ThreadPoolExecutor(
+        max_workers=_worker_count(max_workers, len(candidates))
+    ) as pool:
+        planned = list(pool.map(_plan_one, candidates))
+    return [change for change in planned if change is not None]
+
+
+class RewriteJournal:
+    """Append-only record of text files a rewrite has already completed.
+
+    The first line identifies the rewrite by fingerprint and may carry the
+    rewrite's *plan*; every further line names one finished file and the
+    hash it was left with, or one finished plan step (e.g. a rename). A
+    journal written for a different rewrite is discarded on open.
+    """
+
+    def __init__(
+        self, path: Path, fingerprint: str, plan: dict[str, Any] | None = None
+    ):
+        self.path = Path(path)
+        self.fingerprint = fingerprint
+        self.plan = plan
+        self.completed: dict[str, str] = {}
+        self.steps: set[str] = set()
+        self._lock = threading.Lock()
+        self._load()
+
+    @staticmethod
+    def _read_lines(path: Path) -> tuple[dict[str, Any], list[str]]:
+        try:
+            lines = path.read_text(encoding="utf-8").splitlines()
+        except (OSError, UnicodeDecodeError):
+            return {}, []
+        try:
+            header = json.loads(lines[0]) if lines else {}
+        except json.JSONDecodeError:
+            header = {}
+        if not isinstance(header, dict) or header.get("version") != _JOURNAL_VERSION:
+            return {}, []
+        return header, lines[1:]
+
+    @classmethod
+    def pending(cls, path: Path) -> "RewriteJournal | None":
+        """Return the unfinished journal at *path* if it carries a plan."""
+        header, _lines = cls._read_lines(Path(path))
+        fingerprint = header.get("fingerprint")
+        if not isinstance(fingerprint, str) or not isinstance(header.get("plan"), dict):
+            return None
+        return cls(path, fingerprint)
+
+    def _load(self) -> None:
+        header, lines = self._read_lines(self.path)
+        if header.get("fingerprint") != self.fingerprint:
+            return
+        if self.plan is None and isinstance(header.get("plan"), dict):
+            self.plan = header["plan"]
+        for line in lines:
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                # A torn final line from an interrupted run.
+                continue
+            if not isinstance(entry, dict):
+                continue
+            if entry.get("step"):
+                self.steps.add(str(entry["step"]))
+            elif entry.get("path") and entry.get("sha256"):
+                self.completed[str(entry["path"])] = str(entry["sha256"])
+
+    def is_completed(self, path: Path, digest: str) -> bool:
+        return self.completed.get(str(path)) == digest
+
+    def __enter__(self) -> "RewriteJournal":
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        existing = dict(self.completed)
+        self._handle = open(self.path, "w", encoding="utf-8")
+        header: dict[str, Any] = {
+            "version": _JOURNAL_VERSION,
+            "fingerprint": self.fingerprint,
+        }
+        if self.plan is not None:
+            header["plan"] = self.plan
+        self._write(header)
+        for step in sorted(self.steps):
+            self._write({"step": step})
+        for path_text, digest in existing.items():
+            self._write({"path": path_text, "sha256": digest})
+        return self
+
+    def record(self, path: Path, digest: str) -> None:
+        with self._lock:
+            self.completed[str(path)] = digest
+            self._write({"path": str(path), "sha256": digest})
+
+    def record_step(self, step: str) -> None:
+        """Mark one plan step (e.g. a rename) as done."""
+        with self._lock:
+            self.steps.add(step)
+            self._write({"step": step})
+
+    def _write(self, entry: dict[str, Any]) -> None:
+        self._handle.write(json.dumps(entry) + "\n")
+        self._handle.flush()
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self._handle.close()
+        if exc_type is None:
+            self.discard()
+
+    def discard(self) -> None:
+        """Remove the journal (and its folder, when left empty)."""
+        try:
+            self.path.unlink()
+        except OSError:
+            return
+        try:
+            self.path.parent.rmdir()
+        except OSError:
+            pass
+
+
+def apply_text_rewrites(
+    changes: Iterable[PlannedTextChange],
+    rewrite: Callable[[str], str],
+    *,
+    relocate: Callable[[Path], Path] | None = None,
+    journal: RewriteJournal | None = None,
+    max_workers: int | None = None,
+) -> list[Path]:
+    """Apply planned *changes* and return the rewritten paths in plan order.
+
+    *relocate* maps a planned path to where the file lives now (the rewriters
+    rename files before rewriting their content). A file whose bytes match
+    neither the planned original nor the planned result was edited after the
+    plan was made; it is left untouched and reported in a ``ValueError``
+    once every other file has been processed.
+    """
+    planned = list(changes)
+    if not planned:
+        return []
+
+    def _apply_one(change: PlannedTextChange) -> tuple[Path, bool, bool]:
+        path = relocate(change.path) if relocate is not None else change.path
+        loaded = _read_text(path)
+        if loaded is None:
+            return path, False, False
+        text, digest = loaded
+        if digest == change.rewritten_sha256 or (
+            journal is not None and journal.is_completed(path, digest)
+        ):
+            return path, True, False
+        if digest != change.sha256:
+            return path, False, True
+        _atomic_write_text(path, rewrite(text))
+        if journal is not None:
+            journal.record(path, change.rewritten_sha256)
+        return path, True, False
+
+    results: dict[int, tuple[Path, bool, bool]] = {}
+    first_error: BaseException | None = None
+    with ThreadPoolExecutor(
+        max_workers=_worker_count(max_workers, len(planned))
+    ) as pool:
+        futures = {
+            pool.submit(_apply_one, change): index
+            for index, change in enumerate(planned)
+        }
+        for future in as_completed(futures):
+            try:
+                results[futures[future]] = future.result()
+            except BaseException as exc:  # keep finishing the other files
+                if first_error is None:
+                    first_error = exc
+    if first_error is not None:
+        raise first_error
+
+    changed: list[Path] = []
+    stale: list[Path] = []
+    for index in range(len(planned)):
+        path, was_changed, is_stale = results[index]
+        if was_changed:
+            changed.append(path)
+        if is_stale:
+            stale.append(path)
+    if stale:
+        raise ValueError(
+            "Text files changed after the rewrite was previewed: "
+            + ", ".join(str(path) for path in stale[:20])
+            + ("" if len(stale) <= 20 else ", ...")
+        )
+    return changed
+
+
+def find_stale_text_changes(
+    changes: Iterable[PlannedTextChange],
+    *,
+    max_workers: int | None = None,
+) -> list[Path]:
+    """Return planned files whose bytes match neither planned hash.
+
+    Rewriters call this before renaming anything, so a file edited after the
+    preview stops the apply while the tree is still untouched.
+    """
+    planned = list(changes)
+    if not planned:
+        return []
+    with ThreadPoolExecutor(
+        max_workers=_worker_count(max_workers, len(planned))
+    ) as pool:
+        digests = list(pool.map(lambda change: _load_digest(change.path), planned))
+    return [
+        change.path
+        for change, digest in zip(planned, digests)
+        if digest is not None and digest not in (change.sha256, change.rewritten_sha256)
+    ]
@@ -44,6 +44,8 @@ import src.api as api_mod
 missing = [name for name in {_CHECKED_NAMES!r} if getattr(api_mod, name, None) is None]
 if missing:
     raise SystemExit("missing: " + ",".join(missing))
+if not api_mod._VALIDATOR_AVAILABLE:
+    raise SystemExit("validator reported unavailable")
 print("OK")
 """
 
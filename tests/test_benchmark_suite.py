@@ -0,0 +1,85 @@
+"""Benchmark suite: synthetic project generation, timing and run history."""
+
+from __future__ import annotations
+
+import sys
+from dataclasses import replace
+from pathlib import Path
+
+APP_DIR = Path(__file__).resolve().parents[1] / "app"
+if str(APP_DIR) not in sys.path:
+    sys.path.insert(0, str(APP_DIR))
+
+from benchmarks import harness  # noqa: E402
+from benchmarks.datasets import PROFILES, generate_benchmark_project  # noqa: E402
+
+
+def test_generated_project_is_valid_and_deterministic(tmp_path):
+    from src.runner import validate_dataset
+
+    spec = PROFILES["tiny"]
+    first = generate_benchmark_project(tmp_path / "a", spec)
+    second = generate_benchmark_project(tmp_path / "b", spec)
+
+    issues, _stats = validate_dataset(str(first.root))
+    assert [issue for issue in issues if issue[0] == "ERROR"] == []
+    assert len(list(first.root.glob("sub-*/ses-*/survey/*_survey.tsv"))) == (
+        spec.subjects * spec.sessions * spec.surveys
+    )
+    assert len(list(first.physio_source_dir.glob("*.edf"))) == (
+        spec.subjects * spec.sessions
+    )
+    assert first.lsa_archives and first.wide_exports
+    for relative in ("participants.tsv", "code/rawdata/survey_wide_ses-1.csv"):
+        assert (first.root / relative).read_bytes() == (
+            second.root / relative
+        ).read_bytes()
+
+
+def test_run_benchmarks_records_history_and_detects_regressions(tmp_path):
+    record = harness.run_benchmarks(
+        profile="tiny",
+        cases=["validate", "recipes", "batch_convert"],
+        repeats=1,
+        isolate=False,
+        work_dir=tmp_path / "work",
+    )
+
+    assert set(record["results"]) == {"validate", "recipes", "batch_convert"}
+    for result in record["results"].values():
+        assert result["error"] is None
+        assert result["median_seconds"] is not None
+    assert record["spec"]["subjects"] == PROFILES["tiny"].subjects
+
+    history_path = tmp_path / "history.jsonl"
+    harness.append_history(record, history_path)
+    harness.append_history(record, history_path)
+    history = harness.load_history(history_path)
+    assert len(history) == 2
+
+    slower = dict(
+        record,
+        results={
+            "validate": dict(
+                record["results"]["validate"],
+                median_seconds=record["results"]["validate"]["median_seconds"] + 1.0,
+            ),
+        },
+    )
+    regressions = harness.compare_to_history(slower, history)
+    assert [item["case"] for item in regressions] == ["validate"]
+    assert harness.compare_to_history(record, history) == []
+
+    other_spec = dict(slower, spec=dict(record["spec"], subjects=999))
+    assert harness.compare_to_history(other_spec, history) == []
+
+
+def test_mutating_case_works_on_a_copy(tmp_path):
+    project = generate_benchmark_project(
+        tmp_path / "p", replace(PROFILES["tiny"], biometrics=False, physio_seconds=0)
+    )
+
+    result = harness.run_case(harness.CASES["recipes"], project, repeats=2)
+
+    assert result.error is None and len(result.seconds) == 2
+    assert not (project.root / "derivatives" / "survey").exists()
@@ -0,0 +1,229 @@
+"""Caching and change-scoped re-runs of the external BIDS validator."""
+
+import json
+import os
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+sys.path.insert(
+    0, os.path.join(os.path.dirname(os.path.dirname(__file__)), "app", "src")
+)
+
+import bids_validator  # noqa: E402
+import bids_validator_cache  # noqa: E402
+
+
+def _write(path, text="x"):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+
+
+def _bump(path, text):
+    _write(path, text)
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+@pytest.fixture
+def dataset(tmp_path):
+    root = tmp_path / "dataset"
+    _write(root / "dataset_description.json", '{"Name": "demo"}')
+    _write(root / "participants.tsv", "participant_id\nsub-01\nsub-02\nsub-03\n")
+    _write(root / ".bidsignore", "survey/\ncode/\n")
+    for sub in ("sub-01", "sub-02", "sub-03"):
+        _write(root / sub / "anat" / f"{sub}_T1w.nii.gz", "nifti")
+        _write(root / sub / "survey" / f"{sub}_task-x_survey.tsv", "a\n1\n")
+        _write(root / sub / "physio" / f"{sub}_task-x_physio.tsv", "1\n")
+    _write(root / "code" / "script.py", "print()")
+    return root
+
+
+class FakeDeno:
+    """Stands in for ``subprocess.run``; reports one issue per T1w file."""
+
+    def __init__(self):
+        self.targets = []
+
+    def __call__(self, cmd, check=False, stdout=None, stderr=None, text=False):
+        if cmd[:2] == ["deno", "--version"]:
+            return SimpleNamespace(stdout="deno 2.0.0", stderr="", returncode=0)
+        target = cmd[5]
+        self.targets.append(target)
+        issues = [
+            {
+                "code": "DATASET_LEVEL",
+                "severity": "warning",
+                "location": "/participants.tsv",
+                "issueMessage": f"seen {len(os.listdir(target))} entries",
+            }
+        ]
+        size = 0
+        for dirpath, dirs, files in os.walk(target, followlinks=True):
+            dirs[:] = [name for name in dirs if not name.startswith(".")]
+            for name in files:
+                size += os.path.getsize(os.path.join(dirpath, name))
+                if name.endswith("_T1w.nii.gz"):
+                    rel = os.path.relpath(os.path.join(dirpath, name), target)
+                    with open(os.path.join(dirpath, name), encoding="utf-8") as fh:
+                        content = fh.read()
+                    issues.append(
+                        {
+                            "code": "T1W_CONTENT",
+                            "severity": "error",
+                            "issueMessage": content,
+                            "location": "/" + rel.replace(os.sep, "/"),
+                        }
+                    )
+        report = {
+            "issues": {"issues": issues, "codeMessages": {}},
+            "summary": {"size": size},
+        }
+        return SimpleNamespace(stdout=json.dumps(report), stderr="", returncode=1)
+
+
+def _messages(issues):
+    return sorted(message for _level, message, _path in issues)
+
+
+def test_unchanged_dataset_reuses_cached_report(monkeypatch, dataset):
+    fake = FakeDeno()
+    monkeypatch.setattr(bids_validator.subprocess, "run", fake)
+
+    first = bids_validator.run_bids_validator(str(dataset))
+    # Survey edits and ignored folders do not invalidate the cache.
+    _bump(dataset / "sub-01" / "survey" / "sub-01_task-x_survey.tsv", "a\n2\n")
+    _bump(dataset / "code" / "script.py", "print(1)")
+    second = bids_validator.run_bids_validator(str(dataset))
+
+    assert fake.targets == [str(dataset)]
+    assert _messages(first) == _messages(second)
+    assert (dataset / ".prism" / "bids_validator_cache.json").exists()
+
+    bids_validator.run_bids_validator(str(dataset), use_cache=False)
+    monkeypatch.setenv(bids_validator_cache.CACHE_ENV_VAR, "0")
+    bids_validator.run_bids_validator(str(dataset))
+    assert len(fake.targets) == 3
+
+
+def test_changed_subject_is_revalidated_on_a_view_and_merged(monkeypatch, dataset):
+    fake = FakeDeno()
+    monkeypatch.setattr(bids_validator.subprocess, "run", fake)
+    bids_validator.run_bids_validator(str(dataset))
+
+    _bump(dataset / "sub-02" / "anat" / "sub-02_T1w.nii.gz", "fixed")
+    issues = bids_validator.run_bids_validator(str(dataset))
+
+    assert len(fake.targets) == 2 and fake.targets[1] != str(dataset)
+    assert not os.path.exists(fake.targets[1])
+    messages = _messages(issues)
+    assert any("T1W_CONTENT: fixed" in m and "sub-02" in m for m in messages)
+    assert sum("T1W_CONTENT: nifti" in m for m in messages) == 2
+    # Dataset-level issues come from the full run, not from the partial view.
+    assert any("seen 7 entries" in m for m in messages)
+    assert not any("seen 4 entries" in m for m in messages)
+
+    # The merged report is cached for the next unchanged run.
+    assert _messages(bids_validator.run_bids_validator(str(dataset))) == messages
+    assert len(fake.targets) == 2
+
+
+def test_top_level_or_subject_set_changes_force_a_full_run(monkeypatch, dataset):
+    fake = FakeDeno()
+    monkeypatch.setattr(bids_validator.subprocess, "run", fake)
+    bids_validator.run_bids_validator(str(dataset))
+
+    _bump(dataset / "participants.tsv", "participant_id\nsub-01\n")
+    bids_validator.run_bids_validator(str(dataset))
+    _write(dataset / "sub-04" / "anat" / "sub-04_T1w.nii.gz", "new")
+    bids_validator.run_bids_validator(str(dataset))
+
+    assert fake.targets == [str(dataset)] * 3
+
+
+def test_file_set_changes_inside_a_subject_force_a_full_run(monkeypatch, dataset):
+    fake = FakeDeno()
+    monkeypatch.setattr(bids_validator.subprocess, "run", fake)
+    bids_validator.run_bids_validator(str(dataset))
+
+    # Subject consistency and summary counts depend on every subject's files.
+    _write(dataset / "sub-01" / "anat" / "sub-01_T2w.nii.gz", "extra")
+    bids_validator.run_bids_validator(str(dataset))
+    (dataset / "sub-01" / "anat" / "sub-01_T2w.nii.gz").unlink()
+    bids_validator.run_bids_validator(str(dataset))
+
+    assert fake.targets == [str(dataset)] * 3
+
+
+def test_partial_run_adjusts_the_summary_size(monkeypatch, dataset):
+    fake = FakeDeno()
+    monkeypatch.setattr(bids_validator.subprocess, "run", fake)
+    bids_validator.run_bids_validator(str(dataset))
+
+    _bump(dataset / "sub-02" / "anat" / "sub-02_T1w.nii.gz", "a longer image")
+    bids_validator.run_bids_validator(str(dataset))
+
+    cache = json.loads(
+        (dataset / ".prism" / "bids_validator_cache.json").read_text(encoding="utf-8")
+    )
+    (entry,) = cache["entries"].values()
+    full = json.loads(fake(["deno", "run", "-A", "x", "--json", str(dataset)]).stdout)
+    assert len(fake.targets) == 3 and fake.targets[1] != str(dataset)
+    assert entry["report"]["summary"]["size"] == full["summary"]["size"]
+
+
+def test_bidsignore_matching_follows_gitignore_rules():
+    ignore = bids_validator_cache.BidsIgnore(
+        [
+            "# comment",
+            "survey/",
+            "*_physio.*",
+            "/extra",
+            "docs/**/*.md",
+            "!keep_physio.tsv",
+        ]
+    )
+
+    assert ignore.ignores("sub-01/survey", is_dir=True)
+    assert not ignore.ignores("sub-01/survey")
+    assert ignore.ignores("sub-01/func/sub-01_physio.tsv")
+    assert not ignore.ignores("sub-01/func/keep_physio.tsv")
+    assert ignore.ignores("extra", is_dir=True)
+    assert not ignore.ignores("sub-01/extra")
+    assert ignore.ignores("docs/a/b/readme.md")
+    assert ignore.ignores("docs/readme.md")
+
+
+def test_merge_legacy_reports_replaces_changed_subject_files():
+    def issue(key, *paths):
+        return {
+            "key": key,
+            "reason": key,
+            "files": [{"file": {"relativePath": p}} for p in paths],
+        }
+
+    cached = {
+        "issues": {
+            "errors": [issue("A", "/sub-01/x", "/sub-02/x"), issue("B", "/sub-02/y")],
+            "warnings": [{"key": "DATASET", "reason": "r", "files": []}],
+        }
+    }
+    partial = {
+        "issues": {
+            "errors": [
+                issue("A", "/sub-02/z", "/participants.tsv"),
+                issue("C", "/sub-02/c"),
+            ],
+            "warnings": [],
+        }
+    }
+
+    merged = bids_validator_cache.merge_legacy_reports(cached, partial, {"sub-02"})
+
+    errors = {
+        item["key"]: [f["file"]["relativePath"] for f in item["files"]]
+        for item in merged["issues"]["errors"]
+    }
+    assert errors == {"A": ["/sub-01/x", "/sub-02/z"], "C": ["/sub-02/c"]}
+    assert [w["key"] for w in merged["issues"]["warnings"]] == ["DATASET"]
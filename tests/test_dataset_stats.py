@@ -0,0 +1,106 @@
+import os
+import sys
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(current_dir)
+app_src_path = os.path.join(project_root, "app", "src")
+
+if app_src_path not in sys.path:
+    sys.path.insert(0, app_src_path)
+
+from stats import DatasetStats
+
+
+def _session_stats(sessions_by_subject):
+    stats = DatasetStats()
+    for subject_id, sessions in sessions_by_subject.items():
+        for session_id in sessions:
+            stats.add_file(
+                subject_id,
+                session_id,
+                "survey",
+                "phq",
+                f"{subject_id}_{session_id}_task-phq_survey.tsv",
+            )
+    return stats
+
+
+def test_entities_are_extracted_per_modality():
+    stats = DatasetStats()
+    stats.add_file(
+        "sub-01", "ses-1", "survey", "phq", "sub-01_ses-1_task-phq_acq-short_survey.tsv"
+    )
+    stats.add_file(
+        "sub-01", "ses-1", "survey", "bdi", "sub-01_ses-1_task-bdi_acq-long.tsv"
+    )
+    stats.add_file("sub-01", "ses-1", "physio", None, "sub-01_task-rest_physio.tsv.gz")
+    stats.add_file("sub-01", None, "biometrics", None, "sub-01_biometrics-grip.tsv")
+    stats.add_file("sub-01", None, "environment", None, "sub-01_recording-room.json")
+
+    assert stats.survey_variants == {"phq": {"short"}}
+    assert stats.acq_labels == {"survey": {"short", "long"}}
+    assert stats.physio == {"rest"}
+    assert stats.biometrics == {"grip"}
+    assert stats.environment == {"room"}
+    assert stats.sessions == {"sub-01/ses-1"}
+    assert stats.total_files == 5 and stats.sidecar_files == 1
+
+
+def test_subject_data_view_matches_recorded_files():
+    stats = DatasetStats()
+    stats.add_file("sub-01", "ses-1", "anat", None, "sub-01_ses-1_T1w.nii.gz")
+    stats.add_file("sub-01", "ses-2", "func", "rest", "sub-01_ses-2_task-rest_bold.nii")
+    stats.add_file("sub-02", None, "beh", "nback", "sub-02_task-nback_beh.tsv")
+
+    assert stats.subject_data == {
+        "sub-01": {
+            "sessions": {"ses-1", "ses-2"},
+            "modalities": {"anat", "func"},
+            "tasks": {"rest"},
+            "session_data": {
+                "ses-1": {"modalities": {"anat"}, "tasks": set()},
+                "ses-2": {"modalities": {"func"}, "tasks": {"rest"}},
+            },
+        },
+        "sub-02": {
+            "sessions": set(),
+            "modalities": {"beh"},
+            "tasks": {"nback"},
+            "session_data": {},
+        },
+    }
+
+
+def test_consistency_flags_rare_and_missing_sessions():
+    sessions = {f"sub-{i:02d}": ["ses-1", "ses-2"] for i in range(1, 11)}
+    sessions["sub-03"] = ["ses-1"]
+    sessions["sub-07"] = ["ses-1", "ses-2", "ses-boseline"]
+
+    warnings = _session_stats(sessions).check_consistency()
+
+    assert warnings == [
+        ("WARNING", "Session ses-2 missing for subjects", "sub-03"),
+        (
+            "WARNING",
+            "Potential typo/mislabeled session: 'ses-boseline'",
+            "Appears only in 1 subject(s): sub-07",
+        ),
+    ]
+
+
+def test_consistency_reports_missing_modalities_and_tasks():
+    stats = DatasetStats()
+    stats.add_file("sub-01", None, "beh", "nback", "sub-01_task-nback_beh.tsv")
+    stats.add_file("sub-01", None, "anat", None, "sub-01_T1w.nii.gz")
+    stats.add_file("sub-02", None, "beh", "nback", "sub-02_task-nback_beh.tsv")
+    stats.add_file("sub-03", None, "anat", None, "sub-03_T1w.nii.gz")
+    stats.add_file("sub-04", "ses-1", "anat", None, "sub-04_ses-1_T1w.nii.gz")
+
+    warnings = stats.check_consistency()
+
+    assert warnings == [
+        ("WARNING", "Missing anat data", "sub-02"),
+        ("WARNING", "Missing beh data", "sub-03"),
+        ("WARNING", "Missing task nback", "sub-03"),
+        ("WARNING", "Mixed session structure", "1 subjects have sessions, 3 don't"),
+    ]
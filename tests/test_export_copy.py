@@ -0,0 +1,107 @@
+"""Copy strategy selection for dataset exports."""
+
+from __future__ import annotations
+
+import errno
+import os
+import shutil
+
+import pytest
+
+from src import export_copy
+from src.export_copy import ExportCopier, is_hardlink_safe
+
+
+@pytest.fixture
+def project(tmp_path):
+    root = tmp_path / "project"
+    func_dir = root / "sub-01" / "func"
+    func_dir.mkdir(parents=True)
+    (root / "participants.tsv").write_text("participant_id\nsub-01\n")
+    (func_dir / "sub-01_task-rest_bold.json").write_text('{"TaskName": "rest"}')
+    (func_dir / "sub-01_task-rest_bold.nii.gz").write_bytes(os.urandom(8192))
+    (func_dir / ".hidden.bin").write_bytes(b"x")
+    return root
+
+
+def _no_reflink(monkeypatch, calls=None):
+    def fail(src, dst):
+        if calls is not None:
+            calls.append(src)
+        open(dst, "wb").close()
+        raise OSError(errno.EOPNOTSUPP, "no reflink")
+
+    monkeypatch.setattr(export_copy, "_reflink", fail)
+
+
+def test_hardlink_safety_rules(project):
+    func_dir = project / "sub-01" / "func"
+    assert is_hardlink_safe(func_dir / "sub-01_task-rest_bold.nii.gz", project)
+    assert not is_hardlink_safe(func_dir / "sub-01_task-rest_bold.json", project)
+    assert not is_hardlink_safe(func_dir / ".hidden.bin", project)
+    assert not is_hardlink_safe(project / "participants.tsv", project)
+
+    (project / "sub-01" / "link.nii.gz").symlink_to(
+        func_dir / "sub-01_task-rest_bold.nii.gz"
+    )
+    assert not is_hardlink_safe(project / "sub-01" / "link.nii.gz", project)
+
+
+def test_copytree_links_payloads_and_copies_metadata(project, tmp_path, monkeypatch):
+    calls: list[str] = []
+    _no_reflink(monkeypatch, calls)
+    copier = ExportCopier(root=project)
+
+    out = tmp_path / "out"
+    shutil.copytree(project, out, copy_function=copier)
+
+    func_src = project / "sub-01" / "func"
+    func_out = out / "sub-01" / "func"
+    assert os.path.samefile(
+        func_src / "sub-01_task-rest_bold.nii.gz",
+        func_out / "sub-01_task-rest_bold.nii.gz",
+    )
+    for name in ("sub-01_task-rest_bold.json", ".hidden.bin"):
+        assert (func_out / name).read_bytes() == (func_src / name).read_bytes()
+        assert not os.path.samefile(func_src / name, func_out / name)
+    assert copier.summary()["files_by_strategy"]["hardlink"] == 1
+    assert sum(copier.counts.values()) == 4
+    # The unsupported reflink is probed once per device pair, not per file.
+    assert len(calls) == 1
+
+
+def test_copy_mode_and_existing_destination(project, tmp_path):
+    payload = project / "sub-01" / "func" / "sub-01_task-rest_bold.nii.gz"
+    dst = tmp_path / "payload.nii.gz"
+    os.link(payload, dst)
+
+    copier = ExportCopier("copy")
+    assert copier.copy(payload, dst) == "copy"
+    assert not os.path.samefile(payload, dst)
+    assert dst.read_bytes() == payload.read_bytes()
+    assert copier.summary() == {
+        "mode": "copy",
+        "strategy": "copy",
+        "files_by_strategy": {"copy": 1},
+    }
+
+    with pytest.raises(ValueError):
+        ExportCopier("move")
+    with pytest.raises(FileNotFoundError):
+        copier(project / "missing.nii.gz", tmp_path / "missing.nii.gz")
+
+
+def test_falls_back_to_byte_copy(project, tmp_path, monkeypatch):
+    _no_reflink(monkeypatch)
+
+    def no_range(src, dst):
+        open(dst, "wb").close()
+        raise OSError(errno.EXDEV, "cross device")
+
+    monkeypatch.setattr(export_copy, "_copy_file_range", no_range)
+    copier = ExportCopier(root=project, allow_hardlink=lambda *_: False)
+    payload = project / "sub-01" / "func" / "sub-01_task-rest_bold.nii.gz"
+
+    assert copier.copy(payload, tmp_path) == "copy"
+    assert (tmp_path / payload.name).read_bytes() == payload.read_bytes()
+    assert copier.describe() == "copy 1"
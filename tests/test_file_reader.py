@@ -22,6 +22,7 @@ import pytest
 from app.src.converters.file_reader import (
     ReadResult,
     list_excel_sheets,
+    preview_tabular_file,
     read_tabular_file,
     resolve_sheet_selection,
 )
@@ -435,3 +436,129 @@ class TestExcelSheetSelection:
         result = read_tabular_file(f, kind="xlsx", sheet="Notes")
 
         assert list(result.df.columns) == ["CODE", "comment"]
+
+
+class TestSampledDetection:
+    def test_text_is_parsed_without_reading_the_whole_file_into_memory(
+        self, tmp_path, monkeypatch
+    ):
+        f = tmp_path / "stream.csv"
+        _write(f, "id;name\n" + "".join(f"{i};Müller\n" for i in range(5000)))
+
+        def _no_full_read(self):
+            raise AssertionError("read_bytes should not be used for text input")
+
+        monkeypatch.setattr(Path, "read_bytes", _no_full_read)
+        result = read_tabular_file(f, kind="csv")
+
+        assert list(result.df.columns) == ["id", "name"]
+        assert len(result.df) == 5000
+        assert result.encoding_used == "utf-8-sig"
+        assert result.delimiter_used == ";"
+
+    def test_invalid_byte_beyond_the_sample_falls_back_to_latin1(self, tmp_path):
+        f = tmp_path / "late_latin.csv"
+        body = "".join(f"{i},name{i}\n" for i in range(40000)).encode("utf-8")
+        _write(f, b"id,name\n" + body + b"99999,M\xfcller\n" + body)
+
+        result = read_tabular_file(f, kind="csv")
+
+        assert result.encoding_used == "latin-1"
+        assert "Müller" in set(result.df["name"])
+
+    def test_numeric_values_stringify_like_python(self):
+        from app.src.converters.file_reader import _coerce_values_to_str
+
+        df = pd.DataFrame(
+            {
+                "likert": [1.0, 2.0, None, 1.0],
+                "signed_zero": [-0.0, 0.0, 0.5, None],
+                "single": pd.Series([0.1, 2.5, 3.0, 4.0], dtype="float32"),
+                "codes": pd.Series([1, 2, 3, 4], dtype="int8"),
+                "text": ["a", 1, None, "d"],
+            }
+        )
+
+        result = _coerce_values_to_str(df, pd)
+
+        assert result["likert"].tolist()[:2] == ["1.0", "2.0"]
+        assert pd.isna(result["likert"].iloc[2])
+        assert result["signed_zero"].tolist()[:3] == ["-0.0", "0.0", "0.5"]
+        assert result["single"].tolist()[0] == str(float(df["single"].iloc[0]))
+        assert result["codes"].tolist() == ["1", "2", "3", "4"]
+        assert result["text"].tolist()[:2] == ["a", "1"]
+        assert pd.isna(result["text"].iloc[2])
+
+
+class TestPreview:
+    def test_large_csv_preview_is_bounded_with_estimated_count(self, tmp_path):
+        f = tmp_path / "large.csv"
+        _write(f, "id;group\n" + "".join(f"{i:05d};g{i % 3}\n" for i in range(20000)))
+
+        preview = preview_tabular_file(f, max_rows=5, max_values=2)
+
+        assert preview.columns == ["id", "group"]
+        assert preview.df["id"].tolist() == ["00000", "00001", "00002", "00003", "00004"]
+        assert preview.row_count_exact is False
+        assert 15000 < preview.row_count < 25000
+        assert preview.value_samples == {"id": ["00000", "00001"], "group": ["g0", "g1"]}
+        assert preview.delimiter_used == ";"
+        assert preview.warnings
+
+    def test_small_csv_preview_counts_rows_exactly(self, tmp_path):
+        f = tmp_path / "small.csv"
+        _write(f, "id,age\n001,25\n002,\n003,25\n")
+
+        preview = preview_tabular_file(f, max_rows=2)
+
+        assert len(preview.df) == 2
+        assert preview.row_count == 3
+        assert preview.row_count_exact is True
+        assert preview.value_samples["age"] == ["25"]
+
+    def test_header_only_csv_is_empty(self, tmp_path):
+        f = tmp_path / "header.csv"
+        _write(f, "id,age\n")
+        with pytest.raises(ValueError, match="empty"):
+            preview_tabular_file(f)
+
+    def test_xlsx_preview_streams_first_rows(self, tmp_path):
+        f = tmp_path / "data.xlsx"
+        pd.DataFrame({"id": range(300), "score": [i % 5 for i in range(300)]}).to_excel(
+            f, index=False
+        )
+
+        preview = preview_tabular_file(f, max_rows=3)
+
+        assert preview.df["id"].tolist() == ["0", "1", "2"]
+        assert preview.row_count == 300
+        assert preview.row_count_exact is False
+
+        header_only = preview_tabular_file(f, max_rows=0)
+        assert header_only.columns == ["id", "score"]
+        assert header_only.df.empty
+
+    def test_sav_preview_reports_total_rows_from_metadata(self, tmp_path):
+        pyreadstat = pytest.importorskip("pyreadstat")
+
+        f = tmp_path / "data.sav"
+        pyreadstat.write_sav(pd.DataFrame({"id": [f"{i:03d}" for i in range(50)]}), str(f))
+
+        preview = preview_tabular_file(f, max_rows=4)
+
+        assert preview.df["id"].tolist() == ["000", "001", "002", "003"]
+        assert preview.row_count == 50
+        assert preview.row_count_exact is True
+
+    def test_list_excel_sheets_sees_data_below_a_blank_row(self, tmp_path):
+        import openpyxl
+
+        f = tmp_path / "gap.xlsx"
+        wb = openpyxl.Workbook()
+        ws = wb.active
+        ws.append(["ID", "score"])
+        ws.append([None, None])
+        ws.append([1, 10])
+        wb.save(str(f))
+
+        assert list_excel_sheets(f)["non_empty_sheet_indexes"] == [0]
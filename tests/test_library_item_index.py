@@ -0,0 +1,124 @@
+"""Shared, persisted item index for template libraries."""
+
+from __future__ import annotations
+
+import json
+import os
+
+import pytest
+
+from src import library_item_index
+from src.converters.item_registry import ItemRegistry
+from src.library_item_index import (
+    INDEX_RELATIVE_PATH,
+    LibraryItemIndex,
+    clear_library_item_indexes,
+)
+from src.library_validator import LibraryValidator
+
+
+@pytest.fixture
+def library(tmp_path):
+    clear_library_item_indexes()
+    lib = tmp_path / "library"
+    lib.mkdir()
+    _write(
+        lib / "survey-phq.json",
+        {
+            "Study": {"TaskName": "phq"},
+            "PHQ01": {"Description": {"en": "Interest", "de": "Interesse"}},
+            "PHQ03": {"Description": {"de": "Schlaf", "fr": "Sommeil"}},
+            "PHQ02": {"Description": "Mood"},
+            "PHQ02b": {"Description": "Mood", "AliasOf": "PHQ02"},
+        },
+    )
+    _write(
+        lib / "biometrics-grip.json",
+        {"Questions": {"GRIP": {"Description": "Grip strength"}}},
+    )
+    _write(lib / "survey-dup.json", {"DUP01": {"Description": "x"}, "PHQ01": {}})
+    (lib / "notes.json").write_text("{}", encoding="utf-8")
+    yield lib
+    clear_library_item_indexes()
+
+
+def _write(path, payload):
+    path.write_text(json.dumps(payload), encoding="utf-8")
+
+
+def _count_parses(monkeypatch):
+    parsed: list[str] = []
+    real_read = library_item_index._read_json
+
+    def counting_read(path):
+        parsed.append(path.name)
+        return real_read(path)
+
+    monkeypatch.setattr(library_item_index, "_read_json", counting_read)
+    return parsed
+
+
+def test_consumers_share_one_index(library, monkeypatch):
+    parsed = _count_parses(monkeypatch)
+    validator = LibraryValidator(library)
+
+    var_map = validator.get_all_library_variables()
+    assert var_map["PHQ01"] == ["survey-dup.json", "survey-phq.json"]
+    assert var_map["GRIP"] == ["biometrics-grip.json"]
+    assert "Study" not in var_map
+
+    issues = validator.find_redundant_items()
+    assert [(i["file"], i["items"], i["severity"]) for i in issues] == [
+        ("survey-phq.json", ["PHQ02", "PHQ02b"], "info")
+    ]
+    assert validator.validate_draft({"PHQ01": {}, "NEW": {}}, "survey-phq.json") == [
+        "Variable 'PHQ01' is already defined in: survey-dup.json"
+    ]
+
+    registry = ItemRegistry.from_libraries(local_library=library)
+    assert registry._items["PHQ01"]["source_task"] == "dup"
+    assert registry._items["PHQ02"]["source_task"] == "phq"
+    assert registry._items["PHQ03"]["description"] == "Schlaf"
+    assert "GRIP" not in registry._items
+
+    assert sorted(parsed) == [
+        "biometrics-grip.json",
+        "survey-dup.json",
+        "survey-phq.json",
+    ]
+    assert (library / INDEX_RELATIVE_PATH).exists()
+
+
+def test_refresh_reparses_only_changed_files(library, monkeypatch):
+    LibraryItemIndex.for_library(library)
+    parsed = _count_parses(monkeypatch)
+
+    phq = library / "survey-phq.json"
+    _write(phq, {"PHQ01": {"Description": "Interest"}, "PHQ09": {}})
+    os.utime(phq, ns=(1, 1))
+    (library / "survey-dup.json").unlink()
+
+    var_map = LibraryValidator(library).get_all_library_variables()
+    assert parsed == ["survey-phq.json"]
+    assert var_map["PHQ01"] == ["survey-phq.json"]
+    assert "DUP01" not in var_map and "PHQ09" in var_map
+
+    # A fresh process starts from the persisted index without parsing.
+    clear_library_item_indexes()
+    parsed.clear()
+    index = LibraryItemIndex.for_library(library)
+    assert parsed == []
+    assert [entry.name for entry in index.templates()] == [
+        "biometrics-grip.json",
+        "survey-phq.json",
+    ]
+
+
+def test_unreadable_template_is_reported_not_indexed(library, capsys):
+    (library / "survey-bad.json").write_text("{not json", encoding="utf-8")
+
+    var_map = LibraryValidator(library).get_all_library_variables()
+
+    assert "Error reading survey-bad.json" in capsys.readouterr().out
+    assert all("survey-bad.json" not in files for files in var_map.values())
+    assert ItemRegistry.from_libraries(local_library=library).get_item_count() == 5
@@ -639,3 +639,48 @@ def test_parse_lsa_timings_handles_invalid_zip_and_dataframe_failures(tmp_path,
         assert parse_lsa_timings(str(archive)) is None
     finally:
         monkeypatch.setattr(limesurvey_module.pd, "DataFrame", original_dataframe)
+
+
+def test_parse_lsa_responses_keeps_row_dict_semantics_when_streaming(tmp_path):
+    from tests.test_limesurvey_structure import _MINIMAL_LSS
+
+    responses_xml = """<document>
+    <fields><fieldname>id</fieldname><fieldname>1X1X10</fieldname></fields>
+    <responses>
+        <rows>
+            <row><id>1</id><_1X1X10>2</_1X1X10></row>
+            <row><id>2</id><_1X1X10/><token>a</token><token>b</token></row>
+            <row><id>3</id></row>
+        </rows>
+    </responses>
+    <other><rows><row><id>ignored</id></row></rows></other>
+</document>"""
+
+    archive = _build_lsa_archive(
+        tmp_path,
+        lss_xml=_MINIMAL_LSS,
+        responses_xml=responses_xml,
+    )
+
+    df, _questions_map, _groups_map = parse_lsa_responses(str(archive))
+    assert list(df.columns) == ["id", "AGE", "token"]
+    assert df["id"].tolist() == ["1", "2", "3"]
+    assert df.loc[0, "AGE"] == "2"
+    assert df.loc[1, "token"] == "b"
+    assert df["AGE"].isna().tolist() == [False, True, True]
+    assert df["token"].isna().tolist() == [True, False, True]
+
+
+def test_read_xml_rows_clears_rows_as_it_streams():
+    import io
+
+    from src.converters.limesurvey import _read_xml_rows_as_dataframe
+
+    xml = b"<document><rows>" + b"".join(
+        b"<row><a>%d</a><b>x</b></row>" % i for i in range(50)
+    ) + b"</rows></document>"
+
+    df = _read_xml_rows_as_dataframe(io.BytesIO(xml))
+    assert df.shape == (50, 2)
+    assert df["a"].tolist() == [str(i) for i in range(50)]
+    assert df["b"].map(id).nunique() == 1  # short repeated answers are interned
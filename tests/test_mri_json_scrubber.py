@@ -460,6 +460,62 @@ class TestBuildDefacingReportExtra:
         assert "sub-02/ses-2/anat/sub-02_ses-2_T1w.json" not in files
 
 
+class TestBuildDefacingReportBatch:
+    @staticmethod
+    def _write_nifti(path, descrip):
+        import gzip
+        import struct
+
+        block = bytearray(352)
+        struct.pack_into("<i", block, 0, 348)
+        block[148 : 148 + len(descrip)] = descrip
+        block[344:348] = b"n+1\x00"
+        with gzip.open(path, "wb") as fh:
+            fh.write(bytes(block))
+
+    def test_header_descrip_drives_batch_report(self, tmp_path):
+        anat = tmp_path / "sub-01" / "anat"
+        anat.mkdir(parents=True)
+        (anat / "sub-01_T1w.json").write_text("{}", encoding="utf-8")
+        (anat / "sub-01_T2w.json").write_text("{}", encoding="utf-8")
+        self._write_nifti(anat / "sub-01_T1w.nii.gz", b"pydeface output")
+        self._write_nifti(anat / "sub-01_T2w.nii.gz", b"")
+
+        report = build_defacing_report(tmp_path, max_workers=2)
+
+        by_file = {entry["file"]: entry["status"] for entry in report}
+        assert by_file == {
+            "sub-01/anat/sub-01_T1w.json": "defaced",
+            "sub-01/anat/sub-01_T2w.json": "not_defaced",
+        }
+
+    def test_batch_report_matches_single_file_checks(self, tmp_path):
+        anat = tmp_path / "sub-01" / "ses-1" / "anat"
+        anat.mkdir(parents=True)
+        (anat / "sub-01_ses-1_T1w.json").write_text("{}", encoding="utf-8")
+        self._write_nifti(anat / "sub-01_ses-1_T1w.nii.gz", b"")
+        (anat / "sub-01_ses-1_T1w_defacemask.nii.gz").write_bytes(b"")
+        (anat / "sub-01_ses-1_FLAIR.json").write_text("{}", encoding="utf-8")
+
+        report = build_defacing_report(tmp_path)
+
+        for entry in report:
+            expected = is_anatomical_defaced(tmp_path / entry["file"])
+            assert entry["status"] == expected["status"]
+            assert entry["reason"] == expected["reason"]
+        assert {entry["status"] for entry in report} == {"defaced", "unknown"}
+
+    def test_scan_mri_jsons_skips_non_mri_folders(self, tmp_path):
+        (tmp_path / "sub-01" / "anat").mkdir(parents=True)
+        (tmp_path / "sub-01" / "survey").mkdir(parents=True)
+        (tmp_path / "sub-01" / "anat" / "sub-01_T1w.json").write_text("{}")
+        (tmp_path / "sub-01" / "survey" / "sub-01_task-x_survey.json").write_text("{}")
+
+        results = scan_mri_jsons(tmp_path)
+
+        assert [path.name for path in results] == ["sub-01_T1w.json"]
+
+
 class TestDefaceAnatomicalScans:
     def test_returns_error_when_pydeface_missing(self, tmp_path, monkeypatch):
         from src import mri_json_scrubber
@@ -0,0 +1,96 @@
+"""Tests for src/nifti_header.py — header-only NIfTI inspection."""
+
+import gzip
+import os
+import struct
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from src.nifti_header import (
+    NIFTI1_HEADER_SIZE,
+    NIFTI2_HEADER_SIZE,
+    parse_nifti_header,
+    read_nifti_header,
+)
+
+
+def _nifti1_header(descrip: bytes = b"", byte_order: str = "<") -> bytes:
+    block = bytearray(NIFTI1_HEADER_SIZE + 4)
+    struct.pack_into(f"{byte_order}i", block, 0, NIFTI1_HEADER_SIZE)
+    struct.pack_into(f"{byte_order}8h", block, 40, 3, 4, 5, 6, 1, 1, 1, 1)
+    struct.pack_into(f"{byte_order}2h", block, 70, 4, 16)
+    block[148 : 148 + len(descrip)] = descrip
+    block[344:348] = b"n+1\x00"
+    return bytes(block)
+
+
+def _nifti2_header(descrip: bytes = b"") -> bytes:
+    block = bytearray(NIFTI2_HEADER_SIZE + 4)
+    struct.pack_into("<i", block, 0, NIFTI2_HEADER_SIZE)
+    block[4:12] = b"n+2\x00\r\n\x1a\n"
+    struct.pack_into("<2h", block, 12, 16, 32)
+    struct.pack_into("<8q", block, 16, 4, 2, 3, 4, 7, 1, 1, 1)
+    block[240 : 240 + len(descrip)] = descrip
+    return bytes(block)
+
+
+class TestParseNiftiHeader:
+    def test_nifti1_little_endian(self):
+        info = parse_nifti_header(_nifti1_header(b"FSL5.0 defaced"))
+        assert info is not None
+        assert info.version == 1
+        assert info.byte_order == "<"
+        assert info.dim == (4, 5, 6)
+        assert info.datatype == 4
+        assert info.bitpix == 16
+        assert info.descrip == "FSL5.0 defaced"
+
+    def test_nifti1_big_endian(self):
+        info = parse_nifti_header(_nifti1_header(b"x", byte_order=">"))
+        assert info is not None
+        assert info.byte_order == ">"
+        assert info.dim == (4, 5, 6)
+
+    def test_nifti2(self):
+        info = parse_nifti_header(_nifti2_header(b"pydeface"))
+        assert info is not None
+        assert info.version == 2
+        assert info.dim == (2, 3, 4, 7)
+        assert info.descrip == "pydeface"
+
+    def test_rejects_bad_magic(self):
+        block = bytearray(_nifti1_header())
+        block[344:348] = b"xxxx"
+        assert parse_nifti_header(bytes(block)) is None
+
+    def test_rejects_short_block(self):
+        assert parse_nifti_header(b"\x5c\x01\x00\x00") is None
+        assert parse_nifti_header(b"") is None
+
+
+class TestReadNiftiHeader:
+    def test_reads_plain_nii(self, tmp_path):
+        path = tmp_path / "sub-01_T1w.nii"
+        path.write_bytes(_nifti1_header(b"skull stripped") + b"\x00" * 256)
+        info = read_nifti_header(path)
+        assert info is not None
+        assert info.descrip == "skull stripped"
+
+    def test_reads_only_header_of_gzip(self, tmp_path):
+        path = tmp_path / "sub-01_T1w.nii.gz"
+        with gzip.open(path, "wb") as fh:
+            fh.write(_nifti2_header(b"clean"))
+            fh.write(b"\x00" * (1 << 20))
+        info = read_nifti_header(path)
+        assert info is not None
+        assert info.version == 2
+        assert info.descrip == "clean"
+
+    def test_corrupt_gzip_returns_none(self, tmp_path):
+        path = tmp_path / "broken.nii.gz"
+        path.write_bytes(b"not gzip at all")
+        assert read_nifti_header(path) is None
+
+    def test_missing_file_returns_none(self, tmp_path):
+        assert read_nifti_header(tmp_path / "missing.nii") is None
@@ -3,7 +3,9 @@ from __future__ import annotations
 import json
 
 import pandas as pd
+import pytest
 
+from src.converters import phenotype_export
 from src.converters.phenotype_export import (
     build_phenotype_sidecar,
     collect_phenotype_bridge_files,
@@ -128,3 +130,49 @@ def test_build_phenotype_sidecar_drops_prism_specific_fields():
         "PrismTaskName": "wellbeing",
         "PrismVariantID": None,
     }
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        "A\tB\tC\n1\tn/a\t\n",
+        "\ufeffA\tB\n\"x\ty\"\tNA\n",
+        "A\tB\n\n1\t2\n\n",
+        "A\tA\n1\t2\n",
+        "A\t\tC\n1\t2\t3\n",
+        "A\tB\n1\n",
+        "A\tB\n1\t2\n3\t4\n",
+        "A\tB\n",
+    ],
+)
+def test_read_survey_tsv_matches_pandas(tmp_path, content):
+    path = tmp_path / "sub-01_ses-01_task-x_survey.tsv"
+    path.write_text(content, encoding="utf-8")
+    expected = pd.read_csv(path, sep="\t", dtype=str)
+
+    header, rows = phenotype_export._read_survey_tsv(path)
+
+    assert header == [str(column) for column in expected.columns]
+    actual = pd.DataFrame(rows, columns=header, dtype=object)
+    pd.testing.assert_frame_equal(
+        actual, expected.astype(object), check_dtype=False, check_index_type=False
+    )
+
+
+def test_collect_phenotype_bridge_files_reads_many_files_in_order(
+    tmp_path, monkeypatch
+):
+    monkeypatch.setattr(phenotype_export, "_PHENOTYPE_READ_BATCH", 2)
+    for index in range(1, 41):
+        values = {"WB01": index}
+        if index % 10 == 0:
+            values["WB02"] = "n/a"
+        _write_survey_tsv(tmp_path, f"{index:02d}", "01", "wellbeing", None, values)
+
+    result = collect_phenotype_bridge_files(tmp_path)
+
+    frame = result.files[0].dataframe
+    assert list(frame.columns) == ["participant_id", "session_id", "WB01", "WB02"]
+    assert frame["WB01"].tolist() == [str(index) for index in range(1, 41)]
+    assert frame["WB02"].isna().all()
+
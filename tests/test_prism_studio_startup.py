@@ -0,0 +1,147 @@
+"""Startup cost of app/prism-studio.py: lazy blueprints and import budget."""
+
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
+
+from flask import Flask, url_for
+
+APP_DIR = Path(__file__).resolve().parents[1] / "app"
+if str(APP_DIR) not in sys.path:
+    sys.path.insert(0, str(APP_DIR))
+
+from src.startup_profile import StartupImportProfiler  # noqa: E402
+from src.web.lazy_blueprints import (  # noqa: E402
+    MODULAR_BLUEPRINTS,
+    BlueprintSpec,
+    build_route_manifest,
+    load_route_manifest,
+    register_lazy_blueprint,
+)
+
+# Modules that must not be imported before the first request. Each of them
+# used to be pulled in at module load and together cost well over a second.
+_DEFERRED_MODULES = (
+    "pandas",
+    "numpy",
+    "runner",
+    "src.project_manager",
+    "src.converters.survey",
+    "src.web.blueprints.conversion_utils",
+) + tuple(spec.module_name for spec in MODULAR_BLUEPRINTS)
+
+# Generous ceiling on the summed import time (``-X importtime`` self times)
+# of loading prism-studio.py; currently ~0.3 s, previously ~1.6 s.
+_STARTUP_IMPORT_BUDGET_SECONDS = 1.0
+
+_PROBE_SCRIPT = textwrap.dedent(
+    """
+    import importlib.util, json, sys
+    spec = importlib.util.spec_from_file_location("prism_studio_probe", {path!r})
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    sys.__stdout__.write("PROBE " + json.dumps(sorted(sys.modules)) + "\\n")
+    sys.__stdout__.flush()
+    """
+)
+
+
+def test_route_manifest_matches_blueprints():
+    assert load_route_manifest() == build_route_manifest(), (
+        "app/src/web/blueprint_routes.json is stale; run "
+        "python scripts/generate_blueprint_routes.py"
+    )
+
+
+def test_prism_studio_cold_start_stays_within_import_budget():
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-X",
+            "importtime",
+            "-c",
+            _PROBE_SCRIPT.format(path=str(APP_DIR / "prism-studio.py")),
+        ],
+        cwd=str(APP_DIR),
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+    probe_lines = [line for line in result.stdout.splitlines() if line.startswith("PROBE ")]
+    assert probe_lines, result.stdout + result.stderr
+    loaded = set(json.loads(probe_lines[-1][len("PROBE ") :]))
+
+    assert sorted(loaded.intersection(_DEFERRED_MODULES)) == []
+
+    self_us = [
+        int(line.split("|")[0].split(":")[1])
+        for line in result.stderr.splitlines()
+        if line.startswith("import time:") and "self [us]" not in line
+    ]
+    assert sum(self_us) / 1_000_000 < _STARTUP_IMPORT_BUDGET_SECONDS
+
+
+def test_lazy_blueprint_imports_module_on_first_request(tmp_path, monkeypatch):
+    (tmp_path / "lazy_blueprint_demo.py").write_text(
+        textwrap.dedent(
+            """
+            from flask import Blueprint
+
+            demo_bp = Blueprint("demo", __name__)
+
+
+            @demo_bp.route("/demo/<name>", methods=["GET", "POST"])
+            def hello(name):
+                return f"hello {name}"
+            """
+        ),
+        encoding="utf-8",
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.delitem(sys.modules, "lazy_blueprint_demo", raising=False)
+    spec = BlueprintSpec("lazy_blueprint_demo", "demo_bp", "demo")
+
+    app = Flask(__name__)
+    lazy = register_lazy_blueprint(
+        app,
+        spec,
+        [{"rule": "/demo/<name>", "endpoint": "demo.hello", "methods": ["GET", "POST"]}],
+    )
+
+    with app.test_request_context():
+        assert url_for("demo.hello", name="x") == "/demo/x"
+    assert "lazy_blueprint_demo" not in sys.modules
+    assert not lazy.loaded
+
+    client = app.test_client()
+    assert client.get("/demo/ada").get_data(as_text=True) == "hello ada"
+    assert client.post("/demo/bob").get_data(as_text=True) == "hello bob"
+    assert lazy.loaded
+    assert app.view_functions["demo.hello"] is sys.modules["lazy_blueprint_demo"].hello
+
+
+def test_startup_profiler_reports_module_import_times(tmp_path, monkeypatch):
+    (tmp_path / "profiled_demo_child.py").write_text("VALUE = 1\n", encoding="utf-8")
+    (tmp_path / "profiled_demo.py").write_text(
+        "import profiled_demo_child\n", encoding="utf-8"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    profiler = StartupImportProfiler()
+    profiler.install()
+    try:
+        import profiled_demo  # noqa: F401
+    finally:
+        profiler.uninstall()
+        sys.modules.pop("profiled_demo", None)
+        sys.modules.pop("profiled_demo_child", None)
+
+    parent_self, parent_cumulative = profiler.timings["profiled_demo"]
+    _child_self, child_cumulative = profiler.timings["profiled_demo_child"]
+    assert parent_cumulative >= parent_self + child_cumulative - 1
+    report = profiler.format_report()
+    assert "profiled_demo_child" in report
+    assert profiler not in sys.meta_path
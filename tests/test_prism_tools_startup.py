@@ -0,0 +1,117 @@
+"""Startup cost of prism_tools: lazy command handlers and import budget."""
+
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+import textwrap
+from argparse import Namespace
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+APP_DIR = PROJECT_ROOT / "app"
+if str(APP_DIR) not in sys.path:
+    sys.path.insert(0, str(APP_DIR))
+
+from src.cli.dispatch import (  # noqa: E402
+    COMMAND_HANDLERS,
+    LazyCommandHandlers,
+    dispatch_prism_tools,
+    resolve_command_handler,
+)
+
+_COMMAND_MODULES = tuple(
+    sorted({target.partition(":")[0] for target in COMMAND_HANDLERS.values()})
+)
+
+# Nothing behind a command handler may load for ``--help`` or parsing.
+_DEFERRED_MODULES = (
+    "pandas",
+    "numpy",
+    "pyedflib",
+    "src.project_manager",
+    "src.validator",
+) + tuple(name for name in _COMMAND_MODULES if name != "src.cli.entrypoint")
+
+# Generous ceiling on the summed import time (``-X importtime`` self times)
+# of ``prism_tools.py --help``; currently ~0.1 s, previously ~1.4 s.
+_STARTUP_IMPORT_BUDGET_SECONDS = 0.5
+
+_PROBE_SCRIPT = textwrap.dedent(
+    """
+    import json, runpy, sys
+    sys.argv = [{path!r}, *{argv!r}]
+    try:
+        runpy.run_path({path!r}, run_name="__main__")
+    except SystemExit:
+        pass
+    sys.__stdout__.write("PROBE " + json.dumps(sorted(sys.modules)) + "\\n")
+    sys.__stdout__.flush()
+    """
+)
+
+
+def _probe(*argv: str) -> tuple[set[str], float]:
+    env = os.environ.copy()
+    env["PRISM_SKIP_VENV_CHECK"] = "1"
+    env["PRISM_DAEMON_DISABLE"] = "1"
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-X",
+            "importtime",
+            "-c",
+            _PROBE_SCRIPT.format(path=str(PROJECT_ROOT / "prism_tools.py"), argv=argv),
+        ],
+        cwd=str(PROJECT_ROOT),
+        capture_output=True,
+        text=True,
+        timeout=120,
+        env=env,
+    )
+    probe_lines = [line for line in result.stdout.splitlines() if line.startswith("PROBE ")]
+    assert probe_lines, result.stdout + result.stderr
+    self_us = [
+        int(line.split("|")[0].split(":")[1])
+        for line in result.stderr.splitlines()
+        if line.startswith("import time:") and "self [us]" not in line
+    ]
+    return set(json.loads(probe_lines[-1][len("PROBE ") :])), sum(self_us) / 1_000_000
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [("--help",), ("survey", "convert", "--help"), ("dataset",)],
+)
+def test_prism_tools_cold_start_stays_within_import_budget(argv):
+    loaded, import_seconds = _probe(*argv)
+
+    assert sorted(loaded.intersection(_DEFERRED_MODULES)) == []
+    assert import_seconds < _STARTUP_IMPORT_BUDGET_SECONDS
+
+
+def test_every_command_handler_target_resolves():
+    for key, target in COMMAND_HANDLERS.items():
+        assert callable(resolve_command_handler(target)), key
+
+
+def test_lazy_handlers_import_only_the_selected_command(monkeypatch):
+    imported = []
+
+    def _fake_resolve(target):
+        imported.append(target)
+        return lambda args: None
+
+    monkeypatch.setattr("src.cli.dispatch.resolve_command_handler", _fake_resolve)
+    handlers = LazyCommandHandlers()
+    parsers = {"root": None}
+
+    dispatch_prism_tools(Namespace(command="anonymize"), parsers, handlers)
+    dispatch_prism_tools(Namespace(command="anonymize"), parsers, handlers)
+
+    assert imported == [COMMAND_HANDLERS["anonymize"]]
+    assert sorted(handlers) == sorted(COMMAND_HANDLERS)
@@ -3016,6 +3016,61 @@ class TestProjectManager(unittest.TestCase):
             self.assertGreaterEqual(int(result.get("scrubbed_mri_json_files") or 0), 1)
             self.assertGreaterEqual(int(result.get("scrubbed_mri_json_fields") or 0), 1)
 
+    def test_export_project_to_plain_folder_never_shares_rewritten_files(self):
+        manager = ProjectManager()
+
+        with tempfile.TemporaryDirectory() as tmp:
+            project_path = Path(tmp) / "demo_project"
+            anat_dir = project_path / "sub-001" / "anat"
+            anat_dir.mkdir(parents=True, exist_ok=True)
+            (project_path / "dataset_description.json").write_text("{}\n", encoding="utf-8")
+            sidecar_path = anat_dir / "sub-001_T1w.json"
+            sidecar_path.write_text(
+                json.dumps({"StationName": "AWP175956", "EchoTime": 0.002}),
+                encoding="utf-8",
+            )
+            image_path = anat_dir / "sub-001_T1w.nii.gz"
+            image_path.write_bytes(b"\x1f\x8b" + b"\0" * 4096)
+
+            result = manager.export_project_to_plain_folder(
+                project_path,
+                output_root=Path(tmp) / "exports",
+                scrub_mri_json=True,
+            )
+
+            self.assertTrue(result.get("success"), result)
+            output_anat = Path(result["output_path"]) / "sub-001" / "anat"
+            self.assertIn("StationName", json.loads(sidecar_path.read_text(encoding="utf-8")))
+            self.assertNotIn(
+                "StationName",
+                json.loads((output_anat / "sub-001_T1w.json").read_text(encoding="utf-8")),
+            )
+            self.assertFalse(
+                os.path.samefile(sidecar_path, output_anat / "sub-001_T1w.json")
+            )
+            self.assertEqual(
+                (output_anat / "sub-001_T1w.nii.gz").read_bytes(), image_path.read_bytes()
+            )
+            summary = result["copy_strategy"]
+            self.assertEqual(summary["mode"], "auto")
+            self.assertEqual(sum(summary["files_by_strategy"].values()), 3)
+            self.assertIn("files:", result["message"])
+
+            copy_result = manager.export_project_to_plain_folder(
+                project_path,
+                output_root=Path(tmp) / "exports_copy",
+                copy_mode="copy",
+            )
+            self.assertEqual(
+                copy_result["copy_strategy"]["files_by_strategy"], {"copy": 3}
+            )
+
+            bad_result = manager.export_project_to_plain_folder(
+                project_path, output_root=Path(tmp) / "exports_bad", copy_mode="move"
+            )
+            self.assertFalse(bad_result.get("success"))
+            self.assertIn("Unknown copy mode", bad_result["error"])
+
     def test_export_project_to_plain_folder_skips_missing_annex_content_with_warning(self):
         manager = ProjectManager()
 
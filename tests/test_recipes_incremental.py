@@ -0,0 +1,170 @@
+"""Tests for incremental recipe recomputation driven by provenance sidecars."""
+
+from pathlib import Path
+import json
+import os
+
+import pytest
+
+from src.recipes_surveys import compute_survey_recipes
+
+
+def _write_recipe(recipe_dir: Path, task: str, items: list[str]) -> None:
+    recipe = {
+        "Kind": "survey",
+        "RecipeVersion": "1.0",
+        "Survey": {"TaskName": task},
+        "Scores": [{"Name": "Total", "Method": "sum", "Items": items}],
+    }
+    (recipe_dir / f"recipe-{task}.json").write_text(
+        json.dumps(recipe), encoding="utf-8"
+    )
+
+
+def _survey_path(project_root: Path, sub: str, ses: str, task: str) -> Path:
+    return project_root / sub / ses / "survey" / f"{sub}_{ses}_task-{task}_survey.tsv"
+
+
+def _write_survey(path: Path, q1: int, q2: int) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(f"Q1\tQ2\n{q1}\t{q2}\n", encoding="utf-8")
+
+
+@pytest.fixture
+def project(tmp_path: Path) -> tuple[Path, Path]:
+    project_root = tmp_path / "project"
+    recipe_dir = tmp_path / "recipes"
+    recipe_dir.mkdir(parents=True)
+    for index, sub in enumerate(("sub-001", "sub-002")):
+        for ses in ("ses-1", "ses-2"):
+            for task in ("alpha", "beta"):
+                _write_survey(_survey_path(project_root, sub, ses, task), index, 2)
+    _write_recipe(recipe_dir, "alpha", ["Q1", "Q2"])
+    _write_recipe(recipe_dir, "beta", ["Q2"])
+    return project_root, recipe_dir
+
+
+def _run(project: tuple[Path, Path], **options):
+    project_root, recipe_dir = project
+    return compute_survey_recipes(
+        prism_root=project_root,
+        repo_root=project_root.parent,
+        recipe_dir=recipe_dir,
+        **options,
+    )
+
+
+def _mtimes(root: Path) -> dict[str, int]:
+    return {
+        str(path.relative_to(root)): path.stat().st_mtime_ns
+        for path in root.rglob("*")
+        if path.is_file() and not path.name.endswith(".json")
+    }
+
+
+def _bump(path: Path) -> None:
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def test_unchanged_csv_outputs_are_skipped(project) -> None:
+    first = _run(project, out_format="csv")
+    before = _mtimes(first.out_root)
+
+    # A touched but unchanged file is re-hashed and still counts as unchanged.
+    _bump(_survey_path(project[0], "sub-001", "ses-1", "alpha"))
+    second = _run(project, out_format="csv", incremental=True)
+
+    assert second.up_to_date_recipe_ids == ("alpha", "beta")
+    assert second.written_recipe_ids == ()
+    assert second.processed_files == 0
+    assert second.flat_out_path == first.out_root
+    assert _mtimes(first.out_root) == before
+
+
+def test_changed_input_recomputes_only_its_recipe(project) -> None:
+    first = _run(project, out_format="csv")
+    beta_csv = next(first.out_root.glob("*beta.csv"))
+    beta_mtime = beta_csv.stat().st_mtime_ns
+
+    _write_survey(_survey_path(project[0], "sub-002", "ses-2", "alpha"), 7, 8)
+    second = _run(project, out_format="csv", incremental=True)
+
+    assert second.written_recipe_ids == ("alpha",)
+    assert second.up_to_date_recipe_ids == ("beta",)
+    assert beta_csv.stat().st_mtime_ns == beta_mtime
+    alpha_csv = next(first.out_root.glob("*alpha.csv"))
+    assert "15" in alpha_csv.read_text(encoding="utf-8")
+
+
+def test_recipe_or_option_changes_recompute(project) -> None:
+    _run(project, out_format="csv")
+    _write_recipe(project[1], "beta", ["Q1"])
+
+    changed_recipe = _run(project, out_format="csv", incremental=True)
+    changed_option = _run(
+        project, out_format="csv", missing_policy="text-na", incremental=True
+    )
+
+    assert changed_recipe.written_recipe_ids == ("beta",)
+    assert changed_option.written_recipe_ids == ("alpha", "beta")
+
+
+def test_prism_format_rescores_changed_sessions_only(project) -> None:
+    first = _run(project, out_format="prism")
+    out_root = first.out_root
+    before = _mtimes(out_root)
+
+    changed = _survey_path(project[0], "sub-001", "ses-2", "alpha")
+    _write_survey(changed, 5, 5)
+    removed = _survey_path(project[0], "sub-002", "ses-1", "alpha")
+    removed.unlink()
+    new = _survey_path(project[0], "sub-003", "ses-1", "alpha")
+    _write_survey(new, 1, 1)
+
+    second = _run(project, out_format="prism", incremental=True)
+
+    assert second.processed_files == 2
+    assert second.up_to_date_recipe_ids == ("beta",)
+    after = _mtimes(out_root)
+    rewritten = {key for key in after if before.get(key) != after[key]}
+    assert rewritten == {
+        "alpha/sub-001/ses-2/survey/sub-001_ses-2_task-alpha_desc-scores_survey.tsv",
+        "alpha/sub-003/ses-1/survey/sub-003_ses-1_task-alpha_desc-scores_survey.tsv",
+    }
+    assert not (out_root / "alpha/sub-002/ses-1").exists()
+    assert (out_root / "alpha/sub-002/ses-2/survey").is_dir()
+
+    provenance = json.loads(
+        (out_root / "alpha_provenance.json").read_text(encoding="utf-8")
+    )
+    recorded = {entry["Path"] for entry in provenance["InputFiles"]}
+    assert "sub-003/ses-1/survey/sub-003_ses-1_task-alpha_survey.tsv" in recorded
+    assert "sub-002/ses-1/survey/sub-002_ses-1_task-alpha_survey.tsv" not in recorded
+    assert set(provenance["FileStats"]) >= recorded
+
+
+def test_combined_output_is_rebuilt_when_any_recipe_changes(project) -> None:
+    first = _run(project, out_format="csv", merge_all=True)
+    combined = first.flat_out_path
+
+    skipped = _run(project, out_format="csv", merge_all=True, incremental=True)
+    assert skipped.up_to_date_recipe_ids == ("alpha", "beta")
+    assert skipped.flat_out_path == combined
+
+    _write_survey(_survey_path(project[0], "sub-001", "ses-1", "beta"), 0, 9)
+    rebuilt = _run(project, out_format="csv", merge_all=True, incremental=True)
+
+    assert rebuilt.written_recipe_ids == ("alpha", "beta")
+    assert rebuilt.processed_files == 8
+    assert "9" in combined.read_text(encoding="utf-8")
+
+
+def test_missing_output_is_regenerated(project) -> None:
+    first = _run(project, out_format="flat")
+    first.flat_out_path.unlink()
+
+    second = _run(project, out_format="flat", incremental=True)
+
+    assert second.up_to_date_recipe_ids == ()
+    assert second.flat_out_path.is_file()
@@ -0,0 +1,182 @@
+"""Tests for the streaming xlsx writer and columnar recipe outputs."""
+
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from src import recipes_output_writers as writers
+from src.recipes_export_helpers import (
+    CODEBOOK_COLUMNS,
+    _codebook_rows,
+    _prepare_dataframe_for_sav,
+)
+from src.recipes_surveys import anonymize_recipe_output, compute_survey_recipes
+
+
+def _setup_project(tmp_path: Path) -> tuple[Path, Path]:
+    project_root = tmp_path / "project"
+    recipe_dir = tmp_path / "recipes"
+    survey_dir = project_root / "sub-001" / "ses-1" / "survey"
+    survey_dir.mkdir(parents=True)
+    (survey_dir / "sub-001_ses-1_task-test_survey.tsv").write_text(
+        "Q1\tQ2\n5\t3\n", encoding="utf-8"
+    )
+    recipe_dir.mkdir(parents=True)
+    (recipe_dir / "recipe-test.json").write_text(
+        '{"Kind": "survey", "RecipeVersion": "1.0", "Survey": {"TaskName": "test"},'
+        ' "Scores": [{"Name": "Total", "Method": "sum", "Items": ["Q1", "Q2"]}]}',
+        encoding="utf-8",
+    )
+    return project_root, recipe_dir
+
+
+def test_write_xlsx_round_trips_values_and_sheets(tmp_path: Path) -> None:
+    openpyxl = pytest.importorskip("openpyxl")
+    data = pd.DataFrame(
+        {
+            "participant_id": ["sub-01", "sub-02", "sub-03"],
+            "score": [1.5, None, 3.0],
+            "count": pd.array([1, pd.NA, 3], dtype="Int64"),
+            "note": ["=1+1", "a & <b>", None],
+        }
+    )
+    codebook = pd.DataFrame([{"variable": "score", "label": "Score"}])
+    path = writers.write_xlsx(
+        tmp_path / "out.xlsx",
+        [("Data", data), ("Data", codebook), ("a/b:c", codebook)],
+        chunk_rows=2,
+    )
+
+    workbook = openpyxl.load_workbook(path)
+    assert workbook.sheetnames == ["Data", "Data (2)", "a_b_c"]
+    sheet = workbook["Data"]
+    rows = [[cell.value for cell in row] for row in sheet.iter_rows()]
+    assert rows == [
+        ["participant_id", "score", "count", "note"],
+        ["sub-01", 1.5, 1, "=1+1"],
+        ["sub-02", None, None, "a & <b>"],
+        ["sub-03", 3, 3, None],
+    ]
+    assert sheet["A1"].font.b
+    assert sheet["B2"].data_type == "n"
+    # Text that looks like a formula stays text.
+    assert sheet["D2"].data_type == "s"
+
+    read_back = pd.read_excel(path, sheet_name="Data (2)")
+    assert read_back.to_dict("records") == [{"variable": "score", "label": "Score"}]
+
+
+def test_write_xlsx_streams_rows_in_chunks(tmp_path: Path) -> None:
+    openpyxl = pytest.importorskip("openpyxl")
+    data = pd.DataFrame({"x": range(12), "flag": ["#N/A", "ok\x01"] * 6})
+    path = writers.write_xlsx(tmp_path / "big.xlsx", [("Data", data)], chunk_rows=5)
+
+    sheet = openpyxl.load_workbook(path)["Data"]
+    rows = list(sheet.iter_rows(values_only=True))
+    assert len(rows) == 13
+    assert rows[-1] == (11, "ok")
+    # Text matching an Excel error code stays text.
+    assert sheet["B2"].value == "#N/A"
+    assert sheet["B2"].data_type == "s"
+
+
+def test_codebook_rows_match_tsv_columns() -> None:
+    rows = _codebook_rows(
+        ["Total", "Q1"],
+        {"Total": "Total score"},
+        {"Q1": {2: "b", 1: "a"}},
+        {"Total": {"method": "sum", "items": ["Q1", "Q2"], "min_valid": 2}},
+    )
+
+    assert [list(row) for row in rows] == [CODEBOOK_COLUMNS] * 2
+    assert rows[0]["label"] == "Total score"
+    assert rows[0]["score_details"].startswith("method=sum; items=Q1+Q2")
+    assert rows[1]["values"] == "1=a; 2=b"
+
+
+def test_prepare_dataframe_for_sav_handles_repeated_values() -> None:
+    df = pd.DataFrame(
+        {
+            "decimal": ["1,5", " 2 ", "n/a", "1,5"] * 3,
+            "zeros": ["001", "002", "001", None] * 3,
+            "text": ["a", "b", "NA", "a"] * 3,
+        }
+    )
+
+    out = _prepare_dataframe_for_sav(df)
+
+    assert out["decimal"].isna().tolist()[:4] == [False, False, True, False]
+    assert out["decimal"].dropna().tolist()[:3] == [1.5, 2.0, 1.5]
+    assert out["zeros"].tolist()[:3] == ["001", "002", "001"]
+    assert out["text"].isna().tolist()[:4] == [False, False, True, False]
+
+
+def test_columnar_frame_types_columns() -> None:
+    df = pd.DataFrame(
+        {"participant_id": ["sub-01", "sub-02"], "group": ["1", "2"], "v": ["1", "2"]}
+    )
+
+    frame = writers.columnar_frame(df, string_columns=["group"])
+
+    assert pd.api.types.is_string_dtype(frame["participant_id"])
+    assert pd.api.types.is_string_dtype(frame["group"])
+    assert frame["v"].tolist() == [1, 2]
+
+
+def test_write_columnar_rejects_unknown_format(tmp_path: Path) -> None:
+    with pytest.raises(ValueError):
+        writers.write_columnar(tmp_path / "x.orc", pd.DataFrame(), "orc")
+
+
+def test_parquet_export_falls_back_to_csv_without_pyarrow(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    def _missing(*_args, **_kwargs):
+        raise ImportError("pyarrow is required for parquet output")
+
+    monkeypatch.setattr("src.recipes_surveys.write_columnar", _missing)
+    project_root, recipe_dir = _setup_project(tmp_path)
+
+    result = compute_survey_recipes(
+        prism_root=project_root,
+        repo_root=tmp_path,
+        recipe_dir=recipe_dir,
+        modality="survey",
+        out_format="parquet",
+    )
+
+    out_files = sorted(p.name for p in result.out_root.rglob("*") if p.is_file())
+    assert any(name.endswith(".csv") for name in out_files)
+    assert not any(name.endswith(".parquet") for name in out_files)
+    assert result.fallback_note and "parquet" in result.fallback_note
+    assert result.out_format == "csv"
+
+
+def test_anonymize_rewrites_columnar_csv_fallback(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    def _missing(*_args, **_kwargs):
+        raise ImportError("pyarrow is required for parquet output")
+
+    monkeypatch.setattr("src.recipes_surveys.write_columnar", _missing)
+    project_root, recipe_dir = _setup_project(tmp_path)
+    (project_root / "participants.tsv").write_text(
+        "participant_id\nsub-001\n", encoding="utf-8"
+    )
+    result = compute_survey_recipes(
+        prism_root=project_root,
+        repo_root=tmp_path,
+        recipe_dir=recipe_dir,
+        modality="survey",
+        out_format="parquet",
+    )
+
+    # Callers that still pass the requested format anonymize the CSVs too.
+    count, _mapping = anonymize_recipe_output(
+        dataset_path=project_root, out_root=result.out_root, out_format="parquet"
+    )
+
+    assert count == 1
+    for path in result.out_root.rglob("*.csv"):
+        assert "sub-001" not in path.read_text(encoding="utf-8")
@@ -0,0 +1,154 @@
+"""Tests for grouped, optionally parallel recipe scoring."""
+
+from pathlib import Path
+import json
+
+import pytest
+
+from src import recipes_surveys
+from src.recipes_surveys import compute_survey_recipes
+
+
+def _write_recipe(
+    recipe_dir: Path, recipe_id: str, task: str, items: list[str]
+) -> None:
+    recipe = {
+        "Kind": "survey",
+        "RecipeVersion": "1.0",
+        "Survey": {"TaskName": task},
+        "Scores": [{"Name": "Total", "Method": "sum", "Items": items}],
+    }
+    (recipe_dir / f"recipe-{recipe_id}.json").write_text(
+        json.dumps(recipe), encoding="utf-8"
+    )
+
+
+def _setup_project(tmp_path: Path) -> tuple[Path, Path]:
+    project_root = tmp_path / "project"
+    recipe_dir = tmp_path / "recipes"
+    recipe_dir.mkdir(parents=True)
+    for sub in ("sub-001", "sub-002", "sub-003"):
+        for ses in ("ses-1", "ses-2"):
+            survey_dir = project_root / sub / ses / "survey"
+            survey_dir.mkdir(parents=True)
+            for task in ("alpha", "beta", "gamma"):
+                value = len(sub) + len(ses) + len(task)
+                (survey_dir / f"{sub}_{ses}_task-{task}_survey.tsv").write_text(
+                    f"Q1\tQ2\n{value}\t{int(ses[-1])}\n", encoding="utf-8"
+                )
+    _write_recipe(recipe_dir, "alpha", "alpha", ["Q1", "Q2"])
+    _write_recipe(recipe_dir, "alphaq1", "alpha", ["Q1"])
+    _write_recipe(recipe_dir, "beta", "beta", ["Q1", "Q2"])
+    _write_recipe(recipe_dir, "gamma", "gamma", ["Q2"])
+    return project_root, recipe_dir
+
+
+def _outputs(root: Path) -> dict[str, bytes]:
+    return {
+        str(path.relative_to(root)): path.read_bytes()
+        for path in sorted(root.rglob("*"))
+        if path.is_file() and path.suffix in {".csv", ".tsv"}
+    }
+
+
+def _job(index: int, *paths: str) -> recipes_surveys._RecipeJob:
+    return recipes_surveys._RecipeJob(
+        index=index,
+        recipe_id=f"r{index}",
+        recipe={},
+        matching=tuple(Path(p) for p in paths),
+        survey_task="t",
+    )
+
+
+def test_jobs_sharing_input_files_are_grouped_in_order() -> None:
+    jobs = [_job(0, "a"), _job(1, "b"), _job(2, "c", "a"), _job(3, "d"), _job(4, "b")]
+
+    groups = recipes_surveys._group_recipe_jobs(jobs)
+
+    assert [[job.index for job in group] for group in groups] == [[0, 2], [1, 4], [3]]
+
+
+def test_shared_inputs_are_read_once_per_run(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    project_root, recipe_dir = _setup_project(tmp_path)
+    reads: list[Path] = []
+    original = recipes_surveys._read_tsv_rows
+
+    def _counting_read(path):
+        reads.append(path)
+        return original(path)
+
+    monkeypatch.setattr(recipes_surveys, "_read_tsv_rows", _counting_read)
+
+    result = compute_survey_recipes(
+        prism_root=project_root,
+        repo_root=tmp_path,
+        recipe_dir=recipe_dir,
+        out_format="csv",
+        max_workers=1,
+    )
+
+    assert result.written_recipe_ids == ("alpha", "alphaq1", "beta", "gamma")
+    # alpha and alphaq1 share the six alpha files.
+    assert result.processed_files == 24
+    assert len(reads) == len(set(reads)) == 18
+
+
+@pytest.mark.parametrize(
+    "options",
+    [
+        {"out_format": "csv"},
+        {"out_format": "csv", "merge_all": True, "layout": "wide"},
+        {"out_format": "flat"},
+        {"out_format": "prism"},
+    ],
+)
+def test_worker_processes_produce_identical_outputs(
+    tmp_path: Path, options: dict
+) -> None:
+    results = {}
+    for workers in (1, 2):
+        run_root = tmp_path / f"workers{workers}"
+        project_root, recipe_dir = _setup_project(run_root)
+        result = compute_survey_recipes(
+            prism_root=project_root,
+            repo_root=run_root,
+            recipe_dir=recipe_dir,
+            max_workers=workers,
+            **options,
+        )
+        results[workers] = (
+            _outputs(project_root / "derivatives"),
+            result.processed_files,
+            result.written_files,
+            result.written_recipe_ids,
+        )
+
+    assert results[1][0]
+    assert results[1] == results[2]
+
+
+def test_worker_count_defaults(monkeypatch: pytest.MonkeyPatch) -> None:
+    small = [[_job(0, "a")], [_job(1, "b")], [_job(2, "c")]]
+    many = [[_job(i, *(f"{i}-{n}" for n in range(100)))] for i in range(3)]
+    monkeypatch.delenv(recipes_surveys.RECIPES_WORKERS_ENV_VAR, raising=False)
+    monkeypatch.setattr(recipes_surveys.os, "cpu_count", lambda: 8)
+
+    assert recipes_surveys._recipe_worker_count(None, small) == 1
+    assert recipes_surveys._recipe_worker_count(None, many) == 1
+    assert recipes_surveys._recipe_worker_count(0, small) == 1
+    assert recipes_surveys._recipe_worker_count(0, many) == 3
+    assert recipes_surveys._recipe_worker_count(2, small) == 2
+    assert recipes_surveys._recipe_worker_count(4, small[:1]) == 1
+
+    monkeypatch.setenv(recipes_surveys.RECIPES_WORKERS_ENV_VAR, "2")
+    assert recipes_surveys._recipe_worker_count(None, small) == 2
+    monkeypatch.setenv(recipes_surveys.RECIPES_WORKERS_ENV_VAR, "0")
+    assert recipes_surveys._recipe_worker_count(None, many) == 3
+    monkeypatch.setenv(recipes_surveys.RECIPES_WORKERS_ENV_VAR, "1")
+    assert recipes_surveys._recipe_worker_count(None, many) == 1
+
+    monkeypatch.setattr(recipes_surveys.sys, "frozen", True, raising=False)
+    assert recipes_surveys._recipe_worker_count(4, many) == 1
@@ -0,0 +1,105 @@
+"""Tests for per-run sidecar, variant and score-table caching in recipe scoring."""
+
+from pathlib import Path
+import json
+
+import pytest
+
+from src import recipes_surveys
+from src.recipes_surveys import compute_survey_recipes
+
+RECIPE = {
+    "Kind": "survey",
+    "RecipeVersion": "1.0",
+    "Survey": {"TaskName": "alpha"},
+    "Scores": [{"Name": "Total", "Method": "sum", "Items": ["Q1", "Q2"]}],
+    "VersionedScores": {
+        "short": [{"Name": "Short", "Method": "sum", "Items": ["Q1"]}],
+        "long": [{"Name": "Long", "Method": "sum", "Items": ["Q1", "Q2", "Q3"]}],
+    },
+}
+
+
+def _setup_project(tmp_path: Path) -> tuple[Path, Path]:
+    project_root = tmp_path / "project"
+    recipe_dir = tmp_path / "recipes"
+    recipe_dir.mkdir(parents=True)
+    for sub in ("sub-001", "sub-002", "sub-003"):
+        survey_dir = project_root / sub / "ses-1" / "survey"
+        survey_dir.mkdir(parents=True)
+        name = f"{sub}_ses-1_task-alpha_survey.tsv"
+        if sub == "sub-003":
+            name = f"{sub}_ses-1_task-alpha_acq-long_survey.tsv"
+        (survey_dir / name).write_text("Q1\tQ2\tQ3\n1\t2\t4\n", encoding="utf-8")
+    library = project_root / "code" / "library" / "survey"
+    library.mkdir(parents=True)
+    (library / "survey-alpha.json").write_text(
+        json.dumps(
+            {
+                "Technical": {},
+                "Study": {"Version": "short"},
+                "Q1": {"Description": "One"},
+                "Q2": {"Description": "Two"},
+                "Q3": {"Description": "Three"},
+            }
+        ),
+        encoding="utf-8",
+    )
+    (recipe_dir / "recipe-alpha.json").write_text(json.dumps(RECIPE), encoding="utf-8")
+    return project_root, recipe_dir
+
+
+@pytest.mark.parametrize("version", [None, "", "short", "long", "unknown"])
+def test_score_table_matches_resolve_recipe_scores(version) -> None:
+    # Empty keys are rejected by validation but never selected either way.
+    versioned = {**RECIPE["VersionedScores"], "": [{"Name": "Ignored"}]}
+    recipe = {**RECIPE, "VersionedScores": versioned}
+    table = recipes_surveys._recipe_score_table(recipe)
+
+    block = table.get(version or None, table[None])
+
+    assert block.scores == recipes_surveys._resolve_recipe_scores(recipe, version)
+    assert block.names == [score["Name"] for score in block.scores]
+    assert block.name_set == frozenset(block.names)
+
+
+def test_templates_are_loaded_once_per_run(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    project_root, recipe_dir = _setup_project(tmp_path)
+    loads: list[tuple[str, str]] = []
+    original = recipes_surveys._get_sidecar_for_task
+
+    def _counting_load(dataset_path, prefix, name):
+        loads.append((prefix, name))
+        return original(dataset_path, prefix, name)
+
+    monkeypatch.setattr(recipes_surveys, "_get_sidecar_for_task", _counting_load)
+
+    result = compute_survey_recipes(
+        prism_root=project_root,
+        repo_root=tmp_path,
+        recipe_dir=recipe_dir,
+        out_format="csv",
+        merge_all=True,
+        max_workers=1,
+    )
+
+    assert result.processed_files == 3
+    assert loads == [("survey", "alpha")]
+    combined = result.flat_out_path.read_text(encoding="utf-8").splitlines()
+    header = combined[0].split(",")
+    values = [dict(zip(header, line.split(","))) for line in combined[1:]]
+    assert [row["alpha_Short"] for row in values] == ["1", "1", ""]
+    assert [row["alpha_Long"] for row in values] == ["", "", "7"]
+
+
+def test_variant_resolution_uses_acq_before_template(tmp_path: Path) -> None:
+    project_root, _ = _setup_project(tmp_path)
+    inputs = recipes_surveys._RecipeInputs()
+    paths = sorted(project_root.rglob("*_survey.tsv"))
+
+    variants = [inputs.variant(project_root, "alpha", path) for path in paths]
+
+    assert variants == ["short", "short", "long"]
+    assert inputs.variant(project_root, "missing", paths[0]) is None
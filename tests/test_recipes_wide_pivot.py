@@ -0,0 +1,220 @@
+"""Tests for the columnar wide-layout pivot used by recipe exports."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src import recipes_wide_pivot as wide
+from src.recipes_surveys import _handle_wide_pivot
+
+
+def _long_frame(seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    keys = [
+        (f"sub-{p:02d}", f"ses-{s}", run)
+        for p in range(12)
+        for s in (1, 2)
+        for run in ("run-01", "run-02", None)
+    ]
+    keys = [keys[i] for i in sorted(rng.choice(len(keys), 50, replace=False))]
+    frame = pd.DataFrame(keys, columns=["participant_id", "session", "run"])
+    pool = np.array(["1", "2.5", "n/a", None], dtype=object)
+    for column in ("B", "A", "C"):
+        frame[column] = pd.array(pool[rng.integers(0, 4, len(frame))], dtype="str")
+    return frame
+
+
+def _run_key(values: tuple) -> str:
+    return "_".join("" if pd.isna(v) else str(v) for v in values)
+
+
+def test_matches_pandas_pivot_per_recipe() -> None:
+    frame = _long_frame()
+    pivot_key = (frame["session"] + "_" + frame["run"].fillna("")).str.rstrip("_")
+    expected = frame.assign(_pivot_key=pivot_key).pivot(
+        index="participant_id", columns="_pivot_key", values=["B", "A", "C"]
+    )
+    expected.columns = [f"{value}_{key}" for value, key in expected.columns]
+    expected = expected.reset_index().fillna("n/a")
+
+    codes, labels = wide.context_codes(
+        frame, ["session", "run"], lambda v: _run_key(v).rstrip("_")
+    )
+    result = wide.pivot_wide(
+        frame,
+        ["B", "A", "C"],
+        codes,
+        labels,
+        column_name=lambda value, key: f"{value}_{key}",
+    )
+
+    pd.testing.assert_frame_equal(result, expected, check_names=False)
+
+
+@pytest.mark.parametrize("budget", [None, 1])
+def test_matches_melt_pivot_with_missing_values(budget) -> None:
+    frame = _long_frame(seed=1)
+    frame.loc[frame["participant_id"] == "sub-03", ["A", "B", "C"]] = None
+    melted = frame.melt(
+        id_vars=["participant_id", "session", "run"],
+        value_vars=["B", "A", "C"],
+    ).dropna(subset=["value"])
+    melted["col_name"] = (
+        melted["variable"] + "_" + melted["session"] + "_" + melted["run"].fillna("")
+    ).str.rstrip("_")
+    expected = (
+        melted.pivot(index="participant_id", columns="col_name", values="value")
+        .reset_index()
+        .fillna("n/a")
+    )
+    expected = expected[["participant_id"] + sorted(expected.columns[1:])]
+
+    codes, labels = wide.context_codes(frame, ["session", "run"], _run_key)
+    result = wide.pivot_wide(
+        frame,
+        ["B", "A", "C"],
+        codes,
+        labels,
+        column_name=lambda value, key: f"{value}_{key}".rstrip("_"),
+        drop_missing=True,
+        sort_columns=True,
+        memory_budget=budget,
+    )
+
+    pd.testing.assert_frame_equal(result, expected, check_names=False)
+    assert "sub-03" not in set(result["participant_id"])
+
+
+def test_duplicate_entries_only_conflict_when_both_have_values() -> None:
+    frame = pd.DataFrame(
+        {
+            "participant_id": ["sub-01", "sub-01", "sub-02"],
+            "session": ["ses-1", "ses-1", "ses-1"],
+            "a_Total": ["1", None, "3"],
+            "b_Total": [None, "2", None],
+        }
+    )
+    codes, labels = wide.context_codes(frame, ["session"], _run_key)
+
+    def _pivot(drop_missing: bool) -> pd.DataFrame:
+        return wide.pivot_wide(
+            frame,
+            ["a_Total", "b_Total"],
+            codes,
+            labels,
+            column_name=lambda value, key: f"{value}_{key}",
+            drop_missing=drop_missing,
+        )
+
+    merged = _pivot(drop_missing=True)
+    assert merged.to_dict("records") == [
+        {"participant_id": "sub-01", "a_Total_ses-1": "1", "b_Total_ses-1": "2"},
+        {"participant_id": "sub-02", "a_Total_ses-1": "3", "b_Total_ses-1": "n/a"},
+    ]
+    with pytest.raises(ValueError, match="duplicate entries"):
+        _pivot(drop_missing=False)
+
+    frame.loc[1, "a_Total"] = "9"
+    with pytest.raises(ValueError, match="duplicate entries"):
+        _pivot(drop_missing=True)
+
+
+@pytest.mark.parametrize("drop_missing", [False, True])
+def test_numeric_columns_with_fills_become_object(drop_missing: bool) -> None:
+    frame = pd.DataFrame(
+        {
+            "participant_id": ["a", "a", "b"],
+            "session": ["ses-1", "ses-2", "ses-1"],
+            "score": [1.5, 2.0, 3.0],
+        }
+    )
+    expected = frame.pivot(index="participant_id", columns="session", values="score")
+    expected.columns = [f"score_{key}" for key in expected.columns]
+    expected = expected.reset_index().fillna("n/a")
+
+    codes, labels = wide.context_codes(frame, ["session"], _run_key)
+    result = wide.pivot_wide(
+        frame,
+        ["score"],
+        codes,
+        labels,
+        column_name=lambda value, key: f"{value}_{key}",
+        drop_missing=drop_missing,
+    )
+
+    pd.testing.assert_frame_equal(result, expected, check_names=False)
+    assert result["score_ses-1"].dtype == np.float64
+    assert result["score_ses-2"].tolist() == [2.0, "n/a"]
+
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        {"score": [1, 2, 3]},
+        {"flag": [True, False, True]},
+        {"score": [1, 2, 3], "mean": [1.5, 2.5, 3.5]},
+    ],
+)
+def test_integer_and_bool_columns_are_upcast_like_pandas_pivot(values) -> None:
+    frame = pd.DataFrame(
+        {"participant_id": ["a", "a", "b"], "session": ["ses-1", "ses-2", "ses-1"]}
+    ).assign(**values)
+    expected = frame.pivot(
+        index="participant_id", columns="session", values=list(values)
+    )
+    expected.columns = [f"{value}_{key}" for value, key in expected.columns]
+    expected = expected.reset_index().fillna("n/a")
+
+    codes, labels = wide.context_codes(frame, ["session"], _run_key)
+    result = wide.pivot_wide(
+        frame,
+        list(values),
+        codes,
+        labels,
+        column_name=lambda value, key: f"{value}_{key}",
+    )
+
+    pd.testing.assert_frame_equal(result, expected, check_names=False)
+    assert [type(value) for value in result.iloc[:, 1:].to_numpy().ravel()] == [
+        type(value) for value in expected.iloc[:, 1:].to_numpy().ravel()
+    ]
+
+
+def test_context_codes_share_codes_for_equal_labels() -> None:
+    frame = pd.DataFrame(
+        {"session": ["ses-1", "ses-1", "ses-2"], "run": ["", None, ""]}
+    )
+
+    codes, labels = wide.context_codes(
+        frame, ["session", "run"], lambda v: _run_key(v).rstrip("_")
+    )
+
+    assert labels == ["ses-1", "ses-2"]
+    assert codes.tolist() == [0, 0, 1]
+
+
+def test_memory_budget_from_environment(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv(wide.WIDE_PIVOT_MEMORY_ENV_VAR, raising=False)
+    assert wide.wide_pivot_memory_budget() == wide.WIDE_PIVOT_MEMORY_MB << 20
+    assert wide.wide_pivot_memory_budget(2) == 2 << 20
+
+    monkeypatch.setenv(wide.WIDE_PIVOT_MEMORY_ENV_VAR, "16")
+    assert wide.wide_pivot_memory_budget() == 16 << 20
+    monkeypatch.setenv(wide.WIDE_PIVOT_MEMORY_ENV_VAR, "lots")
+    assert wide.wide_pivot_memory_budget() == wide.WIDE_PIVOT_MEMORY_MB << 20
+
+
+def test_handle_wide_pivot_falls_back_on_duplicates() -> None:
+    frame = pd.DataFrame(
+        {
+            "participant_id": ["sub-01", "sub-01"],
+            "session": ["ses-1", "ses-1"],
+            "Total": ["1", "2"],
+        }
+    )
+
+    result, header, note = _handle_wide_pivot(frame, ["Total"])
+
+    assert result is frame
+    assert header == ["Total"]
+    assert note and note.startswith("Could not create wide layout")
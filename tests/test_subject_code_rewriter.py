@@ -448,3 +448,91 @@ def test_subject_rewrite_renames_broken_symlink_binary_files(tmp_path):
     assert renamed_symlink.is_symlink()
     assert not (project_root / "sub-101" / "anat" / "sub-01_T1w.nii.gz").exists()
     assert not (project_root / "sub-101" / "anat" / "sub-01_T1w.nii.gz").is_symlink()
+
+
+def test_subject_code_rewriter_apply_consumes_preview_plan(tmp_path, monkeypatch):
+    project_root = tmp_path / "project"
+    anat_dir = project_root / "sub-1293167" / "anat"
+    anat_dir.mkdir(parents=True)
+    sidecar = anat_dir / "sub-1293167_T1w.json"
+    sidecar.write_text('{"Source": "sub-1293167"}', encoding="utf-8")
+    (project_root / "participants.tsv").write_text(
+        "participant_id\nsub-1293167\n", encoding="utf-8"
+    )
+
+    rewriter = SubjectCodeRewriter(project_root)
+    preview = rewriter.preview(mode="last3")
+
+    def _unexpected_rebuild(*args, **kwargs):
+        raise AssertionError("apply() should reuse the preview plan")
+
+    monkeypatch.setattr(rewriter, "_build_plan", _unexpected_rebuild)
+    result = rewriter.apply(mode="last3")
+
+    assert sorted(preview["text_update_files"]) == [
+        "participants.tsv",
+        "sub-1293167/anat/sub-1293167_T1w.json",
+    ]
+    assert sorted(result["text_update_files"]) == [
+        "participants.tsv",
+        "sub-167/anat/sub-167_T1w.json",
+    ]
+    rewritten = project_root / "sub-167" / "anat" / "sub-167_T1w.json"
+    assert rewritten.read_text(encoding="utf-8") == '{"Source": "sub-167"}'
+    assert not (project_root / ".prism").exists()
+
+
+def test_subject_code_rewriter_resumes_interrupted_apply(tmp_path, monkeypatch):
+    from src import text_rewrite_engine
+
+    project_root = tmp_path / "project"
+    for number in range(1001, 1011):
+        anat_dir = project_root / f"sub-{number}" / "anat"
+        anat_dir.mkdir(parents=True)
+        (anat_dir / f"sub-{number}_T1w.json").write_text(
+            f'{{"Source": "sub-{number}"}}', encoding="utf-8"
+        )
+
+    original_write = text_rewrite_engine._atomic_write_text
+    writes = []
+
+    def _crash_after_two(path, text):
+        writes.append(path)
+        if len(writes) > 2:
+            raise OSError("disk went away")
+        original_write(path, text)
+
+    monkeypatch.setattr(text_rewrite_engine, "_atomic_write_text", _crash_after_two)
+    with pytest.raises(OSError):
+        SubjectCodeRewriter(project_root).apply(mode="last3")
+    assert (project_root / ".prism" / "subject_rewrite_journal.jsonl").exists()
+
+    monkeypatch.setattr(text_rewrite_engine, "_atomic_write_text", original_write)
+    result = SubjectCodeRewriter(project_root).apply(mode="last3")
+
+    assert result["resumed"] is True
+    assert result["mapping"] == {}
+    # Files finished before the crash are reported with the resumed run.
+    assert result["text_update_count"] == 10
+    for number in range(1001, 1011):
+        short = f"sub-{str(number)[-3:]}"
+        sidecar = project_root / short / "anat" / f"{short}_T1w.json"
+        assert sidecar.read_text(encoding="utf-8") == f'{{"Source": "{short}"}}'
+    assert not (project_root / ".prism").exists()
+
+
+def test_subject_code_rewriter_checks_text_files_before_renaming(tmp_path):
+    project_root = tmp_path / "project"
+    anat_dir = project_root / "sub-1293167" / "anat"
+    anat_dir.mkdir(parents=True)
+    sidecar = anat_dir / "sub-1293167_T1w.json"
+    sidecar.write_text('{"Source": "sub-1293167"}', encoding="utf-8")
+
+    rewriter = SubjectCodeRewriter(project_root)
+    rewriter.preview(mode="last3")
+    sidecar.write_text('{"Source": "sub-1293167", "Edited": true}', encoding="utf-8")
+
+    with pytest.raises(ValueError, match="changed after the rewrite was previewed"):
+        rewriter.apply(mode="last3")
+    assert sidecar.exists()
+    assert not (project_root / "sub-167").exists()
@@ -0,0 +1,146 @@
+import json
+import os
+
+from src.converters import survey_templates
+from src.converters.survey_templates import (
+    _load_project_templates,
+    clear_template_library_cache,
+    match_against_library,
+)
+
+
+def _write_template(path, task, items, **study):
+    payload = {"Study": {"TaskName": task, **study}}
+    for code in items:
+        payload[code] = {"Description": code, "Levels": {"0": "no", "1": "yes"}}
+    path.write_text(json.dumps(payload), encoding="utf-8")
+
+
+def _survey_dir(tmp_path):
+    survey_dir = tmp_path / "code" / "library" / "survey"
+    survey_dir.mkdir(parents=True)
+    return survey_dir
+
+
+def test_project_templates_are_parsed_once_until_file_changes(tmp_path, monkeypatch):
+    clear_template_library_cache()
+    survey_dir = _survey_dir(tmp_path)
+    template_path = survey_dir / "survey-gad.json"
+    _write_template(template_path, "gad", ["GAD01", "GAD02"])
+
+    reads = []
+    original_read_json = survey_templates._read_json
+
+    def _counting_read_json(path):
+        reads.append(path)
+        return original_read_json(path)
+
+    monkeypatch.setattr(survey_templates, "_read_json", _counting_read_json)
+
+    first = _load_project_templates(tmp_path)
+    second = _load_project_templates(tmp_path)
+    assert len(reads) == 1
+    assert first["gad"]["json"] is second["gad"]["json"]
+
+    _write_template(template_path, "gad", ["GAD01", "GAD02", "GAD03"])
+    stat = template_path.stat()
+    os.utime(template_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    third = _load_project_templates(tmp_path)
+    assert len(reads) == 2
+    assert third["gad"]["structure"] == {"GAD01", "GAD02", "GAD03"}
+
+
+def test_new_and_removed_templates_are_picked_up(tmp_path):
+    clear_template_library_cache()
+    survey_dir = _survey_dir(tmp_path)
+    _write_template(survey_dir / "survey-gad.json", "gad", ["GAD01"])
+    assert set(_load_project_templates(tmp_path)) == {"gad"}
+
+    _write_template(survey_dir / "survey-phq.json", "phqrun2", ["PHQ01"])
+    (survey_dir / "survey-gad.json").unlink()
+    stat = survey_dir.stat()
+    os.utime(survey_dir, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    templates = _load_project_templates(tmp_path)
+    assert set(templates) == {"phq"}
+    assert templates["phq"]["source"] == "project"
+
+
+def test_precomputed_item_index_drives_matching(tmp_path):
+    clear_template_library_cache()
+    survey_dir = _survey_dir(tmp_path)
+    _write_template(
+        survey_dir / "survey-bfi.json", "bfi", ["BFI_01", "BFI_02", "BFI_03"]
+    )
+
+    templates = _load_project_templates(tmp_path)
+    items = templates["bfi"]["items"]
+    assert items.ls_norm == {"bfi01": "BFI_01", "bfi02": "BFI_02", "bfi03": "BFI_03"}
+
+    imported = {
+        "BFI01run1": {"Levels": {"0": "no", "1": "yes"}},
+        "BFI02run1": {"Levels": {"0": "no", "1": "yes"}},
+        "BFI03run1": {"Levels": {"0": "no", "1": "yes"}},
+        "BFI01run2": {"Levels": {"0": "no", "1": "yes"}},
+        "BFI02run2": {"Levels": {"0": "no", "1": "yes"}},
+        "BFI03run2": {"Levels": {"0": "no", "1": "yes"}},
+    }
+    match = match_against_library(imported, global_templates={}, project_path=tmp_path)
+
+    assert match is not None
+    assert match.template_key == "bfi"
+    assert match.confidence == "exact"
+    assert match.runs_detected == 2
+    assert match.levels_match is True
+
+
+def _library(*entries):
+    templates = {}
+    for key, items, abbrev in entries:
+        sidecar = {"Study": {"TaskName": key, "Abbreviation": abbrev}}
+        for code in items:
+            sidecar[code] = {"Description": code}
+        templates[key] = {
+            "path": survey_templates.Path(f"survey-{key}.json"),
+            "json": sidecar,
+            "structure": set(items),
+        }
+    return templates
+
+
+def test_library_index_only_returns_templates_sharing_codes():
+    library = _library(
+        ("gad", ["GAD01", "GAD02"], "GAD-7"),
+        ("phq", ["PHQ01", "PHQ02"], "PHQ-9"),
+        ("bdi", ["BDI01"], "BDI"),
+    )
+    index = survey_templates._build_template_library_index(library)
+
+    assert index.candidate_keys({"gad01", "bdi01"}, "") == ["gad", "bdi"]
+    assert index.candidate_keys({"unknown"}, "phq9") == ["phq"]
+    assert index.candidate_keys({"unknown"}, "") == []
+
+
+def test_match_groups_uses_shared_index_with_identical_results():
+    library = _library(
+        ("gad", ["GAD01", "GAD02", "GAD03"], "GAD-7"),
+        ("phq", ["PHQ01", "PHQ02"], "PHQ-9"),
+        ("mixed", ["GAD01", "PHQ01"], "MIX"),
+    )
+    groups = {
+        "gad": {"GAD01": {}, "GAD02": {}, "GAD03": {}},
+        "phqrun1": {"PHQ01run1": {}, "PHQ02run1": {}},
+        "other": {"XYZ01": {}},
+    }
+
+    batch = survey_templates.match_groups_against_library(groups, library)
+
+    for group_name, prism_json in groups.items():
+        single = match_against_library(prism_json, library, group_name=group_name)
+        left = batch[group_name].to_dict() if batch[group_name] else None
+        right = single.to_dict() if single else None
+        assert left == right
+    assert batch["gad"].template_key == "gad"
+    assert batch["gad"].confidence == "exact"
+    assert batch["phqrun1"].template_key == "phq"
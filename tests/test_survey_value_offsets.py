@@ -111,6 +111,33 @@ def test_survey_converter_raises_structured_error_for_out_of_bounds_value(tmp_pa
     assert evidence.get("corrected_by_best_offset_percent") == pytest.approx(100.0)
 
 
+def test_survey_converter_writes_nothing_when_a_later_row_is_out_of_bounds(tmp_path):
+    input_path = tmp_path / "survey.csv"
+    input_path.write_text(
+        "ID,PSS01\nsub-001,1\nsub-002,2\nsub-003,9\n", encoding="utf-8"
+    )
+
+    library_root = tmp_path / "library"
+    _write_basic_survey_template(library_root, task="pss")
+    output_root = tmp_path / "out"
+
+    with pytest.raises(SurveyValueOutOfBoundsError) as error_info:
+        SurveyResponsesConverter().convert_xlsx(
+            input_path=input_path,
+            library_dir=library_root,
+            output_root=output_root,
+            id_column="ID",
+            session="all",
+            dry_run=False,
+            force=True,
+            skip_participants=True,
+            separator=",",
+        )
+
+    assert error_info.value.raw_value == "9"
+    assert not list(output_root.rglob("*_survey.tsv"))
+
+
 def test_survey_converter_infers_structural_task_offset_evidence(tmp_path):
     input_path = tmp_path / "survey.csv"
     input_path.write_text(
@@ -820,3 +847,136 @@ def test_survey_preview_validate_path_returns_task_review_summary(tmp_path):
     assert payload["survey_tasks"][0]["manual_review_required"] is True
     assert payload["survey_tasks"][0]["out_of_range"]["item_id"] == "PSS01"
     assert payload["survey_tasks"][0]["out_of_range"]["suggested_offsets"] == [-1]
+
+
+def test_survey_dry_run_reports_value_preflight_per_task(tmp_path):
+    input_path = tmp_path / "survey.csv"
+    input_path.write_text(
+        "ID,PSS01\nsub-001,1\nsub-002,5\nsub-003,5\n", encoding="utf-8"
+    )
+
+    library_root = tmp_path / "library"
+    _write_basic_survey_template(library_root, task="pss")
+    output_root = tmp_path / "out"
+
+    result = SurveyResponsesConverter().convert_xlsx(
+        input_path=input_path,
+        library_dir=library_root,
+        output_root=output_root,
+        id_column="ID",
+        session="all",
+        dry_run=True,
+        force=True,
+        skip_participants=True,
+        separator=",",
+    )
+
+    report = result.dry_run_preview["value_preflight"]["pss"]
+    assert report["out_of_range_values"] == 2
+    assert report["out_of_range_items"] == ["PSS01"]
+    assert report["task_offsets"] == [-1]
+    item = report["items"]["PSS01"]
+    assert item["observed_values"] == ["1", "5"]
+    assert (item["numeric_min"], item["numeric_max"]) == (1, 5)
+    assert item["invalid_values"] == ["5"]
+    assert item["valid_offsets"] == [-1]
+
+    error = result.out_of_bounds_errors["pss"]
+    assert isinstance(error, SurveyValueOutOfBoundsError)
+    assert error.sub_id == "sub-002"
+    assert error.suggested_offsets == [-1]
+    assert error.offset_evidence["sampled_numeric_values"] == 3
+    assert error.offset_evidence["invalid_without_offset"] == 2
+    assert not output_root.exists() or not list(output_root.rglob("*.tsv"))
+
+
+def test_survey_preview_uses_preflight_errors_instead_of_per_task_runs(tmp_path):
+    app = Flask(__name__)
+    app.secret_key = os.urandom(32)
+
+    project_root = tmp_path / "project"
+    project_root.mkdir()
+    library_root = tmp_path / "library"
+    _write_basic_survey_template(library_root, task="pss")
+
+    preflight_error = SurveyValueOutOfBoundsError(
+        task="pss",
+        item_id="PSS01",
+        sub_id="sub-001",
+        raw_value="5",
+        expected_levels=["0", "1", "2", "3", "4"],
+        suggested_offsets=[-1],
+        message="Item PSS01 for task pss has value 5 outside expected levels",
+    )
+    calls = []
+
+    def fake_run_survey_with_official_fallback(_converter, **kwargs):
+        calls.append(kwargs)
+        return type(
+            "Result",
+            (),
+            {
+                "dry_run_preview": {
+                    "summary": {"tasks": ["pss"], "total_files": 1},
+                    "participants": [],
+                    "files_to_create": [],
+                    "data_issues": [],
+                    "column_mapping": {},
+                },
+                "tasks_included": ["pss"],
+                "unknown_columns": [],
+                "missing_items_by_task": {},
+                "id_column": "ID",
+                "session_column": None,
+                "run_column": None,
+                "detected_sessions": [],
+                "conversion_warnings": [],
+                "task_runs": {},
+                "template_matches": None,
+                "tool_columns": [],
+                "near_match_candidates": [],
+                "near_match_applied": False,
+                "applied_value_offsets": {},
+                "value_offset_application_counts": {},
+                "out_of_bounds_errors": {"pss": preflight_error},
+            },
+        )()
+
+    with app.test_request_context(
+        "/api/survey-convert-preview",
+        method="POST",
+        data={
+            "file": (io.BytesIO(b"ID,PSS01\nsub-001,5\n"), "demo.csv"),
+            "id_column": "ID",
+            "validate": "true",
+        },
+        content_type="multipart/form-data",
+    ):
+        session["current_project_path"] = str(project_root)
+        response = handle_api_survey_convert_preview(
+            convert_survey_xlsx_to_prism_dataset=object(),
+            convert_survey_lsa_to_prism_dataset=object(),
+            resolve_effective_library_path=lambda: library_root,
+            run_survey_with_official_fallback=fake_run_survey_with_official_fallback,
+            validate_project_templates_for_tasks=lambda **_kwargs: [],
+            build_template_completion_gate=lambda _issues: None,
+            format_unmatched_groups_response=lambda _error: {},
+            id_column_not_detected_error_cls=ValueError,
+            unmatched_groups_error_cls=RuntimeError,
+            survey_value_out_of_bounds_error_cls=SurveyValueOutOfBoundsError,
+            format_value_offset_confirmation_response=lambda error: {
+                "error": "value_offset_manual_review_required",
+                "task": error.task,
+                "item_id": error.item_id,
+                "suggested_offsets": list(error.suggested_offsets),
+            },
+        )
+
+    payload = response.get_json()
+    assert response.status_code == 200
+    assert len(calls) == 1
+    assert calls[0]["dry_run"] is True
+    out_of_range = payload["survey_tasks"][0]["out_of_range"]
+    assert payload["survey_tasks"][0]["manual_review_required"] is True
+    assert out_of_range["item_id"] == "PSS01"
+    assert out_of_range["suggested_offsets"] == [-1]
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import os
+import stat
+
+import pytest
+
+from src.text_rewrite_engine import (
+    RewriteJournal,
+    apply_text_rewrites,
+    plan_text_rewrites,
+    rewrite_fingerprint,
+)
+
+
+def _append_suffix(text: str) -> str:
+    # Deliberately not idempotent: applying it twice would corrupt the file.
+    return text.replace("task-rest", "task-rest2")
+
+
+def test_plan_skips_unchanged_and_undecodable_files(tmp_path):
+    changed = tmp_path / "a.json"
+    changed.write_text('{"TaskName": "task-rest"}', encoding="utf-8")
+    unchanged = tmp_path / "b.json"
+    unchanged.write_text('{"TaskName": "nback"}', encoding="utf-8")
+    binary = tmp_path / "c.tsv"
+    binary.write_bytes(b"\xff\xfetask-rest")
+
+    plan = plan_text_rewrites([changed, unchanged, binary], _append_suffix)
+
+    assert [change.path for change in plan] == [changed]
+    assert plan[0].sha256 != plan[0].rewritten_sha256
+
+
+def test_apply_writes_atomically_and_keeps_mode_and_symlinks(tmp_path):
+    target = tmp_path / "shared.json"
+    target.write_text("task-rest\r\n", encoding="utf-8")
+    target.chmod(0o640)
+    link = tmp_path / "link.json"
+    link.symlink_to(target)
+
+    plan = plan_text_rewrites([link], _append_suffix)
+    changed = apply_text_rewrites(plan, _append_suffix)
+
+    assert changed == [link]
+    assert link.is_symlink()
+    assert target.read_bytes() == b"task-rest2\n"
+    assert stat.S_IMODE(target.stat().st_mode) == 0o640
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        "link.json",
+        "shared.json",
+    ]
+
+
+def test_apply_rejects_files_edited_after_planning(tmp_path):
+    first = tmp_path / "first.json"
+    first.write_text("task-rest", encoding="utf-8")
+    second = tmp_path / "second.json"
+    second.write_text("task-rest", encoding="utf-8")
+    plan = plan_text_rewrites([first, second], _append_suffix)
+
+    second.write_text("task-rest edited", encoding="utf-8")
+
+    with pytest.raises(ValueError, match="second.json"):
+        apply_text_rewrites(plan, _append_suffix)
+    assert first.read_text(encoding="utf-8") == "task-rest2"
+    assert second.read_text(encoding="utf-8") == "task-rest edited"
+
+
+def test_journal_resumes_without_rewriting_completed_files(tmp_path):
+    done = tmp_path / "done.json"
+    done.write_text("task-rest", encoding="utf-8")
+    pending = tmp_path / "pending.json"
+    pending.write_text("task-rest", encoding="utf-8")
+    journal_path = tmp_path / ".prism" / "journal.jsonl"
+    fingerprint = rewrite_fingerprint([["task-rest", "task-rest2"]])
+
+    # Simulate an interrupted run that finished "done.json" only.
+    plan = plan_text_rewrites([done], _append_suffix)
+    with pytest.raises(RuntimeError):
+        with RewriteJournal(journal_path, fingerprint) as journal:
+            apply_text_rewrites(plan, _append_suffix, journal=journal)
+            raise RuntimeError("interrupted")
+    assert journal_path.exists()
+
+    # The retry re-plans from disk, where "done.json" still matches the
+    # (non-idempotent) rewrite; the journal keeps it from being applied twice.
+    plan = plan_text_rewrites([done, pending], _append_suffix)
+    with RewriteJournal(journal_path, fingerprint) as journal:
+        changed = apply_text_rewrites(plan, _append_suffix, journal=journal)
+
+    assert changed == [done, pending]
+    assert done.read_text(encoding="utf-8") == "task-rest2"
+    assert pending.read_text(encoding="utf-8") == "task-rest2"
+    assert not journal_path.parent.exists()
+
+
+def test_journal_for_another_rewrite_is_ignored(tmp_path):
+    journal_path = tmp_path / "journal.jsonl"
+    with pytest.raises(RuntimeError):
+        with RewriteJournal(journal_path, "old") as journal:
+            journal.record(tmp_path / "a.json", "0" * 64)
+            raise RuntimeError("interrupted")
+
+    assert RewriteJournal(journal_path, "new").completed == {}
+    assert RewriteJournal(journal_path, "old").completed == {
+        str(tmp_path / "a.json"): "0" * 64
+    }
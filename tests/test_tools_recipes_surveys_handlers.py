@@ -65,6 +65,34 @@ def test_combined_output_check_only_flags_combined_targets(tmp_path: Path) -> No
     assert existing == [combined_sav, combined_codebook]
 
 
+def test_output_check_includes_csv_fallback_without_pyarrow(tmp_path: Path) -> None:
+    handlers = _import_handlers_module()
+
+    out_dir = tmp_path / "derivatives" / "survey" / "long_en"
+    out_dir.mkdir(parents=True)
+    combined_csv = out_dir / "combined_survey.csv"
+    combined_csv.write_text("participant_id\nsub-001\n", encoding="utf-8")
+    single_csv = out_dir / "ads.csv"
+    single_csv.write_text("participant_id\nsub-001\n", encoding="utf-8")
+
+    def _existing(merge_all: bool, pyarrow_available: bool) -> list[Path]:
+        return handlers._find_existing_recipe_output_files(
+            derivatives_dir=out_dir,
+            out_format="parquet",
+            merge_all=merge_all,
+            modality="survey",
+            pyreadstat_available=True,
+            pyarrow_available=pyarrow_available,
+        )
+
+    assert _existing(merge_all=True, pyarrow_available=True) == []
+    assert _existing(merge_all=True, pyarrow_available=False) == [combined_csv]
+    assert sorted(_existing(merge_all=False, pyarrow_available=False)) == [
+        single_csv,
+        combined_csv,
+    ]
+
+
 def test_recipes_template_defaults_to_spss_output() -> None:
     template_path = (
         Path(__file__).resolve().parents[1] / "app" / "templates" / "recipes.html"
@@ -187,6 +215,7 @@ def test_handle_api_recipes_surveys_forwards_recipe_prefix_flag(
 
     assert response.status_code == 200
     assert run_job.call_args.kwargs["include_recipe_prefix"] is False
+    assert run_job.call_args.kwargs["max_workers"] == 1
 
 
 def test_handle_api_recipes_surveys_emits_cmd_prefix_for_backend_styling(
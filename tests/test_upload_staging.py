@@ -0,0 +1,176 @@
+import io
+import os
+import time
+
+import pytest
+from flask import Flask
+from werkzeug.datastructures import FileStorage
+
+from src.converters import upload_staging
+from src.converters.upload_staging import UploadStagingArea
+
+
+def _upload(payload: bytes, filename: str) -> FileStorage:
+    return FileStorage(stream=io.BytesIO(payload), filename=filename)
+
+
+def test_identical_uploads_are_staged_once(tmp_path):
+    area = UploadStagingArea(tmp_path / "staging")
+    payload = b"participant_id,GAD01\nsub-01,1\n"
+
+    first = area.stage_upload(_upload(payload, "export.csv"), filename="export.csv")
+    second = area.stage_upload(_upload(payload, "export.csv"), filename="export.csv")
+    renamed = area.stage_upload(_upload(payload, "copy.csv"), filename="copy.csv")
+
+    assert first == second
+    assert renamed.digest == first.digest
+    assert renamed.path.read_bytes() == payload
+    assert [entry.name for entry in area.root.iterdir()] == [first.digest]
+    assert area.resolve(first.digest).path.read_bytes() == payload
+    assert area.resolve("0" * 64) is None
+    assert area.resolve("../etc") is None
+
+
+def test_staged_table_is_parsed_once_per_read_options(tmp_path, monkeypatch):
+    area = UploadStagingArea(tmp_path / "staging")
+    source = tmp_path / "export.csv"
+    source.write_text("participant_id,GAD01\nsub-01,1\nsub-02,2\n", encoding="utf-8")
+    staged = area.stage_file(source)
+
+    calls = []
+    original_read = upload_staging.read_tabular_file
+
+    def _counting_read(*args, **kwargs):
+        calls.append(kwargs.get("separator"))
+        return original_read(*args, **kwargs)
+
+    monkeypatch.setattr(upload_staging, "read_tabular_file", _counting_read)
+
+    first = area.read_tabular(staged.path, kind="csv", separator=",")
+    first.df.loc[0, "GAD01"] = "mutated"
+    second = area.read_tabular(staged.path, kind="csv", separator=",", sheet="0")
+
+    assert calls == [","]
+    assert list(second.df["GAD01"]) == ["1", "2"]
+    assert second.delimiter_used == ","
+
+    area.read_tabular(staged.path, kind="csv", separator=";")
+    area.read_tabular(source, kind="csv", separator=",")
+    assert calls == [",", ";", ","]
+    assert [path.name for path in (area.root / staged.digest).iterdir()] == [
+        "export.csv"
+    ]
+
+    area.discard(staged.digest)
+    assert area.resolve(staged.digest) is None
+    area.stage_file(source)
+    area.read_tabular(staged.path, kind="csv", separator=",")
+    assert calls == [",", ";", ",", ","]
+
+
+def test_frame_cache_is_bounded_by_memory_and_age(tmp_path, monkeypatch):
+    area = UploadStagingArea(tmp_path / "staging", frame_ttl_seconds=60)
+    small = area.stage_upload(_upload(b"id,x\n1,2\n", "s.csv"), filename="s.csv")
+    large = area.stage_upload(
+        _upload(b"id,x\n" + b"1,2\n" * 500, "l.csv"), filename="l.csv"
+    )
+
+    area.read_tabular(small.path, kind="csv")
+    small_bytes = next(iter(area._frames.values())).nbytes
+    area.max_cached_frame_bytes = small_bytes * 2
+    area.read_tabular(large.path, kind="csv")
+    assert [key[0] for key in area._frames] == [small.digest]
+
+    area.read_tabular(small.path, kind="csv", encoding="utf-8")
+    assert len(area._frames) == 2
+    area.max_cached_frame_bytes = small_bytes
+    area.read_tabular(small.path, kind="csv", encoding="utf-8")
+    assert [key[4] for key in area._frames] == ["utf-8"]
+
+    later = time.time() + 120
+    monkeypatch.setattr(upload_staging.time, "time", lambda: later)
+    area.read_tabular(small.path, kind="csv")
+    assert [key[0] for key in area._frames] == [small.digest]
+
+
+def test_discard_keeps_uploads_held_by_another_workflow(tmp_path):
+    area = UploadStagingArea(tmp_path / "staging")
+    payload = b"participant_id,GAD01\nsub-01,1\n"
+    first = area.stage_upload(_upload(payload, "a.csv"), filename="a.csv", workflow="a")
+    second = area.stage_upload(
+        _upload(payload, "a.csv"), filename="a.csv", workflow="b"
+    )
+
+    assert area.discard(first.digest, workflow="a") is False
+    assert area.resolve(second.digest).path.read_bytes() == payload
+    assert area.discard(second.digest, workflow="b") is True
+    assert area.resolve(second.digest) is None
+
+
+@pytest.mark.skipif(not hasattr(os, "getuid"), reason="POSIX permissions")
+def test_staging_root_must_be_private(tmp_path, monkeypatch):
+    area = UploadStagingArea(tmp_path / "staging")
+    area.stage_upload(_upload(b"id\n1\n", "a.csv"), filename="a.csv")
+    assert (area.root.stat().st_mode & 0o777) == 0o700
+
+    shared = tmp_path / "shared"
+    shared.mkdir(mode=0o755)
+    shared.chmod(0o755)
+    with pytest.raises(PermissionError):
+        UploadStagingArea(shared).stage_upload(
+            _upload(b"id\n1\n", "a.csv"), filename="a.csv"
+        )
+
+    monkeypatch.setattr(upload_staging, "default_staging_root", lambda: shared)
+    fallback = UploadStagingArea()
+    assert fallback.root != shared
+    assert (fallback.root.stat().st_mode & 0o777) == 0o700
+    fallback.root.rmdir()
+
+
+def test_eviction_drops_expired_then_least_recently_used(tmp_path):
+    area = UploadStagingArea(tmp_path / "staging", ttl_seconds=60, max_bytes=25)
+    old = area.stage_upload(_upload(b"a" * 10, "a.csv"), filename="a.csv")
+    stale = area.stage_upload(_upload(b"b" * 10, "b.csv"), filename="b.csv")
+    now = time.time()
+    os.utime(area.root / old.digest, (now - 30, now - 30))
+    os.utime(area.root / stale.digest, (now - 120, now - 120))
+
+    assert area.evict(now=now) == [stale.digest]
+
+    fresh = area.stage_upload(_upload(b"c" * 20, "c.csv"), filename="c.csv")
+
+    assert area.resolve(old.digest) is None
+    assert area.resolve(fresh.digest) is not None
+
+
+def test_source_hash_resolves_a_previously_staged_upload(tmp_path, monkeypatch):
+    from src.web.blueprints import conversion_request_helpers as helpers
+
+    area = UploadStagingArea(tmp_path / "staging")
+    monkeypatch.setattr(upload_staging, "_default_area", area)
+    staged = area.stage_upload(_upload(b"id,x\n1,2\n", "survey.csv"), filename="survey.csv")
+
+    app = Flask(__name__)
+    app.secret_key = "test"
+    with app.test_request_context(
+        "/api/survey-convert-preview",
+        method="POST",
+        data={"source_hash": staged.digest},
+    ):
+        upload, error = helpers.resolve_uploaded_or_source_file(field_names=("excel",))
+        restaged = helpers.stage_uploaded_file(upload, filename=upload.filename)
+
+    assert error is None
+    assert upload.filename == "survey.csv"
+    assert restaged == staged
+
+    with app.test_request_context(
+        "/api/survey-convert-preview",
+        method="POST",
+        data={"source_hash": "f" * 64},
+    ):
+        upload, error = helpers.resolve_uploaded_or_source_file(field_names=("excel",))
+
+    assert upload is None
+    assert "expired" in error
@@ -1,12 +1,18 @@
 from __future__ import annotations
 
+from pathlib import Path
+
 import pandas as pd
+import pytest
 
+from src.converters.file_reader import open_tabular_chunks
 from src.converters.wide_to_long import (
     convert_wide_to_long_dataframe,
     detect_wide_session_prefixes,
     find_empty_data_rows,
     inspect_wide_to_long_columns,
+    prepare_wide_to_long_plan,
+    stream_wide_to_long,
 )
 
 
@@ -287,3 +293,74 @@ def test_no_matched_cols_for_indicator_skipped() -> None:
     )
     assert len(result) == 1
     assert result.iloc[0]["ses"] == "T1"
+
+
+def _sorted_long(df: pd.DataFrame, keys: list[str]) -> pd.DataFrame:
+    return df.sort_values(keys).reset_index(drop=True).fillna("")
+
+
+def test_stream_wide_to_long_matches_in_memory_conversion(tmp_path: Path) -> None:
+    wide = pd.DataFrame(
+        {
+            "participant_id": [f"sub-{index:02d}" for index in range(10)],
+            "group": ["a", "b"] * 5,
+            "T1_score_run1": [str(index) for index in range(10)],
+            "T1_score_run2": [str(index + 10) for index in range(10)],
+            "T2_score_run1": [str(index + 20) for index in range(10)],
+            "T2_score_run2": [str(index + 30) for index in range(10)],
+            "T2_extra": ["x"] * 10,
+        }
+    )
+    wide.iloc[3, 2:] = None
+    input_path = tmp_path / "wide.csv"
+    wide.to_csv(input_path, index=False)
+    options = {
+        "session_indicators": ["T1_", "T2_"],
+        "session_value_map": {"T1_": "pre"},
+        "run_indicators": ["_run1", "_run2"],
+    }
+
+    chunks = open_tabular_chunks(input_path, chunk_rows=3)
+    prepared = prepare_wide_to_long_plan(chunks.columns, **options)
+    output_path = tmp_path / "long.csv"
+    result = stream_wide_to_long(
+        chunks,
+        prepared,
+        id_column="participant_id",
+        output_path=output_path,
+        drop_empty_rows=True,
+        preview_rows=2,
+    )
+
+    expected = convert_wide_to_long_dataframe(
+        pd.read_csv(input_path, dtype=str).drop(index=[3]), **options
+    )
+    streamed = pd.read_csv(output_path, dtype=str)
+    keys = ["participant_id", "session", "run"]
+    assert list(streamed.columns) == list(expected.columns)
+    assert _sorted_long(streamed, keys).equals(_sorted_long(expected, keys))
+    assert result["empty_data_rows"] == [{"row_index": 3, "id_value": "sub-03"}]
+    assert (result["rows_in"], result["rows_out"]) == (10, len(expected))
+    assert len(result["preview"]) == 2
+
+
+def test_stream_wide_to_long_leaves_no_partial_output_on_error(tmp_path: Path) -> None:
+    prepared = prepare_wide_to_long_plan(
+        ["participant_id", "T1_score", "T2_score"], session_indicators=["T1_", "T2_"]
+    )
+    first = pd.DataFrame(
+        {"participant_id": ["sub-01"], "T1_score": ["1"], "T2_score": ["2"]}
+    )
+    broken = first.rename(columns={"participant_id": "subject"})
+    output_path = tmp_path / "long.csv"
+
+    with pytest.raises(ValueError, match="ID column 'participant_id' not found"):
+        stream_wide_to_long(
+            [first, broken],
+            prepared,
+            id_column="participant_id",
+            output_path=output_path,
+        )
+
+    assert list(tmp_path.iterdir()) == []
+
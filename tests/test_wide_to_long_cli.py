@@ -264,3 +264,41 @@ def test_wide_to_long_cli_rejects_non_unique_selected_id_column(
     output = (result.stdout or "") + (result.stderr or "")
     assert result.returncode == 2, output
     assert "non-unique values for the selected ID column 'slim_id'" in output
+
+
+def test_wide_to_long_cli_chunked_mode_streams_csv_output(tmp_path: Path) -> None:
+    input_path = tmp_path / "wide.csv"
+    output_path = tmp_path / "long.tsv"
+    pd.DataFrame(
+        {
+            "participant_id": ["sub-01", "sub-02", "sub-03"],
+            "T1_score": ["1", "", "5"],
+            "T2_score": ["2", "", "6"],
+        }
+    ).to_csv(input_path, index=False)
+
+    result = _run_prism_tools(
+        "wide-to-long",
+        "--input",
+        str(input_path),
+        "--output",
+        str(output_path),
+        "--session-indicators",
+        "T1_,T2_",
+        "--chunk-size",
+        "2",
+        "--drop-empty-rows",
+    )
+
+    output = (result.stdout or "") + (result.stderr or "")
+    assert result.returncode == 0, output
+    assert "Dropped 1 participant(s)" in output
+    assert "Output rows: 4" in output
+    long_df = pd.read_csv(output_path, sep="\t", dtype=str)
+    assert sorted(zip(long_df["participant_id"], long_df["score"])) == [
+        ("sub-01", "1"),
+        ("sub-01", "2"),
+        ("sub-03", "5"),
+        ("sub-03", "6"),
+    ]
+
@@ -0,0 +1,200 @@
+"""Worker daemon: job forwarding, fallback and change-driven restarts."""
+
+from __future__ import annotations
+
+import io
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+from jsonschema import ValidationError, validate
+
+APP_DIR = Path(__file__).resolve().parents[1] / "app"
+if str(APP_DIR) not in sys.path:
+    sys.path.insert(0, str(APP_DIR))
+
+from src import schema_manager  # noqa: E402
+from src.cli import daemon  # noqa: E402
+
+pytestmark = pytest.mark.skipif(
+    not daemon.daemon_supported(), reason="needs Unix domain sockets"
+)
+
+
+@pytest.fixture
+def running_daemon(tmp_path, monkeypatch):
+    monkeypatch.delenv(daemon.DISABLE_ENV_VAR, raising=False)
+    watched = tmp_path / "schemas"
+    watched.mkdir()
+    (watched / "survey.schema.json").write_text("{}", encoding="utf-8")
+    server = daemon.WorkerDaemon(tmp_path / "d.sock", watch_dirs=[watched])
+    server.bind()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server, watched
+    if not server._stop.is_set():
+        daemon.request({"op": "shutdown"}, server.socket_path)
+    thread.join(timeout=5)
+
+
+def test_jobs_run_in_daemon_and_stream_output(running_daemon, monkeypatch):
+    server, _ = running_daemon
+    monkeypatch.setenv("PRISM_SKIP_VENV_CHECK", "1")
+    out, err = io.StringIO(), io.StringIO()
+
+    code = daemon.submit(
+        "prism_tools",
+        ["dataset"],
+        socket_path=server.socket_path,
+        stdout=out,
+        stderr=err,
+    )
+    failing = daemon.submit(
+        "prism_tools",
+        ["no-such-command"],
+        socket_path=server.socket_path,
+        stdout=io.StringIO(),
+        stderr=err,
+    )
+
+    assert code == 0
+    assert "build-biometrics-smoketest" in out.getvalue()
+    assert failing == 2
+    assert "invalid choice" in err.getvalue()
+    assert daemon.request({"op": "ping"}, server.socket_path)["jobs"] == 2
+
+
+def test_job_prompts_read_the_client_stdin(running_daemon, tmp_path, monkeypatch):
+    server, _ = running_daemon
+    script = tmp_path / "prompt.py"
+    script.write_text(
+        'answer = input("Delete? [y/N] ")\nprint(f"answer={answer}")\n',
+        encoding="utf-8",
+    )
+    monkeypatch.setitem(daemon.PROGRAMS, "prism_tools", script)
+    out = io.StringIO()
+
+    code = daemon.submit(
+        "prism_tools",
+        [],
+        socket_path=server.socket_path,
+        stdin=io.StringIO("y\n"),
+        stdout=out,
+    )
+    at_eof = daemon.submit(
+        "prism_tools",
+        [],
+        socket_path=server.socket_path,
+        stdin=io.StringIO(""),
+        stdout=io.StringIO(),
+        stderr=io.StringIO(),
+    )
+
+    assert code == 0
+    assert out.getvalue() == "Delete? [y/N] answer=y\n"
+    assert at_eof == 1
+
+
+def test_busy_daemon_refuses_jobs_instead_of_queueing(running_daemon):
+    server, _ = running_daemon
+    assert server._lock.acquire(timeout=5)
+    try:
+        with pytest.raises(daemon.DaemonUnavailable, match="busy"):
+            daemon.submit("prism_tools", ["--help"], socket_path=server.socket_path)
+        assert daemon.request({"op": "ping"}, server.socket_path)["busy"] is True
+    finally:
+        server._lock.release()
+
+    assert daemon.request({"op": "ping"}, server.socket_path)["jobs"] == 0
+
+
+def test_changed_schema_makes_daemon_refuse_and_restart(running_daemon):
+    server, watched = running_daemon
+    daemon.request({"op": "ping"}, server.socket_path)
+    (watched / "survey.schema.json").write_text('{"type": "object"}', encoding="utf-8")
+
+    with pytest.raises(daemon.DaemonUnavailable):
+        daemon.submit("prism_tools", ["--help"], socket_path=server.socket_path)
+
+    assert server._restart is True
+
+
+def test_run_via_daemon_falls_back_without_daemon(tmp_path, monkeypatch):
+    monkeypatch.delenv(daemon.DISABLE_ENV_VAR, raising=False)
+    monkeypatch.setenv(daemon.SOCKET_ENV_VAR, str(tmp_path / "missing.sock"))
+
+    assert daemon.run_via_daemon("prism", ["dataset"]) is None
+
+    (tmp_path / "missing.sock").write_text("", encoding="utf-8")
+    assert daemon.run_via_daemon("prism", ["dataset"]) is None
+
+
+def test_socket_outside_private_directory_is_not_used(tmp_path, monkeypatch):
+    monkeypatch.delenv(daemon.DISABLE_ENV_VAR, raising=False)
+    shared = tmp_path / "shared"
+    shared.mkdir()
+    shared.chmod(0o755)
+    socket_path = shared / "d.sock"
+
+    with pytest.raises(RuntimeError, match="Refusing"):
+        daemon.WorkerDaemon(socket_path).bind()
+
+    shared.chmod(0o700)
+    server = daemon.WorkerDaemon(socket_path)
+    server.bind()
+    try:
+        daemon.verify_socket_path(socket_path)
+        shared.chmod(0o750)
+        monkeypatch.setenv(daemon.SOCKET_ENV_VAR, str(socket_path))
+        with pytest.raises(daemon.DaemonUnavailable):
+            daemon.request({"op": "ping"}, socket_path)
+        assert daemon.run_via_daemon("prism", ["dataset"]) is None
+    finally:
+        server._listener.close()
+
+
+def test_only_path_and_prism_variables_are_forwarded():
+    environ = {
+        "PATH": "/usr/bin",
+        "PRISM_LIBRARY_ROOT": "/data/library",
+        "HOME": "/home/someone",
+        "AWS_SECRET_ACCESS_KEY": "secret",
+    }
+
+    assert daemon.forwarded_env(environ) == {
+        "PATH": "/usr/bin",
+        "PRISM_LIBRARY_ROOT": "/data/library",
+    }
+
+
+def test_file_change_watcher_reports_edits_new_and_removed_files(tmp_path):
+    (tmp_path / "a.json").write_text("{}", encoding="utf-8")
+    watcher = daemon.FileChangeWatcher([tmp_path])
+    assert watcher.changed() == []
+
+    (tmp_path / "b.json").write_text("{}", encoding="utf-8")
+    assert watcher.changed() == [str(tmp_path / "b.json")]
+    assert watcher.changed() == []
+
+    (tmp_path / "a.json").unlink()
+    assert str(tmp_path / "a.json") in watcher.changed()
+
+
+def test_validate_against_schema_matches_jsonschema_and_compiles_once():
+    schema_manager.clear_compiled_validators()
+    schema = {
+        "type": "object",
+        "properties": {"age": {"type": "integer", "minimum": 0}},
+        "required": ["age"],
+    }
+
+    schema_manager.validate_against_schema({"age": 3}, schema)
+    for instance in ({"age": -1}, {}):
+        with pytest.raises(ValidationError) as expected:
+            validate(instance=instance, schema=schema)
+        with pytest.raises(ValidationError) as actual:
+            schema_manager.validate_against_schema(instance, dict(schema))
+        assert actual.value.message == expected.value.message
+
+    assert len(schema_manager._compiled_validators) == 1